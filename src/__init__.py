@@ -275,6 +275,7 @@ __all__ = [
     #
     'closeOutput',
     'describeEvolProcess',
+    'flushBackgroundSaves',
     'loadPopulation',
     'loadPedigree',
     'moduleInfo',
@@ -309,7 +310,7 @@ __all__ = [
 
 # get options
 from simuOpt import simuOptions
-import os, sys, re
+import os, sys, re, atexit
 
 if simuOptions['Optimized']:
     if simuOptions['AlleleType'] == 'short':
@@ -340,6 +341,10 @@ else:
 
 __version__ = moduleInfo()['version']
 
+# populations that are still being saved in the background are written before
+# the interpreter exits, and errors are reported instead of being lost
+atexit.register(flushBackgroundSaves)
+
     
 if simuOptions['Version'] is not None:
     expMajor, expMinor, expRelease = [
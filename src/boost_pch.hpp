@@ -62,6 +62,7 @@
 #include <boost/iostreams/filtering_stream.hpp>
 #include <boost/iostreams/filter/gzip.hpp>
 #include <boost/iostreams/device/file.hpp>
+#include <boost/iostreams/device/back_inserter.hpp>
 
 #include "boost/lexical_cast.hpp"
 #include "boost/dynamic_bitset/detail/lowest_bit.hpp"
@@ -52,6 +52,8 @@ struct arrayobject_template
 	PyObject_VAR_HEAD
 	// pointer to the beginning of the genotype
 	T ob_iter;
+	// the object that owns the genotype
+	PyObject * ob_owner;
 };
 
 /// CPPONLY
@@ -165,11 +167,26 @@ carray_init_template(PyTypeObject * /* type */, PyObject * /* args */, PyObject
 template <typename T>
 PyObject * newcarrayobject_template(T begin, T end);
 
+/// CPPONLY create an array of part of array \e a, which shares the owner of \e a
+template <typename T>
+PyObject * slicecarrayobject_template(struct arrayobject_template<T> * a, T begin, T end)
+{
+	struct arrayobject_template<T> * np =
+		(struct arrayobject_template<T> *)newcarrayobject_template<T>(begin, end);
+
+	if (np != NULL) {
+		np->ob_owner = a->ob_owner;
+		Py_XINCREF(np->ob_owner);
+	}
+	return (PyObject *)np;
+}
+
 /// CPPONLY
 template <typename T>
 void
 array_dealloc_template(arrayobject_template<T> * op)
 {
+	Py_XDECREF(op->ob_owner);
 	PyObject_Del(op);
 }
 
@@ -419,7 +436,7 @@ PyObject * array_slice_template(struct arrayobject_template<T> * a, Py_ssize_t i
 		ihigh = ilow;
 	else if (ihigh > Py_SIZE(a))
 		ihigh = Py_SIZE(a);
-	np = (struct arrayobject_template<T> *)newcarrayobject_template<T>(a->ob_iter + ilow, a->ob_iter + ihigh);
+	np = (struct arrayobject_template<T> *)slicecarrayobject_template<T>(a, a->ob_iter + ilow, a->ob_iter + ihigh);
 	if (np == NULL)
 		return NULL;
 	return (PyObject *)np;
@@ -685,6 +702,7 @@ PyObject * newcarrayobject_template<GenoIterator>(GenoIterator begin, GenoIterat
 	}
 	//
 	op->ob_iter = begin;
+	op->ob_owner = NULL;
 #if PY_VERSION_HEX >= 0x030b0000
 #  ifdef MUTANTALLELE
 	Py_SET_SIZE(op, end.index() - begin.index());
@@ -716,6 +734,7 @@ PyObject * newcarrayobject_template<LineageIterator>(LineageIterator begin, Line
 	}
 	//
 	op->ob_iter = begin;
+	op->ob_owner = NULL;
 #if PY_VERSION_HEX >= 0x030b0000
 	Py_SET_SIZE(op, end - begin);
 #else
@@ -734,6 +753,8 @@ struct arrayobject_template
 	PyObject_VAR_HEAD
 	// pointer to the beginning of the genotype
 	T ob_iter;
+	// the object that owns the genotype
+	PyObject * ob_owner;
 };
 
 template <typename T>
@@ -742,6 +763,20 @@ bool is_carrayobject_template(PyObject * op);
 template <typename T>
 PyObject * newcarrayobject_template(T begin, T end);
 
+/// CPPONLY create an array of part of array \e a, which shares the owner of \e a
+template <typename T>
+PyObject * slicecarrayobject_template(struct arrayobject_template<T> * a, T begin, T end)
+{
+	struct arrayobject_template<T> * np =
+		(struct arrayobject_template<T> *)newcarrayobject_template<T>(begin, end);
+
+	if (np != NULL) {
+		np->ob_owner = a->ob_owner;
+		Py_XINCREF(np->ob_owner);
+	}
+	return (PyObject *)np;
+}
+
 template <typename T>
 PyObject *
 getarrayitem_template(PyObject * op, Py_ssize_t i)
@@ -810,6 +845,7 @@ template <typename T>
 void
 array_dealloc_template(struct arrayobject_template<T> * op)
 {
+	Py_XDECREF(op->ob_owner);
 	Py_TYPE(op)->tp_free((PyObject *)op);
 }
 
@@ -1038,7 +1074,7 @@ array_slice_template(struct arrayobject_template<T> * a, Py_ssize_t ilow, Py_ssi
 		ihigh = ilow;
 	else if (ihigh > Py_SIZE(a))
 		ihigh = Py_SIZE(a);
-	np = (struct arrayobject_template<T> *)newcarrayobject_template<T>(a->ob_iter + ilow, a->ob_iter + ihigh);
+	np = (struct arrayobject_template<T> *)slicecarrayobject_template<T>(a, a->ob_iter + ilow, a->ob_iter + ihigh);
 	if (np == NULL)
 		return NULL;
 	return (PyObject *)np;
@@ -1225,9 +1261,9 @@ array_subscr_template(struct arrayobject_template<T> * self, PyObject * item)
 		}
 
 		if (slicelength <= 0)
-			return newcarrayobject_template<T>(self->ob_iter, self->ob_iter);
-		return newcarrayobject_template<T>(self->ob_iter + start,
-		                                   self->ob_iter + stop);
+			return slicecarrayobject_template<T>(self, self->ob_iter, self->ob_iter);
+		return slicecarrayobject_template<T>(self, self->ob_iter + start,
+		                                     self->ob_iter + stop);
 	}else {
 		PyErr_SetString(PyExc_TypeError,
 			"array indices must be integers");
@@ -1500,6 +1536,68 @@ getarrayitem_template<GenoIterator>(PyObject * op, Py_ssize_t i)
 }
 
 
+/// CPPONLY expose len items at buf of object obj with the buffer protocol
+template <typename ITEM>
+int fill_array_buffer(PyObject * obj, ITEM * buf, Py_ssize_t len, const char * format,
+                      Py_buffer * view, int flags)
+{
+	static ITEM emptybuf[1];
+
+	view->obj = obj;
+	Py_INCREF(obj);
+	view->buf = len == 0 ? emptybuf : buf;
+	view->len = len * sizeof(ITEM);
+	view->readonly = 0;
+	view->itemsize = sizeof(ITEM);
+	view->format = (flags & PyBUF_FORMAT) ? const_cast<char *>(format) : NULL;
+	view->ndim = 1;
+	view->shape = (flags & PyBUF_ND) ? &((PyVarObject *)obj)->ob_size : NULL;
+	view->strides = (flags & PyBUF_STRIDES) ? &view->itemsize : NULL;
+	view->suboffsets = NULL;
+	view->internal = NULL;
+	return 0;
+}
+
+
+/// CPPONLY
+template <typename T>
+int array_getbuffer_template(struct arrayobject_template<T> * self, Py_buffer * view, int flags);
+
+
+/// CPPONLY
+template <>
+int array_getbuffer_template<GenoIterator>(struct arrayobject_template<GenoIterator> * self,
+                                           Py_buffer * view, int flags)
+{
+#  if defined(BINARYALLELE) || defined(MUTANTALLELE)
+	(void)self;
+	(void)flags;
+	view->obj = NULL;
+	PyErr_SetString(PyExc_BufferError,
+		"Genotypes of binary and mutant modules are not stored as an array of alleles.");
+	return -1;
+#  else
+	Allele * buf = Py_SIZE(self) == 0 ? NULL : &*self->ob_iter;
+#    ifdef LONGALLELE
+	return fill_array_buffer<Allele>((PyObject *)self, buf, Py_SIZE(self), "L", view, flags);
+#    else
+	return fill_array_buffer<Allele>((PyObject *)self, buf, Py_SIZE(self), "B", view, flags);
+#    endif
+#  endif
+}
+
+
+/// CPPONLY
+template <>
+int array_getbuffer_template<LineageIterator>(struct arrayobject_template<LineageIterator> * self,
+                                              Py_buffer * view, int flags)
+{
+	long * buf = Py_SIZE(self) == 0 ? NULL : &*self->ob_iter;
+
+	return fill_array_buffer<long>((PyObject *)self, buf, Py_SIZE(self), "l", view, flags);
+}
+
+
 /// CPPONLY
 template <typename T>
 PyObject * newcarrayobject_template(T begin, T end)
@@ -1522,6 +1620,7 @@ PyObject * newcarrayobject_template<GenoIterator>(GenoIterator begin, GenoIterat
 	}
 	//
 	op->ob_iter = begin;
+	op->ob_owner = NULL;
 #if PY_VERSION_HEX >= 0x030b0000
 	Py_SET_SIZE(op, end - begin);
 #else
@@ -1545,6 +1644,7 @@ PyObject * newcarrayobject_template<LineageIterator>(LineageIterator begin, Line
 	}
 	//
 	op->ob_iter = begin;
+	op->ob_owner = NULL;
 #if PY_VERSION_HEX >= 0x030b0000
 	Py_SET_SIZE(op, end - begin);
 #else
@@ -39,6 +39,133 @@
 #  endif                                                                                        /* DONT_HAVE_SYS_TYPES_H */
 #endif                                                                                          /* !STDC_HEADERS */
 
+/* info array type: an object that exposes information fields of individuals,
+   which are stored as a matrix of doubles, with the buffer protocol */
+
+/// CPPONLY
+typedef struct
+{
+	PyObject_HEAD
+	// pointer to the information fields of the first individual
+	double * ob_buf;
+	// number of individuals and information fields
+	Py_ssize_t ob_shape[2];
+	Py_ssize_t ob_strides[2];
+	// the object that owns the information fields
+	PyObject * ob_owner;
+} infoarrayobject;
+
+
+/// CPPONLY
+void infoarray_dealloc(infoarrayobject * op)
+{
+	Py_XDECREF(op->ob_owner);
+	PyObject_Del(op);
+}
+
+
+PyMemberDef infoarray_members[] = {
+	{ const_cast<char *>("owner"), T_OBJECT, offsetof(infoarrayobject, ob_owner), READONLY,
+	  const_cast<char *>("the object that owns the information fields") },
+	{ NULL }
+};
+
+
+/// CPPONLY
+int infoarray_getbuffer(infoarrayobject * self, Py_buffer * view, int flags)
+{
+	// memoryview does not accept a NULL buffer even if it is empty
+	static double emptybuf[1];
+
+	view->obj = (PyObject *)self;
+	Py_INCREF(self);
+	view->buf = self->ob_buf == NULL ? emptybuf : self->ob_buf;
+	view->len = self->ob_shape[0] * self->ob_shape[1] * sizeof(double);
+	view->readonly = 0;
+	view->itemsize = sizeof(double);
+	view->format = (flags & PyBUF_FORMAT) ? const_cast<char *>("d") : NULL;
+	view->ndim = 2;
+	view->shape = (flags & PyBUF_ND) ? self->ob_shape : NULL;
+	view->strides = (flags & PyBUF_STRIDES) ? self->ob_strides : NULL;
+	view->suboffsets = NULL;
+	view->internal = NULL;
+	return 0;
+}
+
+
+PyBufferProcs infoarray_as_buffer = {
+#if PY_VERSION_HEX < 0x03000000
+	0, 0, 0, 0,
+#endif
+	(getbufferproc)infoarray_getbuffer,
+	(releasebufferproc)0
+};
+
+PyTypeObject InfoArraytype = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"simuPOP.infoarray",
+	sizeof(infoarrayobject),
+	0,
+	(destructor)infoarray_dealloc,              /* tp_dealloc */
+	0,                                          /* tp_print */
+	0,                                          /* tp_getattr */
+	0,                                          /* tp_setattr */
+	0,                                          /* tp_reserved */
+	0,                                          /* tp_repr */
+	0,                                          /* tp_as_number*/
+	0,                                          /* tp_as_sequence*/
+	0,                                          /* tp_as_mapping*/
+	0,                                          /* tp_hash */
+	0,                                          /* tp_call */
+	0,                                          /* tp_str */
+	PyObject_GenericGetAttr,                    /* tp_getattro */
+	0,                                          /* tp_setattro */
+	&infoarray_as_buffer,                       /* tp_as_buffer*/
+#if PY_VERSION_HEX < 0x03000000
+	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_NEWBUFFER, /* tp_flags */
+#else
+	Py_TPFLAGS_DEFAULT,                         /* tp_flags */
+#endif
+	"information fields of individuals",        /* tp_doc */
+	0,                                          /* tp_traverse */
+	0,                                          /* tp_clear */
+	0,                                          /* tp_richcompare */
+	0,                                          /* tp_weaklistoffset */
+	0,                                          /* tp_iter */
+	0,                                          /* tp_iternext */
+	0,                                          /* tp_methods */
+	infoarray_members,                          /* tp_members */
+};
+
+
+/// CPPONLY
+PyObject * newinfoarrayobject(double * buf, size_t numInds, size_t infoSize)
+{
+	infoarrayobject * op = PyObject_New(infoarrayobject, &InfoArraytype);
+
+	if (op == NULL)
+		return PyErr_NoMemory();
+	op->ob_buf = numInds * infoSize == 0 ? NULL : buf;
+	op->ob_shape[0] = numInds;
+	op->ob_shape[1] = infoSize;
+	op->ob_strides[0] = infoSize * sizeof(double);
+	op->ob_strides[1] = sizeof(double);
+	op->ob_owner = NULL;
+	return (PyObject *)op;
+}
+
+
+/// CPPONLY invalidate allele counts tracked by \e owner, a population whose
+/// genotype can be changed through an array returned by Population.genotype()
+void invalidateTrackedAlleles(PyObject * owner)
+{
+	void * pop = NULL;
+
+	if (owner != NULL && SWIG_IsOK(SWIG_ConvertPtr(owner, &pop, SWIGTYPE_p_simuPOP__Population, 0)))
+		reinterpret_cast<simuPOP::Population *>(pop)->trackedAlleles().invalidate();
+}
+
+
 #if PY_VERSION_HEX < 0x03000000
 
 /// CPPONLY
@@ -141,6 +268,7 @@ PyObject * array_slice(arrayobject * a, Py_ssize_t ilow, Py_ssize_t ihigh)
 /// CPPONLY
 int array_ass_slice(arrayobject * a, Py_ssize_t ilow, Py_ssize_t ihigh, PyObject * v)
 {
+	invalidateTrackedAlleles(a->ob_owner);
 	return(array_ass_slice_template<GenoIterator>(a, ilow, ihigh, v));
 }
 
@@ -148,6 +276,7 @@ int array_ass_slice(arrayobject * a, Py_ssize_t ilow, Py_ssize_t ihigh, PyObject
 /// CPPONLY
 Py_ssize_t array_ass_item(arrayobject * a, Py_ssize_t i, PyObject * v)
 {
+	invalidateTrackedAlleles(a->ob_owner);
 	return(array_ass_item_template<GenoIterator>(a, i, v));
 }
 
@@ -789,7 +918,9 @@ int initCustomizedTypes(PyObject * m)
 	// from python reference manual.
 	Arraytype.ob_type = &PyType_Type;
 	LineageArraytype.ob_type = &PyType_Type;
-	if (PyType_Ready(&Arraytype) < 0 || PyType_Ready(&LineageArraytype) < 0)
+	InfoArraytype.ob_type = &PyType_Type;
+	if (PyType_Ready(&Arraytype) < 0 || PyType_Ready(&LineageArraytype) < 0 ||
+	    PyType_Ready(&InfoArraytype) < 0)
 		return -1;
 	//
 	defdict_type.ob_type = &PyType_Type;
@@ -873,6 +1004,7 @@ array_slice(arrayobject * a, Py_ssize_t ilow, Py_ssize_t ihigh)
 int
 array_ass_slice(arrayobject * a, Py_ssize_t ilow, Py_ssize_t ihigh, PyObject * v)
 {
+	invalidateTrackedAlleles(a->ob_owner);
 	return array_ass_slice_template<GenoIterator>(a, ilow, ihigh, v);
 }
 
@@ -880,6 +1012,7 @@ array_ass_slice(arrayobject * a, Py_ssize_t ilow, Py_ssize_t ihigh, PyObject * v
 int
 array_ass_item(arrayobject * a, Py_ssize_t i, PyObject * v)
 {
+	invalidateTrackedAlleles(a->ob_owner);
 	return array_ass_item_template<GenoIterator>(a, i, v);
 }
 
@@ -962,6 +1095,7 @@ array_subscr(arrayobject* self, PyObject* item)
 int
 array_ass_subscr(arrayobject* self, PyObject* item, PyObject* value)
 {
+	invalidateTrackedAlleles(self->ob_owner);
 	return array_ass_subscr_template<GenoIterator>(self, item, value);
 }
 
@@ -971,6 +1105,19 @@ PyMappingMethods array_as_mapping = {
 	(objobjargproc)array_ass_subscr
 };
 
+int
+array_getbuffer(arrayobject * self, Py_buffer * view, int flags)
+{
+	// the buffer is writable
+	invalidateTrackedAlleles(self->ob_owner);
+	return array_getbuffer_template<GenoIterator>(self, view, flags);
+}
+
+PyBufferProcs array_as_buffer = {
+	(getbufferproc)array_getbuffer,
+	(releasebufferproc)0
+};
+
 PyObject * array_new(PyTypeObject * type, PyObject * args, PyObject * kwds)
 {
 	return array_new_template<GenoIterator>(type, args, kwds);
@@ -1023,7 +1170,7 @@ PyTypeObject Arraytype = {
 	0,                                          /* tp_str */
 	PyObject_GenericGetAttr,                    /* tp_getattro */
 	0,                                          /* tp_setattro */
-	0,                                          /* tp_as_buffer*/
+	&array_as_buffer,                            /* tp_as_buffer*/
 	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,   /* tp_flags */
 	arraytype_doc,                              /* tp_doc */
 	0,                                          /* tp_traverse */
@@ -1221,6 +1368,17 @@ PyMappingMethods array_as_mapping_lineage = {
 	(objobjargproc)array_ass_subscr_lineage
 };
 
+int
+array_getbuffer_lineage(arrayobject_lineage * self, Py_buffer * view, int flags)
+{
+	return array_getbuffer_template<LineageIterator>(self, view, flags);
+}
+
+PyBufferProcs array_as_buffer_lineage = {
+	(getbufferproc)array_getbuffer_lineage,
+	(releasebufferproc)0
+};
+
 PyObject * array_new_lineage(PyTypeObject * type, PyObject * args, PyObject * kwds)
 {
 	return array_new_template<LineageIterator>(type, args, kwds);
@@ -1273,7 +1431,7 @@ PyTypeObject LineageArraytype = {
 	0,                                          /* tp_str */
 	PyObject_GenericGetAttr,                    /* tp_getattro */
 	0,                                          /* tp_setattro */
-	0,                                          /* tp_as_buffer*/
+	&array_as_buffer_lineage,                            /* tp_as_buffer*/
 	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,   /* tp_flags */
 	arraytype_doc_lineage,                              /* tp_doc */
 	0,                                          /* tp_traverse */
@@ -1517,6 +1675,9 @@ int initCustomizedTypes(PyObject * m)
 	Py_SET_TYPE(&Arraytype, &PyType_Type);
 	if (PyType_Ready(&Arraytype) < 0)
 		return -1;
+	Py_SET_TYPE(&InfoArraytype, &PyType_Type);
+	if (PyType_Ready(&InfoArraytype) < 0)
+		return -1;
 	//
 	Py_SET_TYPE(&defdict_type, &PyType_Type);
 	defdict_type.tp_base = &PyDict_Type;
@@ -1524,6 +1685,9 @@ int initCustomizedTypes(PyObject * m)
 	Py_TYPE(&Arraytype) = &PyType_Type;
 	if (PyType_Ready(&Arraytype) < 0)
 		return -1;
+	Py_TYPE(&InfoArraytype) = &PyType_Type;
+	if (PyType_Ready(&InfoArraytype) < 0)
+		return -1;
 	//
 	Py_TYPE(&defdict_type) = &PyType_Type;
 	defdict_type.tp_base = &PyDict_Type;
@@ -1538,3 +1702,27 @@ int initCustomizedTypes(PyObject * m)
 
 
 #endif
+
+
+/// CPPONLY let \e view, an array or a memoryview of information fields
+/// returned by a member function of \e owner, keep \e owner alive because it
+/// refers to memory of \e owner. Other objects are returned unchanged.
+PyObject * setViewOwner(PyObject * view, PyObject * owner)
+{
+	if (view == NULL || owner == NULL)
+		return view;
+
+	PyObject ** slot = NULL;
+	if (is_carrayobject(view))
+		slot = &((arrayobject *)view)->ob_owner;
+	else if (is_carrayobject_lineage(view))
+		slot = &((arrayobject_lineage *)view)->ob_owner;
+	else if (PyMemoryView_Check(view) && PyMemoryView_GET_BASE(view) != NULL &&
+	         Py_TYPE(PyMemoryView_GET_BASE(view)) == &InfoArraytype)
+		slot = &((infoarrayobject *)PyMemoryView_GET_BASE(view))->ob_owner;
+	if (slot != NULL && *slot == NULL) {
+		Py_INCREF(owner);
+		*slot = owner;
+	}
+	return view;
+}
@@ -402,7 +402,11 @@ void GenoStruTrait::setGenoStructure(const GenoStructure & rhs)
 			return;
 		}
 	}
-	// no zero-referenced structure
+	// no zero-referenced structure. Reserve space for all structures so that
+	// existing structures are never relocated while being read by populations
+	// that are saved in the background.
+	if (s_genoStruRepository.capacity() < MaxTraitIndex)
+		s_genoStruRepository.reserve(MaxTraitIndex);
 	s_genoStruRepository.push_back(rhs);
 	DBG_DO(DBG_POPULATION, cerr << "Adding an geno structure. (tot size: "
 		                        << s_genoStruRepository.size() << ")" << endl);
@@ -885,9 +885,8 @@ private:
 	TraitIndexType m_genoStruIdx;
 
 	/// glocal genotypic strcuture repository
-	/// only unique structure will be saved
-	/// store pointers instead of object to avoid relocation of
-	/// objects themselves by vector
+	/// only unique structure will be saved. Space for all structures is
+	/// reserved to avoid relocation of objects themselves by vector
 	static vector<GenoStructure> s_genoStruRepository;
 };
 }
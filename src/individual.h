@@ -1227,12 +1227,9 @@ public:
 			m_chromType = AUTOSOME;
 		//
 		if (m_chromType == CHROMOSOME_Y) {
-			if (m_it->sex() == FEMALE) {
-				while (m_it.valid())
-					if ((++m_it)->sex() == MALE)
-						break;
-				m_valid = m_it.valid();
-			}
+			while (m_it.valid() && m_it->sex() == FEMALE)
+				++m_it;
+			m_valid = m_it.valid();
 			m_p = 1;
 		}
 	}
@@ -1563,12 +1560,9 @@ public:
 			m_chromType = AUTOSOME;
 		//
 		if (m_chromType == CHROMOSOME_Y) {
-			if (m_it->sex() == FEMALE) {
-				while (m_it.valid())
-					if ((++m_it)->sex() == MALE)
-						break;
-				m_valid = m_it.valid();
-			}
+			while (m_it.valid() && m_it->sex() == FEMALE)
+				++m_it;
+			m_valid = m_it.valid();
 			m_p = 1;
 		}
 	}
@@ -47,6 +47,9 @@ bool InitSex::apply(Population & pop) const
 {
 	const subPopList subPops = applicableSubPops(pop);
 
+	// alleles on sex chromosomes are counted according to sex
+	pop.trackedAlleles().invalidate();
+
 	size_t idx = 0;
 	subPopList::const_iterator sp = subPops.begin();
 	subPopList::const_iterator sp_end = subPops.end();
@@ -272,6 +275,7 @@ bool InitGenotype::apply(Population & pop) const
 		for (size_t i = 0 ; i < pop.ploidy(); ++i)
 			ploidy.push_back(i);
 
+	pop.trackedAlleles().invalidate();
 	pop.syncIndPointers();
 
 	subPopList::const_iterator sp = subPops.begin();
@@ -0,0 +1,244 @@
+/**
+ *  $File: mapped_allocator.h $
+ *  $LastChangedDate$
+ *  $Rev$
+ *
+ *  This file is part of simuPOP, a forward-time population genetics
+ *  simulation environment. Please visit http://simupop.sourceforge.net
+ *  for details.
+ *
+ *  Copyright (C) 2004 - 2010 Bo Peng (bpeng@mdanderson.org)
+ *
+ *  This program is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 3 of the License, or
+ *  (at your option) any later version.
+ *
+ *  This program is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with this program. If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef _MAPPED_ALLOCATOR_H
+#define _MAPPED_ALLOCATOR_H
+
+#include <cstddef>
+#include <new>
+#if __cplusplus >= 201103L
+#  include <type_traits>
+#endif
+
+namespace simuPOP {
+
+/** A region of file that is mapped to memory by \c mapFileRegion.
+ */
+struct MappedRegion
+{
+	MappedRegion() : ptr(NULL), size(0), base(NULL), length(0), device(0), inode(0)
+	{
+	}
+
+
+	/// start and size (in bytes) of the requested region
+	void * ptr;
+	size_t size;
+	/// start and length of the mapped pages
+	void * base;
+	size_t length;
+	/// the file that is mapped
+	unsigned long device;
+	unsigned long inode;
+};
+
+/** Map \e size bytes of file \e filename from \e offset to memory and
+ *  save the mapping to \e region. Pages are mapped privately so that
+ *  changes to the memory are not written back to the file. Pages are read
+ *  from the file when they are first accessed, so a process that accesses a
+ *  page after the file is truncated receives a \c SIGBUS signal. Return
+ *  \c false if the file cannot be mapped.
+ */
+bool mapFileRegion(const char * filename, size_t offset, size_t size, MappedRegion & region);
+
+/// Unmap \e region that is mapped by \c mapFileRegion.
+void unmapFileRegion(const MappedRegion & region);
+
+/// Return \c true if \e region is mapped from file \e filename.
+bool isMappedFrom(const MappedRegion & region, const char * filename);
+
+
+/** An allocator that allocates memory from free store as std::allocator
+ *  except that it can adopt a region of file that is mapped to memory by
+ *  \c mapFileRegion. It is used only for genotypes of populations (type
+ *  \c vectorg) so that a population loaded with \c memoryMap=True can use
+ *  genotypes that are stored in a file without reading them into memory.
+ *  The mapped region is stored in the allocator and follows the memory of
+ *  the container when containers are swapped or moved. A copy of the
+ *  container allocates its own memory. An allocator without a mapped
+ *  region behaves exactly like \c std::allocator.
+ */
+template<typename T>
+class MappedAllocator
+{
+public:
+	typedef T value_type;
+	typedef T * pointer;
+	typedef const T * const_pointer;
+	typedef T & reference;
+	typedef const T & const_reference;
+	typedef std::size_t size_type;
+	typedef std::ptrdiff_t difference_type;
+
+#if __cplusplus >= 201103L
+	typedef std::true_type propagate_on_container_move_assignment;
+	typedef std::true_type propagate_on_container_swap;
+#endif
+
+	template<typename U>
+	struct rebind
+	{
+		typedef MappedAllocator<U> other;
+	};
+
+	MappedAllocator() : m_region(), m_pending(false), m_fresh(NULL)
+	{
+	}
+
+
+	/** An allocator that returns \e region for the next allocation of
+	 *  exactly the size of the region. Elements of the region keep the
+	 *  values in the file when they are constructed for the first time, so
+	 *  that their values are read from the file only when they are accessed.
+	 */
+	explicit MappedAllocator(const MappedRegion & region) :
+		m_region(region), m_pending(true), m_fresh(NULL)
+	{
+	}
+
+
+	template<typename U>
+	MappedAllocator(const MappedAllocator<U> &) : m_region(), m_pending(false), m_fresh(NULL)
+	{
+	}
+
+
+	/// a copy of a container allocates its own memory
+	MappedAllocator select_on_container_copy_construction() const
+	{
+		return MappedAllocator();
+	}
+
+
+	/// the region that is adopted by this allocator
+	const MappedRegion & region() const
+	{
+		return m_region;
+	}
+
+
+	pointer address(reference x) const
+	{
+		return &x;
+	}
+
+
+	const_pointer address(const_reference x) const
+	{
+		return &x;
+	}
+
+
+	size_type max_size() const
+	{
+		return static_cast<size_type>(-1) / sizeof(T);
+	}
+
+
+	pointer allocate(size_type n, const void * = 0)
+	{
+		if (m_pending && n * sizeof(T) == m_region.size) {
+			m_pending = false;
+			m_fresh = static_cast<char *>(m_region.ptr);
+			return static_cast<pointer>(m_region.ptr);
+		}
+		return static_cast<pointer>(::operator new(n * sizeof(T)));
+	}
+
+
+	void deallocate(pointer p, size_type n)
+	{
+		if (p == m_region.ptr && n * sizeof(T) == m_region.size && p != NULL) {
+			unmapFileRegion(m_region);
+			m_region = MappedRegion();
+			m_pending = false;
+			m_fresh = NULL;
+			return;
+		}
+		::operator delete(p);
+	}
+
+
+	template<typename U>
+	void construct(U * p)
+	{
+		// Elements of an adopted region that have never been constructed
+		// keep their values in the file. Elements are constructed in
+		// increasing order, so elements before m_fresh have been constructed
+		// and are value-initialized again after they are destroyed.
+		char * c = reinterpret_cast<char *>(p);
+		if (m_fresh != NULL && c >= m_fresh && c < static_cast<char *>(m_region.ptr) + m_region.size) {
+			m_fresh = c + sizeof(U);
+			return;
+		}
+		new(p) U();
+	}
+
+
+	template<typename U, typename V>
+	void construct(U * p, const V & val)
+	{
+		new(p) U(val);
+	}
+
+
+	template<typename U>
+	void destroy(U * p)
+	{
+		p->~U();
+	}
+
+
+private:
+	template<typename U, typename V>
+	friend bool operator==(const MappedAllocator<U> &, const MappedAllocator<V> &);
+
+	MappedRegion m_region;
+
+	// if m_region has not been adopted
+	bool m_pending;
+
+	// first element of the adopted region that has never been constructed
+	char * m_fresh;
+};
+
+// allocators can deallocate memory of each other unless one of them
+// owns a mapped region
+template<typename T, typename U>
+inline bool operator==(const MappedAllocator<T> & lhs, const MappedAllocator<U> & rhs)
+{
+	return lhs.m_region.ptr == rhs.m_region.ptr;
+}
+
+
+template<typename T, typename U>
+inline bool operator!=(const MappedAllocator<T> & lhs, const MappedAllocator<U> & rhs)
+{
+	return !(lhs == rhs);
+}
+
+
+}
+#endif
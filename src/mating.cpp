@@ -279,11 +279,6 @@ UINT OffspringGenerator::numOffspring(ssize_t gen)
 
 bool OffspringGenerator::parallelizable() const
 {
-#ifdef MUTANTALLELE
-	// mutant allele model cannot generate offspring in parallele
-	// due to the use of std::map
-	return false;
-#else
 	if (!m_sexModel->parallelizable())
 		return false;
 	if (!m_numOffModel->parallelizable())
@@ -296,7 +291,6 @@ bool OffspringGenerator::parallelizable() const
 			return false;
 	}
 	return true;
-#endif
 }
 
 Sex OffspringGenerator::getSex(UINT count)
@@ -727,13 +721,33 @@ ParentChooser::IndividualPair SequentialParentChooser::chooseParents()
 	}
 }
 
+// Draw an index from a weighted sampler. Indexes are drawn in batches of at
+// most 256 numbers, which are kept in a separate buffer for each thread
+// because parents can be chosen in parallel.
+static size_t drawFromBatch(WeightedSampler &sampler, vector<vectoru> &batches, size_t numCandidates)
+{
+#ifdef _OPENMP
+	vectoru &batch = batches[omp_get_thread_num()];
+#else
+	vectoru &batch = batches[0];
+#endif
+	if (batch.empty())
+	{
+		vectoru drawn = sampler.drawSamples(static_cast<ULONG>(std::min(numCandidates, static_cast<size_t>(256))));
+		batch.swap(drawn);
+	}
+	size_t idx = batch.back();
+	batch.pop_back();
+	return idx;
+}
+
 void RandomParentChooser::initialize(Population &pop, size_t sp)
 {
 	m_basePtr = pop.rawIndBegin();
 
 	m_index.clear();
 
-	m_selection = m_replacement && pop.hasInfoField(m_selectionField);
+	m_selection = pop.hasInfoField(m_selectionField);
 	size_t fit_id = m_selection ? pop.infoIdx(m_selectionField) : 0;
 	// In a virtual subpopulation, because m_begin + ... is **really** slow
 	// It is a good idea to cache IndIterators. This is however inefficient
@@ -783,7 +797,26 @@ void RandomParentChooser::initialize(Population &pop, size_t sp)
 	}
 
 	if (m_selection)
+	{
 		m_sampler.set(fitness.begin(), fitness.end());
+		if (!m_replacement)
+		{
+			// chosen parents are removed by setting their fitness to zero,
+			// which takes O(log(N)) time after the sampler is converted to
+			// a binary indexed tree.
+			m_size = 0;
+			for (size_t i = 0; i < fitness.size(); ++i)
+				if (fitness[i] > 0)
+					++m_size;
+			if (!fitness.empty())
+				m_sampler.useFenwickTree();
+		}
+		else
+		{
+			m_size = fitness.size();
+			m_drawn.assign(numThreads(), vectoru());
+		}
+	}
 	else
 	{
 		m_size = m_index.size();
@@ -791,7 +824,7 @@ void RandomParentChooser::initialize(Population &pop, size_t sp)
 			m_size = pop.subPopSize(sp);
 	}
 
-	if (!m_replacement)
+	if (!m_replacement && !m_selection)
 		getRNG().randomShuffle(m_index.begin(), m_index.end());
 
 	m_shift = pop.subPopBegin(sp);
@@ -805,6 +838,15 @@ ParentChooser::IndividualPair RandomParentChooser::chooseParents()
 	// choose a parent
 	if (!m_replacement)
 	{
+		if (m_selection)
+		{
+			if (m_size == 0)
+				throw RuntimeError("All parents have been chosen.");
+			size_t idx = m_sampler.draw();
+			m_sampler.update(idx, 0);
+			--m_size;
+			return IndividualPair(&*m_index[idx], (Individual *)(0));
+		}
 		if (m_index.empty())
 			throw RuntimeError("All parents have been chosen.");
 		Individual *ind = &*m_index.back();
@@ -816,14 +858,14 @@ ParentChooser::IndividualPair RandomParentChooser::chooseParents()
 	{
 		if (m_selection)
 			// basePtr points to the beginning of the population, not subpopulation
-			ind = &*(m_basePtr + m_shift + m_sampler.draw());
+			ind = &*(m_basePtr + m_shift + drawFromBatch(m_sampler, m_drawn, m_size));
 		else
 			ind = &*(m_basePtr + m_shift + getRNG().randInt(static_cast<ULONG>(m_size)));
 	}
 	else
 	{
 		if (m_selection)
-			ind = &*(m_index[m_sampler.draw()]);
+			ind = &*(m_index[drawFromBatch(m_sampler, m_drawn, m_size)]);
 		else
 			ind = &*(m_index[getRNG().randInt(static_cast<ULONG>(m_size))]);
 	}
@@ -890,6 +932,8 @@ void RandomParentsChooser::initialize(Population &pop, size_t subPop)
 	{
 		m_malesampler.set(m_fitness.begin(), m_fitness.begin() + m_numMale);
 		m_femalesampler.set(m_fitness.rbegin(), m_fitness.rbegin() + m_numFemale);
+		m_drawnMales.assign(numThreads(), vectoru());
+		m_drawnFemales.assign(numThreads(), vectoru());
 		DBG_DO(DBG_DEVEL, cerr << "Male and Female fitness " << m_fitness << endl);
 	}
 
@@ -929,8 +973,8 @@ ParentChooser::IndividualPair RandomParentsChooser::chooseParents()
 	if (m_selection)
 	{
 		// using weighted sampler.
-		dad = &**(m_index.begin() + m_malesampler.draw());
-		mom = &**(m_index.rbegin() + m_femalesampler.draw());
+		dad = &**(m_index.begin() + drawFromBatch(m_malesampler, m_drawnMales, m_numMale));
+		mom = &**(m_index.rbegin() + drawFromBatch(m_femalesampler, m_drawnFemales, m_numFemale));
 	}
 	else
 	{
@@ -1000,6 +1044,8 @@ void PolyParentsChooser::initialize(Population &pop, size_t subPop)
 	{
 		m_malesampler.set(m_maleFitness.begin(), m_maleFitness.end());
 		m_femalesampler.set(m_femaleFitness.begin(), m_femaleFitness.end());
+		m_drawnMales.assign(numThreads(), vectoru());
+		m_drawnFemales.assign(numThreads(), vectoru());
 		DBG_DO(DBG_DEVEL, cerr << "Male fitness " << m_maleFitness << endl);
 		DBG_DO(DBG_DEVEL, cerr << "Female fitness " << m_femaleFitness << endl);
 	}
@@ -1044,7 +1090,7 @@ ParentChooser::IndividualPair PolyParentsChooser::chooseParents()
 			throw RuntimeError("PolyParentsChooser fails because there is no male individual in a subpopulation.");
 
 		if (m_selection)
-			dad = &*(m_maleIndex[m_malesampler.draw()]);
+			dad = &*(m_maleIndex[drawFromBatch(m_malesampler, m_drawnMales, m_numMale)]);
 		else
 			dad = &*(m_maleIndex[getRNG().randInt(static_cast<ULONG>(m_numMale))]);
 
@@ -1066,7 +1112,7 @@ ParentChooser::IndividualPair PolyParentsChooser::chooseParents()
 			throw RuntimeError("PolyParentsChooser fails because there is no female individual in a subpopulation.");
 
 		if (m_selection)
-			mom = &*(m_femaleIndex[m_femalesampler.draw()]);
+			mom = &*(m_femaleIndex[drawFromBatch(m_femalesampler, m_drawnFemales, m_numFemale)]);
 		else
 			mom = &*(m_femaleIndex[getRNG().randInt(static_cast<ULONG>(m_numFemale))]);
 
@@ -1239,8 +1285,8 @@ void CombinedParentsChooser::finalize()
 }
 
 PyParentsChooser::PyParentsChooser(PyObject *pc)
-	: ParentChooser(), m_func(pc), m_popObj(NULL),
-	  m_generator(NULL)
+	: ParentChooser(), m_size(0), m_func(pc), m_popObj(NULL),
+	  m_generator(NULL), m_block(), m_blockWidth(1), m_blockIdx(0)
 {
 }
 
@@ -1254,9 +1300,7 @@ void PyParentsChooser::initialize(Population &pop, size_t sp)
 	DBG_FAILIF(pop.hasActivatedVirtualSubPop(sp), ValueError,
 			   "Python parent chooser can not be used in a virtual subpopulation.");
 
-#ifndef OPTIMIZED
 	m_size = pop.subPopSize(sp);
-#endif
 	m_begin = pop.indIterator(sp);
 
 	m_popObj = pyPopObj(static_cast<void *>(&pop));
@@ -1278,6 +1322,8 @@ void PyParentsChooser::initialize(Population &pop, size_t sp)
 	}
 	m_generator.set(m_func(args));
 	Py_DECREF(args);
+	m_block.clear();
+	m_blockIdx = 0;
 	m_initialized = true;
 }
 
@@ -1286,18 +1332,72 @@ ParentChooser::IndividualPair PyParentsChooser::chooseParents()
 	DBG_ASSERT(initialized(), SystemError,
 			   "Please initialize this parent chooser before using it");
 
-	PyObject *item = m_generator.next();
+	if (m_blockIdx == m_block.size())
+	{
+		PyObject *item = m_generator.next();
 
 #ifndef OPTIMIZED
-	if (item == NULL && debug(DBG_GENERAL))
-	{
-		PyErr_Print();
-		PyErr_Clear();
-	}
-	DBG_FAILIF(item == NULL, ValueError,
-			   "User-defined function yield invalid value.");
+		if (item == NULL && debug(DBG_GENERAL))
+		{
+			PyErr_Print();
+			PyErr_Clear();
+		}
+		DBG_FAILIF(item == NULL, ValueError,
+				   "User-defined function yield invalid value.");
 #endif
+		// bytes and strings support the buffer protocol but are not blocks
+		// of parents
+		if (PyBytes_Check(item) || PyByteArray_Check(item) || PyUnicode_Check(item))
+		{
+			Py_DECREF(item);
+			throw ValueError("User-defined function yield a string, which is not a valid parent or block of parents.");
+		}
+		bool isBlock = false;
+		if (!PyInt_Check(item) && !PyLong_Check(item))
+		{
+			// blocks of floating point numbers or negative indexes are rejected
+			try
+			{
+				isBlock = PyObj_As_NumBuffer(item, m_block, true, &m_blockWidth);
+			}
+			catch (...)
+			{
+				Py_DECREF(item);
+				throw;
+			}
+		}
+		if (!isBlock)
+			return parentsFromItem(item);
+		Py_DECREF(item);
+		m_blockIdx = 0;
+		// blocks are validated in optimized modules as well because invalid
+		// blocks would be read beyond their ends
+		if ((m_blockWidth != 1 && m_blockWidth != 2) || m_block.size() % m_blockWidth != 0)
+		{
+			m_block.clear();
+			throw ValueError("Blocks of parents should be arrays of indexes or of pairs of indexes.");
+		}
+		if (m_block.empty())
+			throw ValueError("User-defined function yield an empty block of parents.");
+		for (size_t i = 0; i < m_block.size(); ++i)
+		{
+			if (m_block[i] >= m_size)
+			{
+				size_t idx = m_block[i];
+				m_block.clear();
+				throw ValueError((boost::format("Returned parent index (%1%) is greater than subpopulation size %2%") % idx % m_size).str());
+			}
+		}
+	}
+	// parents from the current block, no Python object is involved
+	Individual *first = &*(m_begin + m_block[m_blockIdx++]);
+	if (m_blockWidth == 1)
+		return ParentChooser::IndividualPair(first, (Individual *)(0));
+	return ParentChooser::IndividualPair(first, &*(m_begin + m_block[m_blockIdx++]));
+}
 
+ParentChooser::IndividualPair PyParentsChooser::parentsFromItem(PyObject *item)
+{
 	if (PyInt_Check(item) || PyLong_Check(item))
 	{
 		long parent;
@@ -1412,15 +1512,25 @@ bool MatingScheme::prepareScratchPop(Population &pop, Population &scratch)
 	// this is not absolutely necessary but will reduce confusions
 	scratch.setVirtualSplitter(pop.virtualSplitter());
 	// the scratch population has the same generation and rep number as the parent population.
-	// The numbers might be used by during mating operator
-	scratch.setGen(pop.gen());
-	scratch.setRep(pop.rep());
+	// The numbers might be used by during mating operator. Because the
+	// numbers are also stored as population variables, the GIL is needed
+	// if replicates are evolved in multiple threads.
+	if (scratch.gen() != pop.gen() || scratch.rep() != pop.rep())
+	{
+		PyGILState_STATE gil = PyGILState_Ensure();
+		scratch.setGen(pop.gen());
+		scratch.setRep(pop.rep());
+		PyGILState_Release(gil);
+	}
 	scratch.clearInfo();
 #ifdef MUTANTALLELE
 	// for mutant allele, clearing all existing genotype will make subsequent
 	// copyChromosomes much faster ...
 	scratch.setGenotype(vectoru(1, 0));
 #endif
+	// alleles of offspring are counted during mating if they are tracked
+	scratch.trackedAlleles() = pop.trackedAlleles();
+	scratch.trackedAlleles().reset(scratch.numSubPop());
 	DBG_DO(DBG_SIMULATOR, cerr << "New subpop size " << scratch.subPopSizes() << endl);
 
 	DBG_FAILIF(scratch.numSubPop() != pop.numSubPop(),
@@ -1464,8 +1574,21 @@ string HomoMating::describe(bool format) const
 	return format ? formatDescription(desc) : desc;
 }
 
+#ifdef MUTANTALLELE
+// Threads can generate offspring in [begin, end) only if the mutants of each
+// offspring are stored in its own block of the genotype container. This is
+// the case if the block size of the container is the genotype size of an
+// individual, which populations use by default.
+static void useIndividualBlocks(RawIndIterator begin, RawIndIterator end)
+{
+	if (begin != end)
+		begin->genoBegin()().set_block_size(begin->genoSize());
+}
+
+#endif
+
 bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
-							RawIndIterator offBegin, RawIndIterator offEnd)
+							RawIndIterator offBegin, RawIndIterator offEnd, bool multiThreaded)
 {
 	// nothing to do.
 	if (offBegin == offEnd)
@@ -1480,10 +1603,21 @@ bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
 	// generate scratch.subPopSize(sp) individuals.
 	RawIndIterator it = offBegin;
 	// If the parent chooser is not parallelizable, or if openMP is not supported
-	// or if number of thread is set to 1, use the sequential method.
-	if (!m_ParentChooser->parallelizable() || numThreads() == 1 || !m_OffspringGenerator->parallelizable())
+	// or if number of thread is set to 1, use the sequential method. The
+	// sequential method is also used if replicates are being evolved in
+	// parallel.
+	bool sequential = !m_ParentChooser->parallelizable() || !multiThreaded || !m_OffspringGenerator->parallelizable();
+#ifdef _OPENMP
+	sequential = sequential || omp_in_parallel();
+#endif
+	// alleles of offspring are counted right after they are generated
+	TrackedAlleles & tracked = offPop.trackedAlleles();
+	bool trackAlleles = !tracked.empty();
+	if (sequential)
 	{
 		DBG_DO(DBG_MATING, cerr << "Mating is done in single-thread mode" << endl);
+		vectoru counts;
+		vectoru numOfSex;
 		while (it != offEnd)
 		{
 			Individual *dad = NULL;
@@ -1492,7 +1626,17 @@ bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
 			dad = parents.first;
 			mom = parents.second;
 
+			RawIndIterator first = it;
 			m_OffspringGenerator->generateOffspring(pop, offPop, dad, mom, it, offEnd);
+			if (trackAlleles)
+				tracked.count(first, it, counts, numOfSex);
+		}
+		// offspring of a subpopulation can be generated by several mating
+		// schemes in parallel (c.f. HeteroMating)
+		if (trackAlleles)
+		{
+#pragma omp critical
+			tracked.add(subPop, counts, numOfSex);
 		}
 	}
 	else
@@ -1503,15 +1647,21 @@ bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
 		size_t offPopSize = offEnd - offBegin;
 		ssize_t nBlocks = numThreads() * 2;
 		ssize_t numOffspring = m_OffspringGenerator->numOffspring(pop.gen());
+		size_t blockSize = (offPopSize / nBlocks / numOffspring) * numOffspring;
 		int except = 0;
 		string msg;
+		vector<vectoru> blockCounts(trackAlleles ? nBlocks : 0);
+		vector<vectoru> blockSex(trackAlleles ? nBlocks : 0);
+#ifdef MUTANTALLELE
+		useIndividualBlocks(offBegin, offEnd);
+#endif
 #pragma omp parallel for
 		for (int i = 0; i < nBlocks; i++)
 		{
 			try
 			{
-				RawIndIterator local_it = offBegin + i * (offPopSize / nBlocks / numOffspring) * numOffspring;
-				RawIndIterator local_offEnd = i == nBlocks - 1 ? offEnd : local_it + (offPopSize / nBlocks / numOffspring) * numOffspring;
+				RawIndIterator local_it = offBegin + i * blockSize;
+				RawIndIterator local_offEnd = i == nBlocks - 1 ? offEnd : local_it + blockSize;
 
 				while (local_it != local_offEnd)
 				{
@@ -1522,7 +1672,10 @@ bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
 					ParentChooser::IndividualPair const parents = m_ParentChooser->chooseParents();
 					dad = parents.first;
 					mom = parents.second;
+					RawIndIterator first = local_it;
 					m_OffspringGenerator->generateOffspring(pop, offPop, dad, mom, local_it, local_offEnd);
+					if (trackAlleles)
+						tracked.count(first, local_it, blockCounts[i], blockSex[i]);
 				}
 			}
 			catch (StopEvolution e)
@@ -1574,6 +1727,8 @@ bool HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop,
 			throw Exception(msg);
 		else if (except == -1)
 			throw Exception("Unexpected error from openMP parallel region");
+		for (size_t i = 0; i < blockCounts.size(); ++i)
+			tracked.add(subPop, blockCounts[i], blockSex[i]);
 #endif
 	}
 	m_ParentChooser->finalize();
@@ -1610,15 +1765,20 @@ bool PedigreeMating::mate(Population &pop, Population &scratch)
 	opList::const_iterator iopEnd = m_transmitters.end();
 	for (; iop != iopEnd; ++iop)
 		(*iop)->initializeIfNeeded(*pop.rawIndBegin());
+#ifdef MUTANTALLELE
+	useIndividualBlocks(scratch.rawIndBegin(), scratch.rawIndEnd());
+#endif
 
 #pragma omp parallel private(it, it_end) if (numThreads() > 1 && parallelizable())
 	{
 #ifdef _OPENMP
+		// the region runs in a single thread if the operators are not parallelizable
 		size_t id = omp_get_thread_num();
+		size_t nThreads = omp_get_num_threads();
 		size_t offPopSize = scratch.rawIndEnd() - scratch.rawIndBegin();
-		it = scratch.rawIndBegin() + id * (offPopSize / numThreads());
-		it_end = id == numThreads() - 1 ? scratch.rawIndEnd() : it + (offPopSize / numThreads());
-		size_t i = id * (offPopSize / numThreads());
+		it = scratch.rawIndBegin() + id * (offPopSize / nThreads);
+		it_end = id == nThreads - 1 ? scratch.rawIndEnd() : it + (offPopSize / nThreads);
+		size_t i = id * (offPopSize / nThreads);
 #else
 		it = scratch.rawIndBegin();
 		it_end = scratch.rawIndEnd();
@@ -1686,6 +1846,12 @@ string PedigreeMating::describe(bool format) const
 	return format ? formatDescription(desc) : desc;
 }
 
+bool HomoMating::replicateParallelizable() const
+{
+	return !m_subPopSize.func().isValid() && m_ParentChooser->parallelizable() &&
+		   m_OffspringGenerator->parallelizable();
+}
+
 bool PedigreeMating::parallelizable() const
 {
 	opList::const_iterator iop = m_transmitters.begin();
@@ -1757,6 +1923,12 @@ HeteroMating::~HeteroMating()
 
 	for (; it != it_end; ++it)
 		delete *it;
+	for (size_t t = 0; t < m_threadSchemes.size(); ++t)
+	{
+		for (size_t i = 0; i < m_threadSchemes[t].size(); ++i)
+			delete m_threadSchemes[t][i];
+		delete m_threadRNGs[t];
+	}
 }
 
 HeteroMating::HeteroMating(const HeteroMating &rhs) : MatingScheme(rhs), m_shuffleOffspring(rhs.m_shuffleOffspring), m_weightBy(rhs.m_weightBy)
@@ -1773,15 +1945,78 @@ HeteroMating::HeteroMating(const HeteroMating &rhs) : MatingScheme(rhs), m_shuff
 	}
 }
 
+// Populate offspring in [offBegin, offEnd) of subpopulation subPop in the
+// current thread, using random number generator rng, which should have been
+// seeded for the task. The random number generator of the current thread is
+// restored afterwards.
+static bool mateWithRNG(HomoMating &scheme, Population &pop, Population &scratch, size_t subPop,
+						RawIndIterator offBegin, RawIndIterator offEnd, RNG &rng)
+{
+	bool res = false;
+
+	getRNG().swap(rng);
+	try
+	{
+		res = scheme.mateSubPop(pop, scratch, subPop, offBegin, offEnd, false);
+	}
+	catch (...)
+	{
+		getRNG().swap(rng);
+		throw;
+	}
+	getRNG().swap(rng);
+	return res;
+}
+
+void HeteroMating::prepareThreadSchemes()
+{
+	size_t nThreads = numThreads();
+
+	if (m_threadSchemes.size() < nThreads)
+	{
+		m_threadSchemes.resize(nThreads);
+		m_threadRNGs.resize(nThreads, NULL);
+	}
+	for (size_t t = 0; t < nThreads; ++t)
+	{
+		if (m_threadSchemes[t].empty())
+			for (size_t i = 0; i < m_matingSchemes.size(); ++i)
+				m_threadSchemes[t].push_back(dynamic_cast<HomoMating *>(m_matingSchemes[i]->clone()));
+		// the type of random number generator might have been changed
+		if (m_threadRNGs[t] == NULL || string(m_threadRNGs[t]->name()) != getRNG().name())
+		{
+			delete m_threadRNGs[t];
+			m_threadRNGs[t] = new RNG(getRNG().name(), 1);
+		}
+	}
+}
+
 bool HeteroMating::mate(Population &pop, Population &scratch)
 {
 	// scrtach will have the right structure.
 	if (!prepareScratchPop(pop, scratch))
 		return false;
 
+	// With multiple threads, each mating scheme in each subpopulation is a
+	// task that is executed after offspring of all tasks are assigned.
+	// Tasks that do not involve virtual subpopulations or Python functions
+	// are executed in parallel if there are more than one of them.
+	bool useTasks = numThreads() > 1;
+#ifdef _OPENMP
+	useTasks = useTasks && !omp_in_parallel();
+#endif
+	vectormating taskSchemes;
+	vectoru taskSchemeIdx;
+	subPopList taskSubPops;
+	vector<RawIndIterator> taskBegin;
+	vector<RawIndIterator> taskEnd;
+	vectoru taskIdx;
+	vectoru shuffledSubPops;
+
 	for (size_t sp = 0; sp < static_cast<size_t>(pop.numSubPop()); ++sp)
 	{
 		vectormating m;
+		vectoru mIdx;   // index of mating schemes
 		vectorf w_pos;  // positive weights
 		vectorf w_neg;  // negative weights
 		subPopList sps; // each subpopulations
@@ -1799,6 +2034,7 @@ bool HeteroMating::mate(Population &pop, Population &scratch)
 					continue;
 				// if it is used for this subpop, or all subpopulations
 				m.push_back(*it);
+				mIdx.push_back(it - m_matingSchemes.begin());
 				sps.push_back(*vsp);
 				double w = (*it)->weight();
 				// less than zero...
@@ -1932,6 +2168,17 @@ bool HeteroMating::mate(Population &pop, Population &scratch)
 									 "of another mating scheme.");
 			if (*itSize == 0)
 				continue;
+			if (useTasks)
+			{
+				taskSchemes.push_back(m[idx]);
+				taskSchemeIdx.push_back(mIdx[idx]);
+				taskSubPops.push_back(sps[idx]);
+				taskBegin.push_back(ind);
+				taskEnd.push_back(ind + *itSize);
+				taskIdx.push_back(idx);
+				ind += *itSize;
+				continue;
+			}
 			if (sps[idx].isVirtual())
 				pop.activateVirtualSubPop(sps[idx]);
 			// if previous mating scheme works on a virtual subpop,
@@ -1959,17 +2206,186 @@ bool HeteroMating::mate(Population &pop, Population &scratch)
 			pop.deactivateVirtualSubPop(sp);
 		// if more than two mating schemes working on the same subpopulation,
 		// it is better to shuffle offspring afterwards,
-		if (m.size() > 1 && m_shuffleOffspring)
+		if (m.size() > 1 && m_shuffleOffspring && useTasks)
+			shuffledSubPops.push_back(sp);
+		else if (m.size() > 1 && m_shuffleOffspring)
 		{
 			DBG_DO(DBG_MATING, cerr << "Random shuffle individuals in the offspring generation." << endl);
 			getRNG().randomShuffle(scratch.rawIndBegin(sp), scratch.rawIndEnd(sp));
 			scratch.setIndOrdered(false);
 		}
 	} // each subpopulation.
+
+	if (useTasks)
+	{
+		size_t numTasks = taskSchemes.size();
+		vector<bool> inThread(numTasks);
+		size_t numInThread = 0;
+		for (size_t i = 0; i < numTasks; ++i)
+		{
+			inThread[i] = !taskSubPops[i].isVirtual() && taskSchemes[i]->replicateParallelizable();
+			numInThread += inThread[i];
+		}
+		if (numInThread <= 1)
+		{
+			// nothing to run in parallel, so tasks are executed in order as
+			// without tasks, and offspring of a subpopulation can still be
+			// produced in multiple threads.
+			for (size_t i = 0; i < numTasks; ++i)
+			{
+				size_t sp = taskSubPops[i].subPop();
+				if (taskSubPops[i].isVirtual())
+					pop.activateVirtualSubPop(taskSubPops[i]);
+				try
+				{
+					if (!taskSchemes[i]->mateSubPop(pop, scratch, sp, taskBegin[i], taskEnd[i]))
+						return false;
+				}
+				catch (Exception &)
+				{
+					cerr << "Mating scheme " << taskIdx[i] << " in subpopulation " << sp << " failed to produce "
+						 << (taskEnd[i] - taskBegin[i]) << " offspring." << endl;
+					throw;
+				}
+				if (pop.hasActivatedVirtualSubPop(sp))
+					pop.deactivateVirtualSubPop(sp);
+				// shuffle offspring after the last task of a subpopulation
+				if ((i + 1 == numTasks || taskSubPops[i + 1].subPop() != sp) &&
+					std::find(shuffledSubPops.begin(), shuffledSubPops.end(), sp) != shuffledSubPops.end())
+				{
+					DBG_DO(DBG_MATING, cerr << "Random shuffle individuals in the offspring generation." << endl);
+					getRNG().randomShuffle(scratch.rawIndBegin(sp), scratch.rawIndEnd(sp));
+					scratch.setIndOrdered(false);
+				}
+			}
+			submitScratch(pop, scratch);
+			return true;
+		}
+		// each task uses its own random number stream so that offspring
+		// do not depend on the number of threads.
+		vectoru seeds(numTasks);
+		for (size_t i = 0; i < numTasks; ++i)
+			seeds[i] = getRNG().randInt(MaxRandomNumber) + 1;
+		// clones of mating schemes and random number generators are kept
+		// across generations for each thread
+		prepareThreadSchemes();
+		// tasks that activate virtual subpopulations or call Python
+		// functions are executed in the main thread
+		for (size_t i = 0; i < numTasks; ++i)
+		{
+			if (inThread[i])
+				continue;
+			size_t sp = taskSubPops[i].subPop();
+			pop.activateVirtualSubPop(taskSubPops[i]);
+			RNG &rng = *m_threadRNGs[0];
+			rng.set(NULL, seeds[i]);
+			try
+			{
+				if (!mateWithRNG(*taskSchemes[i], pop, scratch, sp, taskBegin[i], taskEnd[i], rng))
+					return false;
+			}
+			catch (Exception &)
+			{
+				cerr << "Mating scheme " << taskIdx[i] << " in subpopulation " << sp << " failed to produce "
+					 << (taskEnd[i] - taskBegin[i]) << " offspring." << endl;
+				throw;
+			}
+			pop.deactivateVirtualSubPop(sp);
+		}
+		// other tasks are executed in parallel, each with the copy of the
+		// mating scheme of its thread because a scheme can be used by
+		// several tasks.
+		vectori except(numTasks, 0);
+		vectorstr msg(numTasks);
+#ifdef MUTANTALLELE
+		useIndividualBlocks(scratch.rawIndBegin(), scratch.rawIndEnd());
+#endif
+#pragma omp parallel for schedule(dynamic)
+		for (int i = 0; i < static_cast<int>(numTasks); ++i)
+		{
+			if (!inThread[i])
+				continue;
+#ifdef _OPENMP
+			size_t t = omp_get_thread_num();
+#else
+			size_t t = 0;
+#endif
+			HomoMating *scheme = m_threadSchemes[t][taskSchemeIdx[i]];
+			RNG &rng = *m_threadRNGs[t];
+			rng.set(NULL, seeds[i]);
+			try
+			{
+				mateWithRNG(*scheme, pop, scratch, taskSubPops[i].subPop(), taskBegin[i], taskEnd[i], rng);
+			}
+			catch (StopEvolution e)
+			{
+				except[i] = 1;
+				msg[i] = e.message();
+			}
+			catch (ValueError e)
+			{
+				except[i] = 2;
+				msg[i] = e.message();
+			}
+			catch (RuntimeError e)
+			{
+				except[i] = 3;
+				msg[i] = e.message();
+			}
+			catch (Exception e)
+			{
+				except[i] = 4;
+				msg[i] = e.message();
+			}
+			catch (...)
+			{
+				except[i] = -1;
+			}
+		}
+		for (size_t i = 0; i < numTasks; ++i)
+		{
+			if (except[i] == 0)
+				continue;
+			cerr << "Mating scheme " << taskIdx[i] << " in subpopulation " << taskSubPops[i].subPop()
+				 << " failed to produce " << (taskEnd[i] - taskBegin[i]) << " offspring." << endl;
+			if (except[i] == 1)
+				throw StopEvolution(msg[i]);
+			else if (except[i] == 2)
+				throw ValueError(msg[i]);
+			else if (except[i] == 3)
+				throw RuntimeError(msg[i]);
+			else if (except[i] == 4)
+				throw Exception(msg[i]);
+			else
+				throw Exception("Unexpected error from openMP parallel region");
+		}
+		for (size_t i = 0; i < shuffledSubPops.size(); ++i)
+		{
+			size_t sp = shuffledSubPops[i];
+			DBG_DO(DBG_MATING, cerr << "Random shuffle individuals in the offspring generation." << endl);
+			getRNG().randomShuffle(scratch.rawIndBegin(sp), scratch.rawIndEnd(sp));
+			scratch.setIndOrdered(false);
+		}
+	}
 	submitScratch(pop, scratch);
 	return true;
 }
 
+bool HeteroMating::replicateParallelizable() const
+{
+	if (m_subPopSize.func().isValid())
+		return false;
+
+	vectormating::const_iterator it = m_matingSchemes.begin();
+	vectormating::const_iterator it_end = m_matingSchemes.end();
+	for (; it != it_end; ++it)
+	{
+		if (!(*it)->replicateParallelizable())
+			return false;
+	}
+	return true;
+}
+
 ConditionalMating::ConditionalMating(PyObject *cond, const MatingScheme &ifMatingScheme,
 									 const MatingScheme &elseMatingScheme)
 #if PY_VERSION_HEX >= 0x03000000
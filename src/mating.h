@@ -911,7 +911,10 @@ private:
  *  individuals will be chosen at a probability proportional to his or her
  *  fitness value. If parents are chosen without replacement, a parent can be
  *  chosen only once. An \c RuntimeError will be raised if all parents are
- *  exhausted. Natural selection is disabled in the without-replacement case.
+ *  exhausted. If parents are chosen without replacement and fitness values
+ *  are assigned, parents are chosen one by one with probabilities that are
+ *  proportional to the fitness values of the remaining individuals, and
+ *  individuals with zero fitness are never chosen.
  */
 class RandomParentChooser : public ParentChooser
 {
@@ -977,6 +980,8 @@ protected:
 	vector<RawIndIterator> m_chosen;
 	/// accumulative fitness
 	WeightedSampler m_sampler;
+	/// parents drawn from m_sampler, one batch for each thread
+	vector<vectoru> m_drawn;
 	/// individuals to choose
 	size_t m_size;
 	/// index to the subpopulation
@@ -1063,6 +1068,10 @@ private:
 	// weighted sampler
 	WeightedSampler m_malesampler;
 	WeightedSampler m_femalesampler;
+
+	/// parents drawn from the samplers, one batch for each thread
+	vector<vectoru> m_drawnMales;
+	vector<vectoru> m_drawnFemales;
 };
 
 
@@ -1166,6 +1175,10 @@ private:
 	// weighted sampler
 	WeightedSampler m_malesampler;
 	WeightedSampler m_femalesampler;
+
+	/// parents drawn from the samplers, one batch for each thread
+	vector<vectoru> m_drawnMales;
+	vector<vectoru> m_drawnFemales;
 };
 
 
@@ -1336,6 +1349,13 @@ private:
  *  for each subpopulation and retrieves parents repeatedly using the iterator
  *  interface of the generator function.
  *
+ *  To avoid calling the generator for each mating event, the generator can
+ *  also yield blocks of parents as arrays of integers (e.g. a numpy array or
+ *  a Python \c array). A one-dimensional array is used as a list of single
+ *  parents, and a two-dimensional array with two columns is used as a list
+ *  of (father, mother) pairs. Parents in a block are used in order before the
+ *  generator is called again.
+ *
  *  This parent chooser does not support virtual subpopulation directly.
  *  However, because virtual subpopulations are defined in the passed parental
  *  population, it is easy to return parents from a particular virtual
@@ -1355,8 +1375,9 @@ public:
 
 	/// CPPONLY
 	PyParentsChooser(const PyParentsChooser & rhs)
-		: ParentChooser(rhs), m_func(rhs.m_func),
-		m_popObj(NULL), m_generator(NULL)
+		: ParentChooser(rhs), m_size(0), m_func(rhs.m_func),
+		m_popObj(NULL), m_generator(NULL), m_block(),
+		m_blockWidth(1), m_blockIdx(0)
 	{
 		m_initialized = false;
 	}
@@ -1406,14 +1427,22 @@ public:
 	IndividualPair chooseParents();
 
 private:
-#ifndef OPTIMIZED
+	// parents from a single item (not a block) yielded by the generator
+	IndividualPair parentsFromItem(PyObject * item);
+
 	size_t m_size;
-#endif
 	IndIterator m_begin;
 
 	pyFunc m_func;
 	PyObject * m_popObj;
 	pyGenerator m_generator;
+
+	/// indexes of parents in the last block yielded by the generator
+	vectoru m_block;
+	/// number of parents of each mating event in m_block
+	size_t m_blockWidth;
+	/// index of the next parent in m_block
+	size_t m_blockIdx;
 };
 
 
@@ -1501,6 +1530,17 @@ public:
 	}
 
 
+	/** CPPONLY
+	 *  Return \c true if clones of this mating scheme can populate offspring
+	 *  generations of different populations at the same time, which requires
+	 *  that no Python function is called during mating.
+	 */
+	virtual bool replicateParallelizable() const
+	{
+		return false;
+	}
+
+
 protected:
 	/** Specify subpopulation size of the offspring generation. Can be a
 	 *  list of subpopulation sizes or a function.
@@ -1585,7 +1625,20 @@ public:
 
 	/// CPPONLY
 	virtual bool mateSubPop(Population & pop, Population & offPop, size_t subPop,
-		RawIndIterator offBegin, RawIndIterator offEnd);
+		RawIndIterator offBegin, RawIndIterator offEnd)
+	{
+		return mateSubPop(pop, offPop, subPop, offBegin, offEnd, numThreads() > 1);
+	}
+
+
+	/** CPPONLY Populate offspring in [\e offBegin, \e offEnd). Offspring are
+	 *  generated in a single thread if \e multiThreaded is \c false.
+	 */
+	bool mateSubPop(Population & pop, Population & offPop, size_t subPop,
+		RawIndIterator offBegin, RawIndIterator offEnd, bool multiThreaded);
+
+	/// CPPONLY
+	bool replicateParallelizable() const;
 
 private:
 	ParentChooser * m_ParentChooser;
@@ -1724,6 +1777,13 @@ public:
 	 *  offspring produced by these mating schemes are shuffled randomly. If this
 	 *  is not desired, you can turn off offspring shuffling by setting parameter
 	 *  \e shuffleOffspring to \c False.
+	 *
+	 *  If multiple threads are used, each mating scheme in each subpopulation
+	 *  produces its offspring with its own random number stream, and mating
+	 *  schemes that are applied to non-virtual subpopulations and do not call
+	 *  any Python function are executed in parallel. Offspring generations
+	 *  therefore do not depend on the number of threads (if more than one
+	 *  thread is used).
 	 */
 	HeteroMating(const vectormating & matingSchemes,
 		const uintListFunc & subPopSize = uintListFunc(),
@@ -1750,12 +1810,23 @@ public:
 	 */
 	bool mate(Population & pop, Population & scratch);
 
+	/// CPPONLY
+	bool replicateParallelizable() const;
+
 private:
+	/// clone mating schemes and create random number generators for threads
+	void prepareThreadSchemes();
+
 	vectormating m_matingSchemes;
 	///
 	bool m_shuffleOffspring;
 	///
 	SexChoice m_weightBy;
+
+	/// clones of mating schemes used by each thread to mate subpopulations
+	/// in parallel, and random number generators of these tasks.
+	vector<vectormating> m_threadSchemes;
+	vector<RNG *> m_threadRNGs;
 };
 
 
@@ -28,11 +28,123 @@
 
 #ifdef MUTANTALLELE
 
-#  include <map>
+#  include <vector>
+#  include <utility>
+#  include <algorithm>
 #  include <iostream>
 
 namespace simuPOP {
 
+/** CPPONLY
+ *  Iterator over the mutants stored in the blocks of a vectorm. The
+ *  iterator points to the \e pos-th mutant of the \e block-th block. When
+ *  it is moved past the last mutant of a block, it is not moved to the
+ *  next non-empty block right away because this could scan a long list of
+ *  empty blocks. The iterator is instead moved over empty blocks when it is
+ *  compared to an iterator in a later block, so an iterator can be
+ *  dereferenced only after it has been compared with the end of its range.
+ *  In this way an iterator over the genotype of an individual never reads
+ *  the blocks of other individuals.
+ */
+template <typename Blocks, typename Value>
+class vectorm_val_iterator
+{
+	template <typename B, typename V> friend class vectorm_val_iterator;
+
+public:
+	vectorm_val_iterator() : m_blocks(NULL), m_block(0), m_pos(0)
+	{
+	}
+
+
+	vectorm_val_iterator(Blocks * blocks, size_t block, size_t pos) :
+		m_blocks(blocks), m_block(block), m_pos(pos)
+	{
+	}
+
+
+	// conversion from val_iterator to const_val_iterator
+	template <typename B, typename V>
+	vectorm_val_iterator(const vectorm_val_iterator<B, V> & iter) :
+		m_blocks(iter.m_blocks), m_block(iter.m_block), m_pos(iter.m_pos)
+	{
+	}
+
+
+	Value & operator*() const
+	{
+		return (*m_blocks)[m_block][m_pos];
+	}
+
+
+	Value * operator->() const
+	{
+		return &(*m_blocks)[m_block][m_pos];
+	}
+
+
+	vectorm_val_iterator & operator++()
+	{
+		++m_pos;
+		return *this;
+	}
+
+
+	vectorm_val_iterator operator++(int)
+	{
+		vectorm_val_iterator orig = *this;
+
+		++m_pos;
+		return orig;
+	}
+
+
+	template <typename B, typename V>
+	bool operator==(const vectorm_val_iterator<B, V> & iter) const
+	{
+		if (m_block < iter.m_block)
+			skip_to(iter.m_block);
+		else if (iter.m_block < m_block)
+			iter.skip_to(m_block);
+		return m_block == iter.m_block && m_pos == iter.m_pos;
+	}
+
+
+	template <typename B, typename V>
+	bool operator!=(const vectorm_val_iterator<B, V> & iter) const
+	{
+		return !(*this == iter);
+	}
+
+
+private:
+	// move over exhausted blocks, but not beyond the given block
+	void skip_to(size_t block) const
+	{
+		while (m_block < block && m_pos >= (*m_blocks)[m_block].size()) {
+			++m_block;
+			m_pos = 0;
+		}
+	}
+
+
+	Blocks * m_blocks;
+	mutable size_t m_block;
+	mutable size_t m_pos;
+};
+
+
+/** CPPONLY
+ *  A sparse genotype vector that stores only non-zero alleles (mutants).
+ *  The index range of the vector is divided into blocks of blockSize
+ *  indexes, and the mutants of each block are stored as (index, allele)
+ *  pairs sorted by index in a vector. A population uses the size of the
+ *  genotype of an individual as block size so that each individual has
+ *  its own block, which makes copying and clearing a region a single
+ *  memory move inside a block, and allows different threads to write to
+ *  the genotypes of different individuals. A block size of zero stores
+ *  all mutants in a single block.
+ */
 class vectorm
 {
 public:
@@ -40,21 +152,25 @@ public:
 	typedef const Allele & const_reference;
 	typedef Allele * pointer;
 	typedef const Allele * const_pointer;
-	typedef std::map<size_t, Allele> storage;
-	typedef storage::iterator val_iterator;
-	typedef storage::const_iterator const_val_iterator;
+	typedef std::pair<size_t, Allele> mutant_type;
+	typedef std::vector<mutant_type> block_type;
+	typedef std::vector<block_type> storage;
+	typedef vectorm_val_iterator<storage, mutant_type> val_iterator;
+	typedef vectorm_val_iterator<const storage, const mutant_type> const_val_iterator;
 
 	// Construction and destruction
 	//
-	// size:     the supposed real size, which is the boundary of indexes in m_data
+	// size:      the supposed real size, which is the boundary of indexes of mutants
+	// blockSize: number of indexes in each block, zero for a single block
 	//
-	inline vectorm (size_t size = 0) : m_size(size), m_data()
+	inline vectorm (size_t size = 0, size_t blockSize = 0) :
+		m_size(size), m_blockSize(blockSize), m_blocks(num_blocks(size, blockSize))
 	{
 	}
 
 
 	inline vectorm (const vectorm & v) :
-		m_size(v.m_size), m_data(v.m_data)
+		m_size(v.m_size), m_blockSize(v.m_blockSize), m_blocks(v.m_blocks)
 	{
 	}
 
@@ -66,26 +182,113 @@ public:
 	}
 
 
-	inline const storage & data() const
+	inline size_t block_size() const
 	{
-		return m_data;
+		return m_blockSize;
 	}
 
 
-	inline storage & data()
+	// number of stored mutants
+	inline size_t count() const
 	{
-		return m_data;
+		size_t cnt = 0;
+
+		for (storage::const_iterator it = m_blocks.begin(); it != m_blocks.end(); ++it)
+			cnt += it->size();
+		return cnt;
+	}
+
+
+	// redistribute mutants to blocks of a new size
+	void set_block_size(size_t blockSize)
+	{
+		if (blockSize == m_blockSize)
+			return;
+		storage blocks(num_blocks(m_size, blockSize));
+		for (storage::const_iterator it = m_blocks.begin(); it != m_blocks.end(); ++it)
+			for (block_type::const_iterator m = it->begin(); m != it->end(); ++m)
+				blocks[blockSize == 0 ? 0 : m->first / blockSize].push_back(*m);
+		m_blockSize = blockSize;
+		m_blocks.swap(blocks);
+	}
+
+
+	// the first mutant at or after index i
+	inline val_iterator lower_bound(size_t i)
+	{
+		size_t b = block_of(i);
+
+		return val_iterator(&m_blocks, b, b < m_blocks.size() ? position(b, i) : 0);
+	}
+
+
+	inline const_val_iterator lower_bound(size_t i) const
+	{
+		size_t b = block_of(i);
+
+		return const_val_iterator(&m_blocks, b, b < m_blocks.size() ? position(b, i) : 0);
+	}
+
+
+	inline const_reference value(size_t i) const
+	{
+		size_t b = block_of(i);
+
+		if (b >= m_blocks.size())
+			return zero_;
+		const block_type & block = m_blocks[b];
+		size_t pos = position(b, i);
+		return pos < block.size() && block[pos].first == i ? block[pos].second : zero_;
+	}
+
+
+	// set allele at index i, zero removes the mutant
+	inline void assign(size_t i, const_reference value)
+	{
+		DBG_FAILIF(i >= m_size, IndexError, "Index out of range of mutant vector");
+		block_type & block = m_blocks[block_of(i)];
+		block_type::iterator it = std::lower_bound(block.begin(), block.end(), i, index_less);
+		// if the element does not exist
+		if (it == block.end() || it->first != i) {
+			if (value != 0)
+				block.insert(it, mutant_type(i, value));
+			// if the element exists, but value is zero, remove it
+		} else if (value == 0)
+			block.erase(it);
+		// finally, update it directly
+		else
+			it->second = value;
+	}
+
+
+	// distance from index i to the next mutant, or to the end of the block of i
+	// if there is no more mutant in the block. Because the block of an individual
+	// ends with its genotype, this function does not read the genotype of other
+	// individuals.
+	inline size_t to_next(size_t i) const
+	{
+		size_t b = block_of(i);
+
+		if (b >= m_blocks.size())
+			return m_size - i;
+		const block_type & block = m_blocks[b];
+		size_t pos = position(b, i + 1);
+		return pos < block.size() ? block[pos].first - i : block_end(b) - i;
 	}
 
 
 	void validate() const
 	{
 #  ifndef OPTIMIZED
-		const_val_iterator it = m_data.begin();
-		const_val_iterator it_end = m_data.end();
-		for (; it != it_end; ++it) {
-			DBG_ASSERT(it->second != 0, RuntimeError,
-				(boost::format("Mutant with zero value is detected at location %1%") % it->first).str());
+		for (size_t b = 0; b < m_blocks.size(); ++b) {
+			const block_type & block = m_blocks[b];
+			for (size_t i = 0; i < block.size(); ++i) {
+				DBG_ASSERT(block[i].second != 0, RuntimeError,
+					(boost::format("Mutant with zero value is detected at location %1%") % block[i].first).str());
+				DBG_ASSERT(block[i].first >= block_begin(b) && block[i].first < block_end(b)
+					&& (i == 0 || block[i - 1].first < block[i].first), RuntimeError,
+					(boost::format("Mutant at location %1% is misplaced") % block[i].first).str());
+			}
 		}
 #  endif
 	}
@@ -95,23 +298,30 @@ public:
 	inline void resize(size_t size, bool preserve = true)
 	{
 		m_size = size;
-		if (preserve)
-			m_data.erase(m_data.upper_bound(size), m_data.end());
-		else
-			m_data.clear();
+		if (!preserve)
+			m_blocks.clear();
+		m_blocks.resize(num_blocks(size, m_blockSize));
+		if (preserve && !m_blocks.empty()) {
+			block_type & block = m_blocks.back();
+			block.erase(std::lower_bound(block.begin(), block.end(), size, index_less), block.end());
+		}
 	}
 
 
 	// Zeroing, but do not set size to zero
 	inline void clear()
 	{
-		m_data.clear();
+		for (storage::iterator it = m_blocks.begin(); it != m_blocks.end(); ++it)
+			it->clear();
 	}
 
 
 	inline void clear(size_t beg, size_t end)
 	{
-		m_data.erase(m_data.lower_bound(beg), m_data.lower_bound(end));
+		for (size_t b = block_of(beg); b < m_blocks.size() && block_begin(b) < end; ++b) {
+			block_type & block = m_blocks[b];
+			block.erase(block.begin() + position(b, beg), block.begin() + position(b, end));
+		}
 	}
 
 
@@ -120,7 +330,8 @@ public:
 	{
 		if (this != &v) {
 			m_size = v.m_size;
-			m_data = v.m_data;
+			m_blockSize = v.m_blockSize;
+			m_blocks = v.m_blocks;
 		}
 		return *this;
 	}
@@ -131,7 +342,8 @@ public:
 	{
 		if (this != &v) {
 			std::swap(m_size, v.m_size);
-			m_data.swap(v.m_data);
+			std::swap(m_blockSize, v.m_blockSize);
+			m_blocks.swap(v.m_blocks);
 		}
 	}
 
@@ -147,7 +359,12 @@ public:
 	inline void push_back(size_t i, const_reference t)
 	{
 		DBG_ASSERT(t != 0, RuntimeError, "Cannot store zero as mutant");
-		m_data.insert(m_data.end(), storage::value_type(i, t));
+		DBG_FAILIF(i >= m_size, IndexError, "Index out of range of mutant vector");
+		block_type & block = m_blocks[block_of(i)];
+		if (block.empty() || block.back().first < i)
+			block.push_back(mutant_type(i, t));
+		else
+			assign(i, t);
 	}
 
 
@@ -160,17 +377,11 @@ public:
 	// This function changes the size of vectorm.
 	inline void insert(const iterator &, const const_iterator & ibeg, const const_iterator iend)
 	{
-		const_val_iterator beg = ibeg.get_val_iterator();
-		const_val_iterator end = iend.get_val_iterator();
-		ssize_t shift = m_size - ibeg.index();
+		size_t dest = m_size;
 
-		m_size += iend.index() - ibeg.index();
-		const_val_iterator ptr = beg;
-		for (; ptr != end; ++ptr) {
-			DBG_ASSERT(ptr->second != 0, RuntimeError, "Cannot store zero as mutant");
-			// we are inserting to the end, which should be constant instead of log(n) time
-			m_data.insert(m_data.end(), storage::value_type(ptr->first + shift, ptr->second));
-		}
+		resize(m_size + (iend.index() - ibeg.index()));
+		iterator it(*this, dest);
+		copy_region(ibeg, iend, it);
 	}
 
 
@@ -178,67 +389,104 @@ public:
 	inline void copy_region(const const_iterator & begin, const const_iterator & end,
 	                        iterator & it)
 	{
-		size_t iend = it.index() + (end - begin);
-		ssize_t lagging = it.index() - begin.index();
-
-		// remove old data
-		if (!m_data.empty() && it.index() <= m_data.rbegin()->first)
-			m_data.erase(m_data.lower_bound(it.index()),
-				iend > m_size ? m_data.end() : m_data.lower_bound(iend));
-		// insert new data
-		const_val_iterator vbeg = begin.get_val_iterator();
-		const_val_iterator vend = (end - (iend > m_size ? iend - m_size : 0)).get_val_iterator();
-		if (vbeg == vend)
-			return;
-		// the first element is insert to get the right location for future insertion
-		DBG_ASSERT(vbeg->second != 0, RuntimeError, "Cannot store zero as mutant");
-		val_iterator dest = m_data.insert(m_data.end(), val_iterator::value_type(vbeg->first + lagging, vbeg->second));
-		++vbeg;
-		// according to the documentation, if ip in insert(ip, val) is set to the position
-		// precedes the value to be inserted, this will make a very fast insertion.
-		// because we are insertion from small to large numbers, we are setting ip to the
-		// location of the last item
-		for (; vbeg != vend; ++vbeg) {
-			DBG_ASSERT(vbeg->second != 0, RuntimeError, "Cannot store zero as mutant");
-			dest = m_data.insert(dest, val_iterator::value_type(vbeg->first + lagging, vbeg->second));
-		}
-#  if 0
-		/*
-		   The following code copies elements one by one, which can be more efficient if the
-		   elements overlap a lot so that we do not have to remove and insert values at the
-		   same location. In practice this rarely happens because we clear genotypes of the
-		   offspring before mating.
-		 */
-		size_t iend = it.index() + (end - begin);
-		ssize_t lagging = it.index() - begin.index();
-
-		const_val_iterator sbeg = begin.get_val_iterator();
-		const_val_iterator send = (end - (iend > m_size ? iend - m_size : 0)).get_val_iterator();
-		if (sbeg == send)
+		size_t dest = it.index();
+		size_t destEnd = std::min(dest + (end - begin), m_size);
+
+		if (dest >= destEnd)
 			return;
+		ssize_t lagging = dest - begin.index();
+		size_t srcEnd = begin.index() + (destEnd - dest);
+		if (&begin() == this) {
+			// copy the mutants out because inserting mutants can move the source
+			block_type tmp;
+			const_val_iterator vbeg = lower_bound(begin.index());
+			const_val_iterator vend = lower_bound(srcEnd);
+			for (; vbeg != vend; ++vbeg)
+				tmp.push_back(*vbeg);
+			replace_region(dest, destEnd, tmp.begin(), tmp.end(), lagging);
+		} else
+			replace_region(dest, destEnd, begin().lower_bound(begin.index()),
+				begin().lower_bound(srcEnd), lagging);
+	}
+
+
+private:
+	static size_t num_blocks(size_t size, size_t blockSize)
+	{
+		return blockSize == 0 ? 1 : (size + blockSize - 1) / blockSize;
+	}
+
+
+	static bool index_less(const mutant_type & mutant, size_t i)
+	{
+		return mutant.first < i;
+	}
+
 
-		val_iterator dbeg = m_data.lower_bound(it.index());
-		val_iterator dend = iend > m_size ? m_data.end() : m_data.lower_bound(iend);
+	// block of index i, number of blocks if i is out of range
+	size_t block_of(size_t i) const
+	{
+		if (i >= m_size)
+			return m_blocks.size();
+		return m_blockSize == 0 ? 0 : i / m_blockSize;
+	}
+
+
+	size_t block_begin(size_t b) const
+	{
+		return b * m_blockSize;
+	}
 
-		for (; sbeg != send; ++sbeg) {
-			if (dbeg == dend) {
-				// destination empty, no comparison is needed
-				for ( ; sbeg != send; ++sbeg)
-					dbeg = m_data.insert(dbeg, val_iterator::value_type(sbeg->first + lagging, sbeg->second));
-				return;
+
+	size_t block_end(size_t b) const
+	{
+		return m_blockSize == 0 ? m_size : std::min((b + 1) * m_blockSize, m_size);
+	}
+
+
+	// position of the first mutant at or after index i in block b. The block is
+	// not read if i is at its beginning.
+	size_t position(size_t b, size_t i) const
+	{
+		if (i <= block_begin(b))
+			return 0;
+		const block_type & block = m_blocks[b];
+		if (i >= block_end(b))
+			return block.size();
+		return std::lower_bound(block.begin(), block.end(), i, index_less) - block.begin();
+	}
+
+
+	// replace mutants in region [dest, destEnd) with mutants [first, last) whose
+	// indexes are shifted by lagging. In each block, the old mutants are
+	// overwritten and the rest of the block is moved at most once.
+	template <typename MutantIterator>
+	void replace_region(size_t dest, size_t destEnd, MutantIterator first,
+	                    MutantIterator last, ssize_t lagging)
+	{
+		for (size_t b = block_of(dest); b < m_blocks.size() && block_begin(b) < destEnd; ++b) {
+			size_t hi = std::min(destEnd, block_end(b));
+			block_type & block = m_blocks[b];
+			size_t p = position(b, std::max(dest, block_begin(b)));
+			size_t q = position(b, hi);
+			// number of new mutants in this block
+			MutantIterator mid = first;
+			size_t n = 0;
+			for (; mid != last && mid->first + lagging < hi; ++mid)
+				++n;
+			if (n > q - p)
+				block.insert(block.begin() + q, n - (q - p), mutant_type());
+			else if (n < q - p)
+				block.erase(block.begin() + p + n, block.begin() + q);
+			for (block_type::iterator ptr = block.begin() + p; first != mid; ++first, ++ptr) {
+				DBG_ASSERT(first->second != 0, RuntimeError, "Cannot store zero as mutant");
+				*ptr = mutant_type(first->first + lagging, first->second);
 			}
-			if (sbeg->first < dbeg->first)          // insert
-				m_data.insert(dbeg, val_iterator::value_type(sbeg->first + lagging, sbeg->second));
-			else if (sbeg->first == dbeg->first) {  // assign
-				dbeg->second = sbeg->second;
-				++dbeg;
-			} else  // remove
-				m_data.erase(dbeg++);
 		}
-#  endif
 	}
 
 
+public:
 	//
 	class iterator
 	{
@@ -320,29 +568,25 @@ public:
 
 		size_t to_next() const
 		{
-			const_val_iterator it = (*this)().data().lower_bound(m_index + 1);
-
-			return it == (*this)().data().end() ? (*this)().size() - m_index : it->first - m_index;
+			return (*this)().to_next(m_index);
 		}
 
 
 		val_iterator get_val_iterator()
 		{
-			return (*this)().data().lower_bound(m_index);
+			return (*this)().lower_bound(m_index);
 		}
 
 
 		const_val_iterator get_val_iterator() const
 		{
-			return (*this)().data().lower_bound(m_index);
+			return (*this)().lower_bound(m_index);
 		}
 
 
 		const_reference value() const
 		{
-			const_val_iterator it((*this)().data().find(m_index));
-
-			return (it == (*this)().data().end()) ? zero_ : it->second;
+			return (*this)().value(m_index);
 		}
 
 
@@ -397,21 +641,7 @@ public:
 
 		void assignIfDiffer(const_reference value)
 		{
-			// find the lower bound
-			val_iterator it((*this)().data().lower_bound(m_index));
-
-			// if the element does not exist
-			if (it == (*this)().data().end() || it->first != m_index) {
-				if (value != 0)
-					// use lower_bound instead of find so that we can use the insert(it, val)
-					// version of insert, which should be faster (constant vs log(n))
-					(*this)().data().insert(it, storage::value_type(m_index, value));
-				// if the element exists, but value is zero, remove it
-			} else if (value == 0)
-				(*this)().data().erase(it);
-			// finally, update it directly
-			else
-				it->second = value;
+			(*this)().assign(m_index, value);
 		}
 
 
@@ -504,15 +734,13 @@ public:
 
 		const_val_iterator get_val_iterator() const
 		{
-			return (*this)().data().lower_bound(m_index);
+			return (*this)().lower_bound(m_index);
 		}
 
 
 		const_reference value() const
 		{
-			const_val_iterator it((*this)().data().find(m_index));
-
-			return (it == (*this)().data().end()) ? zero_ : it->second;
+			return (*this)().value(m_index);
 		}
 
 
@@ -595,7 +823,9 @@ public:
 private:
 	size_t m_size;
 
-	storage m_data;
+	size_t m_blockSize;
+
+	storage m_blocks;
 
 	static const Allele zero_;
 
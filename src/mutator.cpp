@@ -89,6 +89,51 @@ void BaseMutator::fillContext(const Population & pop, IndAlleleIterator ptr, siz
 }
 
 
+// Locate alleles to be mutated in a block of numLoci * numAlleles alleles,
+// where the alleles at the i-th locus are mutated with probability rates[i].
+// Returns indexes i * numAlleles + j of mutated alleles in increasing order.
+// If cumRates is empty, all loci share rates[0] and the gap to the next
+// mutated allele follows a geometric distribution. Otherwise cumRates holds
+// the cumulative sum of -log(1 - rates[i]) so that the number of mutation
+// events follows a Poisson distribution and each event is placed on a locus
+// by a binary search. An allele is mutated if at least one event happens at
+// it, which has probability rates[i].
+static void mutationEvents(const vectorf & rates, const vectorf & cumRates,
+                           size_t numLoci, size_t numAlleles, vectoru & events)
+{
+	events.clear();
+	if (cumRates.empty()) {
+		double p = rates[0];
+		if (p <= 0.)
+			return;
+		// gaps are calculated in double because they can be larger than
+		// the largest value returned by randGeometric
+		double total = static_cast<double>(numLoci) * numAlleles;
+		double logq = log(1. - p);
+		double pos = -1;
+		while (true) {
+			pos += p >= 1. ? 1. : floor(log(getRNG().randUniform()) / logq) + 1.;
+			if (pos >= total)
+				break;
+			events.push_back(static_cast<size_t>(pos));
+		}
+	} else {
+		double length = cumRates.back();
+		if (length <= 0.)
+			return;
+		size_t numEvents = getRNG().randPoisson(length * numAlleles);
+		events.resize(numEvents);
+		for (size_t i = 0; i < numEvents; ++i) {
+			size_t locus = std::upper_bound(cumRates.begin(), cumRates.end(),
+				getRNG().randUniform() * length) - cumRates.begin();
+			events[i] = std::min(locus, numLoci - 1) * numAlleles + getRNG().randInt(numAlleles);
+		}
+		std::sort(events.begin(), events.end());
+		events.erase(std::unique(events.begin(), events.end()), events.end());
+	}
+}
+
+
 bool BaseMutator::apply(Population & pop) const
 {
 	DBG_DO(DBG_MUTATOR, cerr << "Mutate replicate " << pop.rep() << endl);
@@ -154,6 +199,22 @@ bool BaseMutator::apply(Population & pop) const
 	// if no loci to mutate
 	if (iEnd == 0)
 		return true;
+	// allele counts are updated if they are tracked
+	TrackedAlleles & tracked = pop.trackedAlleles();
+	// for rare mutations, mutation events are located in the genotype block
+	// of each (virtual) subpopulation so that the cost is proportional to
+	// the number of mutations, not the number of loci.
+	vectorf cumRates;
+	vectoru events;
+	size_t ev = 0;
+	if (rare && static_cast<size_t>(std::count(rates.begin(), rates.begin() + iEnd, rates[0])) != iEnd) {
+		cumRates.resize(iEnd);
+		double length = 0;
+		for (size_t i = 0; i < iEnd; ++i) {
+			length += -log(1. - rates[i]);
+			cumRates[i] = length;
+		}
+	}
 	// multiple (virtual) subpopulations
 	for (size_t idx = 0; idx < subPops.size(); ++idx) {
 		size_t sp = subPops[idx].subPop();
@@ -171,19 +232,25 @@ bool BaseMutator::apply(Population & pop) const
 			pop.activateVirtualSubPop(subPops[idx]);
 
 		size_t max_pos = pop.ploidy() * popSize;
-		if (!rare) {
+		if (rare) {
+			mutationEvents(rates, cumRates, iEnd, max_pos, events);
+			ev = 0;
+		} else {
 			bt.setParameter(rates, max_pos);
 			bt.doTrial();
 		}
 		for (size_t i = 0; i < iEnd; ++i) {
-			size_t locus = loci[i];
-			DBG_DO(DBG_MUTATOR, cerr << "Mutate at locus " << locus << endl);
 			size_t pos = 0;
 			if (rare) {
-				size_t step = getRNG().randGeometric(rates[i]);
-				pos = (step == 0 || step > max_pos) ? Bernullitrials::npos : (step - 1);
+				if (ev == events.size())
+					break;
+				// jump to the next locus with mutation
+				i = events[ev] / max_pos;
+				pos = events[ev++] % max_pos;
 			} else
 				pos = bt.trialFirstSucc(i);
+			size_t locus = loci[i];
+			DBG_DO(DBG_MUTATOR, cerr << "Mutate at locus " << locus << endl);
 			size_t lastPos = 0;
 			IndAlleleIterator ptr = pop.alleleIterator(locus, sp);
 			LINEAGE_EXPR(IndLineageIterator lineagePtr = pop.lineageIterator(locus, sp));
@@ -232,6 +299,7 @@ bool BaseMutator::apply(Population & pop) const
 					}
 					if (oldAllele != newAllele) {
 						REF_ASSIGN_ALLELE(ptr, newAllele);
+						tracked.update(sp, locus, oldAllele, newAllele);
 						if (hasOutput) {
 							out << pop.gen() << '\t' << locus << '\t' << ptr.currentPloidy() << '\t' << int(oldAllele)
 							    << '\t' << int(newAllele);
@@ -249,12 +317,17 @@ bool BaseMutator::apply(Population & pop) const
 					}
 #endif
 					if (rare) {
-						size_t step = getRNG().randGeometric(rates[i]);
-						pos = (step == 0 || step + pos >= max_pos) ? Bernullitrials::npos : (pos + step);
+						if (ev < events.size() && events[ev] / max_pos == i)
+							pos = events[ev++] % max_pos;
+						else
+							pos = Bernullitrials::npos;
 					} else
 						pos = bt.trialNextSucc(i, pos);
 				} while (pos != Bernullitrials::npos);
 			}                                                                                           // succ.any
+			// skip events beyond the last valid allele of this locus
+			while (rare && ev < events.size() && events[ev] / max_pos == i)
+				++ev;
 		}
 
 		if (subPops[idx].isVirtual())
@@ -300,19 +373,31 @@ MatrixMutator::MatrixMutator(const floatMatrix & rate,
 	setRate(vectorf(1, mu), loci);
 	if (mu == 0.)
 		return;
-	// re-calculate probability
+	// re-calculate probability. Rows of a mutation matrix are usually sparse
+	// (e.g. stepwise models) so alias tables are built only for alleles that
+	// an allele can mutate to, which makes the tables proportional to the
+	// number of non-zero items instead of the square of the number of alleles.
 	m_sampler.clear();
+	m_alleles.clear();
 	for (size_t i = 0; i < rateMatrix.size(); ++i) {
 		double sum = 0;
+		vectoru alleles;
+		vectorf weights;
 		for (size_t j = 0; j < rateMatrix[i].size(); ++j) {
-			if (i == j)
+			if (i == j || rateMatrix[i][j] == 0.)
 				continue;
 			sum += rateMatrix[i][j];
-			rateMatrix[i][j] /= mu;
+			alleles.push_back(j);
+			weights.push_back(rateMatrix[i][j] / mu);
+		}
+		if (sum < mu) {
+			alleles.push_back(i);
+			weights.push_back(1 - sum / mu);
 		}
-		rateMatrix[i][i] = 1 - sum / mu;
-		DBG_DO(DBG_MUTATOR, cerr << "Setting weight for allele " << i << " to " << rateMatrix[i] << endl);
-		m_sampler.push_back(WeightedSampler(rateMatrix[i]));
+		DBG_DO(DBG_MUTATOR, cerr << "Setting weight for allele " << i << " to " << weights
+			                     << " for alleles " << alleles << endl);
+		m_sampler.push_back(WeightedSampler(weights));
+		m_alleles.push_back(alleles);
 	}
 }
 
@@ -324,7 +409,7 @@ Allele MatrixMutator::mutate(Allele allele, size_t) const
 			              % static_cast<size_t>(allele) % (m_sampler.size() - 1)).str());
 		return allele;
 	}
-	return TO_ALLELE(m_sampler[allele].draw());
+	return TO_ALLELE(m_alleles[allele][m_sampler[allele].draw()]);
 }
 
 
@@ -501,6 +586,9 @@ Allele ContextMutator::mutate(Allele allele, size_t locus) const
 
 bool PointMutator::apply(Population & pop) const
 {
+	// mutated alleles are not necessarily counted alleles (e.g. the second
+	// copy of chromosome X of a male), so allele counts are recounted
+	pop.trackedAlleles().invalidate();
 	subPopList subPops = applicableSubPops(pop);
 
 	subPopList::const_iterator sp = subPops.begin();
@@ -578,6 +666,7 @@ bool RevertFixedSites::apply(Population & pop) const
 	if (loci.size() == 0)
 		return true;
 
+	pop.trackedAlleles().invalidate();
 	const subPopList subPops = applicableSubPops(pop);
 	subPopList::const_iterator sp = subPops.begin();
 	subPopList::const_iterator spEnd = subPops.end();
@@ -699,6 +788,7 @@ bool FiniteSitesMutator::apply(Population & pop) const
 
 	size_t indWidth = pop.genoSize();
 	size_t ploidyWidth = pop.totNumLoci();
+	pop.trackedAlleles().invalidate();
 
 	ostream * out = NULL;
 	if (!noOutput())
@@ -268,7 +268,11 @@ public:
 
 
 private:
+	/// alias tables for alleles each allele can mutate to
 	mutable vector<WeightedSampler> m_sampler;
+
+	/// alleles each allele can mutate to, including itself
+	vector<vectoru> m_alleles;
 };
 
 /** This mutator implements a \e k-allele mutation model that assumes \e k
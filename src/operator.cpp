@@ -1142,6 +1142,8 @@ bool PyOperator::apply(Population & pop) const
 
 		PyObject * res = m_func(args);
 		Py_XDECREF(args);
+		// the function can change genotype and sex of any individual
+		pop.trackedAlleles().invalidate();
 		DBG_FAILIF(res != Py_True && res != Py_False, RuntimeError,
 			"A callback function for operator PyOperator has to return either True or False");
 		return res == Py_True;
@@ -1185,6 +1187,7 @@ bool PyOperator::apply(Population & pop) const
 		if (subPops[idx].isVirtual())
 			pop.deactivateVirtualSubPop(subPops[idx].subPop());
 	}
+	pop.trackedAlleles().invalidate();
 	pop.removeMarkedIndividuals();
 	return true;
 }
@@ -1228,6 +1231,109 @@ bool PyOperator::applyDuringMating(Population & pop, Population & offPop, RawInd
 }
 
 
+// create a memoryview of a bytearray with rows x cols items of the specified
+// format (a one-dimensional array if cols is 0), data is set to its content
+static PyObject * newNumMatrix(size_t rows, size_t cols, const char * format,
+                               size_t itemsize, char ** data)
+{
+	PyObject * bytes = PyByteArray_FromStringAndSize(NULL, rows * std::max<size_t>(cols, 1) * itemsize);
+
+	DBG_FAILIF(bytes == NULL, RuntimeError, "Failed to allocate memory for a numeric array");
+	*data = PyByteArray_AS_STRING(bytes);
+	PyObject * view = PyMemoryView_FromObject(bytes);
+	Py_DECREF(bytes);
+	PyObject * res = cols == 0 ? PyObject_CallMethod(view, "cast", "s", format) :
+	                 PyObject_CallMethod(view, "cast", "s(nn)", format,
+		static_cast<Py_ssize_t>(rows), static_cast<Py_ssize_t>(cols));
+	Py_DECREF(view);
+	DBG_FAILIF(res == NULL, RuntimeError, "Failed to create a numeric array");
+	return res;
+}
+
+
+void callVectorizedFunc(const pyFunc & func, Population & pop,
+                        const vector<Individual *> & inds, const vectoru & loci, size_t width, vectorf & values)
+{
+	size_t numInds = inds.size();
+
+	values.clear();
+	if (numInds == 0)
+		return;
+
+	PyObject * args = PyTuple_New(func.numArgs());
+	DBG_ASSERT(args, RuntimeError, "Failed to create a parameter tuple");
+
+	for (size_t i = 0; i < func.numArgs(); ++i) {
+		const string & arg = func.arg(i);
+		if (arg == "geno") {
+			size_t ply = pop.ploidy();
+			size_t cols = loci.size() * ply;
+			char * data = NULL;
+#ifdef LONGALLELE
+			PyObject * geno = newNumMatrix(numInds, cols, "L", sizeof(Allele), &data);
+			Allele * ptr = reinterpret_cast<Allele *>(data);
+#else
+			PyObject * geno = newNumMatrix(numInds, cols, "B", sizeof(unsigned char), &data);
+			unsigned char * ptr = reinterpret_cast<unsigned char *>(data);
+#endif
+			for (size_t j = 0; j < numInds; ++j)
+				for (size_t idx = 0; idx < loci.size(); ++idx)
+					for (size_t p = 0; p < ply; ++p)
+						*ptr++ = inds[j]->allele(loci[idx], p);
+			PyTuple_SET_ITEM(args, i, geno);
+		} else if (arg == "gen")
+			PyTuple_SET_ITEM(args, i, PyLong_FromLong(static_cast<long>(pop.gen())));
+		else if (arg == "pop")
+			PyTuple_SET_ITEM(args, i, pyPopObj(static_cast<void *>(&pop)));
+		else {
+			if (!pop.hasInfoField(arg)) {
+				Py_DECREF(args);
+				throw ValueError("Only parameters 'geno', 'gen', 'pop' and names of information fields are "
+					             "acceptable in vectorized function " + func.name());
+			}
+			size_t idx = pop.infoIdx(arg);
+			char * data = NULL;
+			PyObject * info = newNumMatrix(numInds, 0, "d", sizeof(double), &data);
+			double * ptr = reinterpret_cast<double *>(data);
+			for (size_t j = 0; j < numInds; ++j)
+				ptr[j] = inds[j]->info(idx);
+			PyTuple_SET_ITEM(args, i, info);
+		}
+	}
+
+	PyObject * res = func(args);
+	Py_DECREF(args);
+
+	// numpy arrays are also numbers so buffers are checked first
+	if (PyObj_As_NumBuffer(res, values, false)) {
+		// values are copied from the buffer
+	} else if (PyNumber_Check(res))
+		values.push_back(PyFloat_AsDouble(res));
+	else if (PySequence_Check(res)) {
+		// a sequence of numbers, or of sequences of numbers
+		size_t sz = PySequence_Size(res);
+		for (size_t i = 0; i < sz; ++i) {
+			PyObject * item = PySequence_GetItem(res, i);
+			if (PySequence_Check(item)) {
+				vectorf row;
+				PyObj_As_Array(item, row);
+				values.insert(values.end(), row.begin(), row.end());
+			} else
+				values.push_back(PyFloat_AsDouble(item));
+			Py_DECREF(item);
+		}
+	} else {
+		Py_DECREF(res);
+		throw ValueError("Vectorized function " + func.name() + " should return an array or a sequence of numbers.");
+	}
+	Py_DECREF(res);
+	if (values.size() != numInds * width)
+		throw ValueError((boost::format("Vectorized function %1% returns %2% values for %3% individuals "
+			                            "(%4% values are expected).") % func.name() % values.size() % numInds
+			              % (numInds * width)).str());
+}
+
+
 void applyDuringMatingOperator(const BaseOperator & op,
                                Population * pop, Population * offPop, ssize_t dad, ssize_t mom,
                                const pairu & off)
@@ -957,6 +957,18 @@ private:
 };
 
 
+/** CPPONLY
+ *  Call a user-provided function \e func once for individuals \e inds of
+ *  population \e pop. Genotypes at \e loci are passed to parameter \c geno
+ *  as a matrix with one row of alleles (arranged locus by locus) for each
+ *  individual, and values of information fields are passed as arrays of
+ *  length \c len(inds). Parameters \c gen and \c pop are also acceptable.
+ *  The function should return \e width values for each individual, which
+ *  are saved to \e values.
+ */
+void callVectorizedFunc(const pyFunc & func, Population & pop,
+	const vector<Individual *> & inds, const vectoru & loci, size_t width, vectorf & values);
+
 /** HIDDEN
  *  This function is used to test during mating operators. It simply apply
  *  operator \e op to \e dad, \e mom to offspring \e off through \e off1
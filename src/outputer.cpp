@@ -24,6 +24,11 @@
  */
 #include "outputer.h"
 
+#include <deque>
+#include <thread>
+#include <mutex>
+#include <condition_variable>
+
 namespace simuPOP {
 
 bool PyOutput::apply(Population & pop) const
@@ -167,9 +172,202 @@ bool Dumper::apply(Population & pop) const
 }
 
 
+// maximum number of snapshots waiting to be saved
+const size_t MaxPendingSaves = 2;
+
+/* Save snapshots of populations to files in a background thread. Snapshots
+ * are created and deleted by the main thread. The background thread only
+ * writes them to files so that it never touches any Python object. The
+ * thread is joined by flush(), which is called when evolve() returns and
+ * when the simuPOP module is unloaded, so the saver is never destroyed
+ * with a running thread.
+ */
+class BackgroundSaver
+{
+public:
+	BackgroundSaver() : m_thread(NULL), m_mutex(), m_cond(), m_jobs(), m_saved(),
+		m_error(), m_stop(false)
+	{
+	}
+
+
+	/// save \e pop to \e filename in the background, take ownership of \e pop
+	void save(Population * pop, const string & filename, int compress)
+	{
+		vector<Population *> saved;
+		string error;
+		{
+			// output of the saving thread to Python streams needs the GIL
+			PyThreadState * state = releaseGIL();
+			{
+				std::unique_lock<std::mutex> lock(m_mutex);
+
+				// wait if the disk cannot keep up with the simulation
+				while (m_jobs.size() >= MaxPendingSaves)
+					m_cond.wait(lock);
+				m_jobs.push_back(SaveJob(pop, filename, compress));
+				if (m_thread == NULL)
+					m_thread = new std::thread(&BackgroundSaver::run, this);
+				m_cond.notify_all();
+				takeSaved(saved, error);
+			}
+			acquireGIL(state);
+		}
+		releaseSaved(saved, error);
+	}
+
+
+	/// wait for all snapshots to be saved and stop the saving thread
+	void flush()
+	{
+		vector<Population *> saved;
+		string error;
+		{
+			PyThreadState * state = releaseGIL();
+			std::thread * thread = NULL;
+			{
+				std::lock_guard<std::mutex> lock(m_mutex);
+				// pending snapshots are saved before the thread exits
+				m_stop = true;
+				std::swap(thread, m_thread);
+			}
+			m_cond.notify_all();
+			if (thread != NULL) {
+				thread->join();
+				delete thread;
+			}
+			{
+				std::lock_guard<std::mutex> lock(m_mutex);
+				m_stop = false;
+				takeSaved(saved, error);
+			}
+			acquireGIL(state);
+		}
+		releaseSaved(saved, error);
+	}
+
+
+	/// forget the saving thread in a forked process, which does not inherit
+	/// threads of its parent. A new thread will be started if needed.
+	void detachAfterFork()
+	{
+		m_thread = NULL;
+		m_jobs.clear();
+		m_stop = false;
+	}
+
+
+private:
+	struct SaveJob
+	{
+		SaveJob(Population * pop, const string & filename, int compress)
+			: pop(pop), filename(filename), compress(compress)
+		{
+		}
+
+
+		Population * pop;
+		string filename;
+		int compress;
+	};
+
+	// take saved snapshots and the first error, called with m_mutex locked
+	void takeSaved(vector<Population *> & saved, string & error)
+	{
+		saved.swap(m_saved);
+		error.swap(m_error);
+	}
+
+
+	// delete saved snapshots and report errors to the caller, called by the
+	// main thread with the GIL held because snapshots own Python objects.
+	void releaseSaved(vector<Population *> & saved, const string & error)
+	{
+		for (size_t i = 0; i < saved.size(); ++i)
+			delete saved[i];
+		saved.clear();
+		if (!error.empty())
+			throw ValueError(error);
+	}
+
+
+	void run()
+	{
+		writeOutputWithGIL();
+		std::unique_lock<std::mutex> lock(m_mutex);
+
+		while (true) {
+			while (m_jobs.empty() && !m_stop)
+				m_cond.wait(lock);
+			if (m_jobs.empty())
+				return;
+			SaveJob job = m_jobs.front();
+			m_jobs.pop_front();
+			lock.unlock();
+
+			string error;
+			try {
+				job.pop->save(job.filename, false, job.compress);
+			} catch (Exception & e) {
+				error = e.message();
+			} catch (std::exception & e) {
+				error = e.what();
+			} catch (...) {
+				error = "unknown error";
+			}
+
+			lock.lock();
+			if (!error.empty() && m_error.empty())
+				m_error = "Failed to save population to file " + job.filename + ": " + error;
+			m_saved.push_back(job.pop);
+			m_cond.notify_all();
+		}
+	}
+
+
+	std::thread * m_thread;
+
+	std::mutex m_mutex;
+
+	std::condition_variable m_cond;
+
+	std::deque<SaveJob> m_jobs;
+
+	// saved snapshots that are waiting to be deleted by the main thread
+	vector<Population *> m_saved;
+
+	string m_error;
+
+	bool m_stop;
+};
+
+
+// created on first use and never destroyed so that no thread is joined
+// during static destruction, after the Python interpreter is finalized
+static BackgroundSaver & backgroundSaver()
+{
+	static BackgroundSaver * saver = new BackgroundSaver();
+
+	return *saver;
+}
+
+
+void flushBackgroundSaves()
+{
+	backgroundSaver().flush();
+}
+
+
+void resetBackgroundSavesAfterFork()
+{
+	backgroundSaver().detachAfterFork();
+}
+
+
 string SavePopulation::describe(bool /* format */) const
 {
-	return "<simuPOP.SavePopulation> save population to file " + m_filename;
+	return "<simuPOP.SavePopulation> save population to file " + m_filename
+	       + (m_background ? " in the background" : "");
 }
 
 
@@ -188,7 +386,11 @@ bool SavePopulation::apply(Population & pop) const
 		filename = filenameParser.valueAsString();
 	}
 	DBG_DO(DBG_POPULATION, cerr << "Save to file " << filename << endl);
-	pop.save(filename);
+	if (m_background)
+		// the snapshot is deleted by the saver
+		backgroundSaver().save(pop.snapshot(), filename, m_compress);
+	else
+		pop.save(filename, false, m_compress);
 	return true;
 }
 
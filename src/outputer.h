@@ -178,17 +178,32 @@ public:
 	 *  specifications (\c '', \c 'filename', \c 'filename' prefixed by one
 	 *  or more '>' characters, and \c '!expr') but output from different
 	 *  operators will always replace existing files (effectively ignore
-	 *  '>' specification). Parameter \e subPops is ignored. Please refer to
-	 *  class \c BaseOperator for a detailed description about common operator
-	 *  parameters such as \e stage and \e begin.
+	 *  '>' specification). Parameter \e compress sets the gzip compression
+	 *  level (\c 0 for no compression to \c 9 for best compression) of saved
+	 *  files. A lower level can be used to reduce the time spent on saving
+	 *  populations at the cost of larger files. Populations are always saved
+	 *  in gzip format because other compression formats cannot be loaded by
+	 *  function \c loadPopulation. If \e background is set to
+	 *  \c True, this operator copies the population and saves the copy in
+	 *  a background thread so that the evolutionary process can continue
+	 *  while the population is being saved. At most two copies can wait to
+	 *  be saved so this operator will wait if populations cannot be saved
+	 *  as fast as they are produced. All populations are saved when
+	 *  function \c evolve returns. Parameter \e subPops is ignored. Please
+	 *  refer to class \c BaseOperator for a detailed description about
+	 *  common operator parameters such as \e stage and \e begin.
 	 */
 	SavePopulation(const stringFunc & output = "", int begin = 0, int end = -1,
 		int step = 1, const intList & at = vectori(), const intList & reps = intList(),
-		const subPopList & subPops = subPopList(), const stringList & infoFields = vectorstr()) :
+		const subPopList & subPops = subPopList(), const stringList & infoFields = vectorstr(),
+		int compress = 6, bool background = false) :
 		BaseOperator("", begin, end, step, at, reps, subPops, infoFields),
-		m_filename(output.value())
+		m_filename(output.value()), m_compress(compress), m_background(background)
 	{
 		DBG_WARNIF(output.empty(), "An empty output string is passed to operator SavePopulation. No file will be saved.");
+		PARAM_FAILIF(compress < 0 || compress > 9, ValueError,
+			"Parameter compress should be a gzip compression level between 0 (no compression) "
+			"and 9 (best compression).");
 	}
 
 
@@ -214,7 +229,25 @@ public:
 private:
 	/// filename,
 	const string m_filename;
+
+	/// compression level
+	const int m_compress;
+
+	/// save population in a background thread
+	const bool m_background;
 };
 
+/** Wait for all populations that are being saved in the background by
+ *  operator \c SavePopulation(background=True). A \c ValueError is raised
+ *  if any of them could not be saved. This function is called when
+ *  \c Simulator.evolve() returns and when Python exits, and can be called
+ *  to check if populations saved by operators applied outside of a simulator
+ *  are written.
+ */
+void flushBackgroundSaves();
+
+/// CPPONLY reset the background saver in a forked child process
+void resetBackgroundSavesAfterFork();
+
 }
 #endif
@@ -63,45 +63,52 @@ bool BasePenetrance::apply(Population & pop) const
 			if (sp->isVirtual())
 				pop.activateVirtualSubPop(*sp);
 
-			if (numThreads() > 1 && parallelizable()) {
+			applyToSubPop(pop, sp->subPop(), savePene, infoIdx);
+
+			if (sp->isVirtual())
+				pop.deactivateVirtualSubPop(sp->subPop());
+		}
+	}
+	pop.useAncestralGen(oldGen);
+
+	return true;
+}
+
+
+void BasePenetrance::applyToSubPop(Population & pop, size_t subPop, bool savePene, size_t infoIdx) const
+{
+	if (numThreads() > 1 && parallelizable()) {
 #pragma omp parallel
-				{
+		{
 #ifdef _OPENMP
-					IndIterator ind = pop.indIterator(sp->subPop(), omp_get_thread_num());
-					for (; ind.valid(); ++ind) {
-						double p = penet(&pop, ind.rawIter());
+			IndIterator ind = pop.indIterator(subPop, omp_get_thread_num());
+			for (; ind.valid(); ++ind) {
+				double p = penet(&pop, ind.rawIter());
 
-						if (savePene)
-							ind->setInfo(p, infoIdx);
+				if (savePene)
+					ind->setInfo(p, infoIdx);
 
-						if (getRNG().randUniform() < p)
-							ind->setAffected(true);
-						else
-							ind->setAffected(false);
-					}
+				if (getRNG().randUniform() < p)
+					ind->setAffected(true);
+				else
+					ind->setAffected(false);
+			}
 #endif
-				}
-			} else {
-				IndIterator ind = pop.indIterator(sp->subPop());
-				for (; ind.valid(); ++ind) {
-					double p = penet(&pop, ind.rawIter());
+		}
+	} else {
+		IndIterator ind = pop.indIterator(subPop);
+		for (; ind.valid(); ++ind) {
+			double p = penet(&pop, ind.rawIter());
 
-					if (savePene)
-						ind->setInfo(p, infoIdx);
+			if (savePene)
+				ind->setInfo(p, infoIdx);
 
-					if (getRNG().randUniform() < p)
-						ind->setAffected(true);
-					else
-						ind->setAffected(false);
-				}
-			}
-			if (sp->isVirtual())
-				pop.deactivateVirtualSubPop(sp->subPop());
+			if (getRNG().randUniform() < p)
+				ind->setAffected(true);
+			else
+				ind->setAffected(false);
 		}
 	}
-	pop.useAncestralGen(oldGen);
-
-	return true;
 }
 
 
@@ -348,6 +355,14 @@ double MlPenetrance::penet(Population * pop, RawIndIterator ind) const
 // the same as PyPenetrance
 double PyPenetrance::penet(Population * pop, RawIndIterator ind) const
 {
+	if (m_vectorized) {
+		// during mating or as part of a multi-locus penetrance model
+		DBG_FAILIF(pop == NULL, ValueError, "No valid population reference is passed.");
+		vectorf penetrance;
+		callVectorizedFunc(m_func, *pop, vector<Individual *>(1, &*ind), m_loci.elems(pop), 1, penetrance);
+		return penetrance[0];
+	}
+
 	PyObject * args = PyTuple_New(m_func.numArgs());
 
 	DBG_ASSERT(args, RuntimeError, "Failed to create a parameter tuple");
@@ -380,6 +395,25 @@ double PyPenetrance::penet(Population * pop, RawIndIterator ind) const
 }
 
 
+void PyPenetrance::applyToSubPop(Population & pop, size_t subPop, bool savePene, size_t infoIdx) const
+{
+	if (!m_vectorized) {
+		BasePenetrance::applyToSubPop(pop, subPop, savePene, infoIdx);
+		return;
+	}
+	vector<Individual *> inds;
+	for (IndIterator ind = pop.indIterator(subPop); ind.valid(); ++ind)
+		inds.push_back(&*ind);
+	vectorf penetrance;
+	callVectorizedFunc(m_func, pop, inds, m_loci.elems(&pop), 1, penetrance);
+	for (size_t i = 0; i < inds.size(); ++i) {
+		if (savePene)
+			inds[i]->setInfo(penetrance[i], infoIdx);
+		inds[i]->setAffected(getRNG().randUniform() < penetrance[i]);
+	}
+}
+
+
 PyMlPenetrance::PyMlPenetrance(PyObject * func, int mode, const lociList & loci,
 	const uintList & ancGens,
 	const stringFunc & /* output */, int begin, int end, int step, const intList & at,
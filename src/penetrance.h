@@ -134,6 +134,10 @@ public:
 	}
 
 
+protected:
+	/// set penetrance to individuals in the current (virtual) subpopulation
+	virtual void applyToSubPop(Population & pop, size_t subPop, bool savePene, size_t infoIdx) const;
+
 private:
 	/// how to handle ancestral gen
 	const uintList m_ancGens;
@@ -385,6 +389,14 @@ private:
  *  of loci index (with respect to all genotype of individuals, not just
  *  the first ploidy) and alleles. The returned penetrance values will be
  *  used to determine the affection status of each individual.
+ *
+ *  If \e vectorized is set to \c True, the function is called once for each
+ *  (virtual) subpopulation. Genotypes are passed as a matrix with one row of
+ *  alleles (arranged locus by locus, including unused alleles on sex and
+ *  mitochondrial chromosomes) for each individual, and information fields are
+ *  passed as arrays of values. The function should return an array or a
+ *  sequence of penetrance values, one for each individual. Parameters \c ind
+ *  and \c mut are not supported in this mode.
  */
 class PyPenetrance : public BasePenetrance
 {
@@ -396,6 +408,9 @@ public:
 	 *  of chromosome position pairs, \c ALL_AVAIL, or a function with optional
 	 *  parameter \c pop that will be called at each ganeeration to determine
 	 *  indexes of loci. The return value will be treated as Individual penetrance.
+	 *  If \e vectorized is \c True, \e func is called with genotypes and
+	 *  information fields of all individuals in a (virtual) subpopulation and
+	 *  should return their penetrance values.
 	 */
 	PyPenetrance(PyObject * func,
 		const lociList & loci = vectoru(),
@@ -403,9 +418,9 @@ public:
 		int begin = 0, int end = -1, int step = 1,
 		const intList & at = vectori(), const intList & reps = intList(),
 		const subPopList & subPops = subPopList(),
-		const stringList & infoFields = vectorstr()) :
+		const stringList & infoFields = vectorstr(), bool vectorized = false) :
 		BasePenetrance(ancGens, begin, end, step, at, reps, subPops, infoFields),
-		m_func(func), m_loci(loci)
+		m_func(func), m_loci(loci), m_vectorized(vectorized)
 	{
 		DBG_ASSERT(m_func.isValid(), ValueError, "Passed variable is not a callable python function.");
 	};
@@ -438,12 +453,19 @@ public:
 	}
 
 
+protected:
+	/// call func with all individuals of a subpopulation if vectorized
+	virtual void applyToSubPop(Population & pop, size_t subPop, bool savePene, size_t infoIdx) const;
+
 private:
 	/// user supplied python function
 	const pyFunc m_func;
 
 	/// susceptibility loci
 	const lociList m_loci;
+
+	/// call func with all individuals in a subpopulation
+	const bool m_vectorized;
 };
 
 
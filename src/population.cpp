@@ -29,6 +29,10 @@
 // for file compression
 #include "boost_pch.hpp"
 
+#include <fstream>
+#include <cstring>
+#include <cstdio>
+
 #if PY_VERSION_HEX >= 0x03000000
 #  define PyInt_FromLong(x) PyLong_FromLong(x)
 #endif
@@ -38,6 +42,179 @@ using std::max_element;
 
 namespace simuPOP {
 
+void getValidLoci(const GenoStruTrait & stru, const vectoru & loci, ValidLoci & valid)
+{
+	size_t ply = stru.ploidy();
+
+	for (size_t s = 0; s < 2; ++s)
+		valid[s].assign(ply, vectoru());
+	for (size_t idx = 0; idx < loci.size(); ++idx) {
+		size_t chromType = stru.chromType(stru.chromLocusPair(loci[idx]).first);
+		for (size_t p = 0; p < ply; ++p) {
+			if (chromType == CHROMOSOME_X) {
+				if (p == 0)
+					valid[MALE - 1][p].push_back(idx);
+				if (p <= 1)
+					valid[FEMALE - 1][p].push_back(idx);
+			} else if (chromType == CHROMOSOME_Y) {
+				if (p == 1)
+					valid[MALE - 1][p].push_back(idx);
+			} else if (chromType == MITOCHONDRIAL) {
+				if (p == 0) {
+					valid[MALE - 1][p].push_back(idx);
+					valid[FEMALE - 1][p].push_back(idx);
+				}
+			} else {
+				valid[MALE - 1][p].push_back(idx);
+				valid[FEMALE - 1][p].push_back(idx);
+			}
+		}
+	}
+}
+
+
+void TrackedAlleles::setLoci(const vectoru & loci, const GenoStruTrait & stru)
+{
+	m_loci = loci;
+	m_index.clear();
+	m_counts.clear();
+	m_numOfSex.clear();
+	m_valid = false;
+	if (loci.empty()) {
+		m_genoStru = MaxTraitIndex;
+		return;
+	}
+	m_genoStru = stru.genoStruIdx();
+	m_index.resize(stru.totNumLoci(), -1);
+	for (size_t idx = 0; idx < loci.size(); ++idx) {
+		if (loci[idx] >= stru.totNumLoci())
+			throw IndexError((boost::format("Locus index %1% out of range.") % loci[idx]).str());
+		if (m_index[loci[idx]] != -1)
+			throw ValueError((boost::format("Locus %1% is specified more than once.") % loci[idx]).str());
+		m_index[loci[idx]] = static_cast<ssize_t>(idx);
+	}
+	ValidLoci valid;
+	getValidLoci(stru, m_loci, valid);
+	for (size_t s = 0; s < 2; ++s) {
+		m_offsets[s].clear();
+		m_indexes[s].clear();
+		for (size_t p = 0; p < valid[s].size(); ++p)
+			for (size_t i = 0; i < valid[s][p].size(); ++i) {
+				m_offsets[s].push_back(p * stru.totNumLoci() + loci[valid[s][p][i]]);
+				m_indexes[s].push_back(valid[s][p][i]);
+			}
+	}
+}
+
+
+bool TrackedAlleles::tracks(const vectoru & loci) const
+{
+	for (size_t i = 0; i < loci.size(); ++i)
+		if (loci[i] >= m_index.size() || m_index[loci[i]] < 0)
+			return false;
+	return true;
+}
+
+
+void TrackedAlleles::reset(size_t numSubPop)
+{
+	m_counts.assign(numSubPop, vectoru());
+	m_numOfSex.assign(numSubPop, vectoru(2, 0));
+	m_valid = true;
+}
+
+
+void TrackedAlleles::checkCounted(const vectoru & subPopSizes)
+{
+	if (!m_valid)
+		return;
+	if (m_numOfSex.size() != subPopSizes.size()) {
+		m_valid = false;
+		return;
+	}
+	for (size_t sp = 0; sp < subPopSizes.size(); ++sp)
+		if (m_numOfSex[sp][0] + m_numOfSex[sp][1] != subPopSizes[sp]) {
+			m_valid = false;
+			return;
+		}
+}
+
+
+void TrackedAlleles::count(ConstRawIndIterator begin, ConstRawIndIterator end,
+                           vectoru & counts, vectoru & numOfSex) const
+{
+	size_t nLoci = m_loci.size();
+
+	if (counts.size() < 2 * nLoci)
+		counts.resize(2 * nLoci, 0);
+	if (numOfSex.size() < 2)
+		numOfSex.resize(2, 0);
+	for (; begin != end; ++begin) {
+		size_t s = begin->sex() - 1;
+		++numOfSex[s];
+		GenoIterator geno = begin->genoBegin();
+		const vectoru & offsets = m_offsets[s];
+		const vectoru & idxs = m_indexes[s];
+		for (size_t i = 0; i < offsets.size(); ++i) {
+			size_t a = DEREF_ALLELE(geno + offsets[i]);
+			if (a * nLoci >= counts.size())
+				counts.resize((a + 1) * nLoci, 0);
+			++counts[a * nLoci + idxs[i]];
+		}
+	}
+}
+
+
+void TrackedAlleles::add(size_t subPop, const vectoru & counts, const vectoru & numOfSex)
+{
+	vectoru & cnt = m_counts[subPop];
+
+	if (counts.size() > cnt.size())
+		cnt.resize(counts.size(), 0);
+	for (size_t i = 0; i < counts.size(); ++i)
+		cnt[i] += counts[i];
+	for (size_t s = 0; s < numOfSex.size(); ++s)
+		m_numOfSex[subPop][s] += numOfSex[s];
+}
+
+
+void TrackedAlleles::get(size_t subPop, const vectoru & loci, vectoru & counts, vectoru & totals) const
+{
+	size_t nLoci = m_loci.size();
+	size_t nReq = loci.size();
+	const vectoru & cnt = m_counts[subPop];
+	size_t nAlleles = std::max(size_t(2), cnt.size() / nLoci);
+
+	counts.assign(nAlleles * nReq, 0);
+	totals.resize(nReq);
+	vectoru allTotals(nLoci, 0);
+	for (size_t s = 0; s < 2; ++s)
+		for (size_t i = 0; i < m_indexes[s].size(); ++i)
+			allTotals[m_indexes[s][i]] += m_numOfSex[subPop][s];
+	for (size_t i = 0; i < nReq; ++i) {
+		size_t idx = m_index[loci[i]];
+		totals[i] = allTotals[idx];
+		for (size_t a = 0; a * nLoci < cnt.size(); ++a)
+			counts[a * nReq + i] = cnt[a * nLoci + idx];
+	}
+}
+
+
+void TrackedAlleles::swap(TrackedAlleles & rhs)
+{
+	m_loci.swap(rhs.m_loci);
+	m_index.swap(rhs.m_index);
+	for (size_t s = 0; s < 2; ++s) {
+		m_offsets[s].swap(rhs.m_offsets[s]);
+		m_indexes[s].swap(rhs.m_indexes[s]);
+	}
+	std::swap(m_genoStru, rhs.m_genoStru);
+	m_counts.swap(rhs.m_counts);
+	m_numOfSex.swap(rhs.m_numOfSex);
+	std::swap(m_valid, rhs.m_valid);
+}
+
+
 Population::Population(const uintList & size,
 	float ploidy,
 	const uintList & loci,
@@ -67,6 +244,7 @@ Population::Population(const uintList & size,
 	m_ancestralPops(0),
 	m_curAncestralGen(0),
 	m_indOrdered(true),
+	m_trackedAlleles(),
 	m_gen(0),
 	m_rep(0)
 {
@@ -126,6 +304,7 @@ Population::Population(const Population & rhs) :
 	m_vars(rhs.m_vars),                                                                     // variables will be copied
 	m_curAncestralGen(rhs.m_curAncestralGen),
 	m_indOrdered(true),
+	m_trackedAlleles(rhs.m_trackedAlleles),
 	m_gen(rhs.m_gen),
 	m_rep(rhs.m_rep)
 {
@@ -134,6 +313,9 @@ Population::Population(const Population & rhs) :
 
 	try {
 		m_inds.resize(rhs.m_popSize);
+#ifdef MUTANTALLELE
+		m_genotype.set_block_size(rhs.m_genotype.block_size());
+#endif
 		m_genotype.resize(m_popSize * genoSize());
 		LINEAGE_EXPR(m_lineage.resize(m_popSize * genoSize()));
 		// have 0 length for mpi/non-head node
@@ -248,6 +430,22 @@ Population * Population::clone() const
 }
 
 
+Population * Population::snapshot() const
+{
+	Population * pop = new Population(*this);
+
+	pop->m_pickledVars = varsAsString(true);
+	// release copied variables and splitter, which may contain Python objects
+	SharedVariables vars;
+	pop->m_vars.swap(vars);
+	if (pop->m_vspSplitter) {
+		delete pop->m_vspSplitter;
+		pop->m_vspSplitter = NULL;
+	}
+	return pop;
+}
+
+
 size_t Population::subPopByName(const string & name) const
 {
 	vectorstr::const_iterator it = find(m_subPopNames.begin(), m_subPopNames.end(), name);
@@ -710,6 +908,8 @@ PyObject * Population::genotype(vspID subPopID)
 		"This operation is not allowed when there is an activated virtual subpopulation");
 
 	syncIndPointers();
+	// genotypes can be changed through the returned array
+	m_trackedAlleles.invalidate();
 	if (!vsp.valid()) {
 		// directly expose values. Do not copy data over.
 		return Allele_Vec_As_NumArray(m_genotype.begin(), m_genotype.end());
@@ -744,28 +944,85 @@ pyMutantIterator Population::mutants(vspID subPopID)
 }
 
 
-void Population::setGenotype(const uintList & genoList, vspID subPopID)
+// Assign n alleles starting at ptr with values, which are reused
+// cyclically starting from values[j].
+template <typename T>
+void assignAlleles(GenoIterator ptr, size_t n, const T * values, size_t sz, size_t & j)
 {
-	const vectoru & geno = genoList.elems();
+	for (size_t i = 0; i < n; ++i, ++ptr) {
+		REF_ASSIGN_ALLELE(ptr, TO_ALLELE(values[j]));
+		if (++j == sz)
+			j = 0;
+	}
+}
+
+
+#if !defined(BINARYALLELE) && !defined(MUTANTALLELE)
+// values of the allele type are copied to the genotype storage in blocks
+void assignAlleles(GenoIterator ptr, size_t n, const Allele * values, size_t sz, size_t & j)
+{
+	while (n > 0) {
+		size_t k = std::min(n, sz - j);
+		memcpy(&*ptr, values + j, k * sizeof(Allele));
+		ptr += k;
+		n -= k;
+		j += k;
+		if (j == sz)
+			j = 0;
+	}
+}
+
 
+#endif
+
+template <typename T>
+void Population::setGenotypeFrom(const T * geno, size_t sz, vspID subPopID, const lociList & loci_)
+{
 	vspID subPop = subPopID.resolve(*this);
 
+	DBG_FAILIF(sz == 0, ValueError, "No genotype is provided.");
+
+	m_trackedAlleles.invalidate();
+	if (!loci_.allAvail()) {
+		const vectoru & loci = loci_.elems(this);
+		DBG_FAILIF(subPop.valid() && hasActivatedVirtualSubPop(), ValueError,
+			"This operation is not allowed when there is an activated virtual subpopulation");
+		for (size_t j = 0; j < loci.size(); ++j) {
+			CHECKRANGEABSLOCUS(loci[j]);
+		}
+		if (subPop.valid()) {
+			CHECKRANGESUBPOP(subPop.subPop());
+			activateVirtualSubPop(subPop);
+		}
+		IndIterator it = subPop.valid() ? indIterator(subPop.subPop()) : indIterator();
+		size_t i = 0;
+		for (; it.valid(); ++it)
+			for (size_t p = 0; p < ploidy(); ++p) {
+				GenoIterator ptr = it->genoBegin(p);
+				for (size_t j = 0; j < loci.size(); ++j) {
+					REF_ASSIGN_ALLELE(ptr + loci[j], TO_ALLELE(geno[i]));
+					if (++i == sz)
+						i = 0;
+				}
+			}
+		if (subPop.valid())
+			deactivateVirtualSubPop(subPop.subPop());
+		return;
+	}
+
 #ifdef MUTANTALLELE
 	// a special case: clear genotype for every one. This is
 	// useful for mutant modules
-	if (!subPop.valid() && geno.size() == 1 && geno[0] == 0) {
+	if (!subPop.valid() && sz == 1 && geno[0] == 0) {
 		m_genotype.clear();
 		return;
 	}
 #endif
 
 	syncIndPointers();
+	size_t j = 0;
 	if (!subPop.valid()) {
-		GenoIterator ptr = m_genotype.begin();
-		size_t sz = geno.size();
-		for (size_t i = 0; i < popSize() * genoSize(); ++i, ++ptr) {
-			REF_ASSIGN_ALLELE(ptr, TO_ALLELE(geno[i % sz]));
-		}
+		assignAlleles(m_genotype.begin(), popSize() * genoSize(), geno, sz, j);
 		return;
 	}
 
@@ -775,36 +1032,115 @@ void Population::setGenotype(const uintList & genoList, vspID subPopID)
 	size_t sp = subPop.subPop();
 	CHECKRANGESUBPOP(sp);
 
-	size_t sz = geno.size();
-	if (!subPop.isVirtual()) {
-		GenoIterator ptr = genoBegin(sp, true);
-		for (size_t i = 0; i < subPopSize(sp) * genoSize(); ++i, ++ptr)
-			REF_ASSIGN_ALLELE(ptr, TO_ALLELE(geno[i % sz]));
-	} else {
+	if (!subPop.isVirtual())
+		assignAlleles(genoBegin(sp, true), subPopSize(sp) * genoSize(), geno, sz, j);
+	else {
 		activateVirtualSubPop(subPop);
 		IndIterator it = indIterator(sp);
-		size_t i = 0;
 		for (; it.valid(); ++it)
-			for (GenoIterator git = it->genoBegin(); git != it->genoEnd(); ++git, ++i)
-				REF_ASSIGN_ALLELE(git, TO_ALLELE(geno[i % sz]));
+			assignAlleles(it->genoBegin(), genoSize(), geno, sz, j);
 		deactivateVirtualSubPop(subPop.subPop());
 	}
 }
 
 
-void Population::setLineage(const uintList & lineageList, vspID subPopID)
+void Population::setGenotype(const vectoru & geno, vspID subPop, const lociList & loci)
+{
+	setGenotypeFrom(geno.empty() ? NULL : &geno[0], geno.size(), subPop, loci);
+}
+
+
+// alleles cannot be negative
+template <typename T>
+const T * nonNegativeAlleles(const T * geno, size_t size)
+{
+	for (size_t i = 0; i < size; ++i)
+		if (geno[i] < 0)
+			throw ValueError("Negative alleles are given.");
+	return geno;
+}
+
+
+void Population::setGenotype(PyObject * geno, vspID subPop, const lociList & loci)
+{
+	Py_buffer view;
+	char type = 0;
+	bool isBuffer = PyObj_GetNumBuffer(geno, view, type);
+
+	if (isBuffer && (type == 'f' || type == 'd')) {
+		PyBuffer_Release(&view);
+		isBuffer = false;
+	}
+	if (!isBuffer) {
+		// lists and numbers. uintList rejects buffers of floating point numbers.
+		setGenotype(uintList(geno).elems(), subPop, loci);
+		return;
+	}
+	size_t sz = view.itemsize == 0 ? 0 : view.len / view.itemsize;
+	try {
+		switch (type) {
+		case 'b': setGenotypeFrom(nonNegativeAlleles(static_cast<const signed char *>(view.buf), sz), sz, subPop, loci); break;
+		case 'B': setGenotypeFrom(static_cast<const unsigned char *>(view.buf), sz, subPop, loci); break;
+		case '?': setGenotypeFrom(static_cast<const bool *>(view.buf), sz, subPop, loci); break;
+		case 'h': setGenotypeFrom(nonNegativeAlleles(static_cast<const short *>(view.buf), sz), sz, subPop, loci); break;
+		case 'H': setGenotypeFrom(static_cast<const unsigned short *>(view.buf), sz, subPop, loci); break;
+		case 'i': setGenotypeFrom(nonNegativeAlleles(static_cast<const int *>(view.buf), sz), sz, subPop, loci); break;
+		case 'I': setGenotypeFrom(static_cast<const unsigned int *>(view.buf), sz, subPop, loci); break;
+		case 'l': setGenotypeFrom(nonNegativeAlleles(static_cast<const long *>(view.buf), sz), sz, subPop, loci); break;
+		case 'L': setGenotypeFrom(static_cast<const unsigned long *>(view.buf), sz, subPop, loci); break;
+		case 'q': setGenotypeFrom(nonNegativeAlleles(static_cast<const long long *>(view.buf), sz), sz, subPop, loci); break;
+		case 'Q': setGenotypeFrom(static_cast<const unsigned long long *>(view.buf), sz, subPop, loci); break;
+		case 'n': setGenotypeFrom(nonNegativeAlleles(static_cast<const Py_ssize_t *>(view.buf), sz), sz, subPop, loci); break;
+		case 'N': setGenotypeFrom(static_cast<const size_t *>(view.buf), sz, subPop, loci); break;
+		}
+	} catch (...) {
+		PyBuffer_Release(&view);
+		throw;
+	}
+	PyBuffer_Release(&view);
+}
+
+
+void Population::setLineage(const uintList & lineageList, vspID subPopID, const lociList & loci_)
 {
 #ifdef LINEAGE
 	const vectoru & lineage = lineageList.elems();
 
 	vspID subPop = subPopID.resolve(*this);
+	size_t sz = lineage.size();
+
+	DBG_FAILIF(sz == 0, ValueError, "No lineage is provided.");
+
+	if (!loci_.allAvail()) {
+		const vectoru & loci = loci_.elems(this);
+		DBG_FAILIF(subPop.valid() && hasActivatedVirtualSubPop(), ValueError,
+			"This operation is not allowed when there is an activated virtual subpopulation");
+		if (subPop.valid()) {
+			CHECKRANGESUBPOP(subPop.subPop());
+			activateVirtualSubPop(subPop);
+		}
+		IndIterator it = subPop.valid() ? indIterator(subPop.subPop()) : indIterator();
+		size_t i = 0;
+		for (; it.valid(); ++it)
+			for (size_t p = 0; p < ploidy(); ++p)
+				for (size_t j = 0; j < loci.size(); ++j) {
+					it->setAlleleLineage(static_cast<long>(lineage[i]), loci[j], static_cast<int>(p));
+					if (++i == sz)
+						i = 0;
+				}
+		if (subPop.valid())
+			deactivateVirtualSubPop(subPop.subPop());
+		return;
+	}
 
 	syncIndPointers();
 	if (!subPop.valid()) {
 		LineageIterator ptr = m_lineage.begin();
-		size_t sz = lineage.size();
-		for (size_t i = 0; i < popSize() * genoSize(); ++i)
-			*(ptr++) = static_cast<long>(lineage[i % sz]);
+		for (size_t i = 0, j = 0; i < popSize() * genoSize(); ++i) {
+			*(ptr++) = static_cast<long>(lineage[j]);
+			if (++j == sz)
+				j = 0;
+		}
 		return;
 	}
 
@@ -814,11 +1150,13 @@ void Population::setLineage(const uintList & lineageList, vspID subPopID)
 	size_t sp = subPop.subPop();
 	CHECKRANGESUBPOP(sp);
 
-	size_t sz = lineage.size();
 	if (!subPop.isVirtual()) {
 		LineageIterator ptr = lineageBegin(sp, true);
-		for (size_t i = 0; i < subPopSize(sp) * genoSize(); ++i)
-			*(ptr++) = static_cast<long>(lineage[i % sz]);
+		for (size_t i = 0, j = 0; i < subPopSize(sp) * genoSize(); ++i) {
+			*(ptr++) = static_cast<long>(lineage[j]);
+			if (++j == sz)
+				j = 0;
+		}
 	} else {
 		activateVirtualSubPop(subPop);
 		IndIterator it = indIterator(sp);
@@ -831,6 +1169,7 @@ void Population::setLineage(const uintList & lineageList, vspID subPopID)
 #else
 	(void)lineageList;
 	(void)subPopID;
+	(void)loci_;
 #endif
 }
 
@@ -887,6 +1226,10 @@ void Population::fitSubPopStru(const vectoru & newSubPopSizes,
 		try {
 			if (step != 0 && m_popSize > MaxIndexSize / step)
 				throw RuntimeError("Population size times number of loci exceed maximum index size.");
+#ifdef MUTANTALLELE
+			// each individual stores its mutants in its own block
+			m_genotype.set_block_size(step);
+#endif
 			m_genotype.resize(m_popSize * step);
 			LINEAGE_EXPR(m_lineage.resize(m_popSize * step));
 			m_info.resize(m_popSize * is);
@@ -951,6 +1294,9 @@ void Population::fitGenoStru(size_t stru)
 	for (int depth = ancestralGens(); depth >= 0; --depth) {
 		useAncestralGen(depth);
 		if (oldSize != newSize) {
+#ifdef MUTANTALLELE
+			m_genotype.set_block_size(newSize);
+#endif
 			m_genotype.resize(newSize * popSize());
 			LINEAGE_EXPR(m_lineage.resize(newSize * popSize()));
 		}
@@ -986,6 +1332,9 @@ void Population::setSubPopStru(const vectoru & newSubPopSizes,
 	DBG_ASSERT(newSubPopNames.empty() || newSubPopNames.size() == newSubPopSizes.size(), SystemError,
 		"subpopulation names can either be empty, or be specified for all subpopulations.");
 
+	// individuals might have been moved across subpopulations
+	m_trackedAlleles.invalidate();
+
 	if (newSubPopSizes.empty())
 		m_subPopSize = vectoru(1, 0);
 	else
@@ -1145,6 +1494,7 @@ void Population::setSubPopByIndInfo(const string & field)
 	// sort individuals first
 	parallelSort(rawIndBegin(), rawIndEnd(), indCompare(info));
 	setIndOrdered(false);
+	m_trackedAlleles.invalidate();
 
 	// sort individuals first
 	// remove individuals with negative index.
@@ -1164,9 +1514,9 @@ void Population::setSubPopByIndInfo(const string & field)
 
 		// allocate new genotype and inds
 #ifdef MUTANTALLELE
-		vectorm newGenotype(genoSize() * newPopSize);
+		vectorm newGenotype(genoSize() * newPopSize, genoSize());
 #else
-		vectora newGenotype(genoSize() * newPopSize);
+		vectorg newGenotype(genoSize() * newPopSize);
 #endif
 		LINEAGE_EXPR(vectori newLineage(genoSize() * newPopSize));
 		vectorf newInfo(newPopSize * infoSize());
@@ -1292,7 +1642,7 @@ void Population::removeSubPops(const subPopList & subPops)
 	RawIndIterator newInd = m_inds.begin();
 	GenoIterator oldPtr = m_genotype.begin();
 #ifdef MUTANTALLELE
-	vectorm new_genotype;
+	vectorm new_genotype(0, step);
 #else
 	GenoIterator newPtr = m_genotype.begin();
 #endif
@@ -1435,7 +1785,7 @@ void Population::removeMarkedIndividuals()
 	InfoIterator newInfoPtr = m_info.begin();
 	GenoIterator oldPtr = m_genotype.begin();
 #ifdef MUTANTALLELE
-	vectorm new_genotype;
+	vectorm new_genotype(0, step);
 #else
 	GenoIterator newPtr = m_genotype.begin();
 #endif
@@ -1681,9 +2031,9 @@ size_t Population::mergeSubPops(const uintList & subPops, const string & name, i
 	vector<Individual> new_inds;
 	vectorf new_info;
 #ifdef MUTANTALLELE
-	vectorm new_genotype;
+	vectorm new_genotype(0, step);
 #else
-	vectora new_genotype;
+	vectorg new_genotype;
 	new_genotype.reserve(step * popSize());
 #endif
 #ifdef LINEAGE
@@ -1752,9 +2102,9 @@ void Population::addChromFrom(const Population & pop)
 		DBG_FAILIF(m_subPopSize != pop.m_subPopSize, ValueError,
 			"Can not add chromosomes from a population with different subpopulation sizes");
 #ifdef MUTANTALLELE
-		vectorm newGenotype(genoSize() * m_popSize);
+		vectorm newGenotype(genoSize() * m_popSize, genoSize());
 #else
-		vectora newGenotype(genoSize() * m_popSize);
+		vectorg newGenotype(genoSize() * m_popSize);
 #endif
 		// append pop2 chromosomes to the first one
 		GenoIterator ptr = newGenotype.begin();
@@ -1900,9 +2250,9 @@ void Population::addLociFrom(const Population & pop, bool byName)
 			"Can not add chromosomes from a population with different subpopulation sizes");
 		//
 #ifdef MUTANTALLELE
-		vectorm newGenotype(genoSize() * m_popSize);
+		vectorm newGenotype(genoSize() * m_popSize, genoSize());
 #else
-		vectora newGenotype(genoSize() * m_popSize);
+		vectorg newGenotype(genoSize() * m_popSize);
 #endif
 		// merge chromosome by chromosome
 		GenoIterator ptr = newGenotype.begin();
@@ -1974,9 +2324,9 @@ void Population::addChrom(const floatList & lociPosList, const stringList & loci
 		useAncestralGen(depth);
 		size_t newPopGenoSize = genoSize() * m_popSize;
 #ifdef MUTANTALLELE
-		vectorm newGenotype(newPopGenoSize);
+		vectorm newGenotype(newPopGenoSize, genoSize());
 #else
-		vectora newGenotype(newPopGenoSize, 0);
+		vectorg newGenotype(newPopGenoSize, 0);
 #endif
 
 		// copy data over
@@ -2056,9 +2406,9 @@ vectoru Population::addLoci(const uintList & chromList, const floatList & posLis
 		//
 		size_t newPopGenoSize = genoSize() * m_popSize;
 #ifdef MUTANTALLELE
-		vectorm newGenotype(newPopGenoSize);
+		vectorm newGenotype(newPopGenoSize, genoSize());
 #else
-		vectora newGenotype(newPopGenoSize, 0);
+		vectorg newGenotype(newPopGenoSize, 0);
 #endif
 		// copy data over
 		GenoIterator newPtr = newGenotype.begin();
@@ -2121,9 +2471,9 @@ void Population::resize(const uintList & sizeList, bool propagate)
 	size_t step = genoSize();
 	size_t infoStep = infoSize();
 #ifdef MUTANTALLELE
-	vectorm newGenotype(genoSize() * newPopSize);
+	vectorm newGenotype(genoSize() * newPopSize, genoSize());
 #else
-	vectora newGenotype(genoSize() * newPopSize);
+	vectorg newGenotype(genoSize() * newPopSize);
 #endif
 	GenoIterator ptr = newGenotype.begin();
 	for (size_t i = 0; i < newPopSize; ++i, ptr += step, infoPtr += infoStep) {
@@ -2199,9 +2549,9 @@ Population & Population::extractSubPops(const subPopList & subPops, bool rearran
 
 	vector<Individual> new_inds;
 #ifdef MUTANTALLELE
-	vectorm new_genotype;
+	vectorm new_genotype(0, step);
 #else
-	vectora new_genotype;
+	vectorg new_genotype;
 #endif
 	LINEAGE_EXPR(vectori new_lineage);
 	vectorf new_info;
@@ -2397,9 +2747,9 @@ Population & Population::extractMarkedIndividuals() const
 
 	vector<Individual> new_inds(sz);
 #ifdef MUTANTALLELE
-	vectorm new_genotype(sz * step);
+	vectorm new_genotype(sz * step, step);
 #else
-	vectora new_genotype(sz * step);
+	vectorg new_genotype(sz * step);
 #endif
 	LINEAGE_EXPR(vectori new_lineage(sz * step));
 	vectorf new_info(sz * infoStep);
@@ -2560,6 +2910,54 @@ Population & Population::extractIndividuals(const uintList & indexList,
 }
 
 
+void Population::extractGenoStructure(Population & pop, const vectoru & loci,
+                                      const vectorstr & infoFields) const
+{
+	// figure out number of loci.
+	vectoru new_numLoci;
+	vectorf new_lociPos;
+	vectorstr new_lociNames;
+	matrixstr new_alleleNames;
+	vectoru new_chromTypes;
+	vectorstr new_chromNames;
+	if (!loci.empty()) {
+		vectoru::const_iterator it = loci.begin();
+		vectoru::const_iterator it_end = loci.end();
+		size_t last_ch = chromLocusPair(*it).first;
+		// create the first chromosome
+		new_numLoci.push_back(0);
+		new_chromTypes.push_back(chromType(last_ch));
+		new_chromNames.push_back(chromName(last_ch));
+		for (; it != it_end; ++it) {
+			DBG_FAILIF(*it >= totNumLoci(), IndexError,
+				(boost::format("Locus index %1% out of range.") % (*it)).str());
+			// if new chromosome
+			size_t ch = chromLocusPair(*it).first;
+			if (ch != last_ch) {
+				new_numLoci.push_back(0);
+				new_chromTypes.push_back(chromType(ch));
+				new_chromNames.push_back(chromName(ch));
+				last_ch = ch;
+			}
+			// add a locus
+			++new_numLoci.back();
+			new_lociPos.push_back(locusPos(*it));
+			new_lociNames.push_back(locusName(*it));
+			new_alleleNames.push_back(alleleNames(*it));
+		}
+	}
+	DBG_DO(DBG_POPULATION, cerr << "Extract population with \nnumLoci:" << new_numLoci
+		                        << "\nchromType: " << new_chromTypes
+		                        << "\nlociPos: " << new_lociPos
+		                        << "\nchromNames: " << new_chromNames
+		                        << "\nlociNames: " << new_lociNames
+		                        << "\ninfoFields: " << infoFields
+		                        << endl);
+	pop.setGenoStructure(ploidy(), new_numLoci, new_chromTypes, isHaplodiploid(),
+		new_lociPos, new_chromNames, new_alleleNames, new_lociNames, infoFields);
+}
+
+
 Population & Population::extract(const lociList & extractedLoci, const stringList & infoFieldList,
                                  const subPopList & _subPops, const uintList & ancGens) const
 {
@@ -2592,49 +2990,8 @@ Population & Population::extract(const lociList & extractedLoci, const stringLis
 		pop.setGenoStructure(ploidy(), numLoci(), chromTypes(), isHaplodiploid(),
 			lociPos(), chromNames(), allAlleleNames(), lociNames(), keptInfoFields);
 	} else {
-		// figure out number of loci.
-		vectoru new_numLoci;
-		vectorf new_lociPos;
-		vectorstr new_lociNames;
-		matrixstr new_alleleNames;
-		vectoru new_chromTypes;
-		vectorstr new_chromNames;
-		if (removeLoci && !loci.empty()) {
-			sort(new_loci.begin(), new_loci.end());
-			vectoru::const_iterator it = new_loci.begin();
-			vectoru::const_iterator it_end = new_loci.end();
-			size_t last_ch = chromLocusPair(*it).first;
-			// create the first chromosome
-			new_numLoci.push_back(0);
-			new_chromTypes.push_back(chromType(last_ch));
-			new_chromNames.push_back(chromName(last_ch));
-			for (; it != it_end; ++it) {
-				DBG_FAILIF(*it >= totNumLoci(), IndexError,
-					(boost::format("Locus index %1% out of range.") % (*it)).str());
-				// if new chromosome
-				size_t ch = chromLocusPair(*it).first;
-				if (ch != last_ch) {
-					new_numLoci.push_back(0);
-					new_chromTypes.push_back(chromType(ch));
-					new_chromNames.push_back(chromName(ch));
-					last_ch = ch;
-				}
-				// add a locus
-				++new_numLoci.back();
-				new_lociPos.push_back(locusPos(*it));
-				new_lociNames.push_back(locusName(*it));
-				new_alleleNames.push_back(alleleNames(*it));
-			}
-		}
-		DBG_DO(DBG_POPULATION, cerr << "Extract population with \nnumLoci:" << new_numLoci
-			                        << "\nchromType: " << new_chromTypes
-			                        << "\nlociPos: " << new_lociPos
-			                        << "\nchromNames: " << new_chromNames
-			                        << "\nlociNames: " << new_lociNames
-			                        << "\ninfoFields: " << keptInfoFields
-			                        << endl);
-		pop.setGenoStructure(ploidy(), new_numLoci, new_chromTypes, isHaplodiploid(),
-			new_lociPos, new_chromNames, new_alleleNames, new_lociNames, keptInfoFields);
+		sort(new_loci.begin(), new_loci.end());
+		extractGenoStructure(pop, new_loci, keptInfoFields);
 	}
 	size_t step = pop.genoSize();
 	size_t infoStep = pop.infoSize();
@@ -2696,13 +3053,13 @@ Population & Population::extract(const lociList & extractedLoci, const stringLis
 		vector<Individual> new_inds;
 #ifdef MUTANTALLELE
 		size_t newIdx = 0;
-		vectorm new_genotype;
+		vectorm new_genotype(0, step);
 		// this function uses push_back to insert mutants, which does not
 		// change the size of vectorm... a resize is needed.
 		if (removeLoci)
 			new_genotype.resize(size * step);
 #else
-		vectora new_genotype;
+		vectorg new_genotype;
 		new_genotype.reserve(size * step);
 #endif
 #ifdef LINEAGE
@@ -2798,7 +3155,7 @@ Population & Population::extract(const lociList & extractedLoci, const stringLis
 #ifdef MUTANTALLELE
 		vectorm::iterator ptr = new_genotype.begin();
 #else
-		vectora::iterator ptr = new_genotype.begin();
+		vectorg::iterator ptr = new_genotype.begin();
 #endif
 		for (size_t i = 0; i < size; ++i, ptr += step, infoPtr += infoStep) {
 			new_inds[i].setGenoStruIdx(pop.genoStruIdx());
@@ -2893,9 +3250,9 @@ void Population::removeLoci(const lociList & removeList, const lociList & keepLi
 		useAncestralGen(depth);
 		//
 #ifdef MUTANTALLELE
-		vectorm newGenotype(genoSize() * m_popSize);
+		vectorm newGenotype(genoSize() * m_popSize, genoSize());
 #else
-		vectora newGenotype(genoSize() * m_popSize);
+		vectorg newGenotype(genoSize() * m_popSize);
 #endif
 		// copy data over
 		GenoIterator newPtr = newGenotype.begin();
@@ -2948,6 +3305,7 @@ void Population::recodeAlleles(const uintListFunc & newAlleles, const lociList &
 	if (!loci_.allAvail() && loci.empty())
 		return;
 
+	m_trackedAlleles.invalidate();
 	DBG_FAILIF(alleleNames.size() > 1 &&
 		((loci_.allAvail() && alleleNames.size() != totNumLoci()) ||
 		 (!loci_.allAvail() && alleleNames.size() != loci.size())),
@@ -3130,6 +3488,15 @@ void Population::push(Population & rhs)
 	m_info.swap(rhs.m_info);
 	m_inds.swap(rhs.m_inds);
 	std::swap(m_indOrdered, rhs.m_indOrdered);
+	// allele counts of offspring are used if they are tracked at the same loci
+	// and if all offspring have been counted.
+	if (!m_trackedAlleles.empty()) {
+		if (rhs.m_trackedAlleles.loci() == m_trackedAlleles.loci()) {
+			m_trackedAlleles.swap(rhs.m_trackedAlleles);
+			m_trackedAlleles.checkCounted(m_subPopSize);
+		} else
+			m_trackedAlleles.invalidate();
+	}
 
 #ifdef MUTANTALLELE
 	// vectorm must be setGenoPtr after swap
@@ -3156,6 +3523,45 @@ void Population::push(Population & rhs)
 }
 
 
+void Population::trackAlleles(const lociList & loci)
+{
+#if defined(LONGALLELE) || defined(MUTANTALLELE)
+	if (!loci.empty())
+		throw ValueError("Tracking of allele counts is not available for long and mutant modules.");
+#endif
+	m_trackedAlleles.setLoci(loci.elems(this), *this);
+}
+
+
+bool Population::trackedAlleleCounts(size_t subPop, const vectoru & loci,
+                                     vectoru & counts, vectoru & totals)
+{
+	if (m_trackedAlleles.empty() || m_curAncestralGen != 0)
+		return false;
+	// loci might have been inserted or removed
+	if (m_trackedAlleles.genoStru() != genoStruIdx()) {
+		m_trackedAlleles.setLoci(vectoru(), *this);
+		return false;
+	}
+	if (!m_trackedAlleles.tracks(loci))
+		return false;
+	// subpopulation sizes might have been changed
+	m_trackedAlleles.checkCounted(m_subPopSize);
+	if (!m_trackedAlleles.valid()) {
+		DBG_DO(DBG_POPULATION, cerr << "Recount tracked alleles" << endl);
+		m_trackedAlleles.reset(numSubPop());
+		for (size_t sp = 0; sp < numSubPop(); ++sp) {
+			vectoru cnt;
+			vectoru numOfSex;
+			m_trackedAlleles.count(rawIndBegin(sp), rawIndEnd(sp), cnt, numOfSex);
+			m_trackedAlleles.add(sp, cnt, numOfSex);
+		}
+	}
+	m_trackedAlleles.get(subPop, loci, counts, totals);
+	return true;
+}
+
+
 vectorf Population::indInfo(const uintString & field, vspID subPopID)
 {
 	DBG_FAILIF(hasActivatedVirtualSubPop(), ValueError,
@@ -3183,6 +3589,25 @@ vectorf Population::indInfo(const uintString & field, vspID subPopID)
 }
 
 
+PyObject * Population::infoArray(vspID subPopID)
+{
+	vspID vsp = subPopID.resolve(*this);
+
+	DBG_FAILIF(vsp.isVirtual(), ValueError,
+		"Function infoArray currently does not support virtual subpopulation");
+	DBG_FAILIF(hasActivatedVirtualSubPop(), ValueError,
+		"This operation is not allowed when there is an activated virtual subpopulation");
+
+	syncIndPointers();
+	if (!vsp.valid())
+		return Info_Vec_As_NumArray(m_info.begin(), popSize(), infoSize());
+	size_t subPop = vsp.subPop();
+	CHECKRANGESUBPOP(subPop);
+	return Info_Vec_As_NumArray(m_info.begin() + m_subPopIndex[subPop] * infoSize(),
+		subPopSize(subPop), infoSize());
+}
+
+
 void Population::addInfoFields(const stringList & fieldList, double init)
 {
 	const vectorstr & fields = fieldList.elems();
@@ -3507,7 +3932,7 @@ void Population::save(boost::archive::text_oarchive & ar, const unsigned int ver
 	size_t numMutants = 0;
 	size_t shift = 0;
 #ifdef MUTANTALLELE
-	numMutants = m_genotype.data().size();
+	numMutants = m_genotype.count();
 	// first round: check number of mutants and if they are all the same
 	vectorm::const_val_iterator ptr = m_genotype.begin().get_val_iterator();
 	vectorm::const_val_iterator end = m_genotype.end().get_val_iterator();
@@ -3623,7 +4048,7 @@ void Population::save(boost::archive::text_oarchive & ar, const unsigned int ver
 		size_t shift = 0;
 		size_t lastPos = 0;
 #ifdef MUTANTALLELE
-		numMutants = m_genotype.data().size();
+		numMutants = m_genotype.count();
 		// first round: check number of mutants and if they are all the same
 		vectorm::const_val_iterator ptr = m_genotype.begin().get_val_iterator();
 		vectorm::const_val_iterator end = m_genotype.end().get_val_iterator();
@@ -3870,8 +4295,10 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 		}                                                                                   // if ma == 1
 		else {                                                                              // for non-binary types, ...
 			DBG_DO(DBG_POPULATION, cerr << "Load long from long. " << endl);
-			// long from long
-			ar & m_genotype;
+			// long from long, genotypes were archived as std::vector<Allele>
+			std::vector<Allele> data;
+			ar & data;
+			m_genotype.assign(data.begin(), data.end());
 		}
 #endif
 	}
@@ -3936,6 +4363,9 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 	InfoIterator infoPtr = m_info.begin();
 	size_t infoStep = infoSize();
 	size_t step = genoSize();
+#ifdef MUTANTALLELE
+	m_genotype.set_block_size(step);
+#endif
 	GenoIterator ptr = m_genotype.begin();
 	for (size_t i = 0; i < m_popSize; ++i, ptr += step, infoPtr += infoStep) {
 		m_inds[i].setGenoStruIdx(genoStruIdx());
@@ -4089,7 +4519,9 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 			} else {
 				DBG_DO(DBG_POPULATION, cerr << "Load long from long. " << endl);
 				// long type from long type.
-				ar & pd.m_genotype;
+				std::vector<Allele> data;
+				ar & data;
+				pd.m_genotype.assign(data.begin(), data.end());
 			}
 #endif
 		}
@@ -4134,6 +4566,9 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 		vector<Individual> & inds = p.m_inds;
 		size_t ps = inds.size();
 		infoPtr = p.m_info.begin();
+#ifdef MUTANTALLELE
+		p.m_genotype.set_block_size(step);
+#endif
 		ptr = p.m_genotype.begin();
 		for (size_t i = 0; i < ps; ++i, ptr += step, infoPtr += infoStep) {
 			inds[i].setGenoPtr(ptr);
@@ -4162,44 +4597,1261 @@ void Population::load(boost::archive::text_iarchive & ar, const unsigned int ver
 }
 
 
-void Population::save(const string & filename) const
+// A population saved in binary format starts with a fixed-size header,
+// followed by a number of sections and a section table at the end of the
+// file. Each section holds one piece of the population (e.g. genotype of
+// an ancestral generation) as raw bytes so that it can be located by
+// the section table and read with a single seek.
+const char BinaryPopMagic[8] = { 's', 'i', 'm', 'u', 'P', 'O', 'P', 'b' };
+const uint32_t BinaryPopVersion = 1;
+const uint32_t BinaryPopByteOrder = 0x01020304;
+
+// encoding of the GENOTYPE section
+const uint32_t DenseAlleles = 0;
+const uint32_t PackedBits = 1;
+const uint32_t SparseMutants = 2;
+
+// number of elements that are converted at a time when the file is saved
+// by another module
+const size_t BinaryPopBlockSize = 1 << 16;
+
+struct BinaryPopHeader
 {
-	boost::iostreams::filtering_ostream ofs;
-
-	// compress output
-	ofs.push(boost::iostreams::gzip_compressor());
-	// open file to write
-	boost::iostreams::file_sink dest(filename, std::ios::binary);
-	if (!dest.is_open())
-		throw ValueError("Cannot write to file " + filename);
-	ofs.push(dest);
-	// if ofs itself get into trouble
-	if (!ofs)
-		throw ValueError("Cannot save population to file " + filename);
-
-	boost::archive::text_oarchive oa(ofs);
-	oa << *this;
-}
+	char magic[8];
+	uint32_t version;
+	uint32_t byteOrder;
+	uint32_t alleleBits;
+	uint32_t flags;
+	uint64_t numSections;
+	uint64_t tableOffset;
+};
+
+struct BinaryPopSection
+{
+	char tag[8];
+	uint64_t gen;
+	uint64_t offset;
+	uint64_t size;
+};
 
 
-void Population::load(const string & filename)
+/* Write sections of a population to a binary file. Sections are written
+ * sequentially and the section table is appended by close().
+ */
+class BinaryPopWriter
 {
-	boost::iostreams::filtering_istream ifs;
+public:
+	BinaryPopWriter(const string & filename) : m_filename(filename), m_sections()
+	{
+		m_file.open(filename.c_str(), std::ios::out | std::ios::binary | std::ios::trunc);
+		if (!m_file)
+			throw ValueError("Cannot write to file " + filename);
+		// write a placeholder header, which is rewritten by close()
+		BinaryPopHeader header;
+		memset(&header, 0, sizeof(BinaryPopHeader));
+		write(&header, sizeof(BinaryPopHeader));
+	}
 
-	ifs.push(boost::iostreams::gzip_decompressor());
-	ifs.push(boost::iostreams::file_source(filename, std::ios::binary));
-	// do not have to test again.
-	if (!ifs)
-		throw ValueError("Can not open file " + filename);
 
-	// try to load the file
-	try {
-		boost::archive::text_iarchive ia(ifs);
-		ia >> *this;
-	} catch (const std::exception & e) {
-		throw ValueError("Failed to load Population " + filename + " (" + e.what() + ")\n");
-	} catch (...) {
-		throw ValueError("Failed to load Population " + filename + ".\n");
+	void beginSection(const char * tag, size_t gen)
+	{
+		// align sections to 8 bytes so that data can be used in place
+		// when the file is mapped to memory.
+		size_t pos = static_cast<size_t>(m_file.tellp());
+		if (pos % 8 != 0) {
+			char padding[8] = { 0 };
+			write(padding, 8 - pos % 8);
+		}
+
+		BinaryPopSection sec;
+
+		memset(&sec, 0, sizeof(BinaryPopSection));
+		strncpy(sec.tag, tag, 8);
+		sec.gen = gen;
+		sec.offset = static_cast<uint64_t>(m_file.tellp());
+		m_sections.push_back(sec);
+	}
+
+
+	void endSection()
+	{
+		BinaryPopSection & sec = m_sections.back();
+
+		sec.size = static_cast<uint64_t>(m_file.tellp()) - sec.offset;
+	}
+
+
+	void write(const void * data, size_t size)
+	{
+		if (size > 0)
+			m_file.write(reinterpret_cast<const char *>(data), size);
+	}
+
+
+	template<typename T>
+	void writeValue(T value)
+	{
+		write(&value, sizeof(T));
+	}
+
+
+	void writeString(const string & str)
+	{
+		writeValue<uint64_t>(str.size());
+		write(str.data(), str.size());
+	}
+
+
+	void close()
+	{
+		BinaryPopHeader header;
+
+		memcpy(header.magic, BinaryPopMagic, 8);
+		header.version = BinaryPopVersion;
+		header.byteOrder = BinaryPopByteOrder;
+#ifdef BINARYALLELE
+		header.alleleBits = 1;
+#else
+		header.alleleBits = sizeof(Allele) * 8;
+#endif
+		header.flags = 0;
+		header.numSections = m_sections.size();
+		header.tableOffset = static_cast<uint64_t>(m_file.tellp());
+		if (!m_sections.empty())
+			write(&m_sections[0], m_sections.size() * sizeof(BinaryPopSection));
+		m_file.seekp(0);
+		write(&header, sizeof(BinaryPopHeader));
+		m_file.close();
+		if (!m_file)
+			throw ValueError("Failed to save population to file " + m_filename);
+	}
+
+
+private:
+	std::ofstream m_file;
+
+	string m_filename;
+
+	vector<BinaryPopSection> m_sections;
+};
+
+
+/* Read sections of a population from a binary file.
+ */
+class BinaryPopReader
+{
+public:
+	BinaryPopReader(const string & filename) : m_filename(filename), m_sections()
+	{
+		m_file.open(filename.c_str(), std::ios::in | std::ios::binary);
+		if (!m_file)
+			throw ValueError("Can not open file " + filename);
+		read(&m_header, sizeof(BinaryPopHeader));
+		if (memcmp(m_header.magic, BinaryPopMagic, 8) != 0)
+			throw ValueError("File " + filename + " is not a population saved in binary format.");
+		if (m_header.byteOrder != BinaryPopByteOrder)
+			throw ValueError("File " + filename + " was saved on a platform with a different byte order.");
+		if (m_header.version > BinaryPopVersion)
+			throw ValueError("File " + filename + " was saved by a newer version of simuPOP.");
+		m_sections.resize(m_header.numSections);
+		m_file.seekg(m_header.tableOffset);
+		if (!m_sections.empty())
+			read(&m_sections[0], m_sections.size() * sizeof(BinaryPopSection));
+	}
+
+
+	bool hasSection(const char * tag, size_t gen) const
+	{
+		for (size_t i = 0; i < m_sections.size(); ++i)
+			if (strncmp(m_sections[i].tag, tag, 8) == 0 && m_sections[i].gen == gen)
+				return true;
+		return false;
+	}
+
+
+	const BinaryPopSection & section(const char * tag, size_t gen) const
+	{
+		for (size_t i = 0; i < m_sections.size(); ++i)
+			if (strncmp(m_sections[i].tag, tag, 8) == 0 && m_sections[i].gen == gen)
+				return m_sections[i];
+		throw ValueError((boost::format("Section %1% of generation %2% is not found in file %3%.")
+			              % tag % gen % m_filename).str());
+	}
+
+
+	void seek(const BinaryPopSection & sec)
+	{
+		m_file.seekg(sec.offset);
+	}
+
+
+	void seek(uint64_t offset)
+	{
+		m_file.seekg(offset);
+	}
+
+
+	uint64_t tell()
+	{
+		return static_cast<uint64_t>(m_file.tellg());
+	}
+
+
+	void read(void * data, size_t size)
+	{
+		if (size == 0)
+			return;
+		m_file.read(reinterpret_cast<char *>(data), size);
+		if (!m_file)
+			throw ValueError("Failed to read from file " + m_filename + ". The file might be truncated.");
+	}
+
+
+	template<typename T>
+	T readValue()
+	{
+		T value;
+
+		read(&value, sizeof(T));
+		return value;
+	}
+
+
+	string readString()
+	{
+		uint64_t size = readValue<uint64_t>();
+		string str(size, '\0');
+
+		if (size > 0)
+			read(&str[0], size);
+		return str;
+	}
+
+
+	const BinaryPopHeader & header() const
+	{
+		return m_header;
+	}
+
+
+	const string & filename() const
+	{
+		return m_filename;
+	}
+
+
+private:
+	std::ifstream m_file;
+
+	string m_filename;
+
+	BinaryPopHeader m_header;
+
+	vector<BinaryPopSection> m_sections;
+};
+
+
+// read an unsigned integer of width 1, 2, 4 or 8 bytes
+size_t readUnsignedValue(const char * ptr, uint32_t width)
+{
+	switch (width) {
+	case 1:
+		return *reinterpret_cast<const uint8_t *>(ptr);
+	case 2: {
+		uint16_t v;
+		memcpy(&v, ptr, 2);
+		return v;
+	}
+	case 4: {
+		uint32_t v;
+		memcpy(&v, ptr, 4);
+		return v;
+	}
+	case 8: {
+		uint64_t v;
+		memcpy(&v, ptr, 8);
+		return static_cast<size_t>(v);
+	}
+	default:
+		throw ValueError((boost::format("Unsupported allele width %1%") % width).str());
+	}
+	return 0;
+}
+
+
+#ifdef MUTANTALLELE
+void writeBinaryGenotype(BinaryPopWriter & out, const vectorm & geno)
+{
+	// only mutants are saved, as an array of indexes followed by an array of values
+	out.writeValue<uint32_t>(SparseMutants);
+	out.writeValue<uint32_t>(sizeof(Allele));
+	out.writeValue<uint64_t>(geno.size());
+	out.writeValue<uint64_t>(geno.count());
+	vectorm::const_val_iterator it = geno.begin().get_val_iterator();
+	vectorm::const_val_iterator it_end = geno.end().get_val_iterator();
+	vector<uint64_t> idx;
+	idx.reserve(BinaryPopBlockSize);
+	for (; it != it_end; ++it) {
+		idx.push_back(it->first);
+		if (idx.size() == BinaryPopBlockSize) {
+			out.write(&idx[0], idx.size() * sizeof(uint64_t));
+			idx.clear();
+		}
+	}
+	if (!idx.empty())
+		out.write(&idx[0], idx.size() * sizeof(uint64_t));
+	vectora val;
+	val.reserve(BinaryPopBlockSize);
+	for (it = geno.begin().get_val_iterator(); it != it_end; ++it) {
+		val.push_back(it->second);
+		if (val.size() == BinaryPopBlockSize) {
+			out.write(&val[0], val.size() * sizeof(Allele));
+			val.clear();
+		}
+	}
+	if (!val.empty())
+		out.write(&val[0], val.size() * sizeof(Allele));
+}
+
+
+inline void setLoadedAllele(vectorm & geno, size_t idx, size_t value)
+{
+	Allele a = TO_ALLELE(value);
+
+	// mutants have to be pushed in order
+	if (a != 0)
+		geno.push_back(idx, a);
+}
+
+
+#else
+void writeBinaryGenotype(BinaryPopWriter & out, const vectorg & geno)
+{
+#  ifdef BINARYALLELE
+	// genotypes are written as packed bits, least significant bit first
+	out.writeValue<uint32_t>(PackedBits);
+	out.writeValue<uint32_t>(1);
+	out.writeValue<uint64_t>(geno.size());
+	size_t nBytes = (geno.size() + 7) / 8;
+	if (nBytes == 0)
+		return;
+	ConstGenoIterator it = geno.begin();
+	const unsigned char * ptr = reinterpret_cast<const unsigned char *>(BITPTR(it));
+	out.write(ptr, nBytes - 1);
+	// bits after the last allele are not necessarily zero
+	unsigned char last = ptr[nBytes - 1];
+	if (geno.size() % 8 != 0)
+		last &= static_cast<unsigned char>((1U << (geno.size() % 8)) - 1);
+	out.writeValue<unsigned char>(last);
+#  else
+	out.writeValue<uint32_t>(DenseAlleles);
+	out.writeValue<uint32_t>(sizeof(Allele));
+	out.writeValue<uint64_t>(geno.size());
+	if (!geno.empty())
+		out.write(&geno[0], geno.size() * sizeof(Allele));
+#  endif
+}
+
+
+inline void setLoadedAllele(vectorg & geno, size_t idx, size_t value)
+{
+	geno[idx] = TO_ALLELE(value);
+}
+
+
+#endif
+
+/* Read alleles from the GENOTYPE section of a generation, which can be
+ * saved by any module. Alleles can be read by ranges so that only part
+ * of the genotype needs to be read.
+ */
+class BinaryGenotypeReader
+{
+public:
+	BinaryGenotypeReader(BinaryPopReader & in, const BinaryPopSection & sec)
+		: m_in(in), m_indexes(), m_values(), m_buf(), m_maxAllele(0)
+	{
+		in.seek(sec);
+		m_encoding = in.readValue<uint32_t>();
+		m_width = in.readValue<uint32_t>();
+		m_count = static_cast<size_t>(in.readValue<uint64_t>());
+		if (m_encoding == SparseMutants) {
+			// locations of mutants are kept to find mutants in a range
+			m_indexes.resize(static_cast<size_t>(in.readValue<uint64_t>()));
+			if (!m_indexes.empty())
+				in.read(&m_indexes[0], m_indexes.size() * sizeof(uint64_t));
+		} else if (m_encoding != DenseAlleles && m_encoding != PackedBits)
+			throw ValueError((boost::format("Unsupported genotype encoding %1% in file %2%")
+				              % m_encoding % in.filename()).str());
+		// beginning of alleles, or values of mutants
+		m_offset = in.tell();
+	}
+
+
+	uint32_t encoding() const
+	{
+		return m_encoding;
+	}
+
+
+	uint32_t width() const
+	{
+		return m_width;
+	}
+
+
+	size_t count() const
+	{
+		return m_count;
+	}
+
+
+	uint64_t offset() const
+	{
+		return m_offset;
+	}
+
+
+	const string & filename() const
+	{
+		return m_in.filename();
+	}
+
+
+	size_t maxAllele() const
+	{
+		return m_maxAllele;
+	}
+
+
+	/// return alleles [start, start + n)
+	const vectoru & read(size_t start, size_t n)
+	{
+		if (start + n > m_count)
+			throw ValueError("Failed to read beyond the end of genotype in file " + m_in.filename());
+		m_values.assign(n, 0);
+		if (n == 0)
+			return m_values;
+
+		if (m_encoding == DenseAlleles) {
+			m_buf.resize(n * m_width);
+			m_in.seek(m_offset + start * m_width);
+			m_in.read(&m_buf[0], n * m_width);
+			for (size_t i = 0; i < n; ++i)
+				m_values[i] = readUnsignedValue(&m_buf[i * m_width], m_width);
+		} else if (m_encoding == PackedBits) {
+			size_t first = start / 8;
+			size_t last = (start + n + 7) / 8;
+			m_buf.resize(last - first);
+			m_in.seek(m_offset + first);
+			m_in.read(&m_buf[0], last - first);
+			for (size_t i = 0; i < n; ++i) {
+				size_t bit = start + i - first * 8;
+				m_values[i] = (static_cast<unsigned char>(m_buf[bit / 8]) >> (bit % 8)) & 1;
+			}
+		} else {
+			vector<uint64_t>::iterator lo = std::lower_bound(m_indexes.begin(),
+				m_indexes.end(), static_cast<uint64_t>(start));
+			vector<uint64_t>::iterator hi = std::lower_bound(lo,
+				m_indexes.end(), static_cast<uint64_t>(start + n));
+			size_t numMutants = hi - lo;
+			if (numMutants > 0) {
+				m_buf.resize(numMutants * m_width);
+				m_in.seek(m_offset + (lo - m_indexes.begin()) * m_width);
+				m_in.read(&m_buf[0], numMutants * m_width);
+				for (size_t i = 0; i < numMutants; ++i, ++lo)
+					m_values[static_cast<size_t>(*lo) - start] = readUnsignedValue(&m_buf[i * m_width], m_width);
+			}
+		}
+		for (size_t i = 0; i < n; ++i)
+			if (m_values[i] > m_maxAllele)
+				m_maxAllele = m_values[i];
+		return m_values;
+	}
+
+
+	/// copy alleles [start, start + n) to geno starting from dest
+	template<typename GENO>
+	void copy(size_t start, size_t n, GENO & geno, size_t dest)
+	{
+		if (n == 0)
+			return;
+#if !defined(BINARYALLELE) && !defined(MUTANTALLELE)
+		// fast path: the same allele type
+		if (m_encoding == DenseAlleles && m_width == sizeof(Allele)) {
+			if (start + n > m_count)
+				throw ValueError("Failed to read beyond the end of genotype in file " + m_in.filename());
+			m_in.seek(m_offset + start * sizeof(Allele));
+			m_in.read(&geno[dest], n * sizeof(Allele));
+			return;
+		}
+#endif
+#ifdef BINARYALLELE
+		// fast path: copy bits of the whole generation to the underlying words
+		if (m_encoding == PackedBits && start == 0 && dest == 0 && n == m_count && n == geno.size()) {
+			GenoIterator it = geno.begin();
+			m_in.seek(m_offset);
+			m_in.read(reinterpret_cast<char *>(BITPTR(it)), (n + 7) / 8);
+			return;
+		}
+#endif
+		for (size_t i = 0; i < n; i += BinaryPopBlockSize) {
+			size_t block = std::min(BinaryPopBlockSize, n - i);
+			const vectoru & values = read(start + i, block);
+			for (size_t j = 0; j < block; ++j)
+				if (values[j] != 0)
+					setLoadedAllele(geno, dest + i + j, values[j]);
+		}
+	}
+
+
+private:
+	BinaryPopReader & m_in;
+
+	uint32_t m_encoding;
+
+	uint32_t m_width;
+
+	size_t m_count;
+
+	uint64_t m_offset;
+
+	vector<uint64_t> m_indexes;
+
+	vectoru m_values;
+
+	vector<char> m_buf;
+
+	size_t m_maxAllele;
+};
+
+
+#ifdef LINEAGE
+/* Read lineage from the LINEAGE section of a generation.
+ */
+class BinaryLineageReader
+{
+public:
+	BinaryLineageReader(BinaryPopReader & in, const BinaryPopSection & sec)
+		: m_in(in), m_buf()
+	{
+		in.seek(sec);
+		m_width = in.readValue<uint32_t>();
+		m_count = static_cast<size_t>(in.readValue<uint64_t>());
+		if (m_width != 4 && m_width != 8)
+			throw ValueError("Unsupported lineage width in file " + in.filename());
+		m_offset = in.tell();
+	}
+
+
+	size_t count() const
+	{
+		return m_count;
+	}
+
+
+	/// copy lineage [start, start + n) to lineage starting from dest
+	void copy(size_t start, size_t n, vectori & lineage, size_t dest)
+	{
+		if (n == 0)
+			return;
+		if (start + n > m_count)
+			throw ValueError("Failed to read beyond the end of lineage in file " + m_in.filename());
+		m_in.seek(m_offset + start * m_width);
+		if (m_width == sizeof(long)) {
+			m_in.read(&lineage[dest], n * sizeof(long));
+			return;
+		}
+		m_buf.resize(n * m_width);
+		m_in.read(&m_buf[0], n * m_width);
+		for (size_t i = 0; i < n; ++i) {
+			if (m_width == 4) {
+				int32_t v;
+				memcpy(&v, &m_buf[i * 4], 4);
+				lineage[dest + i] = v;
+			} else {
+				int64_t v;
+				memcpy(&v, &m_buf[i * 8], 8);
+				lineage[dest + i] = static_cast<long>(v);
+			}
+		}
+	}
+
+
+private:
+	BinaryPopReader & m_in;
+
+	uint32_t m_width;
+
+	size_t m_count;
+
+	uint64_t m_offset;
+
+	vector<char> m_buf;
+};
+#endif
+
+
+// return sorted indexes of subpopulations in subPops, which can be specified
+// by indexes or names, out of numSubPop subpopulations with names names.
+vectoru loadedSubPops(const subPopList & subPops, size_t numSubPop, const vectorstr & names)
+{
+	vectoru sps;
+
+	if (subPops.allAvail()) {
+		for (size_t sp = 0; sp < numSubPop; ++sp)
+			sps.push_back(sp);
+		return sps;
+	}
+	subPopList::const_iterator it = subPops.begin();
+	subPopList::const_iterator it_end = subPops.end();
+	for (; it != it_end; ++it) {
+		if (it->isVirtual() || it->allAvailSP())
+			throw ValueError("Only subpopulations specified by index or name can be loaded from a file.");
+		size_t sp = InvalidValue;
+		if (it->spName().empty())
+			sp = it->subPop();
+		else {
+			vectorstr::const_iterator name = find(names.begin(), names.end(), it->spName());
+			if (name == names.end())
+				throw ValueError("SubPopulation " + it->spName() + " not found.");
+			sp = name - names.begin();
+		}
+		if (sp >= numSubPop)
+			throw IndexError((boost::format("Subpopulation index %1% out of range of 0 ~ %2%.")
+				              % sp % (numSubPop - 1)).str());
+		sps.push_back(sp);
+	}
+	sort(sps.begin(), sps.end());
+	sps.erase(std::unique(sps.begin(), sps.end()), sps.end());
+	return sps;
+}
+
+
+#if !defined(BINARYALLELE) && !defined(MUTANTALLELE)
+// let geno use genotypes in the file directly if they are saved densely
+// with the same allele type. Return false if the genotype cannot be mapped.
+bool mapBinaryGenotype(const BinaryGenotypeReader & reader, vectorg & geno)
+{
+	size_t size = reader.count();
+
+	if (reader.encoding() != DenseAlleles || reader.width() != sizeof(Allele) || size == 0)
+		return false;
+
+	MappedRegion region;
+	if (!mapFileRegion(reader.filename().c_str(), static_cast<size_t>(reader.offset()), size * sizeof(Allele), region))
+		return false;
+	// the allocation of this size adopts the mapped region, which is
+	// released with the memory of geno
+	vectorg mapped((MappedAllocator<Allele>(region)));
+	mapped.resize(size);
+	DBG_ASSERT(&mapped[0] == region.ptr, SystemError, "Failed to use memory mapped genotype.");
+	geno.swap(mapped);
+	return true;
+}
+
+
+#endif
+
+void Population::saveBinary(const string & filename) const
+{
+	BinaryPopWriter out(filename);
+
+	// genotypic structure is small, so a text archive is used to avoid
+	// duplicating its serialization code
+	out.beginSection("GENOSTRU", 0);
+	std::ostringstream stru;
+	{
+		boost::archive::text_oarchive oa(stru);
+		oa << genoStru();
+	}
+	out.writeString(stru.str());
+	out.endSection();
+
+	out.beginSection("POPINFO", 0);
+	out.writeValue<int64_t>(m_ancestralGens);
+	out.writeValue<uint64_t>(m_ancestralPops.size() + 1);
+	out.endSection();
+
+	for (size_t gen = 0; gen <= m_ancestralPops.size(); ++gen) {
+		const_cast<Population *>(this)->useAncestralGen(gen);
+		// need to make sure individuals are in order
+		const_cast<Population *>(this)->syncIndPointers();
+
+		out.beginSection("SUBPOPS", gen);
+		out.writeValue<uint64_t>(m_subPopSize.size());
+		for (size_t sp = 0; sp < m_subPopSize.size(); ++sp)
+			out.writeValue<uint64_t>(m_subPopSize[sp]);
+		out.writeValue<uint64_t>(m_subPopNames.size());
+		for (size_t sp = 0; sp < m_subPopNames.size(); ++sp)
+			out.writeString(m_subPopNames[sp]);
+		out.endSection();
+
+		// only sex and affection status are saved, as in text format
+		out.beginSection("INDFLAGS", gen);
+		vector<unsigned char> flags(m_inds.size());
+		for (size_t i = 0; i < m_inds.size(); ++i)
+			flags[i] = (m_inds[i].sex() == FEMALE ? 1 : 0) | (m_inds[i].affected() ? 2 : 0);
+		if (!flags.empty())
+			out.write(&flags[0], flags.size());
+		out.endSection();
+
+		out.beginSection("GENOTYPE", gen);
+		writeBinaryGenotype(out, m_genotype);
+		out.endSection();
+
+		out.beginSection("INFOFLDS", gen);
+		if (!m_info.empty())
+			out.write(&m_info[0], m_info.size() * sizeof(double));
+		out.endSection();
+
+#ifdef LINEAGE
+		out.beginSection("LINEAGE", gen);
+		out.writeValue<uint32_t>(sizeof(long));
+		out.writeValue<uint64_t>(m_lineage.size());
+		if (!m_lineage.empty())
+			out.write(&m_lineage[0], m_lineage.size() * sizeof(long));
+		out.endSection();
+#endif
+	}
+	const_cast<Population *>(this)->useAncestralGen(0);
+
+	out.beginSection("POPVARS", 0);
+	out.writeString(varsAsString(true));
+	out.endSection();
+
+	out.close();
+}
+
+
+void Population::loadBinary(const string & filename, bool memoryMap, const lociList & loci,
+                            const subPopList & subPops, const uintList & ancGens,
+                            const stringList & infoFields)
+{
+	BinaryPopReader in(filename);
+
+	GenoStructure stru;
+
+	in.seek(in.section("GENOSTRU", 0));
+	{
+		std::istringstream is(in.readString());
+		boost::archive::text_iarchive ia(is);
+		ia >> stru;
+	}
+	this->setGenoStructure(stru);
+
+	in.seek(in.section("POPINFO", 0));
+	int ancestralGens = static_cast<int>(in.readValue<int64_t>());
+	size_t numGens = static_cast<size_t>(in.readValue<uint64_t>());
+
+	// sizes of genotype and information fields of individuals in the file
+	size_t fileLoci = totNumLoci();
+	size_t fileStep = genoSize();
+	size_t fileInfoStep = infoSize();
+
+	// loci to load
+	bool removeLoci = !loci.allAvail();
+	vectoru lociIdx;
+	if (removeLoci) {
+		lociIdx = loci.elems(this);
+		sort(lociIdx.begin(), lociIdx.end());
+		lociIdx.erase(std::unique(lociIdx.begin(), lociIdx.end()), lociIdx.end());
+		for (size_t i = 0; i < lociIdx.size(); ++i)
+			if (lociIdx[i] >= fileLoci)
+				throw IndexError((boost::format("Locus index %1% out of range.") % lociIdx[i]).str());
+	}
+	// information fields to load
+	bool removeInfo = !infoFields.allAvail();
+	vectorstr keptInfoFields = this->infoFields();
+	vectoru fieldIdx;
+	if (removeInfo) {
+		const vectorstr & fields = infoFields.elems();
+		// check if all fields exist
+		for (size_t i = 0; i < fields.size(); ++i)
+			infoIdx(fields[i]);
+		// fields are kept in their original order
+		keptInfoFields.clear();
+		for (size_t i = 0; i < infoSize(); ++i) {
+			if (find(fields.begin(), fields.end(), infoField(i)) != fields.end()) {
+				keptInfoFields.push_back(infoField(i));
+				fieldIdx.push_back(i);
+			}
+		}
+	}
+	if (removeLoci)
+		extractGenoStructure(*this, lociIdx, keptInfoFields);
+	else if (removeInfo)
+		setGenoStructure(ploidy(), numLoci(), chromTypes(), isHaplodiploid(),
+			lociPos(), chromNames(), allAlleleNames(), lociNames(), keptInfoFields);
+
+	size_t step = genoSize();
+	size_t infoStep = infoSize();
+	size_t ply = ploidy();
+	// individuals are read in blocks if only some loci are loaded
+	size_t blockSize = std::max(size_t(1), BinaryPopBlockSize / std::max(size_t(1), fileStep));
+
+	// generations to load
+	vectoru gens;
+	if (ancGens.allAvail()) {
+		for (size_t gen = 0; gen < numGens; ++gen)
+			gens.push_back(gen);
+	} else if (ancGens.unspecified())
+		gens.push_back(0);
+	else {
+		gens = ancGens.elems();
+		sort(gens.begin(), gens.end());
+		gens.erase(std::unique(gens.begin(), gens.end()), gens.end());
+		for (size_t i = 0; i < gens.size(); ++i)
+			if (gens[i] >= numGens)
+				throw IndexError((boost::format("Ancestral generation %1% does not exist in file %2%.")
+					              % gens[i] % filename).str());
+	}
+
+	size_t max_allele = 0;
+	m_ancestralPops.clear();
+	for (size_t g = 0; g < gens.size(); ++g) {
+		size_t gen = gens[g];
+		// the current generation is loaded to a temporary popData and swapped in
+		popData cur;
+		if (g > 0)
+			m_ancestralPops.push_back(popData());
+		popData & pd = g == 0 ? cur : m_ancestralPops.back();
+
+		// subpopulation structure in the file
+		in.seek(in.section("SUBPOPS", gen));
+		vectoru spSizes(static_cast<size_t>(in.readValue<uint64_t>()));
+		for (size_t sp = 0; sp < spSizes.size(); ++sp)
+			spSizes[sp] = static_cast<size_t>(in.readValue<uint64_t>());
+		vectorstr spNames(static_cast<size_t>(in.readValue<uint64_t>()));
+		for (size_t sp = 0; sp < spNames.size(); ++sp)
+			spNames[sp] = in.readString();
+		vectoru spBegin(spSizes.size() + 1, 0);
+		for (size_t sp = 0; sp < spSizes.size(); ++sp)
+			spBegin[sp + 1] = spBegin[sp] + spSizes[sp];
+		size_t filePopSize = spBegin.back();
+
+		// subpopulations to load
+		vectoru sps = loadedSubPops(subPops, spSizes.size(), spNames);
+		for (size_t i = 0; i < sps.size(); ++i) {
+			pd.m_subPopSize.push_back(spSizes[sps[i]]);
+			if (!spNames.empty())
+				pd.m_subPopNames.push_back(spNames[sps[i]]);
+		}
+		size_t popSize = accumulate(pd.m_subPopSize.begin(), pd.m_subPopSize.end(), size_t(0));
+
+		const BinaryPopSection & flagSec = in.section("INDFLAGS", gen);
+		if (flagSec.size != filePopSize)
+			throw ValueError("Number of individuals does not match population size in file " + filename);
+		vector<unsigned char> flags(filePopSize);
+		in.seek(flagSec);
+		if (filePopSize > 0)
+			in.read(&flags[0], filePopSize);
+
+		BinaryGenotypeReader genoReader(in, in.section("GENOTYPE", gen));
+		if (genoReader.count() != filePopSize * fileStep)
+			throw ValueError("Mismatched number of alleles in file " + filename);
+		bool mapped = false;
+#if !defined(BINARYALLELE) && !defined(MUTANTALLELE)
+		if (memoryMap && !removeLoci && sps.size() == spSizes.size())
+			mapped = mapBinaryGenotype(genoReader, pd.m_genotype);
+#endif
+		if (!mapped) {
+#ifdef MUTANTALLELE
+			pd.m_genotype.set_block_size(step);
+#endif
+			pd.m_genotype.resize(popSize * step);
+			size_t dest = 0;
+			for (size_t i = 0; i < sps.size(); ++i) {
+				size_t first = spBegin[sps[i]];
+				size_t n = spSizes[sps[i]];
+				if (!removeLoci) {
+					genoReader.copy(first * fileStep, n * fileStep, pd.m_genotype, dest);
+					dest += n * fileStep;
+					continue;
+				}
+				for (size_t b = 0; b < n; b += blockSize) {
+					size_t nb = std::min(blockSize, n - b);
+					const vectoru & values = genoReader.read((first + b) * fileStep, nb * fileStep);
+					for (size_t ind = 0; ind < nb; ++ind) {
+						for (size_t p = 0; p < ply; ++p) {
+							size_t base = ind * fileStep + p * fileLoci;
+							for (size_t l = 0; l < lociIdx.size(); ++l, ++dest)
+								if (values[base + lociIdx[l]] != 0)
+									setLoadedAllele(pd.m_genotype, dest, values[base + lociIdx[l]]);
+						}
+					}
+				}
+			}
+		}
+		max_allele = max(max_allele, genoReader.maxAllele());
+
+		const BinaryPopSection & infoSec = in.section("INFOFLDS", gen);
+		if (infoSec.size != filePopSize * fileInfoStep * sizeof(double))
+			throw ValueError("Wrong size of information fields in file " + filename);
+		pd.m_info.resize(popSize * infoStep);
+		vectorf infoBuf;
+		size_t infoDest = 0;
+		for (size_t i = 0; i < sps.size(); ++i) {
+			size_t first = spBegin[sps[i]];
+			size_t n = spSizes[sps[i]];
+			if (n == 0 || infoStep == 0)
+				continue;
+			in.seek(infoSec.offset + first * fileInfoStep * sizeof(double));
+			if (!removeInfo) {
+				in.read(&pd.m_info[infoDest], n * infoStep * sizeof(double));
+				infoDest += n * infoStep;
+			} else {
+				infoBuf.resize(n * fileInfoStep);
+				in.read(&infoBuf[0], n * fileInfoStep * sizeof(double));
+				for (size_t ind = 0; ind < n; ++ind)
+					for (size_t f = 0; f < fieldIdx.size(); ++f)
+						pd.m_info[infoDest++] = infoBuf[ind * fileInfoStep + fieldIdx[f]];
+			}
+		}
+
+#ifdef LINEAGE
+		pd.m_lineage.resize(popSize * step, 0);
+		// lineage is not available if the file is saved by a non-lineage module
+		if (in.hasSection("LINEAGE", gen)) {
+			BinaryLineageReader lineageReader(in, in.section("LINEAGE", gen));
+			if (lineageReader.count() != filePopSize * fileStep)
+				throw ValueError("Mismatched lineage information in file " + filename);
+			vectori lineageBuf;
+			size_t dest = 0;
+			for (size_t i = 0; i < sps.size(); ++i) {
+				size_t first = spBegin[sps[i]];
+				size_t n = spSizes[sps[i]];
+				if (!removeLoci) {
+					lineageReader.copy(first * fileStep, n * fileStep, pd.m_lineage, dest);
+					dest += n * fileStep;
+					continue;
+				}
+				for (size_t b = 0; b < n; b += blockSize) {
+					size_t nb = std::min(blockSize, n - b);
+					lineageBuf.resize(nb * fileStep);
+					lineageReader.copy((first + b) * fileStep, nb * fileStep, lineageBuf, 0);
+					for (size_t ind = 0; ind < nb; ++ind)
+						for (size_t p = 0; p < ply; ++p)
+							for (size_t l = 0; l < lociIdx.size(); ++l)
+								pd.m_lineage[dest++] = lineageBuf[ind * fileStep + p * fileLoci + lociIdx[l]];
+				}
+			}
+		}
+#endif
+
+		pd.m_inds.resize(popSize);
+		size_t idx = 0;
+		for (size_t i = 0; i < sps.size(); ++i) {
+			for (size_t j = spBegin[sps[i]]; j < spBegin[sps[i] + 1]; ++j, ++idx) {
+				pd.m_inds[idx].setSex((flags[j] & 1) != 0 ? FEMALE : MALE);
+				pd.m_inds[idx].setAffected((flags[j] & 2) != 0);
+			}
+		}
+		GenoIterator ptr = pd.m_genotype.begin();
+		InfoIterator infoPtr = pd.m_info.begin();
+		for (size_t i = 0; i < popSize; ++i, ptr += step, infoPtr += infoStep) {
+			pd.m_inds[i].setGenoStruIdx(genoStruIdx());
+			pd.m_inds[i].setGenoPtr(ptr);
+			pd.m_inds[i].setInfoPtr(infoPtr);
+		}
+#ifdef LINEAGE
+		LineageIterator lineagePtr = pd.m_lineage.begin();
+		for (size_t i = 0; i < popSize; ++i, lineagePtr += step)
+			pd.m_inds[i].setLineagePtr(lineagePtr);
+#endif
+		pd.m_indOrdered = true;
+
+		if (g == 0) {
+			pd.swap(*this);
+			m_popSize = popSize;
+			m_subPopIndex.resize(m_subPopSize.size() + 1);
+			m_subPopIndex[0] = 0;
+			for (size_t sp = 1; sp <= m_subPopSize.size(); ++sp)
+				m_subPopIndex[sp] = m_subPopIndex[sp - 1] + m_subPopSize[sp - 1];
+		}
+	}
+	m_ancestralGens = ancestralGens;
+	m_curAncestralGen = 0;
+
+	in.seek(in.section("POPVARS", 0));
+	varsFromString(in.readString(), true);
+	setIndOrdered(true);
+	DBG_WARNIF(max_allele > ModuleMaxAllele, (boost::format("Warning: the maximum allele of the loaded population is %1%"
+												            " which is larger than the maximum allowed allele of this module. "
+												            "These alleles have been truncated.") % max_allele).str());
+}
+
+
+// size of blocks of text that are compressed independently
+const size_t CompressBlockSize = 1 << 20;
+
+/* Write data to a gzip file in independently compressed blocks. Blocks
+ * are compressed in parallel using numThreads() threads and are written
+ * as consecutive members of a gzip file, which can be read by any gzip
+ * decompressor.
+ */
+class ParallelGzipWriter
+{
+public:
+	ParallelGzipWriter(const string & filename, int level)
+		: m_file(filename.c_str(), std::ios::out | std::ios::binary | std::ios::trunc),
+		m_filename(filename), m_level(level), m_buffer(), m_written(false)
+	{
+		if (!m_file)
+			throw ValueError("Cannot write to file " + filename);
+	}
+
+
+	void write(const char * data, size_t size)
+	{
+		m_buffer.append(data, size);
+		if (m_buffer.size() >= CompressBlockSize * numThreads())
+			compress(false);
+	}
+
+
+	void close()
+	{
+		compress(true);
+		m_file.close();
+		if (!m_file)
+			throw ValueError("Cannot save population to file " + m_filename);
+	}
+
+
+private:
+	// compress buffered text, leaving incomplete block in the buffer unless final
+	void compress(bool final)
+	{
+		size_t size = m_buffer.size();
+		size_t numBlocks = final ? (size + CompressBlockSize - 1) / CompressBlockSize : size / CompressBlockSize;
+
+		// write an empty member for an empty file
+		if (numBlocks == 0 && final && !m_written)
+			numBlocks = 1;
+		if (numBlocks == 0)
+			return;
+
+		vectorstr blocks(numBlocks);
+		int except = 0;
+#ifdef _OPENMP
+#  pragma omp parallel for if(numThreads() > 1 && numBlocks > 1)
+#endif
+		for (int i = 0; i < static_cast<int>(numBlocks); ++i) {
+			try {
+				size_t start = i * CompressBlockSize;
+				size_t n = start >= size ? 0 : std::min(CompressBlockSize, size - start);
+				boost::iostreams::filtering_ostream out;
+				out.push(boost::iostreams::gzip_compressor(boost::iostreams::gzip_params(m_level)));
+				out.push(boost::iostreams::back_inserter(blocks[i]));
+				if (n > 0)
+					out.write(m_buffer.data() + start, n);
+				out.reset();
+			} catch (...) {
+#ifdef _OPENMP
+#  pragma omp atomic
+#endif
+				++except;
+			}
+		}
+		if (except)
+			throw RuntimeError("Failed to compress population for file " + m_filename);
+		for (size_t i = 0; i < numBlocks; ++i)
+			m_file.write(blocks[i].data(), blocks[i].size());
+		if (!m_file)
+			throw ValueError("Cannot save population to file " + m_filename);
+		m_buffer.erase(0, std::min(size, numBlocks * CompressBlockSize));
+		m_written = true;
+	}
+
+
+	std::ofstream m_file;
+
+	string m_filename;
+
+	int m_level;
+
+	string m_buffer;
+
+	bool m_written;
+};
+
+
+/* A boost iostreams sink that sends output to a ParallelGzipWriter.
+ */
+class ParallelGzipSink
+{
+public:
+	typedef char char_type;
+	typedef boost::iostreams::sink_tag category;
+
+	ParallelGzipSink(ParallelGzipWriter & writer) : m_writer(&writer)
+	{
+	}
+
+
+	std::streamsize write(const char * data, std::streamsize size)
+	{
+		m_writer->write(data, static_cast<size_t>(size));
+		return size;
+	}
+
+
+private:
+	ParallelGzipWriter * m_writer;
+};
+
+
+bool Population::genotypeMappedFrom(const string & filename) const
+{
+#if !defined(BINARYALLELE) && !defined(MUTANTALLELE)
+	if (isMappedFrom(m_genotype.get_allocator().region(), filename.c_str()))
+		return true;
+	for (size_t i = 0; i < m_ancestralPops.size(); ++i)
+		if (isMappedFrom(m_ancestralPops[i].m_genotype.get_allocator().region(), filename.c_str()))
+			return true;
+#else
+	(void)filename;
+#endif
+	return false;
+}
+
+
+void Population::save(const string & filename, bool binary, int compress) const
+{
+	PARAM_FAILIF(compress < 0 || compress > 9, ValueError,
+		"Parameter compress should be a gzip compression level between 0 (no compression) "
+		"and 9 (best compression).");
+
+	// if genotypes of this population are mapped from the file, write to a
+	// new file and replace the file with it so that the mapped pages are
+	// not truncated.
+	if (genotypeMappedFrom(filename)) {
+		string tmpFile = filename + ".tmp";
+		try {
+			save(tmpFile, binary, compress);
+		} catch (...) {
+			remove(tmpFile.c_str());
+			throw;
+		}
+		if (rename(tmpFile.c_str(), filename.c_str()) != 0)
+			throw RuntimeError("Failed to replace file " + filename);
+		return;
+	}
+
+	if (binary) {
+		saveBinary(filename);
+		return;
+	}
+
+	// compress output in blocks
+	ParallelGzipWriter writer(filename, compress);
+	{
+		boost::iostreams::filtering_ostream ofs;
+		ofs.push(ParallelGzipSink(writer));
+		// if ofs itself get into trouble
+		if (!ofs)
+			throw ValueError("Cannot save population to file " + filename);
+
+		boost::archive::text_oarchive oa(ofs);
+		oa << *this;
+	}
+	writer.close();
+}
+
+
+void Population::load(const string & filename, bool memoryMap, const lociList & loci,
+                      const subPopList & subPops, const uintList & ancGens,
+                      const stringList & infoFields)
+{
+	// check the first bytes of the file to see if it is saved in binary format
+	char magic[8];
+	std::ifstream file(filename.c_str(), std::ios::in | std::ios::binary);
+	if (!file)
+		throw ValueError("Can not open file " + filename);
+	file.read(magic, 8);
+	bool binary = file.gcount() == 8 && memcmp(magic, BinaryPopMagic, 8) == 0;
+	file.close();
+	if (binary) {
+		loadBinary(filename, memoryMap, loci, subPops, ancGens, infoFields);
+		return;
+	}
+	if (memoryMap)
+		throw ValueError("Only populations saved in binary format can be mapped to memory.");
+
+	boost::iostreams::filtering_istream ifs;
+
+	ifs.push(boost::iostreams::gzip_decompressor());
+	ifs.push(boost::iostreams::file_source(filename, std::ios::binary));
+	// do not have to test again.
+	if (!ifs)
+		throw ValueError("Can not open file " + filename);
+
+	// try to load the file
+	try {
+		boost::archive::text_iarchive ia(ifs);
+		ia >> *this;
+	} catch (const std::exception & e) {
+		throw ValueError("Failed to load Population " + filename + " (" + e.what() + ")\n");
+	} catch (...) {
+		throw ValueError("Failed to load Population " + filename + ".\n");
+	}
+	// text files have to be loaded as a whole, unselected parts are then removed
+	if (!ancGens.allAvail()) {
+		vectoru gens = ancGens.unspecified() ? vectoru(1, 0) : ancGens.elems();
+		sort(gens.begin(), gens.end());
+		gens.erase(std::unique(gens.begin(), gens.end()), gens.end());
+		for (size_t i = 0; i < gens.size(); ++i)
+			if (gens[i] > m_ancestralPops.size())
+				throw IndexError((boost::format("Ancestral generation %1% does not exist in file %2%.")
+					              % gens[i] % filename).str());
+		// move selected generations to the front
+		useAncestralGen(gens[0]);
+		m_curAncestralGen = 0;
+		for (size_t i = 1; i < gens.size(); ++i) {
+			if (gens[i] == i)
+				continue;
+			m_ancestralPops[gens[i] - 1].swap(*this);
+			m_ancestralPops[i - 1].swap(*this);
+			m_ancestralPops[gens[i] - 1].swap(*this);
+		}
+		m_ancestralPops.resize(gens.size() - 1);
+		m_popSize = m_inds.size();
+		setSubPopStru(m_subPopSize, m_subPopNames);
+	}
+	if (!subPops.allAvail()) {
+		for (int depth = ancestralGens(); depth >= 0; --depth) {
+			useAncestralGen(depth);
+			vectoru sps = loadedSubPops(subPops, numSubPop(), subPopNames());
+			subPopList removedSubPops;
+			for (size_t sp = 0, i = 0; sp < numSubPop(); ++sp) {
+				if (i < sps.size() && sps[i] == sp)
+					++i;
+				else
+					removedSubPops.push_back(vspID(sp));
+			}
+			if (!removedSubPops.empty())
+				removeSubPops(removedSubPops);
+		}
+	}
+	if (!loci.allAvail()) {
+		vectoru lociIdx = loci.elems(this);
+		sort(lociIdx.begin(), lociIdx.end());
+		lociIdx.erase(std::unique(lociIdx.begin(), lociIdx.end()), lociIdx.end());
+		for (size_t i = 0; i < lociIdx.size(); ++i)
+			if (lociIdx[i] >= totNumLoci())
+				throw IndexError((boost::format("Locus index %1% out of range.") % lociIdx[i]).str());
+		removeLoci(lociList(NULL), lociList(lociIdx));
+	}
+	if (!infoFields.allAvail()) {
+		const vectorstr & fields = infoFields.elems();
+		for (size_t i = 0; i < fields.size(); ++i)
+			infoIdx(fields[i]);
+		vectorstr removedFields;
+		for (size_t i = 0; i < infoSize(); ++i)
+			if (find(fields.begin(), fields.end(), infoField(i)) == fields.end())
+				removedFields.push_back(infoField(i));
+		removeInfoFields(removedFields);
 	}
 }
 
@@ -4296,11 +5948,11 @@ void Population::syncIndPointers(bool infoOnly) const
 		size_t is = infoSize();
 		size_t sz = genoSize();
 #ifdef MUTANTALLELE
-		vectorm tmpGenotype(m_popSize * genoSize());
+		vectorm tmpGenotype(m_popSize * genoSize(), genoSize());
 		vectorm::iterator it = tmpGenotype.begin();
 #else
-		vectora tmpGenotype(m_popSize * genoSize());
-		vectora::iterator it = tmpGenotype.begin();
+		vectorg tmpGenotype(m_popSize * genoSize());
+		vectorg::iterator it = tmpGenotype.begin();
 #endif
 #ifdef LINEAGE
 		vectori tmpLineage(m_popSize * genoSize());
@@ -4339,11 +5991,13 @@ void Population::syncIndPointers(bool infoOnly) const
 }
 
 
-Population & loadPopulation(const string & file)
+Population & loadPopulation(const string & file, bool memoryMap, const lociList & loci,
+                            const subPopList & subPops, const uintList & ancGens,
+                            const stringList & infoFields)
 {
 	Population * p = new Population();
 
-	p->load(file);
+	p->load(file, memoryMap, loci, subPops, ancGens, infoFields);
 	return *p;
 }
 
@@ -141,6 +141,132 @@ private:
 class Pedigree;
 
 
+/** CPPONLY
+ *  Indexes of loci (in a list of loci) with alleles that are counted for each
+ *  sex (MALE - 1 and FEMALE - 1) and homologous copy of chromosomes, following
+ *  the rules of allele iterators (e.g. only the first copy of chromosome X is
+ *  counted for males).
+ */
+typedef vector<vectoru> ValidLoci[2];
+
+/// CPPONLY
+void getValidLoci(const GenoStruTrait & stru, const vectoru & loci, ValidLoci & valid);
+
+
+/** CPPONLY
+ *  Allele counts at a list of loci for each subpopulation of a population
+ *  (c.f. Population::trackAlleles). Counts of offspring are added during
+ *  mating and counts are updated by mutators, so that allele frequencies can
+ *  be obtained without going through the genotypes of all individuals.
+ *  counts(subPop)[a * loci().size() + idx] is the number of allele a at
+ *  locus loci()[idx] in subpopulation subPop.
+ */
+class TrackedAlleles
+{
+public:
+	TrackedAlleles() : m_loci(), m_index(), m_offsets(), m_indexes(), m_genoStru(MaxTraitIndex),
+		m_counts(), m_numOfSex(), m_valid(false)
+	{
+	}
+
+
+	/// track alleles at loci of a genotypic structure, clear all counts
+	void setLoci(const vectoru & loci, const GenoStruTrait & stru);
+
+	const vectoru & loci() const
+	{
+		return m_loci;
+	}
+
+
+	bool empty() const
+	{
+		return m_loci.empty();
+	}
+
+
+	/// index of the genotypic structure of tracked loci
+	size_t genoStru() const
+	{
+		return m_genoStru;
+	}
+
+
+	/// if all alleles at locus are tracked
+	bool tracks(const vectoru & loci) const;
+
+	/// if counts reflect the genotype of the population
+	bool valid() const
+	{
+		return m_valid;
+	}
+
+
+	/// clear counts of \e numSubPop subpopulations before they are recounted
+	void reset(size_t numSubPop);
+
+	void invalidate()
+	{
+		m_valid = false;
+	}
+
+
+	/// invalidate counts unless individuals of all subpopulations are counted
+	void checkCounted(const vectoru & subPopSizes);
+
+	/// add alleles of individuals in [begin, end) to counts and numOfSex
+	void count(ConstRawIndIterator begin, ConstRawIndIterator end,
+		vectoru & counts, vectoru & numOfSex) const;
+
+	/// add counts and numOfSex returned by count() to subpopulation subPop
+	void add(size_t subPop, const vectoru & counts, const vectoru & numOfSex);
+
+	/// replace allele \e from by \e to at \e locus in subpopulation subPop
+	void update(size_t subPop, size_t locus, size_t from, size_t to)
+	{
+		if (!m_valid || locus >= m_index.size() || m_index[locus] < 0)
+			return;
+		size_t nLoci = m_loci.size();
+		vectoru & counts = m_counts[subPop];
+		if (to * nLoci >= counts.size())
+			counts.resize((to + 1) * nLoci, 0);
+		--counts[from * nLoci + m_index[locus]];
+		++counts[to * nLoci + m_index[locus]];
+	}
+
+
+	/** Get counts and totals of alleles at \e loci in subpopulation \e subPop,
+	 *  in the format of counts and totals returned by allele counting
+	 *  functions of operator Stat.
+	 */
+	void get(size_t subPop, const vectoru & loci, vectoru & counts, vectoru & totals) const;
+
+	void swap(TrackedAlleles & rhs);
+
+private:
+	vectoru m_loci;
+
+	/// index of each locus in m_loci, -1 for loci that are not tracked
+	vector<ssize_t> m_index;
+
+	/// positions of counted alleles in the genotype of males and females
+	vectoru m_offsets[2];
+
+	/// indexes of loci (in m_loci) of counted alleles of males and females
+	vectoru m_indexes[2];
+
+	size_t m_genoStru;
+
+	/// allele counts of each subpopulation
+	vector<vectoru> m_counts;
+
+	/// number of males and females counted in each subpopulation
+	vector<vectoru> m_numOfSex;
+
+	bool m_valid;
+};
+
+
 /**
  *  A simuPOP population consists of individuals of the same genotypic
  *  structure, organized by generations, subpopulations and virtual
@@ -265,6 +391,13 @@ public:
 	 */
 	Population * clone() const;
 
+	/** CPPONLY Create a copy of the population that does not refer to any
+	 *  Python object so that it can be saved by a thread other than the main
+	 *  thread. Population variables are pickled and the virtual splitter is
+	 *  not copied. The copy should be deleted by the main thread.
+	 */
+	Population * snapshot() const;
+
 	/** Swap the content of two population objects, which can be handy in some
 	 *  particular circumstances. For example, you could swap out a population
 	 *  in a simulator.
@@ -289,6 +422,7 @@ public:
 		m_ancestralPops.swap(rhs.m_ancestralPops);
 		std::swap(m_curAncestralGen, rhs.m_curAncestralGen);
 		std::swap(m_indOrdered, rhs.m_indOrdered);
+		m_trackedAlleles.swap(rhs.m_trackedAlleles);
 		std::swap(m_vspSplitter, rhs.m_vspSplitter);
 		std::swap(rhs.m_gen, m_gen);
 		std::swap(rhs.m_rep, m_rep);
@@ -1051,6 +1185,10 @@ public:
 	/** Return an editable array of the genotype of all individuals in
 	 *  a population (if <tt>subPop=[]</tt>, default), or individuals in a
 	 *  subpopulation \e subPop. Virtual subpopulation is unsupported.
+	 *  Except for the binary and mutant modules, the returned array supports
+	 *  the buffer protocol so that <tt>numpy.asarray(pop.genotype())</tt>
+	 *  returns an array that shares memory with the population. The returned
+	 *  array keeps the population alive.
 	 *  <group>5-genotype</group>
 	 */
 	PyObject * genotype(vspID subPop = vspID());
@@ -1079,21 +1217,35 @@ public:
 	 *  <tt>subPop=[]</tt>) or in a (virtual) subpopulation \e subPop (if
 	 *  <tt>subPop=sp</tt> or <tt>(sp, vsp)</tt>) using a list of alleles
 	 *  \e geno. \e geno will be reused if its length is less than
-	 *  <tt>subPopSize(subPop)*totNumLoci()*ploidy()</tt>.
+	 *  <tt>subPopSize(subPop)*totNumLoci()*ploidy()</tt>. If a list of
+	 *  loci (by indexes or names) is given, only alleles at these loci are
+	 *  set, in the order of individuals, ploidy and \e loci. \e geno can be
+	 *  any object that supports the buffer protocol (e.g. a numpy array of
+	 *  integers), in which case its values are copied without conversion
+	 *  of individual items, and directly to the genotype storage if it is
+	 *  of the allele type of the module.
 	 *  <group>5-genotype</group>
 	 */
-	void setGenotype(const uintList & geno, vspID subPop = vspID());
+	void setGenotype(PyObject * geno, vspID subPop = vspID(),
+		const lociList & loci = lociList());
+
+	/// CPPONLY
+	void setGenotype(const vectoru & geno, vspID subPop = vspID(),
+		const lociList & loci = lociList());
 
 
 	/** Fill the lineage of all individuals in a population (if
 	 *  <tt>subPop=[]</tt>) or in a (virtual) subpopulation \e subPop (if
 	 *  <tt>subPop=sp</tt> or <tt>(sp, vsp)</tt>) using a list of IDs
 	 *  \e lineage. \e lineage will be reused if its length is less than
-	 *  <tt>subPopSize(subPop)*totNumLoci()*ploidy()</tt>. This function
-	 *  returns directly for modules without lineage information.
+	 *  <tt>subPopSize(subPop)*totNumLoci()*ploidy()</tt>. As in function
+	 *  \c setGenotype, lineage can be set at specified \e loci, and
+	 *  \e lineage can be an object that supports the buffer protocol. This
+	 *  function returns directly for modules without lineage information.
 	 *  <group>5-genotype</group>
 	 */
-	void setLineage(const uintList & geno, vspID subPop = vspID());
+	void setLineage(const uintList & geno, vspID subPop = vspID(),
+		const lociList & loci = lociList());
 
 	//@}
 
@@ -1360,6 +1512,43 @@ public:
 	 */
 	void push(Population & pop);
 
+	/** Keep counts of alleles at \e loci (a list of loci indexes or names,
+	 *  or all loci (\c ALL_AVAIL, default)) for each subpopulation of the
+	 *  current generation. Counts of offspring are added when they are
+	 *  generated by a mating scheme, and counts are updated when mutations
+	 *  are introduced by a mutator, so that operator \c Stat can calculate
+	 *  allele frequencies at these loci for subpopulations without going
+	 *  through the genotypes of all individuals. Alleles are recounted
+	 *  when the genotype of a population is changed by other means (e.g.
+	 *  migration, \c InitGenotype, a \c PyOperator or an array returned by
+	 *  function \c genotype()). Arrays that share memory with the population
+	 *  (e.g. <tt>numpy.asarray(pop.genotype())</tt>) are not tracked after
+	 *  alleles are counted and should be obtained again. Note that changes to
+	 *  genotypes or sex of individuals made directly through member functions
+	 *  of \c Individual are not tracked, so this function should be called
+	 *  again to recount alleles after such changes. An empty list of loci
+	 *  stops the tracking of alleles. This feature is not available for
+	 *  long and mutant modules.
+	 *  <group>7-manipulate</group>
+	 */
+	void trackAlleles(const lociList & loci = lociList());
+
+	/// CPPONLY
+	TrackedAlleles & trackedAlleles()
+	{
+		return m_trackedAlleles;
+	}
+
+
+	/** CPPONLY
+	 *  Get counts and totals of alleles at \e loci in subpopulation
+	 *  \e subPop from tracked allele counts, which are recounted if they
+	 *  are invalid. Return \c false if alleles at some of the loci are not
+	 *  tracked, or if an ancestral generation is used.
+	 */
+	bool trackedAlleleCounts(size_t subPop, const vectoru & loci,
+		vectoru & counts, vectoru & totals);
+
 	/** HIDDEN
 	 *  Return the current ancestral generation number.
 	 *  <group>6-ancestral</group>
@@ -1402,7 +1591,10 @@ public:
 	 *  all individuals (if <tt>subPop=[]</tt>, default), or individuals in
 	 *  a (virtual) subpopulation (<tt>subPop=sp</tt> or <tt>(sp, vsp)</tt>)
 	 *  to \e values. \e values will be reused if its length is smaller than
-	 *  the size of the population or (virtual) subpopulation.
+	 *  the size of the population or (virtual) subpopulation. \e values
+	 *  can be any object that supports the buffer protocol (e.g. a numpy
+	 *  array), in which case its values are copied without conversion of
+	 *  individual items.
 	 *  <group>8-info</group>
 	 */
 	void setIndInfo(const floatList & values, const uintString & field,
@@ -1484,6 +1676,19 @@ public:
 	vectorf indInfo(const uintString & field, vspID subPop = vspID());
 
 
+	/** Return an editable two-dimensional \c memoryview of the information
+	 *  fields of all individuals (if <tt>subPop=[]</tt>, default), or
+	 *  individuals in a subpopulation \e subPop, with one row per individual
+	 *  and one column per information field. The view shares memory with
+	 *  the population (e.g. <tt>numpy.asarray(pop.infoArray())[:, 0]</tt>
+	 *  refers to the first information field of all individuals). The view
+	 *  keeps the population alive but will become invalid once the
+	 *  population changes. Virtual subpopulation is unsupported.
+	 *  <group>8-info</group>
+	 */
+	PyObject * infoArray(vspID subPop = vspID());
+
+
 	/** Add a list of information fields \e fields to a population and
 	 *  initialize their values to \e init. If an information field alreay
 	 *  exists, it will be re-initialized.
@@ -1549,15 +1754,31 @@ public:
 	void syncIndPointers(bool infoOnly = false) const;
 
 	/** Save population to a file \e filename, which can be loaded by a global
-	 *  function <tt>loadPopulation(filename)</tt>.
+	 *  function <tt>loadPopulation(filename)</tt>. By default, the population
+	 *  is saved in a compressed text format that can be loaded across
+	 *  platforms. If \e binary is set to \c True, the population is saved
+	 *  in an uncompressed binary format that stores genotype, information
+	 *  fields and ancestral generations as raw blocks of data. Such files are
+	 *  much faster to save and load, but can only be loaded on platforms with
+	 *  the same byte order. Parameter \e compress sets the gzip compression
+	 *  level of the text format from \c 0 (no compression) to \c 9 (best
+	 *  compression). Lower levels save populations faster but produce larger
+	 *  files. Other compression formats are not supported. Text is compressed
+	 *  in blocks that are processed in parallel if multiple threads are used
+	 *  (see \c setOptions). This parameter is ignored for the binary format,
+	 *  which is not compressed.
 	 *  <group>8-pop</group>
 	 */
-	void save(const string & filename) const;
+	void save(const string & filename, bool binary = false, int compress = 6) const;
 
-	/** CPPONLY load Population from file \e filename
+	/** CPPONLY load Population from file \e filename, map genotypes to
+	 *  memory if \e memoryMap is true, and keep only specified \e loci,
+	 *  \e subPops, \e ancGens and \e infoFields.
 	 *  <group>8-pop</group>
 	 */
-	void load(const string & filename);
+	void load(const string & filename, bool memoryMap = false,
+		const lociList & loci = lociList(), const subPopList & subPops = subPopList(),
+		const uintList & ancGens = uintList(), const stringList & infoFields = stringList());
 
 public:
 	/** return variables of a population as a Python dictionary. If a valid
@@ -1591,6 +1812,8 @@ public:
 	/// CPPONLY
 	string varsAsString(bool use_pickle=false) const
 	{
+		if (use_pickle && !m_pickledVars.empty())
+			return m_pickledVars;
 		if (use_pickle)
 			return m_vars.to_pickle();
 		else
@@ -1638,6 +1861,26 @@ private:
 
 	BOOST_SERIALIZATION_SPLIT_MEMBER();
 
+	/// save population in binary format
+	void saveBinary(const string & filename) const;
+
+	/// load population saved in binary format
+	void loadBinary(const string & filename, bool memoryMap, const lociList & loci,
+		const subPopList & subPops, const uintList & ancGens,
+		const stringList & infoFields);
+
+	/// if genotypes of any generation are mapped from file \e filename
+	bool genotypeMappedFrom(const string & filename) const;
+
+	/// set genotypic structure of \e pop with \e loci (sorted) of this population
+	void extractGenoStructure(Population & pop, const vectoru & loci,
+		const vectorstr & infoFields) const;
+
+	/// set genotype from \e size values starting at \e geno
+	template <typename T>
+	void setGenotypeFrom(const T * geno, size_t size, vspID subPop,
+		const lociList & loci);
+
 private:
 	/// population size: number of individual
 	size_t m_popSize;
@@ -1658,7 +1901,7 @@ private:
 #ifdef MUTANTALLELE
 	vectorm m_genotype;
 #else
-	vectora m_genotype;
+	vectorg m_genotype;
 #endif
 
 #ifdef LINEAGE
@@ -1678,6 +1921,9 @@ private:
 	/// shared variables for this population
 	mutable SharedVariables m_vars;
 
+	/// pickled variables of a snapshot of a population
+	string m_pickledVars;
+
 	/// store previous populations
 	/// need to store: subPopSize, genotype and m_inds
 	struct popData
@@ -1687,7 +1933,7 @@ private:
 #ifdef MUTANTALLELE
 		vectorm m_genotype;
 #else
-		vectora m_genotype;
+		vectorg m_genotype;
 #endif
 
 #ifdef LINEAGE
@@ -1712,6 +1958,9 @@ private:
 	/// within a population.
 	mutable bool m_indOrdered;
 
+	/// allele counts of the current generation
+	TrackedAlleles m_trackedAlleles;
+
 	mutable size_t m_gen;
 	mutable size_t m_rep;
 
@@ -1755,9 +2004,32 @@ public:
 
 };
 
-/** load a population from a file saved by <tt>Population::save()</tt>.
+/** load a population from a file saved by <tt>Population::save()</tt>. The
+ *  format (text or binary) of the file is detected automatically.
+ *  Parameters \e loci, \e subPops, \e ancGens and \e infoFields can be used
+ *  to load only specified loci (by indexes or names), subpopulations (by
+ *  indexes or names, virtual subpopulations are not allowed), ancestral
+ *  generations (default to all generations) and information fields (default
+ *  to all fields) of the population. For a file saved in binary format,
+ *  only selected parts of the file are read so that part of a population
+ *  can be loaded even if the whole population does not fit into memory. A
+ *  file saved in text format is loaded as a whole and unselected parts are
+ *  removed afterward. If \e memoryMap is set to \c True for a file saved in
+ *  binary format, genotypes are mapped to memory instead of being read, so
+ *  that they are read from the file only when they are accessed and can be
+ *  shared by processes that load the same file. Changes to the genotype of
+ *  such a population are not written back to the file. Saving such a
+ *  population to the same file writes a new file that replaces it, but the
+ *  file should not be truncated or overwritten by other means while the
+ *  population exists, because accessing genotypes removed from the file
+ *  terminates the program with a \c SIGBUS signal. Genotypes are read into
+ *  memory if they cannot be mapped, for example for binary and mutant
+ *  modules, or if the file is saved by a module with a different allele
+ *  type.
  */
-Population & loadPopulation(const string & file);
+Population & loadPopulation(const string & file, bool memoryMap = false,
+                            const lociList & loci = lociList(), const subPopList & subPops = subPopList(),
+                            const uintList & ancGens = uintList(), const stringList & infoFields = stringList());
 
 }
 
@@ -46,7 +46,6 @@ bool BaseQuanTrait::apply(Population & pop) const
 		gens.push_back(pop.curAncestralGen());
 
 	size_t oldGen = pop.curAncestralGen();
-	vectorf traits(infoSize());
 	for (unsigned genIdx = 0; genIdx < gens.size(); ++genIdx) {
 		pop.useAncestralGen(gens[genIdx]);
 
@@ -58,12 +57,7 @@ bool BaseQuanTrait::apply(Population & pop) const
 			if (sp->isVirtual())
 				pop.activateVirtualSubPop(*sp);
 
-			IndIterator ind = pop.indIterator(sp->subPop());
-			for (; ind.valid(); ++ind) {
-				qtrait(&*ind, pop.gen(), traits);
-				for (size_t i = 0; i < infoSize(); ++i)
-					ind->setInfo(traits[i], infoIdx[i]);
-			}
+			applyToSubPop(pop, sp->subPop(), infoIdx);
 
 			if (sp->isVirtual())
 				pop.deactivateVirtualSubPop(sp->subPop());
@@ -74,6 +68,19 @@ bool BaseQuanTrait::apply(Population & pop) const
 }
 
 
+void BaseQuanTrait::applyToSubPop(Population & pop, size_t subPop, const vectoru & infoIdx) const
+{
+	vectorf traits(infoSize());
+
+	IndIterator ind = pop.indIterator(subPop);
+	for (; ind.valid(); ++ind) {
+		qtrait(&*ind, pop.gen(), traits);
+		for (size_t i = 0; i < infoSize(); ++i)
+			ind->setInfo(traits[i], infoIdx[i]);
+	}
+}
+
+
 bool BaseQuanTrait::applyDuringMating(Population & pop, Population & offPop, RawIndIterator offspring,
                                       Individual * /* dad */, Individual * /* mom */) const
 
@@ -90,6 +97,41 @@ bool BaseQuanTrait::applyDuringMating(Population & pop, Population & offPop, Raw
 }
 
 
+void PyQuanTrait::applyToSubPop(Population & pop, size_t subPop, const vectoru & infoIdx) const
+{
+	if (!m_vectorized) {
+		BaseQuanTrait::applyToSubPop(pop, subPop, infoIdx);
+		return;
+	}
+	vector<Individual *> inds;
+	for (IndIterator ind = pop.indIterator(subPop); ind.valid(); ++ind)
+		inds.push_back(&*ind);
+	vectorf traits;
+	callVectorizedFunc(m_func, pop, inds, m_loci.elems(&pop), infoSize(), traits);
+	vectorf::const_iterator it = traits.begin();
+	for (size_t i = 0; i < inds.size(); ++i)
+		for (size_t j = 0; j < infoSize(); ++j)
+			inds[i]->setInfo(*it++, infoIdx[j]);
+}
+
+
+bool PyQuanTrait::applyDuringMating(Population & pop, Population & offPop, RawIndIterator offspring,
+                                    Individual * dad, Individual * mom) const
+{
+	if (!m_vectorized)
+		return BaseQuanTrait::applyDuringMating(pop, offPop, offspring, dad, mom);
+	// if offspring does not belong to subPops, do nothing, but does not fail.
+	if (!applicableToAllOffspring() && !applicableToOffspring(offPop, offspring))
+		return true;
+	vectorf traits;
+	callVectorizedFunc(m_func, offPop, vector<Individual *>(1, &*offspring),
+		m_loci.elems(&offPop), infoSize(), traits);
+	for (size_t i = 0; i < traits.size(); ++i)
+		offspring->setInfo(traits[i], infoField(i));
+	return true;
+}
+
+
 void PyQuanTrait::qtrait(Individual * ind, size_t gen, vectorf & traits) const
 {
 	PyObject * args = PyTuple_New(m_func.numArgs());
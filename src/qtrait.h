@@ -114,6 +114,10 @@ public:
 	}
 
 
+protected:
+	/// set traits to individuals in the current (virtual) subpopulation
+	virtual void applyToSubPop(Population & pop, size_t subPop, const vectoru & infoIdx) const;
+
 private:
 	/// how to handle ancestral gen
 	const uintList m_ancGens;
@@ -134,6 +138,14 @@ private:
  *  passed as a default dictionary of loci index (with respect to all genotype of
  *  individuals, not just the first ploidy) and alleles. The return values
  *  will be assigned to specified trait fields.
+ *
+ *  If \e vectorized is set to \c True, the function is called once for each
+ *  (virtual) subpopulation. Genotypes are passed as a matrix with one row of
+ *  alleles (arranged locus by locus, including unused alleles on sex and
+ *  mitochondrial chromosomes) for each individual, and information fields are
+ *  passed as arrays of values. The function should return an array or a
+ *  sequence with one row of trait values for each individual. Parameters
+ *  \c ind and \c mut are not supported in this mode.
  */
 class PyQuanTrait : public BaseQuanTrait
 {
@@ -146,14 +158,16 @@ public:
 	 *  trait fields (\e infoField). If only one trait field is specified, a
 	 *  number or a sequence of one element is acceptable. Otherwise, a
 	 *  sequence of values will be accepted and be assigned to each trait
-	 *  field.
+	 *  field. If \e vectorized is \c True, \e func is called with genotypes
+	 *  and information fields of all individuals in a (virtual)
+	 *  subpopulation and should return their trait values.
 	 */
 	PyQuanTrait(PyObject * func, const lociList & loci = vectoru(),
 		const uintList ancGens = uintList(NULL), int begin = 0, int end = -1, int step = 1,
 		const intList & at = vectori(), const intList & reps = intList(), const subPopList & subPops = subPopList(),
-		const stringList & infoFields = vectorstr()) :
+		const stringList & infoFields = vectorstr(), bool vectorized = false) :
 		BaseQuanTrait(ancGens, begin, end, step, at, reps, subPops, infoFields),
-		m_func(func), m_loci(loci)
+		m_func(func), m_loci(loci), m_vectorized(vectorized)
 	{
 		DBG_ASSERT(m_func.isValid(), ValueError, "Passed variable is not a callable python function.");
 
@@ -179,12 +193,23 @@ public:
 	}
 
 
+	/// CPPONLY
+	bool applyDuringMating(Population & pop, Population & offPop, RawIndIterator offspring,
+		Individual * dad = NULL, Individual * mom = NULL) const;
+
+protected:
+	/// call func with all individuals of a subpopulation if vectorized
+	virtual void applyToSubPop(Population & pop, size_t subPop, const vectoru & infoIdx) const;
+
 private:
 	/// user supplied python function
 	const pyFunc m_func;
 
 	/// susceptibility loci
 	const lociList m_loci;
+
+	/// call func with all individuals in a subpopulation
+	const bool m_vectorized;
 };
 
 }
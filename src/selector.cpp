@@ -34,10 +34,107 @@ using std::ostringstream;
 
 namespace simuPOP {
 
+void GenotypeFitnessCache::validate(const vectoru & loci, size_t genoStru)
+{
+	if (genoStru == m_genoStru && loci == m_loci)
+		return;
+	m_list.clear();
+	m_map.clear();
+	m_loci = loci;
+	m_genoStru = genoStru;
+}
+
+
+bool GenotypeFitnessCache::get(const string & key, double & fitness)
+{
+	FitnessMap::iterator it = m_map.find(key);
+
+	if (it == m_map.end())
+		return false;
+	// move the genotype to the front of the list
+	m_list.splice(m_list.begin(), m_list, it->second);
+	fitness = it->second->second;
+	return true;
+}
+
+
+void GenotypeFitnessCache::set(const string & key, double fitness)
+{
+	if (m_capacity == 0)
+		return;
+	if (m_list.size() >= m_capacity) {
+		// discard the least recently used genotype
+		m_map.erase(m_list.back().first);
+		m_list.pop_back();
+	}
+	m_list.push_front(std::make_pair(key, fitness));
+	m_map[key] = m_list.begin();
+}
+
+
+void BaseSelector::useFitnessCache(size_t size)
+{
+	m_cacheSize = size;
+	m_caches.clear();
+	if (size > 0)
+		m_caches.resize(numThreads(), GenotypeFitnessCache(size));
+}
+
+
+GenotypeFitnessCache * BaseSelector::fitnessCache(const Population & pop, const vectoru & loci) const
+{
+	if (m_caches.empty())
+		return NULL;
+#ifdef _OPENMP
+	size_t id = omp_get_thread_num();
+	// threads created after the cache is resized do not use a cache
+	if (id >= m_caches.size())
+		return NULL;
+	GenotypeFitnessCache * cache = &m_caches[id];
+#else
+	GenotypeFitnessCache * cache = &m_caches[0];
+#endif
+	cache->validate(loci, pop.genoStruIdx());
+	return cache;
+}
+
+
+string BaseSelector::genotypeKey(const Individual & ind, const vectoru & loci, bool withSex) const
+{
+	size_t ply = ind.ploidy();
+	string key;
+
+	key.reserve(loci.size() * ply * sizeof(Allele) + 1);
+	for (size_t idx = 0; idx < loci.size(); ++idx) {
+		for (size_t p = 0; p < ply; ++p) {
+			Allele a = TO_ALLELE(ind.allele(loci[idx], p));
+			key.append(reinterpret_cast<const char *>(&a), sizeof(Allele));
+		}
+	}
+	if (withSex)
+		key.push_back(ind.sex() == MALE ? 'M' : 'F');
+	return key;
+}
+
+
+vectoru BaseSelector::cachedGenotypes() const
+{
+	vectoru sizes(m_caches.size());
+
+	for (size_t i = 0; i < m_caches.size(); ++i)
+		sizes[i] = m_caches[i].size();
+	return sizes;
+}
+
+
 bool BaseSelector::apply(Population & pop) const
 {
 	size_t fit_id = pop.infoIdx(this->infoField(0));
 
+	// the number of threads might have been changed
+	if (m_cacheSize > 0 && m_caches.size() < numThreads())
+		m_caches.resize(numThreads(), GenotypeFitnessCache(m_cacheSize));
+
 	subPopList subPops = applicableSubPops(pop);
 
 	subPopList::const_iterator sp = subPops.begin();
@@ -71,8 +168,26 @@ bool BaseSelector::apply(Population & pop) const
 
 double MapSelector::indFitness(Population & pop, RawIndIterator ind) const
 {
-	vectoru chromTypes;
 	const vectoru & loci = m_loci.elems(&pop);
+	GenotypeFitnessCache * cache = fitnessCache(pop, loci);
+
+	if (cache == NULL)
+		return lookupFitness(ind, loci);
+
+	// sex matters only for sex chromosomes and haplodiploid populations
+	string key = genotypeKey(*ind, loci, pop.isHaplodiploid() || pop.chromX() != -1 || pop.chromY() != -1);
+	double fitness;
+	if (!cache->get(key, fitness)) {
+		fitness = lookupFitness(ind, loci);
+		cache->set(key, fitness);
+	}
+	return fitness;
+}
+
+
+double MapSelector::lookupFitness(RawIndIterator ind, const vectoru & loci) const
+{
+	vectoru chromTypes;
 
 	for (size_t i = 0; i < loci.size(); ++i)
 		chromTypes.push_back(ind->chromType(ind->chromLocusPair(loci[i]).first));
@@ -279,6 +394,13 @@ double MlSelector::indFitness(Population & pop, RawIndIterator ind) const
 
 double PySelector::indFitness(Population & pop, RawIndIterator ind) const
 {
+	if (m_vectorized) {
+		// during mating, or as part of a multi-locus selector
+		vectorf fitness;
+		callVectorizedFunc(m_func, pop, vector<Individual *>(1, &*ind), m_loci.elems(&pop), 1, fitness);
+		return fitness[0];
+	}
+
 	PyObject * args = PyTuple_New(m_func.numArgs());
 
 	DBG_ASSERT(args, RuntimeError, "Failed to create a parameter tuple");
@@ -309,6 +431,34 @@ double PySelector::indFitness(Population & pop, RawIndIterator ind) const
 }
 
 
+bool PySelector::apply(Population & pop) const
+{
+	if (!m_vectorized)
+		return BaseSelector::apply(pop);
+
+	size_t fit_id = pop.infoIdx(this->infoField(0));
+	const vectoru & loci = m_loci.elems(&pop);
+
+	subPopList subPops = applicableSubPops(pop);
+	subPopList::const_iterator sp = subPops.begin();
+	subPopList::const_iterator spEnd = subPops.end();
+	for (; sp != spEnd; ++sp) {
+		if (sp->isVirtual())
+			pop.activateVirtualSubPop(*sp);
+		vector<Individual *> inds;
+		for (IndIterator ind = pop.indIterator(sp->subPop()); ind.valid(); ++ind)
+			inds.push_back(&*ind);
+		vectorf fitness;
+		callVectorizedFunc(m_func, pop, inds, loci, 1, fitness);
+		for (size_t i = 0; i < inds.size(); ++i)
+			inds[i]->setInfo(fitness[i], fit_id);
+		if (sp->isVirtual())
+			pop.deactivateVirtualSubPop(sp->subPop());
+	}
+	return true;
+}
+
+
 PyMlSelector::PyMlSelector(PyObject * func, int mode,
 	const lociList & loci, const stringFunc & output, int begin, int end, int step, const intList & at,
 	const intList & reps, const subPopList & subPops, const stringList & infoFields) :
@@ -45,9 +45,82 @@ using std::min;
 #endif
 
 #include <set>
+#include <list>
 
 namespace simuPOP {
 
+/** CPPONLY
+ *  A size-bounded cache of fitness values keyed by packed multi-locus
+ *  genotypes. The least recently used genotype is discarded when the cache
+ *  is full. A cache is valid only for the loci and genotypic structure with
+ *  which it is validated, and is emptied if they change. Copies of a cache
+ *  are empty.
+ */
+class GenotypeFitnessCache
+{
+public:
+	GenotypeFitnessCache(size_t capacity) : m_capacity(capacity),
+		m_loci(), m_genoStru(0), m_list(), m_map()
+	{
+	}
+
+
+	GenotypeFitnessCache(const GenotypeFitnessCache & rhs) : m_capacity(rhs.m_capacity),
+		m_loci(), m_genoStru(0), m_list(), m_map()
+	{
+	}
+
+
+	GenotypeFitnessCache & operator=(const GenotypeFitnessCache & rhs)
+	{
+		m_capacity = rhs.m_capacity;
+		m_loci.clear();
+		m_genoStru = 0;
+		m_list.clear();
+		m_map.clear();
+		return *this;
+	}
+
+
+	/// empty the cache if loci or genotypic structure differ from the last call
+	void validate(const vectoru & loci, size_t genoStru);
+
+	/// return true and set fitness if genotype key is cached
+	bool get(const string & key, double & fitness);
+
+	/// cache fitness for genotype key
+	void set(const string & key, double fitness);
+
+	/// number of cached genotypes
+	size_t size() const
+	{
+		return m_list.size();
+	}
+
+
+private:
+	typedef std::list<std::pair<string, double> > FitnessList;
+#if TR1_SUPPORT == 0
+	typedef std::map<string, FitnessList::iterator> FitnessMap;
+#elif TR1_SUPPORT == 1
+	typedef std::unordered_map<string, FitnessList::iterator> FitnessMap;
+#else
+	typedef std::tr1::unordered_map<string, FitnessList::iterator> FitnessMap;
+#endif
+
+	size_t m_capacity;
+
+	vectoru m_loci;
+
+	size_t m_genoStru;
+
+	/// cached genotypes, most recently used first
+	FitnessList m_list;
+
+	FitnessMap m_map;
+};
+
+
 /** This class is the base class to all selectors, namely operators that
  *  perform natural selection. It defines a common interface for all selectors.
  *
@@ -121,7 +194,8 @@ public:
 	BaseSelector(const stringFunc & output = "", int begin = 0, int end = -1, int step = 1, const intList & at = vectori(),
 		const intList & reps = intList(), const subPopList & subPops = subPopList(),
 		const stringList & infoFields = stringList("fitness"))
-		: BaseOperator(output, begin, end, step, at, reps, subPops, infoFields)
+		: BaseOperator(output, begin, end, step, at, reps, subPops, infoFields),
+		m_cacheSize(0), m_caches()
 	{
 	}
 
@@ -151,6 +225,14 @@ public:
 	/// HIDDEN set fitness to all individuals. No selection will happen!
 	bool apply(Population & pop) const;
 
+	/** Return the number of genotypes in the fitness cache of each thread,
+	 *  which tells how many genotypes a selector that caches fitness
+	 *  values (e.g. a \c MapSelector with a positive \e cacheSize) has
+	 *  looked up. An empty list is returned if fitness values are not
+	 *  cached.
+	 */
+	vectoru cachedGenotypes() const;
+
 	/// CPPONLY
 	bool applyDuringMating(Population & pop, Population & offPop, RawIndIterator offspring,
 	                       Individual * dad = NULL, Individual * mom = NULL) const
@@ -179,6 +261,22 @@ public:
 	}
 
 
+protected:
+	/// keep fitness values of at most \e size genotypes for each thread
+	void useFitnessCache(size_t size);
+
+	/// cache of the current thread, NULL if no cache is used
+	GenotypeFitnessCache * fitnessCache(const Population & pop, const vectoru & loci) const;
+
+	/// packed genotype of \e ind at \e loci (and sex if \e withSex is true)
+	string genotypeKey(const Individual & ind, const vectoru & loci, bool withSex) const;
+
+private:
+	/// maximum number of genotypes in the cache of each thread
+	size_t m_cacheSize;
+
+	/// a fitness cache for each thread
+	mutable vector<GenotypeFitnessCache> m_caches;
 };
 
 
@@ -205,15 +303,21 @@ public:
 	 *  still can not be found, a \c ValueError will be raised. This
 	 *  operator supports sex chromosomes and haplodiploid populations. In
 	 *  these cases, only valid genotypes should be used to generator the
-	 *  dictionary keys.
+	 *  dictionary keys. Fitness values of up to \e cacheSize most recently
+	 *  seen genotypes are cached across generations so that genotypes that
+	 *  have been looked up are not looked up again. The cache is emptied if
+	 *  \e loci or the genotypic structure of the population changes, and
+	 *  is disabled if \e cacheSize is \c 0. Function \c cachedGenotypes()
+	 *  returns the number of cached genotypes.
 	 */
 	MapSelector(const lociList & loci, const tupleDict & fitness,
 		int begin = 0, int end = -1, int step = 1, const intList & at = vectori(),
 		const intList & reps = intList(), const subPopList & subPops = subPopList(),
-		const stringList & infoFields = stringList("fitness")) :
+		const stringList & infoFields = stringList("fitness"), size_t cacheSize = 1024) :
 		BaseSelector("", begin, end, step, at, reps, subPops, infoFields),
 		m_loci(loci), m_dict(fitness)
 	{
+		useFitnessCache(cacheSize);
 	};
 
 	virtual ~MapSelector()
@@ -249,6 +353,9 @@ public:
 
 
 private:
+	/// look up genotype of ind in the fitness dictionary
+	double lookupFitness(RawIndIterator ind, const vectoru & loci) const;
+
 	///
 	const lociList m_loci;
 
@@ -434,6 +541,14 @@ private:
  *  index (with respect to all genotype of individuals, not just the first ploidy)
  *  and alleles. The returned value will be used to determine the fitness of each
  *  individual.
+ *
+ *  If \e vectorized is set to \c True, the function is called once for each
+ *  (virtual) subpopulation. Genotypes are passed as a matrix with one row of
+ *  alleles (arranged locus by locus, including unused alleles on sex and
+ *  mitochondrial chromosomes) for each individual, and information fields are
+ *  passed as arrays of values. The function should return an array or a
+ *  sequence of fitness values, one for each individual. Parameters \c ind and
+ *  \c mut are not supported in this mode.
  */
 class PySelector : public BaseSelector
 {
@@ -441,15 +556,18 @@ public:
 	/** Create a Python hybrid selector that passes genotype at specified
 	 *  \e loci, values at specified information fields (if requested) and
 	 *  a generation number to a user-defined function \e func. The return
-	 *  value will be treated as individual fitness.
+	 *  value will be treated as individual fitness. If \e vectorized is
+	 *  \c True, \e func is called with genotypes and information fields of
+	 *  all individuals in a (virtual) subpopulation and should return their
+	 *  fitness values.
 	 */
 	PySelector(PyObject * func, lociList loci = vectoru(),
 		int begin = 0, int end = -1, int step = 1,
 		const intList & at = vectori(), const intList & reps = intList(), const stringFunc & output = "",
 		const subPopList & subPops = subPopList(),
-		const stringList & infoFields = stringList("fitness")) :
+		const stringList & infoFields = stringList("fitness"), bool vectorized = false) :
 		BaseSelector(output, begin, end, step, at, reps, subPops, infoFields),
-		m_func(func), m_loci(loci)
+		m_func(func), m_loci(loci), m_vectorized(vectorized)
 	{
 		DBG_ASSERT(m_func.isValid(), ValueError, "Passed variable is not a callable python function.");
 	}
@@ -467,6 +585,9 @@ public:
 	 */
 	virtual double indFitness(Population & pop, RawIndIterator ind) const;
 
+	/// HIDDEN set fitness to all individuals, in batch if vectorized
+	virtual bool apply(Population & pop) const;
+
 	/// HIDDEN
 	string describe(bool format = true) const
 	{
@@ -489,6 +610,8 @@ private:
 	/// susceptibility loci
 	const lociList m_loci;
 
+	/// call func with all individuals in a subpopulation
+	const bool m_vectorized;
 };
 
 
@@ -606,12 +606,21 @@ namespace simuPOP {
 // for mutant vector -- the class wrapper for compressed vector
 #include "mutant_vector.h"
 
+// genotypes of populations in the short, long and lineage modules can be
+// mapped from a file
+#include "mapped_allocator.h"
+#if defined(BINARYALLELE) || defined(MUTANTALLELE)
+typedef vectora vectorg;
+#else
+typedef std::vector<Allele, simuPOP::MappedAllocator<Allele> > vectorg;
+#endif
+
 #ifdef MUTANTALLELE
 typedef simuPOP::vectorm::iterator GenoIterator;
 typedef simuPOP::vectorm::const_iterator ConstGenoIterator;
 #else
-typedef std::vector<Allele>::iterator GenoIterator;
-typedef std::vector<Allele>::const_iterator ConstGenoIterator;
+typedef vectorg::iterator GenoIterator;
+typedef vectorg::const_iterator ConstGenoIterator;
 #endif
 
 #endif
@@ -193,7 +193,7 @@ namespace std
 {
     try
     {
-        $function
+        $action
     }
     catch(simuPOP::StopIteration e)
     {
@@ -309,8 +309,17 @@ namespace std
 }
 
 %include "virtualSubPop.h"
+
+// arrays returned by Population.genotype(), lineage() and infoArray() refer
+// to memory of the population so they keep the population alive
+%typemap(argout) simuPOP::Population * self {
+    $result = setViewOwner($result, $input);
+}
+
 %include "population.h"
 
+%clear simuPOP::Population * self;
+
 namespace std {
     %template()    vector<simuPOP::BaseOperator * >;
 }
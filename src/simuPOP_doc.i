@@ -709,6 +709,22 @@ Details:
 
 %feature("docstring") simuPOP::BaseSelector::apply "Obsolete or undocumented function."
 
+%feature("docstring") simuPOP::BaseSelector::cachedGenotypes "
+
+Usage:
+
+    x.cachedGenotypes()
+
+Details:
+
+    Return the number of genotypes in the fitness cache of each
+    thread, which tells how many genotypes a selector that caches
+    fitness values (e.g. a MapSelector with a positive cacheSize) has
+    looked up. An empty list is returned if fitness values are not
+    cached.
+
+"; 
+
 %ignore simuPOP::BaseSelector::applyDuringMating(Population &pop, Population &offPop, RawIndIterator offspring, Individual *dad=NULL, Individual *mom=NULL) const;
 
 %feature("docstring") simuPOP::BaseSelector::clone "Obsolete or undocumented function."
@@ -2518,6 +2534,18 @@ Details:
 
 %ignore simuPOP::GenoTransmitter::initializeIfNeeded(const Individual &ind) const;
 
+%ignore simuPOP::GenotypeFitnessCache;
+
+%ignore simuPOP::GenotypeFitnessCache::GenotypeFitnessCache(size_t capacity);
+
+%ignore simuPOP::GenotypeFitnessCache::validate(const vectoru &loci, size_t genoStru);
+
+%ignore simuPOP::GenotypeFitnessCache::get(const string &key, double &fitness);
+
+%ignore simuPOP::GenotypeFitnessCache::set(const string &key, double fitness);
+
+%ignore simuPOP::GenotypeFitnessCache::size() const;
+
 %feature("docstring") simuPOP::GenotypeSplitter "
 
 Details:
@@ -2665,6 +2693,22 @@ Usage:
 
 "; 
 
+%ignore simuPOP::HaplotypeCounter;
+
+%ignore simuPOP::HaplotypeCounter::HaplotypeCounter(const vectori &loci=vectori());
+
+%ignore simuPOP::HaplotypeCounter::add(GenoIterator geno);
+
+%ignore simuPOP::HaplotypeCounter::merge(const HaplotypeCounter &rhs);
+
+%ignore simuPOP::HaplotypeCounter::total() const;
+
+%ignore simuPOP::HaplotypeCounter::size() const;
+
+%ignore simuPOP::HaplotypeCounter::getCounts(vector< vectori > &haplotypes, vectoru &counts) const;
+
+%ignore simuPOP::HaplotypeCounter::addTo(tupleDict &dict) const;
+
 %feature("docstring") simuPOP::HaplodiploidGenoTransmitter "
 
 Details:
@@ -2766,7 +2810,12 @@ Details:
     applied to the same subpopulation, offspring produced by these
     mating schemes are shuffled randomly. If this is not desired, you
     can turn off offspring shuffling by setting parameter
-    shuffleOffspring to False.
+    shuffleOffspring to False.  If multiple threads are used, each
+    mating scheme in each subpopulation produces its offspring with its
+    own random number stream, and mating schemes that are applied to
+    non-virtual subpopulations and do not call any Python function are
+    executed in parallel. Offspring generations therefore do not depend
+    on the number of threads (if more than one thread is used).
 
 "; 
 
@@ -2778,6 +2827,8 @@ Details:
 
 %ignore simuPOP::HeteroMating::mate(Population &pop, Population &scratch);
 
+%ignore simuPOP::HeteroMating::replicateParallelizable() const;
+
 %feature("docstring") simuPOP::HeteroMating::~HeteroMating "
 
 Description:
@@ -2836,6 +2887,10 @@ Details:
 
 %ignore simuPOP::HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop, RawIndIterator offBegin, RawIndIterator offEnd);
 
+%ignore simuPOP::HomoMating::mateSubPop(Population &pop, Population &offPop, size_t subPop, RawIndIterator offBegin, RawIndIterator offEnd, bool multiThreaded);
+
+%ignore simuPOP::HomoMating::replicateParallelizable() const;
+
 %ignore simuPOP::HomoMating::subPops() const;
 
 %ignore simuPOP::HomoMating::weight() const;
@@ -4123,7 +4178,8 @@ Details:
 Usage:
 
     MapSelector(loci, fitness, begin=0, end=-1, step=1, at=[],
-      reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=ALL_AVAIL)
+      reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=ALL_AVAIL,
+      cacheSize=1024)
 
 Details:
 
@@ -4143,7 +4199,12 @@ Details:
     still can not be found, a ValueError will be raised. This operator
     supports sex chromosomes and haplodiploid populations. In these
     cases, only valid genotypes should be used to generator the
-    dictionary keys.
+    dictionary keys. Fitness values of up to cacheSize most recently
+    seen genotypes are cached across generations so that genotypes
+    that have been looked up are not looked up again. The cache is
+    emptied if loci or the genotypic structure of the population
+    changes, and is disabled if cacheSize is 0. Function
+    cachedGenotypes() returns the number of cached genotypes.
 
 "; 
 
@@ -4216,6 +4277,8 @@ Details:
 
 %ignore simuPOP::MatingScheme::submitScratch(Population &pop, Population &scratch);
 
+%ignore simuPOP::MatingScheme::replicateParallelizable() const;
+
 %feature("docstring") simuPOP::MatingScheme::~MatingScheme "
 
 Description:
@@ -6139,6 +6202,8 @@ Details:
 
 "; 
 
+%ignore simuPOP::Population::snapshot() const;
+
 %feature("docstring") simuPOP::Population::cmp "
 
 Description:
@@ -6257,7 +6322,11 @@ Details:
 
     Return an editable array of the genotype of all individuals in a
     population (if subPop=[], default), or individuals in a
-    subpopulation subPop. Virtual subpopulation is unsupported.
+    subpopulation subPop. Virtual subpopulation is unsupported. Except
+    for the binary and mutant modules, the returned array supports the
+    buffer protocol so that numpy.asarray(pop.genotype()) returns an
+    array that shares memory with the population. The returned array
+    keeps the population alive.
 
 "; 
 
@@ -6355,6 +6424,25 @@ Details:
 
 "; 
 
+%feature("docstring") simuPOP::Population::infoArray "
+
+Usage:
+
+    x.infoArray(subPop=[])
+
+Details:
+
+    Return an editable two-dimensional memoryview of the information
+    fields of all individuals (if subPop=[], default), or individuals
+    in a subpopulation subPop, with one row per individual and one
+    column per information field. The view shares memory with the
+    population (e.g. numpy.asarray(pop.infoArray())[:, 0] refers to
+    the first information field of all individuals). The view keeps
+    the population alive but will become invalid once the population
+    changes. Virtual subpopulation is unsupported.
+
+"; 
+
 %ignore simuPOP::Population::infoBegin(size_t idx);
 
 %ignore simuPOP::Population::infoEnd(size_t idx);
@@ -6377,7 +6465,7 @@ Details:
 
 "; 
 
-%ignore simuPOP::Population::load(const string &filename);
+%ignore simuPOP::Population::load(const string &filename, bool memoryMap=false, const lociList &loci=lociList(), const subPopList &subPops=subPopList(), const uintList &ancGens=uintList(), const stringList &infoFields=stringList());
 
 %ignore simuPOP::Population::markIndividuals(vspID subPop, bool mark) const;
 
@@ -6626,12 +6714,25 @@ Details:
 
 Usage:
 
-    x.save(filename)
+    x.save(filename, binary=False, compress=6)
 
 Details:
 
     Save population to a file filename, which can be loaded by a
-    global function loadPopulation(filename).
+    global function loadPopulation(filename). By default, the
+    population is saved in a compressed text format that can be
+    loaded across platforms. If binary is set to True, the population
+    is saved in an uncompressed binary format that stores genotype,
+    information fields and ancestral generations as raw blocks of
+    data. Such files are much faster to save and load, but can only be
+    loaded on platforms with the same byte order. Parameter compress
+    sets the gzip compression level of the text format from 0 (no
+    compression) to 9 (best compression). Lower levels save
+    populations faster but produce larger files. Other compression
+    formats are not supported. Text is compressed in blocks that are
+    processed in parallel if multiple threads are used (see
+    setOptions). This parameter is ignored for the binary format,
+    which is not compressed.
 
 "; 
 
@@ -6660,7 +6761,7 @@ Details:
 
 Usage:
 
-    x.setGenotype(geno, subPop=[])
+    x.setGenotype(geno, subPop=[], loci=ALL_AVAIL)
 
 Details:
 
@@ -6668,9 +6769,17 @@ Details:
     subPop=[]) or in a (virtual) subpopulation subPop (if subPop=sp or
     (sp, vsp)) using a list of alleles geno. geno will be reused if
     its length is less than subPopSize(subPop)*totNumLoci()*ploidy().
+    If a list of loci (by indexes or names) is given, only alleles at
+    these loci are set, in the order of individuals, ploidy and loci.
+    geno can be any object that supports the buffer protocol (e.g. a
+    numpy array of integers), in which case its values are copied
+    without conversion of individual items, and directly to the
+    genotype storage if it is of the allele type of the module.
 
 "; 
 
+%ignore simuPOP::Population::setGenotype(const vectoru &geno, vspID subPop=vspID(), const lociList &loci=lociList());
+
 %feature("docstring") simuPOP::Population::setIndInfo "
 
 Usage:
@@ -6683,7 +6792,9 @@ Details:
     individuals (if subPop=[], default), or individuals in a (virtual)
     subpopulation (subPop=sp or (sp, vsp)) to values. values will be
     reused if its length is smaller than the size of the population or
-    (virtual) subpopulation.
+    (virtual) subpopulation. values can be any object that supports the
+    buffer protocol (e.g. a numpy array), in which case its values are
+    copied without conversion of individual items.
 
 "; 
 
@@ -6706,14 +6817,16 @@ Details:
 
 Usage:
 
-    x.setLineage(geno, subPop=[])
+    x.setLineage(geno, subPop=[], loci=ALL_AVAIL)
 
 Details:
 
     Fill the lineage of all individuals in a population (if subPop=[])
     or in a (virtual) subpopulation subPop (if subPop=sp or (sp, vsp))
     using a list of IDs lineage. lineage will be reused if its length
-    is less than subPopSize(subPop)*totNumLoci()*ploidy(). This
+    is less than subPopSize(subPop)*totNumLoci()*ploidy(). As in
+    function setGenotype, lineage can be set at specified loci, and
+    lineage can be an object that supports the buffer protocol. This
     function returns directly for modules without lineage information.
 
 "; 
@@ -6935,6 +7048,38 @@ Details:
 
 %ignore simuPOP::Population::syncIndPointers(bool infoOnly=false) const;
 
+%feature("docstring") simuPOP::Population::trackAlleles "
+
+Usage:
+
+    x.trackAlleles(loci=ALL_AVAIL)
+
+Details:
+
+    Keep counts of alleles at loci (a list of loci indexes or names,
+    or all loci (ALL_AVAIL, default)) for each subpopulation of the
+    current generation. Counts of offspring are added when they are
+    generated by a mating scheme, and counts are updated when
+    mutations are introduced by a mutator, so that operator Stat can
+    calculate allele frequencies at these loci for subpopulations
+    without going through the genotypes of all individuals. Alleles
+    are recounted when the genotype of a population is changed by
+    other means (e.g. migration, InitGenotype, a PyOperator or an array
+    returned by function genotype()). Arrays that share memory with
+    the population (e.g. numpy.asarray(pop.genotype())) are not
+    tracked after alleles are counted and should be obtained again.
+    Note that changes to genotypes or sex of individuals made directly
+    through member functions of Individual are not tracked, so this
+    function should be called again to recount alleles after such
+    changes. An empty list of loci stops the tracking of alleles.
+    This feature is not available for long and mutant modules.
+
+"; 
+
+%ignore simuPOP::Population::trackedAlleles();
+
+%ignore simuPOP::Population::trackedAlleleCounts(size_t subPop, const vectoru &loci, vectoru &counts, vectoru &totals);
+
 %feature("docstring") simuPOP::Population::updateInfoFieldsFrom "
 
 Usage:
@@ -7590,7 +7735,13 @@ Details:
     parent chooser calls the generator function with parental
     population and a subpopulation index for each subpopulation and
     retrieves parents repeatedly using the iterator interface of the
-    generator function.  This parent chooser does not support virtual
+    generator function.  To avoid calling the generator for each
+    mating event, the generator can also yield blocks of parents as
+    arrays of integers (e.g. a numpy array or a Python array). A one-
+    dimensional array is used as a list of single parents, and a two-
+    dimensional array with two columns is used as a list of (father,
+    mother) pairs. Parents in a block are used in order before the
+    generator is called again.  This parent chooser does not support virtual
     subpopulation directly. However, because virtual subpopulations
     are defined in the passed parental population, it is easy to
     return parents from a particular virtual subpopulation using
@@ -7684,6 +7835,14 @@ Details:
     The returned penetrance values will be used to determine the
     affection status of each individual.
 
+    If vectorized is set to True, the function is called once for each
+    (virtual) subpopulation. Genotypes are passed as a matrix with one
+    row of alleles (arranged locus by locus, including unused alleles
+    on sex and mitochondrial chromosomes) for each individual, and
+    information fields are passed as arrays of values. The function
+    should return an array or a sequence with one penetrance value for each
+    individual. Parameters ind and mut are not supported in this mode.
+
 "; 
 
 %feature("docstring") simuPOP::PyPenetrance::PyPenetrance "
@@ -7692,7 +7851,7 @@ Usage:
 
     PyPenetrance(func, loci=[], ancGens=UNSPECIFIED, begin=0,
       end=-1, step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL,
-      infoFields=[])
+      infoFields=[], vectorized=False)
 
 Details:
 
@@ -7703,7 +7862,9 @@ Details:
     chromosome position pairs, ALL_AVAIL, or a function with optional
     parameter pop that will be called at each ganeeration to determine
     indexes of loci. The return value will be treated as Individual
-    penetrance.
+    penetrance. If vectorized is True, func is called with genotypes
+    and information fields of all individuals in a (virtual)
+    subpopulation and should return their penetrance values.
 
 "; 
 
@@ -7734,6 +7895,14 @@ Details:
     individuals, not just the first ploidy) and alleles. The return
     values will be assigned to specified trait fields.
 
+    If vectorized is set to True, the function is called once for each
+    (virtual) subpopulation. Genotypes are passed as a matrix with one
+    row of alleles (arranged locus by locus, including unused alleles
+    on sex and mitochondrial chromosomes) for each individual, and
+    information fields are passed as arrays of values. The function
+    should return an array or a sequence with one row of trait values for each
+    individual. Parameters ind and mut are not supported in this mode.
+
 "; 
 
 %feature("docstring") simuPOP::PyQuanTrait::PyQuanTrait "
@@ -7741,7 +7910,8 @@ Details:
 Usage:
 
     PyQuanTrait(func, loci=[], ancGens=UNSPECIFIED, begin=0, end=-1,
-      step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=[])
+      step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=[],
+      vectorized=False)
 
 Details:
 
@@ -7753,7 +7923,9 @@ Details:
     be assigned to specified trait fields (infoField). If only one
     trait field is specified, a number or a sequence of one element is
     acceptable. Otherwise, a sequence of values will be accepted and
-    be assigned to each trait field.
+    be assigned to each trait field. If vectorized is True, func is
+    called with genotypes and information fields of all individuals in
+    a (virtual) subpopulation and should return their trait values.
 
 "; 
 
@@ -7761,6 +7933,8 @@ Details:
 
 %feature("docstring") simuPOP::PyQuanTrait::describe "Obsolete or undocumented function."
 
+%ignore simuPOP::PyQuanTrait::applyDuringMating(Population &pop, Population &offPop, RawIndIterator offspring, Individual *dad=NULL, Individual *mom=NULL) const;
+
 %ignore simuPOP::PyQuanTrait::qtrait(Individual *ind, size_t gen, vectorf &traits) const;
 
 %feature("docstring") simuPOP::PySelector "
@@ -7786,6 +7960,14 @@ Details:
     individuals, not just the first ploidy) and alleles. The returned
     value will be used to determine the fitness of each individual.
 
+    If vectorized is set to True, the function is called once for each
+    (virtual) subpopulation. Genotypes are passed as a matrix with one
+    row of alleles (arranged locus by locus, including unused alleles
+    on sex and mitochondrial chromosomes) for each individual, and
+    information fields are passed as arrays of values. The function
+    should return an array or a sequence with one fitness value for each
+    individual. Parameters ind and mut are not supported in this mode.
+
 "; 
 
 %feature("docstring") simuPOP::PySelector::PySelector "
@@ -7794,17 +7976,22 @@ Usage:
 
     PySelector(func, loci=[], begin=0, end=-1, step=1, at=[],
       reps=ALL_AVAIL, output=\"\", subPops=ALL_AVAIL,
-      infoFields=ALL_AVAIL)
+      infoFields=ALL_AVAIL, vectorized=False)
 
 Details:
 
     Create a Python hybrid selector that passes genotype at specified
     loci, values at specified information fields (if requested) and a
     generation number to a user-defined function func. The return
-    value will be treated as individual fitness.
+    value will be treated as individual fitness. If vectorized is True,
+    func is called with genotypes and information fields of all
+    individuals in a (virtual) subpopulation and should return their
+    fitness values.
 
 "; 
 
+%feature("docstring") simuPOP::PySelector::apply "Obsolete or undocumented function."
+
 %feature("docstring") simuPOP::PySelector::clone "Obsolete or undocumented function."
 
 %feature("docstring") simuPOP::PySelector::describe "Obsolete or undocumented function."
@@ -8087,6 +8274,8 @@ Details:
 
 "; 
 
+%ignore simuPOP::RNG::swap(RNG &rhs);
+
 %feature("docstring") simuPOP::RNG::~RNG "
 
 Usage:
@@ -8118,8 +8307,11 @@ Details:
     at a probability proportional to his or her fitness value. If
     parents are chosen without replacement, a parent can be chosen
     only once. An RuntimeError will be raised if all parents are
-    exhausted. Natural selection is disabled in the without-
-    replacement case.
+    exhausted. If parents are chosen without replacement and fitness
+    values are assigned, parents are chosen one by one with
+    probabilities that are proportional to the fitness values of the
+    remaining individuals, and individuals with zero fitness are never
+    chosen.
 
 "; 
 
@@ -8455,6 +8647,12 @@ Details:
     IdTagger operator) before this Recombinator is applied.  In
     addition to genotypes, this operator also copies alleleic lineage
     if it is executed in a module with lineage allele type.
+    For long genomes with rare recombinations at different rates,
+    this operator treats recombination rates as a genetic map. The
+    number of recombination events is drawn from the total map length
+    and the events are located on the map so that the cost of
+    transmitting a chromosome is proportional to the number of
+    recombination events, not the number of loci.
 
 Note:
 
@@ -8689,7 +8887,8 @@ Details:
 Usage:
 
     SavePopulation(output=\"\", begin=0, end=-1, step=1, at=[],
-      reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=[])
+      reps=ALL_AVAIL, subPops=ALL_AVAIL, infoFields=[], compress=6,
+      background=False)
 
 Details:
 
@@ -8698,9 +8897,20 @@ Details:
     specifications ('', 'filename', 'filename' prefixed by one or more
     '>' characters, and '!expr') but output from different operators
     will always replace existing files (effectively ignore '>'
-    specification). Parameter subPops is ignored. Please refer to
-    class BaseOperator for a detailed description about common
-    operator parameters such as stage and begin.
+    specification). Parameter compress sets the gzip compression level
+    (0 for no compression to 9 for best compression) of saved files. A
+    lower level can be used to reduce the time spent on saving
+    populations at the cost of larger files. Populations are always
+    saved in gzip format because other compression formats cannot be
+    loaded by function loadPopulation. If background is set to
+    True, this operator copies the population and saves the copy in a
+    background thread so that the evolutionary process can continue
+    while the population is being saved. At most two copies can wait
+    to be saved so this operator will wait if populations cannot be
+    saved as fast as they are produced. All populations are saved
+    when function evolve returns. Parameter subPops is ignored. Please
+    refer to class BaseOperator for a detailed description about
+    common operator parameters such as stage and begin.
 
 "; 
 
@@ -9134,7 +9344,7 @@ Details:
 Usage:
 
     x.evolve(initOps=[], preOps=[], matingScheme=MatingScheme,
-      postOps=[], finalOps=[], gen=-1, dryrun=False)
+      postOps=[], finalOps=[], gen=-1, dryrun=False, processes=1)
 
 Details:
 
@@ -9180,7 +9390,30 @@ Details:
     population, including those that have stopped before others.  If
     parameter dryrun is set to True, this function will print a
     description of the evolutionary process generated by function
-    describeEvolProcess() and exits.
+    describeEvolProcess() and exits.  If parameter processes is set to
+    a number larger than 1 (or 0 for the number of CPUs), replicates
+    are evolved in up to processes forked worker processes after
+    initOps are applied. Each replicate is then evolved independently
+    with its own random number stream, seeded from the random number
+    generator of the simulator, so that the results for a given seed
+    do not depend on the number of processes (but differ from those of
+    sequential evolution). Evolved populations, including their
+    variables, are sent back to the simulator before finalOps are
+    applied. Because replicates are evolved separately, an operator or
+    a StopEvolution exception can only stop the replicate to which it
+    is applied, and operators that use or change other replicates, or
+    Python objects outside of the populations, do not work as in
+    sequential evolution. This feature is not available under windows.
+    If multiple threads are used (see setOptions) and processes is 1,
+    replicates are mated in parallel threads if the mating scheme does
+    not call any Python function (e.g. no Python parents chooser,
+    demographic function or during-mating PyOperator). Only mating is
+    parallelized. Pre- and post-mating operators are applied in the
+    main thread, one replicate after another, before and after all
+    replicates are mated. A replicate mated in the i-th thread uses
+    the random number generator of that thread, and all replicates
+    are mated in the main thread if they have different genotypic
+    structures.
 
 "; 
 
@@ -9357,9 +9590,9 @@ Usage:
       haploHomoFreq=[], sumOfInfo=[], meanOfInfo=[], varOfInfo=[],
       maxOfInfo=[], minOfInfo=[], LD=[], association=[],
       neutrality=[], structure=[], HWE=[], inbreeding=[],
-      effectiveSize=[], vars=ALL_AVAIL, suffix=\"\", output=\"\", begin=0,
-      end=-1, step=1, at=[], reps=ALL_AVAIL, subPops=ALL_AVAIL,
-      infoFields=[])
+      effectiveSize=[], vars=ALL_AVAIL, suffix=\"\", output=\"\",
+      begin=0, end=-1, step=1, at=[], reps=ALL_AVAIL,
+      subPops=ALL_AVAIL, infoFields=[], LDWindow=0, LDThreshold=0)
 
 Details:
 
@@ -9643,11 +9876,29 @@ Details:
     *   LD_ChiSq_p_sp p value for the ChiSq statistics for each
     (virtual) subpopulation.
     *   CramerV_sp Cramer V statistics for each (virtual)
-    subpopulation.association: Parameter association accepts a list of
-    loci, which can be a list of indexes, names, or ALL_AVAIL. At each
-    locus, one or more statistical tests will be performed to test
-    association between this locus and individual affection status.
-    Currently, simuPOP provides the following tests:
+    subpopulation.LDWindow and LDThreshold: If a positive LDWindow is
+    given, parameter LD is treated as a list of loci and LD is
+    calculated for all pairs of these loci that are on the same
+    chromosome and are at most LDWindow apart. The distance is measured
+    in locus positions, which is the number of loci if default
+    positions are used, and base pairs if loci are positioned by bp.
+    Each locus is treated as diallelic with its most common allele (in
+    all specified (virtual) subpopulations) as the primary allele so LD
+    and LD_prime are signed. Haplotypes are bit-packed so this mode is
+    suitable for a large number of loci, and pairs of loci are
+    processed by all threads. Only pairs with R2 at or above
+    LDThreshold (default to 0) are kept, and the results are saved in
+    coordinate format: LD_row and LD_col are arrays (array.array) of
+    the first and second loci of the kept pairs, and LD, LD_prime and
+    R2 are arrays of statistics of these pairs, in the same order.
+    LD_row_sp and LD_col_sp are set for each (virtual) subpopulation
+    if LD_sp, LD_prime_sp or R2_sp is requested. Association
+    statistics are not available in this mode.association: Parameter
+    association accepts a list of loci, which can be a list of
+    indexes, names, or ALL_AVAIL. At each locus, one or more
+    statistical tests will be performed to test association between
+    this locus and individual affection status. Currently, simuPOP
+    provides the following tests:
     *   An allele-based Chi-square test using alleles counts. This
     test can be applied to loci with more than two alleles, and to
     haploid populations.
@@ -9687,13 +9938,31 @@ Details:
     Armitage tests, using cases and controls from each
     subpopulation.neutrality: This parameter performs neutrality tests
     (detection of natural selection) on specified loci, which can be a
-    list of loci indexes, names or ALL_AVAIL. It currently only
-    outputs Pi, which is the average number of pairwise difference
-    between loci. This statistic outputs the following variables:
-    *   Pi Mean pairwise difference between all sequences from all or
-    specified (virtual) subpopulations.
-    *   Pi_sp Mean paiewise difference between all sequences in each
-    (virtual) subpopulation.structure: Parameter structure accepts a
+    list of loci indexes, names or ALL_AVAIL. All statistics are
+    calculated from counts of alleles at each locus (site) so the cost
+    grows linearly with the number of sequences. Allele 0 is assumed
+    to be the ancestral allele, and a site with more than one allele
+    is counted as one segregating site. This statistic outputs the
+    following variables:
+    *   Pi (default) Mean pairwise difference between all sequences
+    from all or specified (virtual) subpopulations.
+    *   S Number of segregating sites.
+    *   Tajima_D Tajima's D statistic (Tajima 1989).
+    *   FuLi_D Fu and Li's D statistic (Fu and Li 1993), using
+    singletons of derived alleles as external mutations.
+    *   FuLi_F Fu and Li's F statistic (Fu and Li 1993, with variance
+    corrected by Simonsen et al. 1995).
+    *   FayWu_H Fay and Wu's H statistic (Fay and Wu 2000), which is
+    the difference between estimates of theta from pairwise
+    differences and from homozygosity of derived alleles.
+    *   SFS Unfolded site frequency spectrum, as a dictionary of the
+    number of sites with i (0 < i < n) copies of derived alleles
+    among n sequences.
+    *   Pi_sp, S_sp, Tajima_D_sp, FuLi_D_sp, FuLi_F_sp, FayWu_H_sp and
+    SFS_sp: The above statistics calculated for sequences in each
+    (virtual) subpopulation.Test statistics are set to 0 if there is
+    no segregating site or too few sequences to calculate
+    them.structure: Parameter structure accepts a
     list of loci at which statistics that measure population structure
     are calculated. structure accepts a list of loci indexes, names or
     ALL_AVAIL. This parameter currently supports the following
@@ -10181,6 +10450,38 @@ Usage:
 
 "; 
 
+%ignore simuPOP::TrackedAlleles;
+
+%ignore simuPOP::TrackedAlleles::TrackedAlleles();
+
+%ignore simuPOP::TrackedAlleles::setLoci(const vectoru &loci, const GenoStruTrait &stru);
+
+%ignore simuPOP::TrackedAlleles::loci() const;
+
+%ignore simuPOP::TrackedAlleles::empty() const;
+
+%ignore simuPOP::TrackedAlleles::genoStru() const;
+
+%ignore simuPOP::TrackedAlleles::tracks(const vectoru &loci) const;
+
+%ignore simuPOP::TrackedAlleles::valid() const;
+
+%ignore simuPOP::TrackedAlleles::reset(size_t numSubPop);
+
+%ignore simuPOP::TrackedAlleles::invalidate();
+
+%ignore simuPOP::TrackedAlleles::checkCounted(const vectoru &subPopSizes);
+
+%ignore simuPOP::TrackedAlleles::count(ConstRawIndIterator begin, ConstRawIndIterator end, vectoru &counts, vectoru &numOfSex) const;
+
+%ignore simuPOP::TrackedAlleles::add(size_t subPop, const vectoru &counts, const vectoru &numOfSex);
+
+%ignore simuPOP::TrackedAlleles::update(size_t subPop, size_t locus, size_t from, size_t to);
+
+%ignore simuPOP::TrackedAlleles::get(size_t subPop, const vectoru &loci, vectoru &counts, vectoru &totals) const;
+
+%ignore simuPOP::TrackedAlleles::swap(TrackedAlleles &rhs);
+
 %ignore simuPOP::UniformNumOffModel;
 
 %feature("docstring") simuPOP::UniformNumOffModel::UniformNumOffModel "
@@ -10279,6 +10580,25 @@ Details:
 
 "; 
 
+%feature("docstring") simuPOP::WeightedSampler::update "
+
+Usage:
+
+    x.update(index, weight)
+
+Details:
+
+    Change the weight of the index-th number to weight. The sampler is
+    converted to a binary indexed (Fenwick) tree when this function is
+    called for the first time so that the sampler does not have to be
+    rebuilt if only a few weights are changed. Both updates and draws
+    take O(log(k)) time afterwards. This function cannot be used with
+    samplers that return exact proportions of numbers.
+
+"; 
+
+%ignore simuPOP::WeightedSampler::useFenwickTree();
+
 %ignore simuPOP::WeightedSampler::set(IT first, IT last, size_t N=0);
 
 %feature("docstring") simuPOP::WeightedSampler::~WeightedSampler "
@@ -10295,6 +10615,10 @@ Usage:
 
 %feature("docstring") simuPOP::applyDuringMatingOperator "Obsolete or undocumented function."
 
+%ignore simuPOP::acquireGIL(PyThreadState *state);
+
+%ignore simuPOP::writeOutputWithGIL();
+
 %ignore simuPOP::armitageTrendTest(const vector< vectoru > &table, const vectorf &weight);
 
 %ignore simuPOP::chisqTest(const vector< vectoru > &table, double &chisq, double &chisq_p);
@@ -10407,6 +10731,8 @@ Usage:
 
 %ignore simuPOP::formatDescription(const string &text);
 
+%ignore simuPOP::getValidLoci(const GenoStruTrait &stru, const vectoru &loci, ValidLoci &valid);
+
 %feature("docstring") simuPOP::getRNG "
 
 Description:
@@ -10532,11 +10858,34 @@ Details:
 
 Usage:
 
-    loadPopulation(file)
+    loadPopulation(file, memoryMap=False, loci=ALL_AVAIL,
+      subPops=ALL_AVAIL, ancGens=ALL_AVAIL, infoFields=ALL_AVAIL)
 
 Details:
 
-    load a population from a file saved by Population::save().
+    load a population from a file saved by Population::save(). The
+    format (text or binary) of the file is detected automatically.
+    Parameters loci, subPops, ancGens and infoFields can be used to
+    load only specified loci (by indexes or names), subpopulations (by
+    indexes or names, virtual subpopulations are not allowed),
+    ancestral generations (default to all generations) and information
+    fields (default to all fields) of the population. For a file saved
+    in binary format, only selected parts of the file are read so that
+    part of a population can be loaded even if the whole population
+    does not fit into memory. A file saved in text format is loaded as
+    a whole and unselected parts are removed afterward. If memoryMap
+    is set to True for a file saved in binary format, genotypes are
+    mapped to memory instead of being read, so that they are read from
+    the file only when they are accessed and can be shared by
+    processes that load the same file. Changes to the genotype of such
+    a population are not written back to the file. Saving such a
+    population to the same file writes a new file that replaces it,
+    but the file should not be truncated or overwritten by other means
+    while the population exists, because accessing genotypes removed
+    from the file terminates the program with a SIGBUS signal.
+    Genotypes are read into memory if they cannot be mapped, for
+    example for binary and mutant modules, or if the file is saved by
+    a module with a different allele type.
 
 "; 
 
@@ -10650,6 +10999,27 @@ Usage:
 
 "; 
 
+%feature("docstring") simuPOP::flushBackgroundSaves "
+
+Usage:
+
+    flushBackgroundSaves()
+
+Details:
+
+    Wait for all populations that are being saved in the background by
+    operator SavePopulation(background=True). A ValueError is raised if
+    any of them could not be saved. This function is called when
+    Simulator.evolve() returns and when Python exits, and can be called
+    to check if populations saved by operators applied outside of a
+    simulator are written.
+
+"; 
+
+%ignore simuPOP::releaseGIL();
+
+%ignore simuPOP::resetBackgroundSavesAfterFork();
+
 %ignore simuPOP::ostreamManager();
 
 %ignore simuPOP::parallelSort(T1 start, T1 end, T2 cmp);
@@ -11364,7 +11734,7 @@ Usage:
 
 Usage:
 
-    statLD(LD, subPops, vars, suffix)
+    statLD(LD, window, threshold, subPops, vars, suffix)
 
 "; 
 
@@ -24,12 +24,41 @@
  */
 
 #include "simulator.h"
+#include "outputer.h"
 
 #include <sstream>
 using std::ostringstream;
+using std::istringstream;
+
+#if !defined (_WIN32) && !defined (__WIN32__)
+#  include <unistd.h>
+#  include <errno.h>
+#  include <sys/types.h>
+#  include <sys/wait.h>
+#endif
 
 namespace simuPOP {
 
+/** Wait for populations that are saved in the background when it goes out
+ *  of scope, also when the evolution is stopped by an exception. Failed
+ *  saves are only reported by an explicit call to flushBackgroundSaves()
+ *  because a destructor should not throw.
+ */
+class BackgroundSavesFlusher
+{
+public:
+	~BackgroundSavesFlusher()
+	{
+		try {
+			flushBackgroundSaves();
+		} catch (...) {
+		}
+	}
+
+
+};
+
+
 Population & pyPopIterator::next()
 {
 	if (m_index == m_end)
@@ -194,7 +223,7 @@ vectoru Simulator::evolve(
                           const MatingScheme & matingScheme,
                           const opList & postOps,
                           const opList & finalOps,
-                          int gens, bool dryrun)
+                          int gens, bool dryrun, UINT processes)
 {
 	if (dryrun) {
 		cerr << describeEvolProcess(initOps, preOps, matingScheme, postOps, finalOps, gens, numRep()) << endl;
@@ -204,10 +233,6 @@ vectoru Simulator::evolve(
 	if (numRep() == 0)
 		return vectoru();
 
-	vector<bool> activeReps(m_pops.size());
-	fill(activeReps.begin(), activeReps.end(), true);
-	size_t numStopped = 0;
-
 	// evolved generations, which will be returned.
 	vectoru evolvedGens(m_pops.size(), 0U);
 
@@ -222,6 +247,10 @@ vectoru Simulator::evolve(
 		m_pops[curRep]->setRep(curRep);
 	}
 
+	// wait for populations that are saved in the background even if
+	// the evolution is stopped by an exception
+	BackgroundSavesFlusher flusher;
+
 	initClock();
 
 	// appy pre-op, most likely initializer. Do not check if they are active
@@ -231,6 +260,90 @@ vectoru Simulator::evolve(
 
 	elapsedTime("Start evolution.");
 
+	if (processes != 1 && m_pops.size() > 1)
+		evolveInProcesses(preOps, matingScheme, postOps, gens, processes, evolvedGens);
+	else if (numThreads() > 1 && m_pops.size() > 1 && matingScheme.replicateParallelizable())
+		evolveInThreads(preOps, matingScheme, postOps, gens, evolvedGens);
+	else {
+		vector<bool> activeReps(m_pops.size(), true);
+		evolveReplicates(preOps, matingScheme, postOps, gens,
+			vector<bool>(m_pops.size(), true), activeReps, evolvedGens);
+	}
+
+	if (!finalOps.empty())
+		apply(finalOps);
+
+	// wait for populations that are saved in the background
+	flushBackgroundSaves();
+	// close every opened file (including append-cross-evolution ones)
+	ostreamManager().closeAll();
+	cleanupCircularRefs();
+	return evolvedGens;
+}
+
+
+bool Simulator::applyOpsToReplicate(const opList & ops, size_t curRep, long & curGen,
+                                    int & gens, ssize_t end, vector<bool> & activeReps, size_t & numStopped,
+                                    const string & stage)
+{
+	Population & curPop = *m_pops[curRep];
+
+	for (size_t it = 0; it < ops.size(); ++it) {
+		if (!ops[it]->isActive(curRep, curGen, end, activeReps))
+			continue;
+
+		try {
+			if (!ops[it]->apply(curPop)) {
+				DBG_DO(DBG_SIMULATOR, cerr << stage << " Operator " << ops[it]->describe() <<
+					" stops at replicate " << curRep << endl);
+				numStopped++;
+				activeReps[curRep] = false;
+				// does not run the rest of the operators.
+				break;
+			}
+			if (PyErr_CheckSignals())
+				throw StopEvolution("Evolution stopped due to keyboard interruption.");
+		} catch (StopEvolution e) {
+			DBG_DO(DBG_SIMULATOR, cerr	<< "All replicates are stopped due to a StopEvolution exception raised by "
+				                        << stage << " Operator " << ops[it]->describe() <<
+				" stops at replicate " << curRep << endl);
+			if (e.message()[0] != '\0')
+				cerr << e.message() << endl;
+			fill(activeReps.begin(), activeReps.end(), false);
+			numStopped = activeReps.size();
+			// does not run the rest of the operators.
+			break;
+		} catch (RevertEvolution e) {
+			revertGeneration(curPop, curGen, gens);
+		}
+
+		elapsedTime("Applied " + ops[it]->describe());
+	}
+	return activeReps[curRep];
+}
+
+
+void Simulator::revertGeneration(Population & curPop, long & curGen, int & gens)
+{
+	long newCurGen = curPop.getVars().getVarAsInt("gen");
+
+	if (newCurGen != static_cast<long>(curPop.gen()))
+		curPop.setGen(newCurGen);
+	if (gens > 0)
+		gens += curGen - newCurGen;
+	curGen = newCurGen;
+	DBG_DO(DBG_SIMULATOR, cerr << "Revert to generation " << curGen << endl);
+}
+
+
+void Simulator::evolveReplicates(const opList & preOps, const MatingScheme & matingScheme,
+                                 const opList & postOps, int gens, const vector<bool> & evolving,
+                                 vector<bool> & activeReps, vectoru & evolvedGens)
+{
+	// replicates that are not evolved are not counted as stopped
+	size_t numEvolving = std::count(evolving.begin(), evolving.end(), true);
+	size_t numStopped = 0;
+
 	while (1) {
 		// save refcount at the beginning
 #ifdef Py_REF_DEBUG
@@ -254,60 +367,18 @@ vectoru Simulator::evolve(
 			DBG_ASSERT(curRep == curPop.rep(), SystemError,
 				"Replicate number does not match");
 
-			if (!activeReps[curRep])
+			if (!evolving[curRep] || !activeReps[curRep])
 				continue;
 
-			size_t it = 0;                                            // asign a value to reduce compiler warning
-
 			if (PyErr_CheckSignals()) {
 				cerr << "Evolution stopped due to keyboard interruption." << endl;
 				fill(activeReps.begin(), activeReps.end(), false);
 				numStopped = activeReps.size();
 			}
 			// apply pre-mating ops to current gen()
-			if (!preOps.empty()) {
-				for (it = 0; it < preOps.size(); ++it) {
-					if (!preOps[it]->isActive(curRep, curGen, end, activeReps))
-						continue;
-
-					try {
-						if (!preOps[it]->apply(curPop)) {
-							DBG_DO(DBG_SIMULATOR, cerr << "Pre-mating Operator " << preOps[it]->describe() <<
-								" stops at replicate " << curRep << endl);
-
-							if (activeReps[curRep]) {
-								numStopped++;
-								activeReps[curRep] = false;
-								break;
-							}
-						}
-						if (PyErr_CheckSignals())
-							throw StopEvolution("Evolution stopped due to keyboard interruption.");
-					} catch (StopEvolution e) {
-						DBG_DO(DBG_SIMULATOR, cerr	<< "All replicates are stopped due to a StopEvolution exception raised by "
-							                        << "Pre-mating Operator " << preOps[it]->describe() <<
-							" stops at replicate " << curRep << endl);
-						if (e.message()[0] != '\0')
-							cerr << e.message() << endl;
-						fill(activeReps.begin(), activeReps.end(), false);
-						numStopped = activeReps.size();
-						break;
-					} catch (RevertEvolution e) {
-						long newCurGen = curPop.getVars().getVarAsInt("gen");
-						if (newCurGen != static_cast<long>(curPop.gen()))
-							curPop.setGen(newCurGen);
-						if (gens > 0)
-							gens += curGen - newCurGen;
-						curGen = newCurGen;
-						DBG_DO(DBG_SIMULATOR, cerr << "Revert to generation " << curGen << endl);
-					}
-
-					elapsedTime("Applied " + preOps[it]->describe());
-				}
-			}
-
-			if (!activeReps[curRep])
+			if (!applyOpsToReplicate(preOps, curRep, curGen, gens, end, activeReps, numStopped, "Pre-mating"))
 				continue;
+
 			elapsedTime((boost::format("Start mating at generation %1%") % curGen).str());
 			// start mating:
 			try {
@@ -330,56 +401,13 @@ vectoru Simulator::evolve(
 				// does not execute post mating operator
 				break;
 			} catch (RevertEvolution e) {
-				long newCurGen = curPop.getVars().getVarAsInt("gen");
-				if (newCurGen != static_cast<long>(curPop.gen()))
-					curPop.setGen(newCurGen);
-				if (gens > 0)
-					gens += curGen - newCurGen;
-				curGen = newCurGen;
-				DBG_DO(DBG_SIMULATOR, cerr << "Revert to generation " << curGen << endl);
+				revertGeneration(curPop, curGen, gens);
 			}
 
 			elapsedTime("Mating finished.");
 
 			// apply post-mating ops to next gen()
-			if (!postOps.empty()) {
-				for (it = 0; it < postOps.size(); ++it) {
-					if (!postOps[it]->isActive(curRep, curGen, end, activeReps))
-						continue;
-
-					try {
-						if (!postOps[it]->apply(curPop)) {
-							DBG_DO(DBG_SIMULATOR, cerr << "Post-mating Operator " + postOps[it]->describe() +
-								" stops at replicate " << curRep << endl);
-							numStopped++;
-							activeReps[curRep] = false;
-							// does not run the rest of the post-mating operators.
-							break;
-						}
-						if (PyErr_CheckSignals())
-							throw StopEvolution("Evolution stopped due to keyboard interruption.");
-					} catch (StopEvolution e) {
-						DBG_DO(DBG_SIMULATOR, cerr	<< "All replicates are stopped due to a StopEvolution exception raised by "
-							                        << "Post-mating Operator " + postOps[it]->describe() +
-							" stops at replicate " << curRep << endl);
-						if (e.message()[0] != '\0')
-							cerr << e.message() << endl;
-						fill(activeReps.begin(), activeReps.end(), false);
-						numStopped = activeReps.size();
-						// does not run the rest of the post-mating operators.
-						break;
-					} catch (RevertEvolution e) {
-						long newCurGen = curPop.getVars().getVarAsInt("gen");
-						if (newCurGen != static_cast<long>(curPop.gen()))
-							curPop.setGen(newCurGen);
-						if (gens > 0)
-							gens += curGen - newCurGen;
-						curGen = newCurGen;
-						DBG_DO(DBG_SIMULATOR, cerr << "Revert to generation " << curGen << endl);
-					}
-					elapsedTime("Applied " + postOps[it]->describe());
-				}
-			}
+			applyOpsToReplicate(postOps, curRep, curGen, gens, end, activeReps, numStopped, "Post-mating");
 			// if a replicate stops at a post mating operator, consider one evolved generation.
 			++evolvedGens[curRep];
 			curPop.setGen(curGen + 1);
@@ -398,17 +426,408 @@ vectoru Simulator::evolve(
 		//    cur, end = cur +1
 		//    will go two generations.
 		//  therefore, step should:
-		if (numStopped == m_pops.size() || gens == 0)
+		if (numStopped >= numEvolving || gens == 0)
 			break;
 	}                                                                                         // the big loop
+}
 
-	if (!finalOps.empty())
-		apply(finalOps);
 
-	// close every opened file (including append-cross-evolution ones)
-	ostreamManager().closeAll();
-	cleanupCircularRefs();
-	return evolvedGens;
+void Simulator::evolveInThreads(const opList & preOps, const MatingScheme & matingScheme,
+                                const opList & postOps, int gens, vectoru & evolvedGens)
+{
+#ifdef _OPENMP
+	// outcome of mating a replicate in a thread
+	enum {
+		NOT_MATED = -1, MATED = 0, MATING_STOPPED, STOP_EVOLUTION, REVERT_EVOLUTION,
+		VALUE_ERROR, RUNTIME_ERROR, OTHER_ERROR, UNKNOWN_ERROR
+	};
+
+	size_t numReps = m_pops.size();
+	int nThreads = static_cast<int>(std::min(static_cast<size_t>(numThreads()), numReps));
+	// each thread uses its own copy of the mating scheme and scratch population.
+	vector<MatingScheme *> schemes(nThreads);
+	vector<Population *> scratches(nThreads);
+	schemes[0] = const_cast<MatingScheme *>(&matingScheme);
+	scratches[0] = m_scratchPop;
+	for (int t = 1; t < nThreads; ++t) {
+		schemes[t] = matingScheme.clone();
+		scratches[t] = new Population();
+	}
+
+	vector<bool> activeReps(numReps, true);
+	size_t numStopped = 0;
+	vector<long> curGens(numReps);
+	vector<ssize_t> ends(numReps);
+	vectori status(numReps);
+	vectorstr messages(numReps);
+
+	try {
+		while (1) {
+#  ifdef Py_REF_DEBUG
+			saveRefCount();
+#  endif
+			// operators can call Python functions and change population
+			// variables so they are applied in the main thread.
+			for (size_t curRep = 0; curRep < numReps; curRep++) {
+				Population & curPop = *m_pops[curRep];
+				curGens[curRep] = curPop.getVars().getVarAsInt("gen");
+				if (curGens[curRep] != static_cast<long>(curPop.gen()))
+					curPop.setGen(curGens[curRep]);
+				ends[curRep] = gens > 0 ? curGens[curRep] + gens - 1 : -1;
+				status[curRep] = NOT_MATED;
+
+				if (!activeReps[curRep])
+					continue;
+
+				if (PyErr_CheckSignals()) {
+					cerr << "Evolution stopped due to keyboard interruption." << endl;
+					fill(activeReps.begin(), activeReps.end(), false);
+					numStopped = activeReps.size();
+				}
+				applyOpsToReplicate(preOps, curRep, curGens[curRep], gens, ends[curRep],
+					activeReps, numStopped, "Pre-mating");
+			}
+
+			vectoru ready;
+			for (size_t curRep = 0; curRep < numReps; curRep++)
+				if (activeReps[curRep])
+					ready.push_back(curRep);
+
+			// Reference counts of genotypic structures are not thread safe, so
+			// scratch populations are fitted to the replicates here. Replicates
+			// with different genotypic structures are mated in the main thread.
+			bool inThreads = !ready.empty();
+			for (size_t i = 1; i < ready.size(); ++i)
+				if (m_pops[ready[i]]->genoStruIdx() != m_pops[ready[0]]->genoStruIdx())
+					inThreads = false;
+			if (inThreads)
+				for (int t = 0; t < nThreads; ++t)
+					if (scratches[t]->genoStruIdx() != m_pops[ready[0]]->genoStruIdx())
+						scratches[t]->fitGenoStru(m_pops[ready[0]]->genoStruIdx());
+
+			// mate ready replicates without holding the GIL. Replicates are
+			// assigned to threads in a fixed order so that results are
+			// reproducible for the same seed and number of threads.
+			PyThreadState * state = releaseGIL();
+#  pragma omp parallel for schedule(static, 1) num_threads(nThreads) if(inThreads)
+			for (int i = 0; i < static_cast<int>(ready.size()); ++i) {
+				size_t t = omp_get_thread_num();
+				size_t curRep = ready[i];
+				try {
+					status[curRep] = schemes[t]->mate(*m_pops[curRep], *scratches[t]) ? MATED : MATING_STOPPED;
+				} catch (StopEvolution e) {
+					status[curRep] = STOP_EVOLUTION;
+				} catch (RevertEvolution e) {
+					status[curRep] = REVERT_EVOLUTION;
+				} catch (ValueError e) {
+					status[curRep] = VALUE_ERROR;
+					messages[curRep] = e.message();
+				} catch (RuntimeError e) {
+					status[curRep] = RUNTIME_ERROR;
+					messages[curRep] = e.message();
+				} catch (Exception e) {
+					status[curRep] = OTHER_ERROR;
+					messages[curRep] = e.message();
+				} catch (...) {
+					status[curRep] = UNKNOWN_ERROR;
+				}
+			}
+			acquireGIL(state);
+			elapsedTime((boost::format("Mating finished for %1% replicates.") % ready.size()).str());
+
+			for (size_t i = 0; i < ready.size(); ++i) {
+				size_t curRep = ready[i];
+				if (status[curRep] == VALUE_ERROR)
+					throw ValueError(messages[curRep]);
+				else if (status[curRep] == RUNTIME_ERROR)
+					throw RuntimeError(messages[curRep]);
+				else if (status[curRep] == OTHER_ERROR)
+					throw Exception(messages[curRep]);
+				else if (status[curRep] == UNKNOWN_ERROR)
+					throw RuntimeError((boost::format("Unknown error while mating replicate %1%.") % curRep).str());
+			}
+			if (PyErr_CheckSignals()) {
+				cerr << "Evolution stopped due to keyboard interruption." << endl;
+				fill(activeReps.begin(), activeReps.end(), false);
+				numStopped = activeReps.size();
+			}
+
+			for (size_t i = 0; i < ready.size(); ++i) {
+				size_t curRep = ready[i];
+				Population & curPop = *m_pops[curRep];
+				if (status[curRep] == MATING_STOPPED) {
+					DBG_DO(DBG_SIMULATOR, cerr << "Mating stops at replicate " << curRep << endl);
+					if (activeReps[curRep]) {
+						numStopped++;
+						activeReps[curRep] = false;
+					}
+					continue;
+				} else if (status[curRep] == STOP_EVOLUTION) {
+					DBG_DO(DBG_SIMULATOR, cerr	<< "All replicates are stopped due to a StopEvolution exception raised by "
+						                        << "During-mating Operator at replicate " << curRep << endl);
+					fill(activeReps.begin(), activeReps.end(), false);
+					numStopped = activeReps.size();
+					continue;
+				} else if (status[curRep] == REVERT_EVOLUTION)
+					revertGeneration(curPop, curGens[curRep], gens);
+
+				// replicates that have been mated before all replicates are
+				// stopped are counted as evolved, without post-mating operators.
+				if (activeReps[curRep])
+					applyOpsToReplicate(postOps, curRep, curGens[curRep], gens, ends[curRep],
+						activeReps, numStopped, "Post-mating");
+				++evolvedGens[curRep];
+				curPop.setGen(curGens[curRep] + 1);
+			}
+
+#  ifdef Py_REF_DEBUG
+			checkRefCount();
+#  endif
+			--gens;
+			if (numStopped >= numReps || gens == 0)
+				break;
+		}
+	} catch (...) {
+		for (int t = 1; t < nThreads; ++t) {
+			delete schemes[t];
+			delete scratches[t];
+		}
+		throw;
+	}
+	for (int t = 1; t < nThreads; ++t) {
+		delete schemes[t];
+		delete scratches[t];
+	}
+#else
+	vector<bool> activeReps(m_pops.size(), true);
+	evolveReplicates(preOps, matingScheme, postOps, gens,
+		vector<bool>(m_pops.size(), true), activeReps, evolvedGens);
+#endif
+}
+
+
+// flush output of Python and C++ so that buffered output is neither
+// duplicated in nor lost by forked processes
+static void flushOutputStreams()
+{
+	const char * names[] = { "stdout", "stderr" };
+
+	for (size_t i = 0; i < 2; ++i) {
+		PyObject * stream = PySys_GetObject(const_cast<char *>(names[i]));
+		if (stream != NULL && stream != Py_None) {
+			PyObject * res = PyObject_CallMethod(stream, const_cast<char *>("flush"), NULL);
+			Py_XDECREF(res);
+		}
+	}
+	PyErr_Clear();
+	std::cout.flush();
+	cerr.flush();
+	fflush(NULL);
+}
+
+
+void Simulator::evolveInProcesses(const opList & preOps, const MatingScheme & matingScheme,
+                                  const opList & postOps, int gens, size_t processes,
+                                  vectoru & evolvedGens)
+{
+#if defined (_WIN32) || defined (__WIN32__)
+	(void)processes;
+	DBG_WARNIF(true, "Evolving replicates in multiple processes is not supported under windows.");
+	vector<bool> activeReps(m_pops.size(), true);
+	evolveReplicates(preOps, matingScheme, postOps, gens,
+		vector<bool>(m_pops.size(), true), activeReps, evolvedGens);
+#else
+	size_t numReps = m_pops.size();
+	if (processes == 0) {
+		long numCPU = sysconf(_SC_NPROCESSORS_ONLN);
+		processes = numCPU > 0 ? numCPU : 1;
+	}
+	processes = std::min(processes, numReps);
+
+	// each replicate uses its own random number stream so that the results
+	// do not depend on the number of processes
+	vectoru seeds(numReps);
+	for (size_t rep = 0; rep < numReps; ++rep)
+		seeds[rep] = getRNG().randInt(MaxRandomNumber) + 1;
+
+	// evolved populations are sent back through a temporary directory
+	const char * tmpdir = getenv("TMPDIR");
+	string dirTemplate = string(tmpdir != NULL && tmpdir[0] != '\0' ? tmpdir : "/tmp") + "/simuPOP_XXXXXX";
+	vector<char> dirBuf(dirTemplate.begin(), dirTemplate.end());
+	dirBuf.push_back('\0');
+	if (mkdtemp(&dirBuf[0]) == NULL)
+		throw RuntimeError("Failed to create a temporary directory in " + dirTemplate);
+	string dirname(&dirBuf[0]);
+	vectorstr filenames(numReps);
+	for (size_t rep = 0; rep < numReps; ++rep)
+		filenames[rep] = (boost::format("%1%/rep_%2%.pop") % dirname % rep).str();
+
+	// threads and buffered output of this process are not inherited cleanly
+	flushBackgroundSaves();
+	flushOutputStreams();
+
+	string error;
+	string errorType = "RuntimeError";
+	vector<pid_t> workers;
+	vector<int> pipes;
+	for (size_t w = 0; w < processes; ++w) {
+		int fd[2];
+		if (pipe(fd) != 0) {
+			error = "Failed to create a pipe to worker process";
+			break;
+		}
+#  if PY_VERSION_HEX >= 0x03070000
+		PyOS_BeforeFork();
+#  endif
+		pid_t pid = fork();
+		if (pid == 0) {
+#  if PY_VERSION_HEX >= 0x03070000
+			PyOS_AfterFork_Child();
+#  else
+			PyOS_AfterFork();
+#  endif
+			resetBackgroundSavesAfterFork();
+			close(fd[0]);
+			for (size_t i = 0; i < pipes.size(); ++i)
+				close(pipes[i]);
+			// evolve replicates w, w + processes, ... one by one and report
+			// evolved generations of each replicate, followed by "ok" or by
+			// the type and message of an error, to the parent process
+			ostringstream msg;
+			int status = 1;
+			try {
+				BackgroundSavesFlusher flusher;
+				for (size_t rep = w; rep < numReps; rep += processes) {
+					// threads of the parent process are not inherited so
+					// workers evolve replicates in a single thread.
+					setOptions(1, NULL, seeds[rep]);
+					vector<bool> evolving(numReps, false);
+					evolving[rep] = true;
+					vector<bool> activeReps(numReps, true);
+					evolveReplicates(preOps, matingScheme, postOps, gens, evolving, activeReps, evolvedGens);
+					m_pops[rep]->save(filenames[rep], true, 0);
+					msg << "evolved " << rep << ' ' << evolvedGens[rep] << '\n';
+				}
+				flushBackgroundSaves();
+				ostreamManager().closeAll();
+				msg << "ok\n";
+				status = 0;
+			} catch (IndexError & e) {
+				msg << "error IndexError\n" << e.message();
+			} catch (ValueError & e) {
+				msg << "error ValueError\n" << e.message();
+			} catch (SystemError & e) {
+				msg << "error SystemError\n" << e.message();
+			} catch (Exception & e) {
+				msg << "error RuntimeError\n" << e.message();
+			} catch (std::bad_alloc &) {
+				msg << "error MemoryError\n";
+			} catch (std::exception & e) {
+				msg << "error RuntimeError\n" << e.what();
+			}
+			flushOutputStreams();
+			string res = msg.str();
+			for (size_t pos = 0; pos < res.size(); ) {
+				ssize_t n = write(fd[1], res.data() + pos, res.size() - pos);
+				if (n < 0 && errno == EINTR)
+					continue;
+				if (n <= 0)
+					break;
+				pos += n;
+			}
+			close(fd[1]);
+			// do not run Python or C++ cleanup code of the parent process
+			_exit(status);
+		}
+#  if PY_VERSION_HEX >= 0x03070000
+		PyOS_AfterFork_Parent();
+#  endif
+		close(fd[1]);
+		if (pid < 0) {
+			close(fd[0]);
+			error = "Failed to start worker process";
+			break;
+		}
+		workers.push_back(pid);
+		pipes.push_back(fd[0]);
+	}
+
+	// collect results from all workers
+	for (size_t w = 0; w < workers.size(); ++w) {
+		string msg;
+		char buf[4096];
+		while (true) {
+			ssize_t n = read(pipes[w], buf, sizeof(buf));
+			if (n < 0 && errno == EINTR)
+				continue;
+			if (n <= 0)
+				break;
+			msg.append(buf, n);
+		}
+		close(pipes[w]);
+		int status = 0;
+		while (waitpid(workers[w], &status, 0) < 0 && errno == EINTR) ;
+
+		// a worker that is killed or exits without reporting its status
+		// terminated abnormally
+		istringstream lines(msg);
+		string line;
+		bool succeeded = false;
+		string workerErrorType = "RuntimeError";
+		string workerError = "Worker process terminated abnormally";
+		while (getline(lines, line)) {
+			if (line.compare(0, 8, "evolved ") == 0) {
+				istringstream values(line.substr(8));
+				size_t rep = 0;
+				size_t evolved = 0;
+				if (values >> rep >> evolved && rep < numReps)
+					evolvedGens[rep] = evolved;
+			} else if (line == "ok") {
+				succeeded = WIFEXITED(status) && WEXITSTATUS(status) == 0;
+			} else if (line.compare(0, 6, "error ") == 0) {
+				// the rest of the message is the error message
+				workerErrorType = line.substr(6);
+				workerError.clear();
+				getline(lines, workerError, '\0');
+				break;
+			}
+		}
+		if (!succeeded && error.empty()) {
+			errorType = workerErrorType;
+			error = workerError.empty() ? workerErrorType : workerError;
+		}
+	}
+
+	// replace populations with evolved ones
+	for (size_t rep = 0; rep < numReps; ++rep) {
+		if (error.empty()) {
+			try {
+				Population evolved;
+				evolved.load(filenames[rep]);
+				evolved.setRep(rep);
+				evolved.setGen(evolved.getVars().getVarAsInt("gen"));
+				evolved.setVirtualSplitter(m_pops[rep]->virtualSplitter());
+				m_pops[rep]->swap(evolved);
+			} catch (Exception & e) {
+				error = e.message();
+			}
+		}
+		unlink(filenames[rep].c_str());
+	}
+	rmdir(dirname.c_str());
+	// raise the error of the worker process with its original type
+	if (error.empty())
+		return;
+	if (errorType == "IndexError")
+		throw IndexError(error);
+	else if (errorType == "ValueError")
+		throw ValueError(error);
+	else if (errorType == "SystemError")
+		throw SystemError(error);
+	else if (errorType == "MemoryError")
+		throw std::bad_alloc();
+	throw RuntimeError(error);
+#endif
 }
 
 
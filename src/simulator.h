@@ -215,6 +215,32 @@ public:
 	 *  If parameter \e dryrun is set to \c True, this function will print a
 	 *  description of the evolutionary process generated by function
 	 *  \c describeEvolProcess() and exits.
+	 *
+	 *  If parameter \e processes is set to a number larger than \c 1 (or
+	 *  \c 0 for the number of CPUs), replicates are evolved in up to
+	 *  \e processes forked worker processes after \e initOps are applied.
+	 *  Each replicate is then evolved independently with its own random
+	 *  number stream, seeded from the random number generator of the
+	 *  simulator, so that the results for a given seed do not depend on
+	 *  the number of processes (but differ from those of sequential
+	 *  evolution). Evolved populations, including their variables, are
+	 *  sent back to the simulator before \e finalOps are applied. Because
+	 *  replicates are evolved separately, an operator or a \c StopEvolution
+	 *  exception can only stop the replicate to which it is applied, and
+	 *  operators that use or change other replicates, or Python objects
+	 *  outside of the populations, do not work as in sequential evolution.
+	 *  This feature is not available under windows.
+	 *
+	 *  If multiple threads are used (see \c setOptions) and \e processes
+	 *  is \c 1, replicates are mated in parallel threads if the mating
+	 *  scheme does not call any Python function (e.g. no Python parents
+	 *  chooser, demographic function or during-mating \c PyOperator).
+	 *  Only mating is parallelized. Pre- and post-mating operators are
+	 *  applied in the main thread, one replicate after another, before and
+	 *  after all replicates are mated. A replicate mated in the \e i-th
+	 *  thread uses the random number generator of that thread, and all
+	 *  replicates are mated in the main thread if they have different
+	 *  genotypic structures.
 	 *  <group>2-evolve</group>
 	 */
 	vectoru evolve(
@@ -223,7 +249,7 @@ public:
 		const MatingScheme & matingScheme = MatingScheme(),
 		const opList & postOps = opList(),
 		const opList & finalOps = opList(),
-		int gen = -1, bool dryrun = false);
+		int gen = -1, bool dryrun = false, UINT processes = 1);
 
 
 	/// CPPONLY apply a list of operators to all populations
@@ -247,6 +273,29 @@ public:
 	int __cmp__(const Simulator & rhs) const;
 
 private:
+	/// evolve replicates marked in \e evolving, which are all replicates
+	/// for sequential evolution.
+	void evolveReplicates(const opList & preOps, const MatingScheme & matingScheme,
+		const opList & postOps, int gens, const vector<bool> & evolving,
+		vector<bool> & activeReps, vectoru & evolvedGens);
+
+	/// evolve replicates sequentially but mate them in multiple threads
+	void evolveInThreads(const opList & preOps, const MatingScheme & matingScheme,
+		const opList & postOps, int gens, vectoru & evolvedGens);
+
+	/// apply operators \e ops to replicate \e curRep, return \c false if
+	/// the replicate is stopped.
+	bool applyOpsToReplicate(const opList & ops, size_t curRep, long & curGen,
+		int & gens, ssize_t end, vector<bool> & activeReps, size_t & numStopped,
+		const string & stage);
+
+	/// reset generation number of a replicate after a RevertEvolution exception
+	void revertGeneration(Population & curPop, long & curGen, int & gens);
+
+	/// evolve replicates in forked worker processes
+	void evolveInProcesses(const opList & preOps, const MatingScheme & matingScheme,
+		const opList & postOps, int gens, size_t processes, vectoru & evolvedGens);
+
 	/// access scratch population
 	Population & scratchPopulation()
 	{
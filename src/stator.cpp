@@ -34,6 +34,11 @@ using std::set;
 #include <vector>
 #include <algorithm>
 
+#ifdef BINARYALLELE
+#  include "boost/dynamic_bitset/detail/lowest_bit.hpp"
+using boost::detail::lowest_bit;
+#endif
+
 #if TR1_SUPPORT == 0
 #  include <map>
 typedef std::map<ULONG, pair<ULONG, ULONG> > IndexMap;
@@ -389,7 +394,9 @@ Stat::Stat(
 	// regular parameters
 	const stringFunc & output,
 	int begin, int end, int step, const intList & at,
-	const intList & reps, const subPopList & subPops, const stringList & infoFields)
+	const intList & reps, const subPopList & subPops, const stringList & infoFields,
+	//
+	double LDWindow, double LDThreshold)
 	: BaseOperator("", begin, end, step, at, reps, subPops, infoFields),
 	// the order of initialization is meaningful since they may depend on each other
 	m_popSize(popSize, subPops, vars, suffix),
@@ -403,7 +410,7 @@ Stat::Stat(
 	m_haploFreq(haploFreq, subPops, vars, suffix),
 	m_haploHomoFreq(haploHeteroFreq, haploHomoFreq, subPops, vars, suffix),
 	m_info(sumOfInfo.elems(), meanOfInfo.elems(), varOfInfo.elems(), maxOfInfo.elems(), minOfInfo.elems(), subPops, vars, suffix),
-	m_LD(LD, subPops, vars, suffix),
+	m_LD(LD, LDWindow, LDThreshold, subPops, vars, suffix),
 	m_association(association, subPops, vars, suffix),
 	m_neutrality(neutrality, subPops, vars, suffix),
 	m_structure(structure, subPops, vars, suffix),
@@ -951,6 +958,188 @@ bool statNumOfMutants::apply(Population & pop) const
 }
 
 
+#if !defined(LONGALLELE) && !defined(MUTANTALLELE)
+
+/* Count alleles of a block of individuals. counts[a * numLoci + idx] is the
+ * number of allele a at the idx-th locus, and hetero (diploid autosomes only)
+ * the number of heterozygotes carrying allele a.
+ */
+static void countAllelesOfBlock(IndIterator ind, const vectoru & loci, const ValidLoci & valid,
+                                vectoru & counts, vectoru * hetero, vectoru & numOfSex)
+{
+	size_t nLoci = loci.size();
+	size_t totNumLoci = ind.valid() ? ind->totNumLoci() : 0;
+
+#ifdef BINARYALLELE
+	counts.resize(2 * nLoci, 0);
+	// there is no need to look at zeros of binary alleles, so we go through
+	// words of genotypes and count ones only, using a map from loci to indexes
+	// of loci for each sex and homologous copy.
+	vector<vector<ssize_t> > index[2];
+	size_t begin = totNumLoci;
+	size_t end = 0;
+	bool unique = true;
+	if (hetero == NULL && nLoci > 0) {
+		begin = *std::min_element(loci.begin(), loci.end());
+		end = *std::max_element(loci.begin(), loci.end()) + 1;
+		for (size_t s = 0; s < 2; ++s) {
+			index[s].resize(valid[s].size(), vector<ssize_t>(end - begin, -1));
+			for (size_t p = 0; p < valid[s].size(); ++p) {
+				for (size_t i = 0; i < valid[s][p].size(); ++i) {
+					ssize_t & pos = index[s][p][loci[valid[s][p][i]] - begin];
+					unique = unique && pos == -1;
+					pos = valid[s][p][i];
+				}
+			}
+		}
+	}
+	if (hetero == NULL && nLoci > 0 && unique) {
+		for (; ind.valid(); ++ind) {
+			size_t s = ind->sex() - 1;
+			++numOfSex[s];
+			GenoIterator geno = ind->genoBegin();
+			for (size_t p = 0; p < index[s].size(); ++p) {
+				if (valid[s][p].empty())
+					continue;
+				const vector<ssize_t> & idx = index[s][p];
+				// bits from start to stop, relative to the word at ptr
+				size_t start = BITOFF(geno) + p * totNumLoci + begin;
+				size_t stop = start + end - begin;
+				const WORDTYPE * ptr = BITPTR(geno) + start / WORDBIT;
+				size_t base = start - start % WORDBIT;
+				WORDTYPE word = *ptr & (~WORDTYPE(0) << (start - base));
+				while (true) {
+					if (stop - base < WORDBIT)
+						word &= (WORDTYPE(1) << (stop - base)) - 1;
+					while (word != 0) {
+						ssize_t i = idx[base + lowest_bit(word) - start];
+						if (i >= 0)
+							++counts[nLoci + i];
+						word &= word - 1;
+					}
+					base += WORDBIT;
+					if (base >= stop)
+						break;
+					word = *++ptr;
+				}
+			}
+		}
+		return;
+	}
+#else
+	if (counts.empty())
+		counts.resize(2 * nLoci, 0);
+#endif
+	if (hetero != NULL)
+		hetero->resize(counts.size(), 0);
+	for (; ind.valid(); ++ind) {
+		size_t s = ind->sex() - 1;
+		++numOfSex[s];
+		GenoIterator geno = ind->genoBegin();
+		if (hetero != NULL) {
+			// both copies of each locus are examined at once
+			for (size_t idx = 0; idx < nLoci; ++idx) {
+				size_t a1 = *(geno + loci[idx]);
+				size_t a2 = *(geno + totNumLoci + loci[idx]);
+				size_t a = std::max(a1, a2);
+				if (a * nLoci >= counts.size()) {
+					counts.resize((a + 1) * nLoci, 0);
+					hetero->resize(counts.size(), 0);
+				}
+				++counts[a1 * nLoci + idx];
+				++counts[a2 * nLoci + idx];
+				if (a1 != a2) {
+					++(*hetero)[a1 * nLoci + idx];
+					++(*hetero)[a2 * nLoci + idx];
+				}
+			}
+			continue;
+		}
+		for (size_t p = 0; p < valid[s].size(); ++p) {
+			const vectoru & idxs = valid[s][p];
+			GenoIterator ptr = geno + p * totNumLoci;
+			for (size_t i = 0; i < idxs.size(); ++i) {
+				size_t a = *(ptr + loci[idxs[i]]);
+				if (a * nLoci >= counts.size())
+					counts.resize((a + 1) * nLoci, 0);
+				++counts[a * nLoci + idxs[i]];
+			}
+		}
+	}
+}
+
+
+/* Count alleles at loci of all individuals in (virtual) subpopulation subPop
+ * in one pass through their genotypes, with individuals divided among threads
+ * if multiple threads are used. Upon return, counts[a * loci.size() + idx] is
+ * the number of allele a at locus loci[idx] for all alleles a less than
+ * counts.size() / loci.size(), and totals[idx] is the number of alleles at the
+ * locus, which can be less than ploidy times number of individuals for loci
+ * on sex and mitochondrial chromosomes. If hetero is specified (for diploid
+ * populations and loci on autosomes), hetero[a * loci.size() + idx] is set to
+ * the number of heterozygotes with allele a at the locus.
+ */
+static void countAlleles(Population & pop, size_t subPop, const vectoru & loci,
+                         vectoru & counts, vectoru & totals, vectoru * hetero = NULL)
+{
+	size_t nLoci = loci.size();
+	ValidLoci valid;
+
+	getValidLoci(pop, loci, valid);
+	counts.clear();
+	if (hetero != NULL)
+		hetero->clear();
+	vectoru numOfSex(2, 0);
+	if (numThreads() > 1) {
+		vector<vectoru> threadCounts(numThreads());
+		vector<vectoru> threadHetero(numThreads());
+		vector<vectoru> threadSex(numThreads(), vectoru(2, 0));
+#pragma omp parallel
+		{
+#ifdef _OPENMP
+			size_t id = omp_get_thread_num();
+			countAllelesOfBlock(pop.indIterator(subPop, id), loci, valid, threadCounts[id],
+				hetero == NULL ? NULL : &threadHetero[id], threadSex[id]);
+#endif
+		}
+		for (size_t id = 0; id < threadCounts.size(); ++id) {
+			if (threadCounts[id].size() > counts.size())
+				counts.resize(threadCounts[id].size(), 0);
+			for (size_t i = 0; i < threadCounts[id].size(); ++i)
+				counts[i] += threadCounts[id][i];
+			if (hetero != NULL) {
+				if (threadHetero[id].size() > hetero->size())
+					hetero->resize(threadHetero[id].size(), 0);
+				for (size_t i = 0; i < threadHetero[id].size(); ++i)
+					(*hetero)[i] += threadHetero[id][i];
+			}
+			numOfSex[0] += threadSex[id][0];
+			numOfSex[1] += threadSex[id][1];
+		}
+	} else
+		countAllelesOfBlock(pop.indIterator(subPop), loci, valid, counts, hetero, numOfSex);
+	if (counts.size() < 2 * nLoci)
+		counts.resize(2 * nLoci, 0);
+	if (hetero != NULL && hetero->size() < counts.size())
+		hetero->resize(counts.size(), 0);
+
+	// number of alleles at each locus
+	totals.assign(nLoci, 0);
+	for (size_t s = 0; s < 2; ++s)
+		for (size_t p = 0; p < valid[s].size(); ++p)
+			for (size_t i = 0; i < valid[s][p].size(); ++i)
+				totals[valid[s][p][i]] += numOfSex[s];
+#ifdef BINARYALLELE
+	// only ones are counted
+	if (hetero == NULL)
+		for (size_t idx = 0; idx < nLoci; ++idx)
+			counts[idx] = totals[idx] - counts[nLoci + idx];
+#endif
+}
+
+
+#endif
+
 statAlleleFreq::statAlleleFreq(const lociList & loci, const subPopList & subPops,
 	const stringList & vars, const string & suffix)
 	: m_loci(loci), m_subPops(subPops), m_vars(), m_suffix(suffix)
@@ -977,6 +1166,22 @@ string statAlleleFreq::describe(bool /* format */) const
 }
 
 
+#if defined(LONGALLELE) || defined(MUTANTALLELE)
+/* Allele iterator used by statistics that count alleles in a subpopulation.
+ * Population::alleleIterator iterates through all homologous copies of
+ * mitochondrial loci of a subpopulation, but only the first copy is counted,
+ * as what countAlleles does for other modules.
+ */
+static IndAlleleIterator statAlleleIterator(Population & pop, size_t loc, size_t subPop)
+{
+	if (pop.chromType(pop.chromLocusPair(loc).first) == MITOCHONDRIAL)
+		return IndAlleleIterator(loc, pop.indIterator(subPop));
+	return pop.alleleIterator(loc, subPop);
+}
+
+
+#endif
+
 bool statAlleleFreq::apply(Population & pop) const
 {
 	if (m_loci.empty())
@@ -1005,7 +1210,7 @@ bool statAlleleFreq::apply(Population & pop) const
 		   be kept in both loci_alleles and alleleCnt, which is not really
 		   necessary. */
 		std::map<size_t, size_t> maxCnt;
-		bool no_sex_chromosome = pop.chromX() < 0 && pop.chromY() < 0;
+		bool no_sex_chromosome = pop.chromX() < 0 && pop.chromY() < 0 && pop.mitochondrial() < 0;
 		if (no_sex_chromosome)
 			maxCnt[0] = pop.ploidy() * pop.subPopSize(*it);
 		else {
@@ -1021,7 +1226,9 @@ bool statAlleleFreq::apply(Population & pop) const
 					for (; ind.valid(); ++ind)
 						if (ind->sex() == MALE)
 							allCnt += 1;
-				} else
+				} else if (chromType == MITOCHONDRIAL)
+					allCnt = pop.subPopSize(*it);
+				else
 					allCnt = pop.ploidy() * pop.subPopSize(*it);
 				maxCnt[ch] = allCnt;
 			}
@@ -1048,10 +1255,12 @@ bool statAlleleFreq::apply(Population & pop) const
 				if (!no_sex_chromosome) {
 					size_t p = (index_it->first - indIndex) / totNumLoci;
 					size_t chromType = pop.chromType(pop.chromLocusPair(lociValue).first);
+					// only the first copy of mitochondrial chromosomes is counted
 					if ((ind->sex() == FEMALE && chromType == CHROMOSOME_Y) ||
 					    (ind->sex() == MALE && (
 					                            (chromType == CHROMOSOME_X && p == 1) ||
-					                            (chromType == CHROMOSOME_Y && p == 0))))
+					                            (chromType == CHROMOSOME_Y && p == 0))) ||
+					    (chromType == MITOCHONDRIAL && p != 0))
 						continue;
 				}
 				// record allele
@@ -1122,51 +1331,30 @@ bool statAlleleFreq::apply(Population & pop) const
 				pop.getVars().setVar((boost::format("%1%{%2%}") % subPopVar_String(*it, AlleleFreq_String, m_suffix) % loc).str(), d);
 			}
 		}
-#else       // for mutant allele
-
-
+#elif defined(LONGALLELE)
 #  pragma omp parallel for if(numThreads() > 1)
 		for (ssize_t idx = 0; idx < static_cast<ssize_t>(loci.size()); ++idx) {
 			size_t loc = loci[idx];
-
-#  ifdef LONGALLELE
 			intDict alleles;
-#  else
-			vectoru alleles(2, 0);
-#  endif
 			size_t allAlleles = 0;
 
 			// go through all alleles
-			IndAlleleIterator a = pop.alleleIterator(loc, it->subPop());
+			IndAlleleIterator a = statAlleleIterator(pop, loc, it->subPop());
 			// use allAllelel here because some marker does not have full number
 			// of alleles (e.g. markers on chromosome X and Y).
 			for (; a.valid(); ++a) {
-				Allele v = a.value();
-#  ifndef BINARYALLELE
-#    ifndef LONGALLELE
-				if (v >= alleles.size())
-					alleles.resize(v + 1, 0);
-#    endif
-#  endif
-				alleles[v]++;
+				alleles[a.value()]++;
 				allAlleles++;
 			}
 			// total allele count
-#  ifdef LONGALLELE
 			intDict::iterator cnt = alleles.begin();
 			intDict::iterator cntEnd = alleles.end();
 			for ( ; cnt != cntEnd; ++cnt)
 				alleleCnt[idx][cnt->first] += cnt->second;
-#  else
-			for (size_t i = 0; i < alleles.size(); ++i)
-				if (alleles[i] != 0)
-					alleleCnt[idx][i] += alleles[i];
-#  endif
 			allAllelesCnt[idx] += allAlleles;
 			// output variable.
-#  ifdef LONGALLELE
 			if (m_vars.contains(AlleleNum_sp_String)) {
-#    pragma omp critical
+#  pragma omp critical
 				pop.getVars().setVar((boost::format("%1%{%2%}") % subPopVar_String(*it, AlleleNum_String, m_suffix) % loc).str(), alleles);
 			}
 			if (m_vars.contains(AlleleFreq_sp_String)) {
@@ -1174,27 +1362,39 @@ bool statAlleleFreq::apply(Population & pop) const
 				intDict::iterator cntEnd = alleles.end();
 				for ( ; cnt != cntEnd; ++cnt)
 					cnt->second /= static_cast<double>(allAlleles);
-#    pragma omp critical
+#  pragma omp critical
 				pop.getVars().setVar((boost::format("%1%{%2%}") % subPopVar_String(*it, AlleleFreq_String, m_suffix) % loc).str(), alleles);
 			}
-#  else
+		}
+#else
+		// use tracked allele counts, or count alleles at all loci in one pass
+		vectoru counts;
+		vectoru totals;
+		if (it->isVirtual() || !pop.trackedAlleleCounts(it->subPop(), loci, counts, totals))
+			countAlleles(pop, it->subPop(), loci, counts, totals);
+		size_t nLoci = loci.size();
+		size_t nAlleles = nLoci == 0 ? 0 : counts.size() / nLoci;
+		for (size_t idx = 0; idx < nLoci; ++idx) {
+			size_t loc = loci[idx];
+			for (size_t a = 0; a < nAlleles; ++a)
+				if (counts[a * nLoci + idx] != 0)
+					alleleCnt[idx][a] += counts[a * nLoci + idx];
+			allAllelesCnt[idx] += totals[idx];
+			// output variable.
 			if (m_vars.contains(AlleleNum_sp_String)) {
 				uintDict d;
-				for (size_t i = 0; i < alleles.size(); ++i)
-					if (alleles[i] != 0)
-						d[i] = static_cast<double>(alleles[i]);
-#    pragma omp critical
+				for (size_t a = 0; a < nAlleles; ++a)
+					if (counts[a * nLoci + idx] != 0)
+						d[a] = static_cast<double>(counts[a * nLoci + idx]);
 				pop.getVars().setVar((boost::format("%1%{%2%}") % subPopVar_String(*it, AlleleNum_String, m_suffix) % loc).str(), d);
 			}
 			if (m_vars.contains(AlleleFreq_sp_String)) {
 				uintDict d;
-				for (size_t i = 0; i < alleles.size(); ++i)
-					if (alleles[i] != 0)
-						d[i] = alleles[i] / static_cast<double>(allAlleles);
-#    pragma omp critical
+				for (size_t a = 0; a < nAlleles; ++a)
+					if (counts[a * nLoci + idx] != 0)
+						d[a] = counts[a * nLoci + idx] / static_cast<double>(totals[idx]);
 				pop.getVars().setVar((boost::format("%1%{%2%}") % subPopVar_String(*it, AlleleFreq_String, m_suffix) % loc).str(), d);
 			}
-#  endif
 		}
 #endif      // for mutant allele type
 		pop.deactivateVirtualSubPop(it->subPop());
@@ -1560,6 +1760,118 @@ bool statGenoFreq::apply(Population & pop) const
 }
 
 
+HaplotypeCounter::HaplotypeCounter(const vectori & loci)
+	: m_loci(loci), m_bits(0), m_allelesPerWord(0), m_words(0), m_keys(), m_counts(),
+	m_size(0), m_total(0), m_key()
+{
+	while (m_bits < 64 && (ModuleMaxAllele >> m_bits) != 0)
+		++m_bits;
+	m_allelesPerWord = 64 / m_bits;
+	m_words = std::max(static_cast<size_t>(1), (m_loci.size() + m_allelesPerWord - 1) / m_allelesPerWord);
+	m_key.resize(m_words);
+}
+
+
+size_t HaplotypeCounter::hash(const uint64_t * key) const
+{
+	uint64_t h = 0x9E3779B97F4A7C15ULL;
+
+	for (size_t w = 0; w < m_words; ++w) {
+		h ^= key[w];
+		h *= 0xFF51AFD7ED558CCDULL;
+		h ^= h >> 33;
+	}
+	return static_cast<size_t>(h);
+}
+
+
+void HaplotypeCounter::resize(size_t slots)
+{
+	vector<uint64_t> keys(slots * m_words, 0);
+	vectoru counts(slots, 0);
+
+	m_keys.swap(keys);
+	m_counts.swap(counts);
+	m_size = 0;
+	m_total = 0;
+	// re-insert existing haplotypes
+	for (size_t slot = 0; slot < counts.size(); ++slot)
+		if (counts[slot] != 0)
+			insert(&keys[slot * m_words], counts[slot]);
+}
+
+
+void HaplotypeCounter::insert(const uint64_t * key, size_t count)
+{
+	// keep the table at most half full so that probes are short
+	if (2 * (m_size + 1) > m_counts.size())
+		resize(std::max(static_cast<size_t>(16), 2 * m_counts.size()));
+
+	size_t mask = m_counts.size() - 1;
+	size_t slot = hash(key) & mask;
+	while (m_counts[slot] != 0) {
+		if (std::equal(key, key + m_words, m_keys.begin() + slot * m_words)) {
+			m_counts[slot] += count;
+			m_total += count;
+			return;
+		}
+		slot = (slot + 1) & mask;
+	}
+	std::copy(key, key + m_words, m_keys.begin() + slot * m_words);
+	m_counts[slot] = count;
+	++m_size;
+	m_total += count;
+}
+
+
+void HaplotypeCounter::add(GenoIterator geno)
+{
+	std::fill(m_key.begin(), m_key.end(), 0);
+	for (size_t i = 0; i < m_loci.size(); ++i)
+		m_key[i / m_allelesPerWord] |= static_cast<uint64_t>(DEREF_ALLELE(geno + m_loci[i]))
+		                               << ((i % m_allelesPerWord) * m_bits);
+	insert(&m_key[0], 1);
+}
+
+
+void HaplotypeCounter::merge(const HaplotypeCounter & rhs)
+{
+	DBG_FAILIF(rhs.m_loci != m_loci, SystemError, "Cannot merge haplotypes at different loci.");
+	for (size_t slot = 0; slot < rhs.m_counts.size(); ++slot)
+		if (rhs.m_counts[slot] != 0)
+			insert(&rhs.m_keys[slot * m_words], rhs.m_counts[slot]);
+}
+
+
+void HaplotypeCounter::getCounts(vector<vectori> & haplotypes, vectoru & counts) const
+{
+	haplotypes.clear();
+	counts.clear();
+	uint64_t mask = m_bits == 64 ? ~uint64_t(0) : (uint64_t(1) << m_bits) - 1;
+	for (size_t slot = 0; slot < m_counts.size(); ++slot) {
+		if (m_counts[slot] == 0)
+			continue;
+		const uint64_t * key = &m_keys[slot * m_words];
+		vectori haplotype(m_loci.size());
+		for (size_t i = 0; i < m_loci.size(); ++i)
+			haplotype[i] = static_cast<long>((key[i / m_allelesPerWord] >> ((i % m_allelesPerWord) * m_bits)) & mask);
+		haplotypes.push_back(haplotype);
+		counts.push_back(m_counts[slot]);
+	}
+}
+
+
+void HaplotypeCounter::addTo(tupleDict & dict) const
+{
+	vector<vectori> haplotypes;
+	vectoru counts;
+
+	getCounts(haplotypes, counts);
+	for (size_t i = 0; i < haplotypes.size(); ++i)
+		dict[haplotypes[i]] += counts[i];
+}
+
+
 statHaploFreq::statHaploFreq(const intMatrix & haploFreq, const subPopList & subPops,
 	const stringList & vars, const string & suffix)
 	: m_loci(haploFreq.elems()), m_subPops(subPops), m_vars(), m_suffix(suffix)
@@ -1609,13 +1921,15 @@ bool statHaploFreq::apply(Population & pop) const
 	DBG_DO(DBG_STATOR, cerr << "Calculated haplotype frequency for loci " << m_loci << endl);
 
 	// count for all specified subpopulations
-	vector<tupleDict> haplotypeCnt(m_loci.size());
-	vectoru allHaplotypeCnt(m_loci.size());
+	vector<HaplotypeCounter> haplotypeCnt;
+	for (size_t idx = 0; idx < m_loci.size(); ++idx)
+		haplotypeCnt.push_back(HaplotypeCounter(m_loci[idx]));
 	// selected (virtual) subpopulatons.
 	subPopList subPops = m_subPops.expandFrom(pop);
 	subPopList::const_iterator it = subPops.begin();
 	subPopList::const_iterator itEnd = subPops.end();
 	size_t ply = pop.ploidy();
+	bool haplodiploid = pop.isHaplodiploid();
 	for (; it != itEnd; ++it) {
 		if (m_vars.contains(HaplotypeNum_sp_String))
 			pop.getVars().removeVar(subPopVar_String(*it, HaplotypeNum_String, m_suffix));
@@ -1624,8 +1938,7 @@ bool statHaploFreq::apply(Population & pop) const
 
 		pop.activateVirtualSubPop(*it);
 
-#pragma omp parallel for if(numThreads() > 1)
-		for (ssize_t idx = 0; idx < static_cast<ssize_t>(m_loci.size()); ++idx) {
+		for (size_t idx = 0; idx < m_loci.size(); ++idx) {
 			const vectori & loci = m_loci[idx];
 			size_t nLoci = loci.size();
 			if (nLoci == 0)
@@ -1640,52 +1953,55 @@ bool statHaploFreq::apply(Population & pop) const
 #endif
 			string key = dictKey(loci);
 
-			tupleDict haplotypes;
-			size_t allHaplotypes = 0;
-
-			// go through all individual
-			IndIterator ind = pop.indIterator(it->subPop());
-			for (; ind.valid(); ++ind) {
-				vectori haplotype(loci.size());
-				for (size_t p = 0; p < ply; ++p) {
-					if (p == 1 && ind->sex() == MALE && pop.isHaplodiploid())
-						continue;
-					if (chromType == CHROMOSOME_Y && ind->sex() == FEMALE)
-						continue;
-					if (((chromType == CHROMOSOME_X && p == 1) ||
-					     (chromType == CHROMOSOME_Y && p == 0)) && ind->sex() == MALE)
-						continue;
-					if (chromType == MITOCHONDRIAL && p > 0)
-						continue;
-					for (size_t idx = 0; idx < nLoci; ++idx)
-						haplotype[idx] = ind->allele(loci[idx], p);
-					haplotypes[haplotype]++;
-					allHaplotypes++;
+			// each thread counts haplotypes of a block of individuals
+			vector<HaplotypeCounter> haplotypes(numThreads(), HaplotypeCounter(loci));
+#pragma omp parallel if(numThreads() > 1)
+			{
+#ifdef _OPENMP
+				HaplotypeCounter & counter = haplotypes[omp_get_thread_num()];
+				IndIterator ind = pop.indIterator(it->subPop(), omp_get_thread_num());
+#else
+				HaplotypeCounter & counter = haplotypes[0];
+				IndIterator ind = pop.indIterator(it->subPop());
+#endif
+				for (; ind.valid(); ++ind) {
+					for (size_t p = 0; p < ply; ++p) {
+						if (p == 1 && ind->sex() == MALE && haplodiploid)
+							continue;
+						if (chromType == CHROMOSOME_Y && ind->sex() == FEMALE)
+							continue;
+						if (((chromType == CHROMOSOME_X && p == 1) ||
+						     (chromType == CHROMOSOME_Y && p == 0)) && ind->sex() == MALE)
+							continue;
+						if (chromType == MITOCHONDRIAL && p > 0)
+							continue;
+						counter.add(ind->genoBegin(p));
+					}
 				}
 			}
+			for (size_t i = 1; i < haplotypes.size(); ++i)
+				haplotypes[0].merge(haplotypes[i]);
 			// total haplotype count
-			tupleDict::iterator dct = haplotypes.begin();
-			tupleDict::iterator dctEnd = haplotypes.end();
-			for (; dct != dctEnd; ++dct)
-				haplotypeCnt[idx][dct->first] += dct->second;
-			allHaplotypeCnt[idx] += allHaplotypes;
+			haplotypeCnt[idx].merge(haplotypes[0]);
 			// output variable.
-			if (m_vars.contains(HaplotypeNum_sp_String)) {
-#pragma omp critical
+			if (!m_vars.contains(HaplotypeNum_sp_String) && !m_vars.contains(HaplotypeFreq_sp_String))
+				continue;
+			tupleDict haploNum;
+			haplotypes[0].addTo(haploNum);
+			if (m_vars.contains(HaplotypeNum_sp_String))
 				pop.getVars().setVar(subPopVar_String(*it, HaplotypeNum_String, m_suffix) + "{"
-					+ key + "}", haplotypes);
-			}
-			// note that genotyeps is changed in place.
+					+ key + "}", haploNum);
+			// note that haploNum is changed in place.
 			if (m_vars.contains(HaplotypeFreq_sp_String)) {
+				size_t allHaplotypes = haplotypes[0].total();
 				if (allHaplotypes != 0) {
-					tupleDict::iterator dct = haplotypes.begin();
-					tupleDict::iterator dctEnd = haplotypes.end();
+					tupleDict::iterator dct = haploNum.begin();
+					tupleDict::iterator dctEnd = haploNum.end();
 					for (; dct != dctEnd; ++dct)
 						dct->second /= allHaplotypes;
 				}
-#pragma omp critical
 				pop.getVars().setVar(subPopVar_String(*it, HaplotypeFreq_String, m_suffix) + "{"
-					+ key + "}", haplotypes);
+					+ key + "}", haploNum);
 			}
 		}
 		pop.deactivateVirtualSubPop(it->subPop());
@@ -1695,23 +2011,27 @@ bool statHaploFreq::apply(Population & pop) const
 		pop.getVars().removeVar(HaplotypeNum_String + m_suffix);
 		for (size_t idx = 0; idx < m_loci.size(); ++idx) {
 			string key = dictKey(m_loci[idx]);
+			tupleDict haploNum;
+			haplotypeCnt[idx].addTo(haploNum);
 			pop.getVars().setVar(string(HaplotypeNum_String) + m_suffix + "{" + key + "}",
-				haplotypeCnt[idx]);
+				haploNum);
 		}
 	}
-	// note that genotyeCnt[idx] is changed in place.
 	if (m_vars.contains(HaplotypeFreq_String)) {
 		pop.getVars().removeVar(HaplotypeFreq_String + m_suffix);
 		for (size_t idx = 0; idx < m_loci.size(); ++idx) {
 			string key = dictKey(m_loci[idx]);
-			if (allHaplotypeCnt[idx] != 0) {
-				tupleDict::iterator dct = haplotypeCnt[idx].begin();
-				tupleDict::iterator dctEnd = haplotypeCnt[idx].end();
+			tupleDict haploFreq;
+			haplotypeCnt[idx].addTo(haploFreq);
+			size_t allHaplotypes = haplotypeCnt[idx].total();
+			if (allHaplotypes != 0) {
+				tupleDict::iterator dct = haploFreq.begin();
+				tupleDict::iterator dctEnd = haploFreq.end();
 				for (; dct != dctEnd; ++dct)
-					dct->second /= allHaplotypeCnt[idx];
+					dct->second /= allHaplotypes;
 			}
 			pop.getVars().setVar(string(HaplotypeFreq_String) + m_suffix + "{" + key + "}",
-				haplotypeCnt[idx]);
+				haploFreq);
 		}
 	}
 	return true;
@@ -1786,8 +2106,7 @@ bool statHaploHomoFreq::apply(Population & pop) const
 		tupleDict heteroCnt;
 		tupleDict homoCnt;
 
-#pragma omp parallel for if(numThreads() > 1)
-		for (ssize_t idx = 0; idx < static_cast<ssize_t>(m_loci.size()); ++idx) {
+		for (size_t idx = 0; idx < m_loci.size(); ++idx) {
 			const vectori & loci = m_loci[idx];
 			size_t nLoci = loci.size();
 			if (nLoci == 0)
@@ -1806,29 +2125,35 @@ bool statHaploHomoFreq::apply(Population & pop) const
 #endif
 			size_t hetero = 0;
 			size_t homo = 0;
-			// go through all individual
-			IndIterator ind = pop.indIterator(it->subPop());
-			for (; ind.valid(); ++ind) {
-				// FIXME: does not consider sex chromosomes
-				bool h = false;
-				for (size_t idx = 0; idx < nLoci; ++idx)
-					if (ind->allele(loci[idx], 0) != ind->allele(loci[idx], 1)) {
-						h = true;
-						break;
-					}
-				if (h)
-					++hetero;
-				else
-					++homo;
-			}
-#pragma omp critical
+			// each thread goes through a block of individuals
+#pragma omp parallel reduction(+ : hetero, homo) if(numThreads() > 1)
 			{
-				heteroCnt[loci] = static_cast<double>(hetero);
-				homoCnt[loci] = static_cast<double>(homo);
-
-				allHeteroCnt[loci] += hetero;
-				allHomoCnt[loci] += homo;
+#ifdef _OPENMP
+				IndIterator ind = pop.indIterator(it->subPop(), omp_get_thread_num());
+#else
+				IndIterator ind = pop.indIterator(it->subPop());
+#endif
+				for (; ind.valid(); ++ind) {
+					// FIXME: does not consider sex chromosomes
+					GenoIterator geno0 = ind->genoBegin(0);
+					GenoIterator geno1 = ind->genoBegin(1);
+					bool h = false;
+					for (size_t i = 0; i < nLoci; ++i)
+						if (DEREF_ALLELE(geno0 + loci[i]) != DEREF_ALLELE(geno1 + loci[i])) {
+							h = true;
+							break;
+						}
+					if (h)
+						++hetero;
+					else
+						++homo;
+				}
 			}
+			heteroCnt[loci] = static_cast<double>(hetero);
+			homoCnt[loci] = static_cast<double>(homo);
+
+			allHeteroCnt[loci] += hetero;
+			allHomoCnt[loci] += homo;
 		}
 		pop.deactivateVirtualSubPop(it->subPop());
 		// output subpopulation variable?
@@ -2170,9 +2495,10 @@ bool statInfo::apply(Population & pop) const
 }
 
 
-statLD::statLD(const intMatrix & LD,  const subPopList & subPops,
-	const stringList & vars, const string & suffix)
-	: m_LD(LD.elems()), m_subPops(subPops), m_vars(), m_suffix(suffix)
+statLD::statLD(const intMatrix & LD, double window, double threshold,
+	const subPopList & subPops, const stringList & vars, const string & suffix)
+	: m_LD(LD.elems()), m_window(window), m_threshold(threshold),
+	m_subPops(subPops), m_vars(), m_suffix(suffix)
 {
 	const char * allowedVars[] = {
 		LD_String,		 LD_prime_String,		R2_String,
@@ -2185,6 +2511,23 @@ statLD::statLD(const intMatrix & LD,  const subPopList & subPops,
 
 	m_vars.obtainFrom(vars, allowedVars, defaultVars);
 
+	if (m_window < 0)
+		throw ValueError("Parameter LDWindow should be non-negative.");
+	if (m_threshold < 0 || m_threshold > 1)
+		throw ValueError("Parameter LDThreshold should be between 0 and 1.");
+
+	if (m_window > 0) {
+		const char * assoVars[] = {
+			ChiSq_String,	 ChiSq_p_String,	CramerV_String,
+			ChiSq_sp_String, ChiSq_p_sp_String, CramerV_sp_String,
+			""
+		};
+		for (size_t i = 0; assoVars[i][0]; ++i)
+			if (m_vars.contains(assoVars[i]))
+				throw ValueError((boost::format("Statistic %1% is not available for LD of pairs of loci within a window.")
+					                  % assoVars[i]).str());
+		return;
+	}
 	for (size_t i = 0; i < m_LD.size(); ++i) {
 		DBG_FAILIF(m_LD[i].size() != 2 && m_LD[i].size() != 4, ValueError,
 			"Parameter LD should be a list of loci pairs with optional primary alleles.");
@@ -2196,8 +2539,11 @@ string statLD::describe(bool /* format */) const
 {
 	string desc;
 
-	if (!m_LD.empty())
+	if (!m_LD.empty()) {
 		desc += "calculate Linkage disequilibrium";
+		if (m_window > 0)
+			desc += (boost::format(" between loci within %1%") % m_window).str();
+	}
 	return desc;
 }
 
@@ -2429,6 +2775,9 @@ bool statLD::apply(Population & pop) const
 	if (m_LD.empty())
 		return true;
 
+	if (m_window > 0)
+		return applyWindowed(pop);
+
 	size_t nLD = m_LD.size();
 	// determine involved LD.
 	vectoru loci;
@@ -2472,7 +2821,9 @@ bool statLD::apply(Population & pop) const
 		pop.activateVirtualSubPop(*it);
 
 		ALLELECNTLIST alleleCnt(loci.size());
-		HAPLOCNTLIST haploCnt(m_LD.size());
+		vector<HaplotypeCounter> haploCounter;
+		for (size_t idx = 0; idx < nLD; ++idx)
+			haploCounter.push_back(HaplotypeCounter(vectori(m_LD[idx].begin(), m_LD[idx].begin() + 2)));
 
 		// count allele and genotype
 		IndIterator ind = pop.indIterator(it->subPop());
@@ -2502,11 +2853,19 @@ bool statLD::apply(Population & pop) const
 						continue;
 					if (chromType == MITOCHONDRIAL && p > 0)
 						continue;
-					haploCnt[idx][HAPLOCNT::key_type(DEREF_ALLELE(geno + m_LD[idx][0]), DEREF_ALLELE(geno + m_LD[idx][1]))]++;
+					haploCounter[idx].add(geno);
 				}
 			}
 		}
 		pop.deactivateVirtualSubPop(it->subPop());
+		HAPLOCNTLIST haploCnt(m_LD.size());
+		for (size_t idx = 0; idx < nLD; ++idx) {
+			vector<vectori> haplotypes;
+			vectoru counts;
+			haploCounter[idx].getCounts(haplotypes, counts);
+			for (size_t i = 0; i < haplotypes.size(); ++i)
+				haploCnt[idx][HAPLOCNT::key_type(haplotypes[i][0], haplotypes[i][1])] = counts[i];
+		}
 		// add to all count
 		for (size_t idx = 0; idx < nLoci; ++idx) {
 			ALLELECNT::iterator cnt = alleleCnt[idx].begin();
@@ -2585,6 +2944,307 @@ bool statLD::apply(Population & pop) const
 }
 
 
+// number of set bits in a 64-bit word
+inline size_t bitCount(uint64_t word)
+{
+#if defined(__GNUC__)
+	return static_cast<size_t>(__builtin_popcountll(word));
+#else
+	word = word - ((word >> 1) & 0x5555555555555555ULL);
+	word = (word & 0x3333333333333333ULL) + ((word >> 2) & 0x3333333333333333ULL);
+	word = (word + (word >> 4)) & 0x0F0F0F0F0F0F0F0FULL;
+	return static_cast<size_t>((word * 0x0101010101010101ULL) >> 56);
+#endif
+}
+
+
+// D, D' and r2 of primary alleles A and B, calculated from the number of
+// AB haplotypes, A and B alleles among n haplotypes
+void diallelicLD(size_t nAB, size_t nA, size_t nB, size_t n,
+                 double & D, double & Dp, double & r2)
+{
+	double P_AB = static_cast<double>(nAB) / n;
+	double P_A = static_cast<double>(nA) / n;
+	double P_B = static_cast<double>(nB) / n;
+
+	D = P_AB - P_A * P_B;
+	double D_max = D > 0 ? std::min(P_A * (1 - P_B), (1 - P_A) * P_B) : std::min(P_A * P_B, (1 - P_A) * (1 - P_B));
+	Dp = fcmp_eq(D_max, 0.) ? 0. : D / D_max;
+	Dp = std::min(std::max(Dp, -1.0), 1.0);
+	r2 = (nA == 0 || nB == 0 || nA == n || nB == n) ? 0. : D * D / P_A / (1 - P_A) / P_B / (1 - P_B);
+}
+
+
+void statLD::outputPairs(Population & pop, const vspID & sp, const LDPairs & pairs) const
+{
+	if (sp.valid()) {
+		pop.getVars().setVar(subPopVar_String(sp, LD_row_String, m_suffix), SizeT_Vec_As_PyArray(pairs.row));
+		pop.getVars().setVar(subPopVar_String(sp, LD_col_String, m_suffix), SizeT_Vec_As_PyArray(pairs.col));
+		if (m_vars.contains(LD_sp_String))
+			pop.getVars().setVar(subPopVar_String(sp, LD_String, m_suffix), Double_Vec_As_PyArray(pairs.D));
+		if (m_vars.contains(LD_prime_sp_String))
+			pop.getVars().setVar(subPopVar_String(sp, LD_prime_String, m_suffix), Double_Vec_As_PyArray(pairs.D_prime));
+		if (m_vars.contains(R2_sp_String))
+			pop.getVars().setVar(subPopVar_String(sp, R2_String, m_suffix), Double_Vec_As_PyArray(pairs.R2));
+	} else {
+		pop.getVars().setVar(LD_row_String + m_suffix, SizeT_Vec_As_PyArray(pairs.row));
+		pop.getVars().setVar(LD_col_String + m_suffix, SizeT_Vec_As_PyArray(pairs.col));
+		if (m_vars.contains(LD_String))
+			pop.getVars().setVar(LD_String + m_suffix, Double_Vec_As_PyArray(pairs.D));
+		if (m_vars.contains(LD_prime_String))
+			pop.getVars().setVar(LD_prime_String + m_suffix, Double_Vec_As_PyArray(pairs.D_prime));
+		if (m_vars.contains(R2_String))
+			pop.getVars().setVar(R2_String + m_suffix, Double_Vec_As_PyArray(pairs.R2));
+	}
+}
+
+
+bool statLD::applyWindowed(Population & pop) const
+{
+	// all loci in parameter LD, sorted so that loci in a window are adjacent
+	vectoru loci;
+	for (size_t i = 0; i < m_LD.size(); ++i) {
+		for (size_t j = 0; j < m_LD[i].size(); ++j) {
+			if (m_LD[i][j] < 0 || static_cast<size_t>(m_LD[i][j]) >= pop.totNumLoci())
+				throw IndexError((boost::format("Locus index %1% out of range.") % m_LD[i][j]).str());
+			loci.push_back(m_LD[i][j]);
+		}
+	}
+	std::sort(loci.begin(), loci.end());
+	loci.erase(std::unique(loci.begin(), loci.end()), loci.end());
+	size_t nLoci = loci.size();
+	if (nLoci == 0)
+		return true;
+
+	vectoru chroms(nLoci);
+	vectorf pos(nLoci);
+	// chromosome types are saved as offsets to CUSTOMIZED
+	vectoru types(nLoci);
+	vector<bool> usedTypes(MITOCHONDRIAL - CUSTOMIZED + 1, false);
+	for (size_t i = 0; i < nLoci; ++i) {
+		chroms[i] = pop.chromLocusPair(loci[i]).first;
+		pos[i] = pop.locusPos(loci[i]);
+		types[i] = pop.chromType(chroms[i]) - CUSTOMIZED;
+		usedTypes[types[i]] = true;
+	}
+	size_t nTypes = usedTypes.size();
+
+	subPopList subPops = m_subPops.expandFrom(pop);
+	size_t nSP = subPops.size();
+	size_t ply = pop.ploidy();
+	bool haplodiploid = pop.isHaplodiploid();
+
+	// Haplotypes that carry each type of chromosomes, ordered by (virtual)
+	// subpopulation. The haplotypes of each subpopulation start at a new
+	// word of the bit-packed alleles so that they can be counted separately.
+	vector<vector<GenoIterator> > haplos(nTypes);
+	vector<vectoru> hapStart(nTypes, vectoru(nSP + 1, 0));
+	vector<vectoru> wordStart(nTypes, vectoru(nSP + 1, 0));
+	for (size_t sp = 0; sp < nSP; ++sp) {
+		pop.activateVirtualSubPop(subPops[sp]);
+		IndIterator ind = pop.indIterator(subPops[sp].subPop());
+		for (; ind.valid(); ++ind) {
+			bool male = ind->sex() == MALE;
+			for (size_t p = 0; p < ply; ++p) {
+				if (ply == 2 && p == 1 && male && haplodiploid)
+					continue;
+				for (size_t t = 0; t < nTypes; ++t) {
+					if (!usedTypes[t])
+						continue;
+					size_t chromType = t + CUSTOMIZED;
+					if (chromType == CHROMOSOME_Y && !male)
+						continue;
+					if (((chromType == CHROMOSOME_X && p == 1) ||
+					     (chromType == CHROMOSOME_Y && p == 0)) && male)
+						continue;
+					if (chromType == MITOCHONDRIAL && p > 0)
+						continue;
+					haplos[t].push_back(ind->genoBegin(p));
+				}
+			}
+		}
+		pop.deactivateVirtualSubPop(subPops[sp].subPop());
+		for (size_t t = 0; t < nTypes; ++t) {
+			hapStart[t][sp + 1] = haplos[t].size();
+			wordStart[t][sp + 1] = wordStart[t][sp] + (hapStart[t][sp + 1] - hapStart[t][sp] + 63) / 64;
+		}
+	}
+
+	// Pack alleles of each locus into bits, with the most common allele as
+	// the primary allele, and count primary alleles in each subpopulation.
+	// Loci are processed in tiles of adjacent loci on chromosomes of the same
+	// type so that alleles of each haplotype are read sequentially.
+	vectoru tiles(1, 0);
+	for (size_t i = 1; i < nLoci; ++i)
+		if (types[i] != types[tiles.back()] || i - tiles.back() == 64)
+			tiles.push_back(i);
+	tiles.push_back(nLoci);
+
+	vector<vector<uint64_t> > bits(nLoci);
+	vector<vectoru> primaryCnt(nLoci, vectoru(nSP, 0));
+#pragma omp parallel for schedule(dynamic) if(numThreads() > 1)
+	for (int tile = 0; tile < static_cast<int>(tiles.size()) - 1; ++tile) {
+		size_t first = tiles[tile];
+		size_t last = tiles[tile + 1];
+		const vector<GenoIterator> & haps = haplos[types[first]];
+		const vectoru & hs = hapStart[types[first]];
+		const vectoru & ws = wordStart[types[first]];
+
+		// Alleles are first packed against the allele of the first haplotype,
+		// and are flipped if the other allele of a diallelic locus is more
+		// common. Multi-allelic loci are counted and packed again.
+		size_t nTile = last - first;
+		vectoru primary(nTile, 0);
+		vectoru other(nTile, 0);
+		vector<bool> hasOther(nTile, false);
+		vector<bool> multiAllelic(nTile, false);
+		for (size_t i = first; i < last; ++i) {
+			if (!haps.empty())
+				primary[i - first] = static_cast<size_t>(DEREF_ALLELE(haps[0] + loci[i]));
+			bits[i].resize(ws[nSP], 0);
+		}
+		vector<uint64_t *> tileBits(nTile, NULL);
+		for (size_t k = 0; k < nTile && ws[nSP] > 0; ++k)
+			tileBits[k] = &bits[first + k][0];
+		for (size_t sp = 0; sp < nSP; ++sp) {
+			for (size_t h = hs[sp]; h < hs[sp + 1]; ++h) {
+				size_t word = ws[sp] + (h - hs[sp]) / 64;
+				uint64_t mask = uint64_t(1) << ((h - hs[sp]) % 64);
+				GenoIterator geno = haps[h];
+				for (size_t k = 0; k < nTile; ++k) {
+					size_t allele = static_cast<size_t>(DEREF_ALLELE(geno + loci[first + k]));
+					if (allele == primary[k])
+						tileBits[k][word] |= mask;
+					else if (!hasOther[k]) {
+						hasOther[k] = true;
+						other[k] = allele;
+					} else if (allele != other[k])
+						multiAllelic[k] = true;
+				}
+			}
+			for (size_t i = first; i < last; ++i)
+				for (size_t w = ws[sp]; w < ws[sp + 1]; ++w)
+					primaryCnt[i][sp] += bitCount(bits[i][w]);
+		}
+
+		for (size_t i = first; i < last; ++i) {
+			size_t k = i - first;
+			if (multiAllelic[k]) {
+				map<size_t, size_t> alleleCnt;
+				for (size_t h = 0; h < haps.size(); ++h)
+					++alleleCnt[static_cast<size_t>(DEREF_ALLELE(haps[h] + loci[i]))];
+				size_t maxCnt = 0;
+				map<size_t, size_t>::const_iterator cnt = alleleCnt.begin();
+				for (; cnt != alleleCnt.end(); ++cnt) {
+					if (cnt->second > maxCnt) {
+						primary[k] = cnt->first;
+						maxCnt = cnt->second;
+					}
+				}
+				std::fill(bits[i].begin(), bits[i].end(), 0);
+				for (size_t sp = 0; sp < nSP; ++sp) {
+					primaryCnt[i][sp] = 0;
+					for (size_t h = hs[sp]; h < hs[sp + 1]; ++h) {
+						if (static_cast<size_t>(DEREF_ALLELE(haps[h] + loci[i])) == primary[k]) {
+							bits[i][ws[sp] + (h - hs[sp]) / 64] |= uint64_t(1) << ((h - hs[sp]) % 64);
+							++primaryCnt[i][sp];
+						}
+					}
+				}
+			} else if (hasOther[k]) {
+				size_t cnt = accumulate(primaryCnt[i].begin(), primaryCnt[i].end(), size_t(0));
+				if (2 * cnt >= haps.size())
+					continue;
+				for (size_t sp = 0; sp < nSP; ++sp) {
+					size_t nHaps = hs[sp + 1] - hs[sp];
+					for (size_t w = ws[sp]; w < ws[sp + 1]; ++w)
+						bits[i][w] = ~bits[i][w];
+					// clear padding bits
+					if (nHaps % 64 != 0)
+						bits[i][ws[sp + 1] - 1] &= (uint64_t(1) << (nHaps % 64)) - 1;
+					primaryCnt[i][sp] = nHaps - primaryCnt[i][sp];
+				}
+			}
+		}
+	}
+
+	bool allSP = m_vars.contains(LD_String) || m_vars.contains(LD_prime_String) || m_vars.contains(R2_String);
+	bool eachSP = m_vars.contains(LD_sp_String) || m_vars.contains(LD_prime_sp_String) || m_vars.contains(R2_sp_String);
+
+	// Pairs are calculated in blocks of loci. Results of each (virtual)
+	// subpopulation, and of all of them (index nSP), are merged by block so
+	// that pairs are ordered by loci regardless of number of threads.
+	size_t nBlocks = std::min(nLoci, static_cast<size_t>(numThreads()) * 4);
+	vector<vector<LDPairs> > blockPairs(nBlocks, vector<LDPairs>(nSP + 1));
+#pragma omp parallel for schedule(dynamic) if(numThreads() > 1)
+	for (int b = 0; b < static_cast<int>(nBlocks); ++b) {
+		vector<LDPairs> & res = blockPairs[b];
+		vectoru nAB(nSP);
+		double D = 0;
+		double Dp = 0;
+		double r2 = 0;
+		for (size_t i = b * nLoci / nBlocks; i < (b + 1) * nLoci / nBlocks; ++i) {
+			const vectoru & hs = hapStart[types[i]];
+			const vectoru & ws = wordStart[types[i]];
+			const uint64_t * bits1 = bits[i].empty() ? NULL : &bits[i][0];
+			for (size_t j = i + 1; j < nLoci && chroms[j] == chroms[i] && pos[j] - pos[i] <= m_window; ++j) {
+				const uint64_t * bits2 = bits[j].empty() ? NULL : &bits[j][0];
+				size_t allAB = 0;
+				size_t allA = 0;
+				size_t allB = 0;
+				for (size_t sp = 0; sp < nSP; ++sp) {
+					size_t cnt = 0;
+					for (size_t w = ws[sp]; w < ws[sp + 1]; ++w)
+						cnt += bitCount(bits1[w] & bits2[w]);
+					nAB[sp] = cnt;
+					allAB += cnt;
+					allA += primaryCnt[i][sp];
+					allB += primaryCnt[j][sp];
+				}
+				for (size_t sp = 0; eachSP && sp < nSP; ++sp) {
+					if (hs[sp + 1] == hs[sp])
+						continue;
+					diallelicLD(nAB[sp], primaryCnt[i][sp], primaryCnt[j][sp], hs[sp + 1] - hs[sp], D, Dp, r2);
+					if (r2 < m_threshold)
+						continue;
+					res[sp].row.push_back(loci[i]);
+					res[sp].col.push_back(loci[j]);
+					res[sp].D.push_back(D);
+					res[sp].D_prime.push_back(Dp);
+					res[sp].R2.push_back(r2);
+				}
+				if (!allSP || hs[nSP] == 0)
+					continue;
+				diallelicLD(allAB, allA, allB, hs[nSP], D, Dp, r2);
+				if (r2 < m_threshold)
+					continue;
+				res[nSP].row.push_back(loci[i]);
+				res[nSP].col.push_back(loci[j]);
+				res[nSP].D.push_back(D);
+				res[nSP].D_prime.push_back(Dp);
+				res[nSP].R2.push_back(r2);
+			}
+		}
+	}
+
+	for (size_t sp = 0; sp <= nSP; ++sp) {
+		if ((sp == nSP && !allSP) || (sp < nSP && !eachSP))
+			continue;
+		LDPairs pairs;
+		for (size_t b = 0; b < nBlocks; ++b) {
+			const LDPairs & res = blockPairs[b][sp];
+			pairs.row.insert(pairs.row.end(), res.row.begin(), res.row.end());
+			pairs.col.insert(pairs.col.end(), res.col.begin(), res.col.end());
+			pairs.D.insert(pairs.D.end(), res.D.begin(), res.D.end());
+			pairs.D_prime.insert(pairs.D_prime.end(), res.D_prime.begin(), res.D_prime.end());
+			pairs.R2.insert(pairs.R2.end(), res.R2.begin(), res.R2.end());
+		}
+		outputPairs(pop, sp == nSP ? vspID() : subPops[sp], pairs);
+	}
+	return true;
+}
+
+
 statAssociation::statAssociation(const lociList & loci,
 	const subPopList & subPops, const stringList & vars, const string & suffix)
 	: m_loci(loci), m_subPops(subPops), m_vars(), m_suffix(suffix)
@@ -2926,7 +3586,14 @@ statNeutrality::statNeutrality(const lociList & loci, const subPopList & subPops
 	m_loci(loci), m_subPops(subPops), m_vars(), m_suffix(suffix)
 {
 	const char * allowedVars[] = {
-		Neutra_Pi_String, Neutra_Pi_sp_String, ""
+		Neutra_Pi_String,	   Neutra_Pi_sp_String,
+		Neutra_S_String,	   Neutra_S_sp_String,
+		Neutra_TajimaD_String, Neutra_TajimaD_sp_String,
+		Neutra_FuLiD_String,   Neutra_FuLiD_sp_String,
+		Neutra_FuLiF_String,   Neutra_FuLiF_sp_String,
+		Neutra_FayWuH_String,  Neutra_FayWuH_sp_String,
+		Neutra_SFS_String,	   Neutra_SFS_sp_String,
+		""
 	};
 	const char * defaultVars[] = { Neutra_Pi_String, "" };
 
@@ -2944,48 +3611,203 @@ string statNeutrality::describe(bool /* format */) const
 }
 
 
-double statNeutrality::calcPi(HAPLOLIST::const_iterator begin, HAPLOLIST::const_iterator end) const
+// add counts of alleles at a site to another
+static void addSiteCount(vector<pairu> & to, const vector<pairu> & from)
 {
-	double diffCnt = 0;
-	int numComparison = 0;
+	for (size_t k = 0; k < from.size(); ++k) {
+		size_t j = 0;
+		for (; j < to.size(); ++j) {
+			if (to[j].first == from[k].first) {
+				to[j].second += from[k].second;
+				break;
+			}
+		}
+		if (j == to.size())
+			to.push_back(from[k]);
+	}
+}
 
-	if (numThreads() > 1) {
+
+void statNeutrality::countSites(Population & pop, const vspID & subPop, const vectoru & loci,
+                                size_t chromType, SITECNT & siteCnt, size_t & numHaplotypes) const
+{
+	size_t nLoci = loci.size();
+	size_t ply = pop.ploidy();
+	bool haplodiploid = pop.isHaplodiploid();
+
+	// each thread counts alleles of a block of individuals
+	vector<SITECNT> threadCnt(numThreads(), SITECNT(nLoci));
+	vectoru threadHaplotypes(numThreads(), 0);
+
+#pragma omp parallel if(numThreads() > 1)
+	{
 #ifdef _OPENMP
-		size_t size = end - begin;
-#  pragma omp parallel reduction(+ : diffCnt, numComparison)
-		{
-			size_t id = omp_get_thread_num();
-			HAPLOLIST::const_iterator it = begin + id * (size / numThreads());
-			HAPLOLIST::const_iterator itEnd = id == numThreads() - 1 ? end : it + (size / numThreads());
-			for (; it != itEnd; ++it) {
-				HAPLOLIST::const_iterator it1 = it;
-				for (++it1; it1 != end; ++it1) {
-					const vectora & seq1 = *it;
-					const vectora & seq2 = *it1;
-					size_t sz = seq1.size();
-					for (size_t i = 0; i < sz; ++i)
-						diffCnt += seq1[i] != seq2[i];
-					++numComparison;
+		size_t id = omp_get_thread_num();
+		IndIterator ind = pop.indIterator(subPop.subPop(), id);
+#else
+		size_t id = 0;
+		IndIterator ind = pop.indIterator(subPop.subPop());
+#endif
+		SITECNT & cnt = threadCnt[id];
+		for (; ind.valid(); ++ind) {
+			for (size_t p = 0; p < ply; ++p) {
+				if (p == 1 && ind->sex() == MALE && haplodiploid)
+					continue;
+				if (chromType == CHROMOSOME_Y && ind->sex() == FEMALE)
+					continue;
+				if (((chromType == CHROMOSOME_X && p == 1) ||
+				     (chromType == CHROMOSOME_Y && p == 0)) && ind->sex() == MALE)
+					continue;
+				if (chromType == MITOCHONDRIAL && p > 0)
+					continue;
+				GenoIterator geno = ind->genoBegin(p);
+				for (size_t i = 0; i < nLoci; ++i) {
+					size_t allele = static_cast<size_t>(DEREF_ALLELE(geno + loci[i]));
+					// there are usually only one or two alleles at a site
+					vector<pairu> & site = cnt[i];
+					size_t j = 0;
+					for (; j < site.size(); ++j) {
+						if (site[j].first == allele) {
+							++site[j].second;
+							break;
+						}
+					}
+					if (j == site.size())
+						site.push_back(pairu(allele, 1));
 				}
+				++threadHaplotypes[id];
 			}
 		}
-#endif
-	}   else{
-		HAPLOLIST::const_iterator it = begin;
-		for (; it != end; ++it) {
-			HAPLOLIST::const_iterator it1 = it;
-			for (++it1; it1 != end; ++it1) {
-				const vectora & seq1 = *it;
-				const vectora & seq2 = *it1;
-				size_t sz = seq1.size();
-				for (size_t i = 0; i < sz; ++i)
-					diffCnt += seq1[i] != seq2[i];
-				++numComparison;
-			}
+	}
+	// merge counts to siteCnt
+	for (size_t t = 0; t < threadCnt.size(); ++t) {
+		numHaplotypes += threadHaplotypes[t];
+		for (size_t i = 0; i < nLoci; ++i)
+			addSiteCount(siteCnt[i], threadCnt[t][i]);
+	}
+}
+
+
+void statNeutrality::outputStats(Population & pop, const vspID & sp, const SITECNT & siteCnt,
+                                 size_t numHaplotypes) const
+{
+	double n = static_cast<double>(numHaplotypes);
+
+	// number of different pairs of sequences, summed over sites
+	double diffCnt = 0;
+	// number of segregating sites
+	size_t S = 0;
+	// number of sites with i copies of derived (non-zero) alleles
+	vectoru sfs(numHaplotypes + 1, 0);
+
+	for (size_t i = 0; i < siteCnt.size(); ++i) {
+		const vector<pairu> & site = siteCnt[i];
+		if (site.size() < 2)
+			continue;
+		++S;
+		double sameCnt = 0;
+		size_t ancestral = 0;
+		for (size_t j = 0; j < site.size(); ++j) {
+			sameCnt += static_cast<double>(site[j].second) * site[j].second;
+			if (site[j].first == 0)
+				ancestral = site[j].second;
 		}
+		diffCnt += (n * n - sameCnt) / 2;
+		++sfs[numHaplotypes - ancestral];
 	}
 	// return 0 if there is only one sequence
-	return numComparison == 0 ? 0 : diffCnt / numComparison;
+	double pi = n < 2 ? 0. : diffCnt / (n * (n - 1) / 2);
+
+	// harmonic sums used by the tests
+	double a1 = 0;
+	double a2 = 0;
+	for (size_t i = 1; i < numHaplotypes; ++i) {
+		a1 += 1. / i;
+		a2 += 1. / (static_cast<double>(i) * i);
+	}
+	double eta = static_cast<double>(S);
+	// external mutations are singletons of derived alleles
+	double eta_e = numHaplotypes > 1 ? static_cast<double>(sfs[1]) : 0.;
+
+	double tajimaD = 0;
+	if (S > 0 && n >= 2) {
+		double b1 = (n + 1) / (3 * (n - 1));
+		double b2 = 2 * (n * n + n + 3) / (9 * n * (n - 1));
+		double c1 = b1 - 1 / a1;
+		double c2 = b2 - (n + 2) / (a1 * n) + a2 / (a1 * a1);
+		double e1 = c1 / a1;
+		double e2 = c2 / (a1 * a1 + a2);
+		double var = e1 * eta + e2 * eta * (eta - 1);
+		if (var > 0)
+			tajimaD = (pi - eta / a1) / sqrt(var);
+	}
+
+	double fuLiD = 0;
+	double fuLiF = 0;
+	if (S > 0 && n >= 3) {
+		double cn = 2 * (n * a1 - 2 * (n - 1)) / ((n - 1) * (n - 2));
+		double vD = 1 + a1 * a1 / (a2 + a1 * a1) * (cn - (n + 1) / (n - 1));
+		double uD = a1 - 1 - vD;
+		double var = uD * eta + vD * eta * eta;
+		if (var > 0)
+			fuLiD = (eta - a1 * eta_e) / sqrt(var);
+		double vF = (cn + 2 * (n * n + n + 3) / (9 * n * (n - 1)) - 2 / (n - 1)) / (a1 * a1 + a2);
+		double uF = (1 + (n + 1) / (3 * (n - 1)) - 4 * (n + 1) / ((n - 1) * (n - 1)) *
+		             (a1 + 1 / n - 2 * n / (n + 1))) / a1 - vF;
+		var = uF * eta + vF * eta * eta;
+		if (var > 0)
+			fuLiF = (pi - eta_e) / sqrt(var);
+	}
+
+	double fayWuH = 0;
+	if (n >= 2) {
+		double thetaPi = 0;
+		double thetaH = 0;
+		for (size_t i = 1; i < numHaplotypes; ++i) {
+			thetaPi += 2. * i * (numHaplotypes - i) * sfs[i];
+			thetaH += 2. * i * i * sfs[i];
+		}
+		fayWuH = (thetaPi - thetaH) / (n * (n - 1));
+	}
+
+	SharedVariables & vars = pop.getVars();
+	if (sp.valid()) {
+		if (m_vars.contains(Neutra_Pi_sp_String))
+			vars.setVar(subPopVar_String(sp, Neutra_Pi_String, m_suffix), pi);
+		if (m_vars.contains(Neutra_S_sp_String))
+			vars.setVar(subPopVar_String(sp, Neutra_S_String, m_suffix), static_cast<double>(S));
+		if (m_vars.contains(Neutra_TajimaD_sp_String))
+			vars.setVar(subPopVar_String(sp, Neutra_TajimaD_String, m_suffix), tajimaD);
+		if (m_vars.contains(Neutra_FuLiD_sp_String))
+			vars.setVar(subPopVar_String(sp, Neutra_FuLiD_String, m_suffix), fuLiD);
+		if (m_vars.contains(Neutra_FuLiF_sp_String))
+			vars.setVar(subPopVar_String(sp, Neutra_FuLiF_String, m_suffix), fuLiF);
+		if (m_vars.contains(Neutra_FayWuH_sp_String))
+			vars.setVar(subPopVar_String(sp, Neutra_FayWuH_String, m_suffix), fayWuH);
+	} else {
+		if (m_vars.contains(Neutra_Pi_String))
+			vars.setVar(Neutra_Pi_String + m_suffix, pi);
+		if (m_vars.contains(Neutra_S_String))
+			vars.setVar(Neutra_S_String + m_suffix, static_cast<double>(S));
+		if (m_vars.contains(Neutra_TajimaD_String))
+			vars.setVar(Neutra_TajimaD_String + m_suffix, tajimaD);
+		if (m_vars.contains(Neutra_FuLiD_String))
+			vars.setVar(Neutra_FuLiD_String + m_suffix, fuLiD);
+		if (m_vars.contains(Neutra_FuLiF_String))
+			vars.setVar(Neutra_FuLiF_String + m_suffix, fuLiF);
+		if (m_vars.contains(Neutra_FayWuH_String))
+			vars.setVar(Neutra_FayWuH_String + m_suffix, fayWuH);
+	}
+	if (m_vars.contains(sp.valid() ? Neutra_SFS_sp_String : Neutra_SFS_String)) {
+		uintDict spectrum;
+		for (size_t i = 1; i < numHaplotypes; ++i)
+			if (sfs[i] > 0)
+				spectrum[i] = static_cast<double>(sfs[i]);
+		if (sp.valid())
+			vars.setVar(subPopVar_String(sp, Neutra_SFS_String, m_suffix), spectrum);
+		else
+			vars.setVar(Neutra_SFS_String + m_suffix, spectrum);
+	}
 }
 
 
@@ -3005,44 +3827,26 @@ bool statNeutrality::apply(Population & pop) const
 	}
 #endif
 	// count for all specified subpopulations
-	HAPLOLIST allHaplotypes;
+	SITECNT allCnt(nLoci);
+	size_t allHaplotypes = 0;
 	// selected (virtual) subpopulatons.
 	subPopList subPops = m_subPops.expandFrom(pop);
 	subPopList::const_iterator it = subPops.begin();
 	subPopList::const_iterator itEnd = subPops.end();
-	size_t ply = pop.ploidy();
 	for (; it != itEnd; ++it) {
 		pop.activateVirtualSubPop(*it);
 
-		size_t spBegin = allHaplotypes.size();
-		// go through all individual
-		IndIterator ind = pop.indIterator(it->subPop());
-		for (; ind.valid(); ++ind) {
-			vectora haplotype(nLoci);
-			for (size_t p = 0; p < ply; ++p) {
-				if (p == 1 && ind->sex() == MALE && pop.isHaplodiploid())
-					continue;
-				if (chromType == CHROMOSOME_Y && ind->sex() == FEMALE)
-					continue;
-				if (((chromType == CHROMOSOME_X && p == 1) ||
-				     (chromType == CHROMOSOME_Y && p == 0)) && ind->sex() == MALE)
-					continue;
-				if (chromType == MITOCHONDRIAL && p > 0)
-					continue;
-				for (size_t idx = 0; idx < nLoci; ++idx)
-					haplotype[idx] = TO_ALLELE(ind->allele(loci[idx], p));
-				allHaplotypes.push_back(haplotype);
-			}
-		}
-		// output variable.
-		if (m_vars.contains(Neutra_Pi_sp_String))
-			pop.getVars().setVar(subPopVar_String(*it, Neutra_Pi_String, m_suffix),
-				calcPi(allHaplotypes.begin() + spBegin, allHaplotypes.end()));
+		SITECNT siteCnt(nLoci);
+		size_t numHaplotypes = 0;
+		countSites(pop, *it, loci, chromType, siteCnt, numHaplotypes);
+		// add to the overall counts
+		allHaplotypes += numHaplotypes;
+		for (size_t i = 0; i < nLoci; ++i)
+			addSiteCount(allCnt[i], siteCnt[i]);
+		outputStats(pop, *it, siteCnt, numHaplotypes);
 		pop.deactivateVirtualSubPop(it->subPop());
 	}
-
-	if (m_vars.contains(Neutra_Pi_String))
-		pop.getVars().setVar(Neutra_Pi_String + m_suffix, calcPi(allHaplotypes.begin(), allHaplotypes.end()));
+	outputStats(pop, vspID(), allCnt, allHaplotypes);
 	return true;
 }
 
@@ -3241,6 +4045,7 @@ bool statStructure::apply(Population & pop) const
 		pop.activateVirtualSubPop(*it);
 
 		size_t spSize = 0;
+#if defined(LONGALLELE) || defined(MUTANTALLELE)
 		for (size_t idx = 0; idx < loci.size(); ++idx) {
 			size_t loc = loci[idx];
 			FREQ & af = alleleFreq[spIdx][loc];
@@ -3250,7 +4055,7 @@ bool statStructure::apply(Population & pop) const
 
 			if (use_observed_het) {
 				// go through all alleles
-				IndAlleleIterator a = pop.alleleIterator(loc, it->subPop());
+				IndAlleleIterator a = statAlleleIterator(pop, loc, it->subPop());
 				for (; a.valid(); ++cnt) {
 					Allele a1 = DEREF_ALLELE(a);
 					++a;
@@ -3277,7 +4082,7 @@ bool statStructure::apply(Population & pop) const
 				spSize = cnt;
 			} else {
 				// go through all alleles
-				IndAlleleIterator a = pop.alleleIterator(loc, it->subPop());
+				IndAlleleIterator a = statAlleleIterator(pop, loc, it->subPop());
 				for (; a.valid(); ++cnt) {
 					Allele c = DEREF_ALLELE(a);
 					++a;
@@ -3300,6 +4105,41 @@ bool statStructure::apply(Population & pop) const
 				spSize = cnt;
 			}
 		}
+#else
+		// count alleles (and heterozygotes) at all loci in one pass
+		vectoru counts;
+		vectoru totals;
+		vectoru hetero;
+		countAlleles(pop, it->subPop(), loci, counts, totals, use_observed_het ? &hetero : NULL);
+		size_t nLoci = loci.size();
+		size_t nAlleles = nLoci == 0 ? 0 : counts.size() / nLoci;
+		for (size_t idx = 0; idx < nLoci; ++idx) {
+			size_t loc = loci[idx];
+			FREQ & af = alleleFreq[spIdx][loc];
+			FREQ & hf = heteroFreq[spIdx][loc];
+			ALLELES & alleles = allAlleles[idx];
+			// number of individuals if heterozygotes are observed, and number
+			// of alleles otherwise
+			size_t cnt = use_observed_het ? totals[idx] / 2 : totals[idx];
+
+			for (size_t a = 0; a < nAlleles; ++a) {
+				size_t num = counts[a * nLoci + idx];
+				if (num == 0)
+					continue;
+				alleles[a] = true;
+				if (use_observed_het) {
+					af[a] = num / (2. * cnt);
+					hf[a] = hetero[a * nLoci + idx] / static_cast<double>(cnt);
+				} else {
+					// h_a = 2 * f_a * (1 - f_a)
+					double f = num / static_cast<double>(cnt);
+					af[a] = f;
+					hf[a] = 2 * f * (1 - f);
+				}
+			}
+			spSize = cnt;
+		}
+#endif
 		// (virtual) subpopulation size
 		n_i.push_back(spSize);
 		pop.deactivateVirtualSubPop(it->subPop());
@@ -4150,55 +4990,54 @@ bool statEffectiveSize::temporalEffectiveSize(Population & pop) const
 		}
 		pop.activateVirtualSubPop(*it);
 
+#if defined(LONGALLELE) || defined(MUTANTALLELE)
 		// do not run in parallel because Pt is pushed in order
 		for (ssize_t idx = 0; idx < static_cast<ssize_t>(loci.size()); ++idx) {
 			size_t loc = loci[idx];
 
-#ifdef LONGALLELE
+#  ifdef LONGALLELE
 			uintDict alleles;
-#else
+#  else
 			// alleles can grow to at most 256
 			vectoru alleles(2, 0);
-#endif
+#  endif
 			size_t allAlleles = 0;
 
 			// go through all alleles
-			IndAlleleIterator a = pop.alleleIterator(loc, it->subPop());
+			IndAlleleIterator a = statAlleleIterator(pop, loc, it->subPop());
 			// use allAllelel here because some marker does not have full number
 			// of alleles (e.g. markers on chromosome X and Y).
 			for (; a.valid(); ++a) {
 				Allele v = a.value();
-#ifndef BINARYALLELE
 #  ifndef LONGALLELE
 				if (v >= alleles.size())
 					alleles.resize(v + 1, 0);
 #  endif
-#endif
 				alleles[v]++;
 				allAlleles++;
 			}
 			// total allele count
-#ifdef LONGALLELE
+#  ifdef LONGALLELE
 			uintDict::iterator cnt = alleles.begin();
 			uintDict::iterator cntEnd = alleles.end();
 			for ( ; cnt != cntEnd; ++cnt)
 				alleleCnt[idx][cnt->first] += cnt->second;
-#else
+#  else
 			for (size_t i = 0; i < alleles.size(); ++i)
 				if (alleles[i] != 0)
 					alleleCnt[idx][i] += alleles[i];
-#endif
+#  endif
 			allAllelesCnt[idx] += allAlleles;
 			// calculate per-subpop statisticsoutput variable.
 			// save frequency
-#ifdef LONGALLELE
+#  ifdef LONGALLELE
 			cnt = alleles.begin();
 			for ( ; cnt != cntEnd; ++cnt)
 				cnt->second /= static_cast<double>(allAlleles);
 			Pt.push_back(alleles);
 			if (m_vars.contains(Ne_temporal_base_sp_String))
 				pop.getVars().setVar((boost::format("%1%{'freq'}{%2%}") % subPopVar_String(*it, Ne_temporal_base_String, m_suffix) % loc).str(), alleles);
-#else
+#  else
 			uintDict d;
 			for (size_t i = 0; i < alleles.size(); ++i)
 				if (alleles[i] != 0)
@@ -4206,8 +5045,32 @@ bool statEffectiveSize::temporalEffectiveSize(Population & pop) const
 			Pt.push_back(d);
 			if (m_vars.contains(Ne_temporal_base_sp_String))
 				pop.getVars().setVar((boost::format("%1%{'freq'}{%2%}") % subPopVar_String(*it, Ne_temporal_base_String, m_suffix) % loc).str(), d);
-#endif
+#  endif
 		}
+#else
+		// count alleles at all loci in one pass
+		vectoru counts;
+		vectoru totals;
+		countAlleles(pop, it->subPop(), loci, counts, totals);
+		size_t nLoci = loci.size();
+		size_t nAlleles = nLoci == 0 ? 0 : counts.size() / nLoci;
+		for (size_t idx = 0; idx < nLoci; ++idx) {
+			size_t loc = loci[idx];
+			uintDict d;
+			for (size_t a = 0; a < nAlleles; ++a) {
+				size_t cnt = counts[a * nLoci + idx];
+				if (cnt != 0) {
+					alleleCnt[idx][a] += cnt;
+					d[a] = cnt / static_cast<double>(totals[idx]);
+				}
+			}
+			allAllelesCnt[idx] += totals[idx];
+			// save frequency
+			Pt.push_back(d);
+			if (m_vars.contains(Ne_temporal_base_sp_String))
+				pop.getVars().setVar((boost::format("%1%{'freq'}{%2%}") % subPopVar_String(*it, Ne_temporal_base_String, m_suffix) % loc).str(), d);
+		}
+#endif
 		if (m_vars.contains(Ne_waples89_sp_String) || m_vars.contains(Ne_waples89_P1_sp_String) || m_vars.contains(Ne_waples89_P2_sp_String)) {
 			// calculate ne
 			vectorf res1(3, St);
@@ -542,6 +542,70 @@ private:
 };
 
 
+/// CPPONLY
+/** Count haplotypes at a list of loci. Alleles of a haplotype are packed
+ *  into one or more 64-bit words (one word holds 64 binary, 8 short or one
+ *  long allele), which are counted in an open-addressing hash table so that
+ *  no container is created for each counted haplotype.
+ */
+class HaplotypeCounter
+{
+public:
+	HaplotypeCounter(const vectori & loci = vectori());
+
+	/// count the haplotype at the loci of a homologous copy starting at \e geno
+	void add(GenoIterator geno);
+
+	/// add counts of another counter of the same loci
+	void merge(const HaplotypeCounter & rhs);
+
+	/// total number of counted haplotypes
+	size_t total() const
+	{
+		return m_total;
+	}
+
+
+	/// number of distinct haplotypes
+	size_t size() const
+	{
+		return m_size;
+	}
+
+
+	/// distinct haplotypes and their counts
+	void getCounts(vector<vectori> & haplotypes, vectoru & counts) const;
+
+	/// add counts to a dictionary indexed by haplotypes
+	void addTo(tupleDict & dict) const;
+
+private:
+	void insert(const uint64_t * key, size_t count);
+
+	void resize(size_t slots);
+
+	size_t hash(const uint64_t * key) const;
+
+private:
+	vectori m_loci;
+
+	/// bits of each allele, alleles per word and words per haplotype
+	size_t m_bits;
+	size_t m_allelesPerWord;
+	size_t m_words;
+
+	/// keys of all slots, and their counts (0 for empty slots)
+	vector<uint64_t> m_keys;
+	vectoru m_counts;
+
+	size_t m_size;
+	size_t m_total;
+
+	/// key of the haplotype being added
+	vector<uint64_t> m_key;
+};
+
+
 /// CPPONLY
 class statHaploFreq
 {
@@ -676,6 +740,9 @@ private:
 #define   ChiSq_p_sp_String    "LD_ChiSq_p_sp"
 #define   CramerV_sp_String    "CramerV_sp"
 
+#define   LD_row_String        "LD_row"
+#define   LD_col_String        "LD_col"
+
 public:
 	// In the previous versions (< 0.9.6), statLD relies statAlleleFreq
 	// and statHaploFreq to obtain allele and haplotype frequencies. This
@@ -686,8 +753,8 @@ public:
 	// calculated only once. However, this appear to be a rare case that does
 	// not worth special optimization. The newer version calculates allele and
 	// haplotype frequencies locally and in a more readable way.
-	statLD(const intMatrix & LD, const subPopList & subPops,
-		const stringList & vars, const string & suffix);
+	statLD(const intMatrix & LD, double window, double threshold,
+		const subPopList & subPops, const stringList & vars, const string & suffix);
 
 	string describe(bool format = true) const;
 
@@ -708,10 +775,30 @@ private:
 
 	void outputVar(Population & pop, const string & name, const vectorf & value) const;
 
+	// LD of pairs of loci within a window, saved in coordinate format
+	struct LDPairs
+	{
+		vectoru row;
+		vectoru col;
+		vectorf D;
+		vectorf D_prime;
+		vectorf R2;
+	};
+
+	// output pairs of a (virtual) subpopulation sp, or all subpopulations
+	// if sp is invalid
+	void outputPairs(Population & pop, const vspID & sp, const LDPairs & pairs) const;
+
+	bool applyWindowed(Population & pop) const;
+
 private:
 	/// LD
 	matrixi m_LD;
 
+	/// window and threshold of R2 for all-pairs LD
+	double m_window;
+	double m_threshold;
+
 	subPopList m_subPops;
 	stringList m_vars;
 	string m_suffix;
@@ -774,8 +861,21 @@ private:
 class statNeutrality
 {
 private:
-#define Neutra_Pi_String      "Pi"
-#define Neutra_Pi_sp_String   "Pi_sp"
+#define Neutra_Pi_String         "Pi"
+#define Neutra_S_String          "S"
+#define Neutra_TajimaD_String    "Tajima_D"
+#define Neutra_FuLiD_String      "FuLi_D"
+#define Neutra_FuLiF_String      "FuLi_F"
+#define Neutra_FayWuH_String     "FayWu_H"
+#define Neutra_SFS_String        "SFS"
+
+#define Neutra_Pi_sp_String      "Pi_sp"
+#define Neutra_S_sp_String       "S_sp"
+#define Neutra_TajimaD_sp_String "Tajima_D_sp"
+#define Neutra_FuLiD_sp_String   "FuLi_D_sp"
+#define Neutra_FuLiF_sp_String   "FuLi_F_sp"
+#define Neutra_FayWuH_sp_String  "FayWu_H_sp"
+#define Neutra_SFS_sp_String     "SFS_sp"
 
 public:
 	statNeutrality(const lociList & loci, const subPopList & subPops,
@@ -787,8 +887,17 @@ public:
 	bool apply(Population & pop) const;
 
 private:
-	typedef vector<vectora> HAPLOLIST;
-	double calcPi(HAPLOLIST::const_iterator begin, HAPLOLIST::const_iterator end) const;
+	// counts of each allele at each site
+	typedef vector<vector<pairu> > SITECNT;
+
+	// count alleles of all haplotypes of a (virtual) subpopulation
+	void countSites(Population & pop, const vspID & subPop, const vectoru & loci,
+		size_t chromType, SITECNT & siteCnt, size_t & numHaplotypes) const;
+
+	// calculate statistics from counts of alleles and output them for a
+	// (virtual) subpopulation, or all subpopulations if sp is invalid
+	void outputStats(Population & pop, const vspID & sp, const SITECNT & siteCnt,
+		size_t numHaplotypes) const;
 
 private:
 	/// Neutrality
@@ -1302,6 +1411,25 @@ public:
 	 *       (virtual) subpopulation.
 	 *  \li \c CramerV_sp Cramer V statistics for each (virtual) subpopulation.
 	 *
+	 *  <b>LDWindow</b> and <b>LDThreshold</b>: If a positive \c LDWindow is
+	 *  given, parameter \c LD is treated as a list of loci and LD is
+	 *  calculated for all pairs of these loci that are on the same chromosome
+	 *  and are at most \c LDWindow apart. The distance is measured in locus
+	 *  positions, which is the number of loci if default positions are used,
+	 *  and base pairs if loci are positioned by bp. Each locus is treated as
+	 *  diallelic with its most common allele (in all specified (virtual)
+	 *  subpopulations) as the primary allele so \c LD and \c LD_prime are
+	 *  signed. Haplotypes are bit-packed so this mode is suitable for a large
+	 *  number of loci, and pairs of loci are processed by all threads. Only
+	 *  pairs with \c R2 at or above \c LDThreshold (default to \c 0) are
+	 *  kept, and the results are saved in coordinate format: \c LD_row and
+	 *  \c LD_col are arrays (\c array.array) of the first and second loci
+	 *  of the kept pairs, and \c LD, \c LD_prime and \c R2 are arrays of
+	 *  statistics of these pairs, in the same order. \c LD_row_sp and \c LD_col_sp are set for
+	 *  each (virtual) subpopulation if \c LD_sp, \c LD_prime_sp or
+	 *  \c R2_sp is requested. Association statistics are not available in
+	 *  this mode.
+	 *
 	 *  <b>association</b>: Parameter \c association accepts a list of loci,
 	 *  which can be a list of indexes, names, or \c ALL_AVAIL. At each locus,
 	 *  one or more statistical tests will be performed to test association
@@ -1348,13 +1476,31 @@ public:
 	 *
 	 *  <b>neutrality</b>: This parameter performs neutrality tests (detection
 	 *  of natural selection) on specified loci, which can be a list of loci
-	 *  indexes, names or \c ALL_AVAIL. It currently only outputs \e Pi, which
-	 *  is the average number of pairwise difference between loci. This
-	 *  statistic outputs the following variables:
-	 *  \li \c Pi Mean pairwise difference between all sequences from all or
-	 *       specified (virtual) subpopulations.
-	 *  \li \c Pi_sp Mean paiewise difference between all sequences in each
-	 *       (virtual) subpopulation.
+	 *  indexes, names or \c ALL_AVAIL. All statistics are calculated from
+	 *  counts of alleles at each locus (site) so the cost grows linearly with
+	 *  the number of sequences. Allele \c 0 is assumed to be the ancestral
+	 *  allele, and a site with more than one allele is counted as one
+	 *  segregating site. This statistic outputs the following variables:
+	 *  \li \c Pi (default) Mean pairwise difference between all sequences
+	 *       from all or specified (virtual) subpopulations.
+	 *  \li \c S Number of segregating sites.
+	 *  \li \c Tajima_D Tajima's D statistic (Tajima 1989).
+	 *  \li \c FuLi_D Fu and Li's D statistic (Fu and Li 1993), using
+	 *       singletons of derived alleles as external mutations.
+	 *  \li \c FuLi_F Fu and Li's F statistic (Fu and Li 1993, with variance
+	 *       corrected by Simonsen et al. 1995).
+	 *  \li \c FayWu_H Fay and Wu's H statistic (Fay and Wu 2000), which is
+	 *       the difference between estimates of theta from pairwise
+	 *       differences and from homozygosity of derived alleles.
+	 *  \li \c SFS Unfolded site frequency spectrum, as a dictionary of the
+	 *       number of sites with \c i (\c 0 < \c i < \c n) copies of derived
+	 *       alleles among \c n sequences.
+	 *  \li \c Pi_sp, \c S_sp, \c Tajima_D_sp, \c FuLi_D_sp, \c FuLi_F_sp,
+	 *       \c FayWu_H_sp and \c SFS_sp: The above statistics calculated for
+	 *       sequences in each (virtual) subpopulation.
+	 *
+	 *  Test statistics are set to \c 0 if there is no segregating site or
+	 *  too few sequences to calculate them.
 	 *
 	 *  <b>structure</b>: Parameter \c structure accepts a list of loci at
 	 *  which statistics that measure population structure are calculated.
@@ -1563,7 +1709,9 @@ public:
 		const stringFunc & output = "",
 		int begin = 0, int end = -1, int step = 1, const intList & at = vectori(),
 		const intList & reps = intList(), const subPopList & subPops = subPopList(),
-		const stringList & infoFields = vectorstr());
+		const stringList & infoFields = vectorstr(),
+		//
+		double LDWindow = 0, double LDThreshold = 0);
 
 	~Stat()
 	{
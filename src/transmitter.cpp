@@ -30,6 +30,23 @@ using std::max;
 
 namespace simuPOP {
 
+// genetic map algorithm is used if there are more recombination points than
+// this number, in which case a table of Bernulli trials would be large.
+static const size_t MinLociForGeneticMap = 4096;
+
+// copy loci [begin, end) of a parental homologous copy to offspring
+inline void copyLoci(GenoIterator from, GenoIterator to, size_t begin, size_t end)
+{
+#ifdef MUTANTALLELE
+	copyGenotype(from + begin, from + end, to + begin);
+#elif defined(BINARYALLELE)
+	copyGenotype(from + begin, to + begin, end - begin);
+#else
+	std::copy(from + begin, from + end, to + begin);
+#endif
+}
+
+
 void GenoTransmitter::initializeIfNeeded(const Individual & ind) const
 {
 	if (m_lastGenoStru != ind.genoStruIdx()) {
@@ -748,10 +765,22 @@ void Recombinator::initialize(const Individual & ind) const
 		if (useLociDist)
 			const_cast<vectorf &>(m_rates).push_back(vecP[0]);
 		m_algorithm = 2;
+	} else if (vecP.size() > MinLociForGeneticMap) {
+		// rare recombinations on a long genome, use a genetic map. A
+		// recombination happens after a locus if at least one event happens
+		// in the interval, so each interval has a map length of -log(1 - r)
+		// to keep the recombination rate r.
+		m_cumMap.resize(vecP.size() - 1);
+		double length = 0;
+		for (size_t i = 0; i + 1 < vecP.size(); ++i) {
+			length += -log(1. - vecP[i]);
+			m_cumMap[i] = length;
+		}
+		m_algorithm = 3;
 	} else
 		m_algorithm = 1;
 
-	if (m_algorithm != 2) {
+	if (m_algorithm < 2) {
 #ifdef _OPENMP
 		for (size_t i = 0; i < numThreads(); i++)
 			m_bt[i].setParameter(vecP);
@@ -833,9 +862,9 @@ void Recombinator::transmitGenotype(const Individual & parent,
 	}
 	// get a new set of values.
 	// const BoolResults& bs = bt.trial();
-	if (m_algorithm != 2)
+	if (m_algorithm < 2)
 		bt.trial();
-	int curCp = m_algorithm == 2 ? getRNG().randBit() : (bt.trialSucc(m_recBeforeLoci.size() - 1) ? 0 : 1);
+	int curCp = m_algorithm >= 2 ? getRNG().randBit() : (bt.trialSucc(m_recBeforeLoci.size() - 1) ? 0 : 1);
 	curCp = forceFirstBegin == 0 ? 0 : (forceSecondBegin == 0 ? 1 : curCp);
 
 	if (m_debugOutput)
@@ -843,7 +872,7 @@ void Recombinator::transmitGenotype(const Individual & parent,
 
 	// the last one does not count, because it determines
 	// the initial copy of paternal chromosome
-	if (m_algorithm != 2)
+	if (m_algorithm < 2)
 		bt.setTrialSucc(m_recBeforeLoci.size() - 1, false);
 
 	// algorithm one:
@@ -864,6 +893,12 @@ void Recombinator::transmitGenotype(const Individual & parent,
 		// negative means no conversion is pending.
 		ssize_t convCount = -1;
 		size_t gtEnd = m_recBeforeLoci.back();
+#ifdef BINARYALLELE
+		// alleles are copied in segments [segBegin, gt) from copy segCp
+		// so that they can be copied word by word.
+		size_t segBegin = 0;
+		int segCp = curCp;
+#endif
 		for (size_t gt = 0, bl = 0; gt < gtEnd; ++gt, --convCount) {
 			// do not copy genotype in the ignored region.
 			if ((ignoreBegin < 0 || gt < static_cast<size_t>(ignoreBegin) || gt >= static_cast<size_t>(ignoreEnd)) &&
@@ -876,11 +911,25 @@ void Recombinator::transmitGenotype(const Individual & parent,
 					last_gt = gt;
 					to_next = min((cp[curCp] + gt).to_next(), (off + gt).to_next());
 				}
+#elif defined(BINARYALLELE)
+				if (curCp != segCp) {
+					copyGenotype(cp[segCp] + segBegin, off + segBegin, gt - segBegin);
+					segBegin = gt;
+					segCp = curCp;
+				}
 #else
 				off[gt] = cp[curCp][gt];
 #endif
 				LINEAGE_EXPR(lineageOff[gt] = lineagep[curCp][gt]);
 			}
+#ifdef BINARYALLELE
+			else {
+				// end the segment before an ignored locus
+				copyGenotype(cp[segCp] + segBegin, off + segBegin, gt - segBegin);
+				segBegin = gt + 1;
+				segCp = curCp;
+			}
+#endif
 			// look ahead
 			if (convCount == 0) {             // conversion ...
 				if (forceFirstBegin > 0 && gt + 1 >= static_cast<size_t>(forceFirstBegin)
@@ -935,6 +984,9 @@ void Recombinator::transmitGenotype(const Individual & parent,
 				++bl;
 			}
 		}
+#ifdef BINARYALLELE
+		copyGenotype(cp[segCp] + segBegin, off + segBegin, gtEnd - segBegin);
+#endif
 	} else if (m_algorithm == 1) {
 #ifndef BINARYALLELE
 		size_t gt = 0, gtEnd = 0;
@@ -1113,7 +1165,7 @@ void Recombinator::transmitGenotype(const Individual & parent,
 		// not used for binary module
 		LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + gtEnd, lineageOff + gt));
 #endif
-	} else {
+	} else if (m_algorithm == 2) {
 #ifndef BINARYALLELE
 		size_t gt = 0, gtEnd = 0;
 		size_t step = getRNG().randGeometric(m_rates[0]);
@@ -1311,6 +1363,72 @@ void Recombinator::transmitGenotype(const Individual & parent,
 		// not used for binary module
 		LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + gtEnd, lineageOff + gt));
 #endif
+	} else {
+		// genetic map: draw the number of recombination events from the map
+		// length and locate them on the cumulative map.
+		double mapLength = m_cumMap.back();
+		size_t numEvents = getRNG().randPoisson(mapLength);
+		vectoru events(numEvents);
+		for (size_t i = 0; i < numEvents; ++i) {
+			size_t pos = std::upper_bound(m_cumMap.begin(), m_cumMap.end(),
+				getRNG().randUniform() * mapLength) - m_cumMap.begin();
+			events[i] = min(pos, m_cumMap.size() - 1);
+		}
+		// multiple events in an interval result in a single recombination
+		std::sort(events.begin(), events.end());
+		events.erase(std::unique(events.begin(), events.end()), events.end());
+
+		size_t gt = 0, gtEnd = 0;
+		ssize_t convCount = -1;
+		size_t convEnd;
+		for (size_t i = 0; i < events.size(); ++i) {
+			// copy from last to this recombination point, but
+			// there might be a conversion event in between
+			gtEnd = m_recBeforeLoci[events[i]];
+			if (convCount > 0) {
+				convEnd = gt + convCount;
+				if (convEnd < gtEnd) {
+					copyLoci(cp[curCp], off, gt, convEnd);
+					LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + convEnd, lineageOff + gt));
+					gt = convEnd;
+					curCp = (curCp + 1) % 2;
+					if (m_debugOutput)
+						*m_debugOutput << ' ' << gt - 1;
+				}
+				// no pending conversion
+				convCount = -1;
+			}
+			// copy from the end of conversion to this recombination point
+			copyLoci(cp[curCp], off, gt, gtEnd);
+			LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + gtEnd, lineageOff + gt));
+			gt = gtEnd;
+			curCp = (curCp + 1) % 2;
+			if (m_debugOutput)
+				*m_debugOutput << ' ' << gt - 1;
+			// conversion event for this recombination event
+			if (withConversion &&
+			    parent.lociLeft(gt - 1) != 1 &&             // can not be at the end of a chromosome
+			    (m_convMode[1] == 1. || getRNG().randUniform() < m_convMode[1])) {
+				// convCount will be decreased, until reconversion completes
+				// or another recombination happens
+				convCount = markersConverted(gt, parent);
+			}
+		}
+		gtEnd = m_recBeforeLoci.back();
+		// copy the last piece
+		if (convCount > 0) {
+			convEnd = gt + convCount;
+			if (convEnd < gtEnd) {
+				copyLoci(cp[curCp], off, gt, convEnd);
+				LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + convEnd, lineageOff + gt));
+				gt = convEnd;
+				curCp = (curCp + 1) % 2;
+				if (m_debugOutput)
+					*m_debugOutput << ' ' << gt - 1;
+			}
+		}
+		copyLoci(cp[curCp], off, gt, gtEnd);
+		LINEAGE_EXPR(copy(lineagep[curCp] + gt, lineagep[curCp] + gtEnd, lineageOff + gt));
 	}
 
 
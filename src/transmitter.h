@@ -571,6 +571,13 @@ public:
 	 *  In addition to genotypes, this operator also copies alleleic lineage if
 	 *  it is executed in a module with lineage allele type.
 	 *
+	 *  For long genomes with rare recombinations at different rates, this
+	 *  operator treats recombination rates as a genetic map. The number of
+	 *  recombination events is drawn from the total map length and the
+	 *  events are located on the map so that the cost of transmitting a
+	 *  chromosome is proportional to the number of recombination events,
+	 *  not the number of loci.
+	 *
 	 *  \note conversion tract length is usually short, and is estimated to be
 	 *      between 337 and 456 bp, with overall range between maybe 50 - 2500
 	 *      bp. This is usually not enough to convert, for example, two adjacent
@@ -663,6 +670,10 @@ private:
 	/// algorithm to use (frequent or seldom recombinations)
 	mutable int m_algorithm;
 
+	/// cumulative map length (expected number of recombination events)
+	/// after each recombination point, used by the genetic map algorithm
+	mutable vectorf m_cumMap;
+
 	mutable ostream * m_debugOutput;
 
 	/// bernulli trials
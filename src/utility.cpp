@@ -105,6 +105,14 @@ using std::ofstream;
 #  include <windows.h>
 #endif
 
+// for memory-mapped genotypes
+#if !defined (_WIN32) && !defined (__WIN32__)
+#  include <sys/mman.h>
+#  include <sys/stat.h>
+#  include <fcntl.h>
+#  include <unistd.h>
+#endif
+
 #include "boost/dynamic_bitset/detail/lowest_bit.hpp"
 using boost::detail::lowest_bit;
 
@@ -124,6 +132,8 @@ extern "C" PyObject * newcarrayobject(GenoIterator begin, GenoIterator end);
 
 extern "C" PyObject * newcarrayobject_lineage(LineageIterator begin, LineageIterator end);
 
+extern "C" PyObject * newinfoarrayobject(double * buf, size_t numInds, size_t infoSize);
+
 extern "C" PyObject * PyDefDict_New();
 
 extern "C" bool is_defdict(PyTypeObject * type);
@@ -469,6 +479,32 @@ void setOptions(const int numThreads, const char * name, unsigned long seed)
 }
 
 
+// whether or not output to Python streams should acquire the GIL
+static bool g_GILReleased = false;
+
+PyThreadState * releaseGIL()
+{
+	g_GILReleased = true;
+	return PyEval_SaveThread();
+}
+
+
+void acquireGIL(PyThreadState * state)
+{
+	PyEval_RestoreThread(state);
+	g_GILReleased = false;
+}
+
+
+// whether or not output to Python streams from this thread always acquires the GIL
+static thread_local bool g_writeWithGIL = false;
+
+void writeOutputWithGIL()
+{
+	g_writeWithGIL = true;
+}
+
+
 UINT numThreads()
 {
 #ifdef _OPENMP
@@ -567,13 +603,110 @@ unsigned pow3(unsigned n)
 
 namespace simuPOP {
 
+// copy n items at buf to val, return false if any of them is negative
+template <typename T, typename ITEM>
+bool copyBufferItems(const void * buf, size_t n, std::vector<T> & val)
+{
+	const ITEM * ptr = static_cast<const ITEM *>(buf);
+	bool nonNegative = true;
+
+	val.resize(n);
+	for (size_t i = 0; i < n; ++i) {
+		// compared as double to avoid warnings for unsigned items
+		if (static_cast<double>(ptr[i]) < 0)
+			nonNegative = false;
+		val[i] = static_cast<T>(ptr[i]);
+	}
+	return nonNegative;
+}
+
+
+bool PyObj_GetNumBuffer(PyObject * obj, Py_buffer & view, char & type)
+{
+	if (!PyObject_CheckBuffer(obj))
+		return false;
+	if (PyObject_GetBuffer(obj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0) {
+		PyErr_Clear();
+		return false;
+	}
+	const char * fmt = view.format == NULL ? "B" : view.format;
+	// only native byte order is supported
+	if (*fmt == '@' || *fmt == '=')
+		++fmt;
+	if (fmt[0] == '\0' || fmt[1] != '\0' || strchr("bB?hHiIlLqQnNfd", fmt[0]) == NULL) {
+		PyBuffer_Release(&view);
+		return false;
+	}
+	type = fmt[0];
+	return true;
+}
+
+
+/* Copy items of a C-contiguous buffer of numbers (e.g. a numpy array or
+ * pop.genotype()) to val without creating Python objects for each item.
+ * Return false if obj is not such a buffer. If integerOnly is set, a
+ * ValueError is raised if the buffer holds floating point numbers or
+ * negative integers, which cannot be converted to indexes. If cols is given,
+ * it is set to the length of the last dimension of a multi-dimensional
+ * buffer, and 1 otherwise.
+ */
+template <typename T>
+bool PyObj_As_NumBuffer(PyObject * obj, std::vector<T> & val, bool integerOnly, size_t * cols)
+{
+	Py_buffer view;
+	char type;
+	if (!PyObj_GetNumBuffer(obj, view, type))
+		return false;
+	size_t n = view.itemsize == 0 ? 0 : view.len / view.itemsize;
+	if (cols)
+		*cols = view.ndim > 1 ? view.shape[view.ndim - 1] : 1;
+	bool nonNegative = true;
+	switch (type) {
+	case 'b': nonNegative = copyBufferItems<T, signed char>(view.buf, n, val); break;
+	case 'B': copyBufferItems<T, unsigned char>(view.buf, n, val); break;
+	case '?': copyBufferItems<T, bool>(view.buf, n, val); break;
+	case 'h': nonNegative = copyBufferItems<T, short>(view.buf, n, val); break;
+	case 'H': copyBufferItems<T, unsigned short>(view.buf, n, val); break;
+	case 'i': nonNegative = copyBufferItems<T, int>(view.buf, n, val); break;
+	case 'I': copyBufferItems<T, unsigned int>(view.buf, n, val); break;
+	case 'l': nonNegative = copyBufferItems<T, long>(view.buf, n, val); break;
+	case 'L': copyBufferItems<T, unsigned long>(view.buf, n, val); break;
+	case 'q': nonNegative = copyBufferItems<T, long long>(view.buf, n, val); break;
+	case 'Q': copyBufferItems<T, unsigned long long>(view.buf, n, val); break;
+	case 'n': nonNegative = copyBufferItems<T, Py_ssize_t>(view.buf, n, val); break;
+	case 'N': copyBufferItems<T, size_t>(view.buf, n, val); break;
+	default:
+		// floating point numbers
+		if (integerOnly) {
+			PyBuffer_Release(&view);
+			throw ValueError("A buffer of integers is expected, floating point numbers are given.");
+		}
+		if (type == 'f')
+			copyBufferItems<T, float>(view.buf, n, val);
+		else
+			copyBufferItems<T, double>(view.buf, n, val);
+	}
+	PyBuffer_Release(&view);
+	if (integerOnly && !nonNegative) {
+		val.clear();
+		throw ValueError("A buffer of non-negative integers is expected, negative numbers are given.");
+	}
+	return true;
+}
+
+
+template bool PyObj_As_NumBuffer<size_t>(PyObject * obj, vectoru & val, bool integerOnly, size_t * cols);
+
+
 // additional types
 floatList::floatList(PyObject * obj) : m_elems()
 {
 	if (obj == NULL)
 		return;
 
-	if (PyNumber_Check(obj))
+	if (PyObj_As_NumBuffer(obj, m_elems, false))
+		return;
+	else if (PyNumber_Check(obj))
 		m_elems.push_back(PyFloat_AsDouble(obj));
 	else if (PySequence_Check(obj)) {
 		size_t n = PySequence_Size(obj);
@@ -1116,7 +1249,9 @@ uintList::uintList(PyObject * obj) : m_elems(), m_status(REGULAR)
 	else if (PyBool_Check(obj))
 		// accept True/False
 		m_status = obj == Py_True ? ALL_AVAIL : UNSPECIFIED;
-	else if (PyNumber_Check(obj)) {
+	else if (PyObj_As_NumBuffer(obj, m_elems, true)) {
+		// accept arrays of non-negative integers (e.g. numpy arrays) in bulk
+	} else if (PyNumber_Check(obj)) {
 		// accept a number
 		m_elems.push_back(static_cast<UINT>(PyInt_AsLong(obj)));
 	} else if (PySequence_Check(obj)) {
@@ -1486,6 +1621,56 @@ PyObject * Lineage_Vec_As_NumArray(LineageIterator begin, LineageIterator end)
 }
 
 
+PyObject * Info_Vec_As_NumArray(InfoIterator begin, size_t numInds, size_t infoSize)
+{
+	PyObject * obj = newinfoarrayobject(numInds * infoSize == 0 ? NULL : &*begin, numInds, infoSize);
+
+	DBG_FAILIF(obj == NULL, ValueError, "Can not convert buf to info array");
+	// the memoryview holds a reference to obj, which exposes the buffer
+	PyObject * res = PyMemoryView_FromObject(obj);
+	Py_DECREF(obj);
+	DBG_FAILIF(res == NULL, ValueError, "Can not convert buf to info array");
+	return res;
+}
+
+
+// create a Python array.array object of type code typecode from size bytes
+// of data
+PyObject * newPyArray(const char * typecode, const void * data, size_t size)
+{
+	PyObject * module = PyImport_ImportModule("array");
+
+	if (module == NULL)
+		throw SystemError("Failed to import module array");
+	PyObject * arrayType = PyObject_GetAttrString(module, "array");
+	Py_DECREF(module);
+	if (arrayType == NULL)
+		throw SystemError("Failed to get type array.array");
+	PyObject * bytes = PyBytes_FromStringAndSize(reinterpret_cast<const char *>(data), size);
+	PyObject * res = PyObject_CallFunction(arrayType, const_cast<char *>("sO"), typecode, bytes);
+	Py_DECREF(arrayType);
+	Py_XDECREF(bytes);
+	if (res == NULL) {
+		PyErr_Clear();
+		throw SystemError("Failed to create a Python array");
+	}
+	return res;
+}
+
+
+PyObject * Double_Vec_As_PyArray(const vectorf & val)
+{
+	return newPyArray("d", val.empty() ? NULL : &val[0], val.size() * sizeof(double));
+}
+
+
+PyObject * SizeT_Vec_As_PyArray(const vectoru & val)
+{
+	return newPyArray(sizeof(size_t) == sizeof(unsigned long) ? "L" : "Q",
+		val.empty() ? NULL : &val[0], val.size() * sizeof(size_t));
+}
+
+
 string PyObj_AsString(PyObject * str)
 {
 #if PY_VERSION_HEX >= 0x03000000
@@ -3864,6 +4049,27 @@ size_t WeightedSampler::draw()
 		else
 			return m_a[K];
 	}
+	case 5: {
+		// binary indexed tree, find the first index with cumulative weight
+		// larger than a random number between 0 and the sum of weights
+		double total = 0;
+		for (size_t i = m_N; i > 0; i -= i & (~i + 1))
+			total += m_q[i - 1];
+		DBG_FAILIF(fcmp_le(total, 0), ValueError, "Sum of weight is <= 0.");
+		while (true) {
+			double w = getRNG().randUniform() * total;
+			size_t pos = 0;
+			for (size_t step = m_param; step > 0; step >>= 1) {
+				if (pos + step <= m_N && m_q[pos + step - 1] <= w) {
+					pos += step;
+					w -= m_q[pos - 1];
+				}
+			}
+			// rounding errors might push pos beyond the last number
+			if (pos < m_N)
+				return pos;
+		}
+	}
 	case 4:
 		// return according to proportion.
 		if (m_index == m_sequence.size())
@@ -3887,12 +4093,151 @@ vectoru WeightedSampler::drawSamples(ULONG num)
 {
 	vectoru res(num);
 
-	for (size_t i = 0; i < num; ++i)
-		res[i] = draw();
+	// draw all numbers in a single loop for the common algorithms
+	RNG & rng = getRNG();
+	switch (m_algorithm) {
+	case 1:
+		std::fill(res.begin(), res.end(), m_param);
+		break;
+	case 2:
+		for (size_t i = 0; i < num; ++i)
+			res[i] = rng.randInt(static_cast<ULONG>(m_param));
+		break;
+	case 3:
+		for (size_t i = 0; i < num; ++i) {
+			double rN = rng.randUniform() * m_N;
+			size_t K = static_cast<size_t>(rN);
+			res[i] = rN - K < m_q[K] ? K : m_a[K];
+		}
+		break;
+	default:
+		for (size_t i = 0; i < num; ++i)
+			res[i] = draw();
+	}
 	return res;
 }
 
 
+void WeightedSampler::useFenwickTree()
+{
+	if (m_algorithm == 0)
+		throw ValueError("weighted sample is not initialized");
+	if (m_algorithm == 4)
+		throw ValueError("Cannot update weights of a sampler that returns exact proportions of numbers");
+	if (m_algorithm == 5)
+		return;
+
+	m_weights.resize(m_N);
+	switch (m_algorithm) {
+	case 1:
+		std::fill(m_weights.begin(), m_weights.end(), 0.);
+		m_weights[m_param] = m_scale;
+		break;
+	case 2:
+		std::fill(m_weights.begin(), m_weights.end(), m_scale);
+		break;
+	case 3:
+		// recover weights from the alias table
+		std::fill(m_weights.begin(), m_weights.end(), 0.);
+		for (size_t i = 0; i < m_N; ++i) {
+			double q = std::min(m_q[i], 1.);
+			m_weights[i] += q * m_scale;
+			m_weights[m_a[i]] += (1. - q) * m_scale;
+		}
+		break;
+	}
+	// build the tree in linear time
+	m_q = m_weights;
+	for (size_t i = 1; i <= m_N; ++i) {
+		size_t parent = i + (i & (~i + 1));
+		if (parent <= m_N)
+			m_q[parent - 1] += m_q[i - 1];
+	}
+	m_a.clear();
+	// largest power of two that is not larger than N
+	for (m_param = 1; m_param * 2 <= m_N; m_param *= 2) ;
+	m_algorithm = 5;
+}
+
+
+void WeightedSampler::update(size_t index, double weight)
+{
+	DBG_FAILIF(weight < 0, ValueError, "Weights should be non-negative.");
+	if (m_algorithm != 5)
+		useFenwickTree();
+	if (index >= m_N)
+		throw IndexError((boost::format("Index %1% out of range of 0 ~ %2%") % index % (m_N - 1)).str());
+
+	double delta = weight - m_weights[index];
+	m_weights[index] = weight;
+	for (size_t i = index + 1; i <= m_N; i += i & (~i + 1))
+		m_q[i - 1] += delta;
+}
+
+
+bool mapFileRegion(const char * filename, size_t offset, size_t size, MappedRegion & region)
+{
+#if defined (_WIN32) || defined (__WIN32__)
+	(void)filename;
+	(void)offset;
+	(void)size;
+	(void)region;
+	return false;
+#else
+	if (size == 0)
+		return false;
+	int fd = open(filename, O_RDONLY);
+	if (fd < 0)
+		return false;
+	struct stat st;
+	if (fstat(fd, &st) != 0 || offset + size > static_cast<size_t>(st.st_size)) {
+		close(fd);
+		return false;
+	}
+	// mapping has to start from the beginning of a page
+	size_t pageSize = static_cast<size_t>(sysconf(_SC_PAGESIZE));
+	size_t start = offset - offset % pageSize;
+	size_t length = size + (offset - start);
+	void * base = mmap(NULL, length, PROT_READ | PROT_WRITE, MAP_PRIVATE, fd, start);
+	close(fd);
+	if (base == MAP_FAILED)
+		return false;
+	region.ptr = static_cast<char *>(base) + (offset - start);
+	region.size = size;
+	region.base = base;
+	region.length = length;
+	region.device = static_cast<unsigned long>(st.st_dev);
+	region.inode = static_cast<unsigned long>(st.st_ino);
+	return true;
+#endif
+}
+
+
+void unmapFileRegion(const MappedRegion & region)
+{
+#if !defined (_WIN32) && !defined (__WIN32__)
+	munmap(region.base, region.length);
+#else
+	(void)region;
+#endif
+}
+
+
+bool isMappedFrom(const MappedRegion & region, const char * filename)
+{
+#if !defined (_WIN32) && !defined (__WIN32__)
+	struct stat st;
+	return region.ptr != NULL && stat(filename, &st) == 0 &&
+	       static_cast<unsigned long>(st.st_dev) == region.device &&
+	       static_cast<unsigned long>(st.st_ino) == region.inode;
+#else
+	(void)region;
+	(void)filename;
+	return false;
+#endif
+}
+
+
 // this is used for Bernullitrials and copyGenotype
 WORDTYPE g_bitMask[WORDBIT];
 
@@ -4467,6 +4812,12 @@ public:
 protected:
 	int overflow(int c)
 	{
+		// output might come from a thread that does not hold the GIL
+		bool ensureGIL = g_GILReleased || g_writeWithGIL;
+		PyGILState_STATE gil = PyGILState_UNLOCKED;
+		if (ensureGIL)
+			gil = PyGILState_Ensure();
+
 		// write out current buffer
 		if (pbase() != pptr()) {
 			// the end of string might not be \0
@@ -4497,6 +4848,8 @@ protected:
 			} else
 				sputc(static_cast<char>(c));
 		}
+		if (ensureGIL)
+			PyGILState_Release(gil);
 		return 0;
 	}
 
@@ -4712,23 +5065,26 @@ void copyGenotype(GenoIterator fr, GenoIterator to, size_t n)
 	size_t fr_off = BITOFF(fr);
 	size_t to_off = BITOFF(to);
 
-	// if offset is different, can not copy in block.
+	if (n == 0)
+		return;
+
 	if (n < WORDBIT) {
-		for (size_t i = 0; i < n; ++i) {
-			// set bit according to from bit
-			if (*fr_p & (1UL << fr_off))
-				*to_p |= (1UL << to_off);
-			else
-				*to_p &= ~(1UL << to_off);
-			// next location
-			if (fr_off++ == WORDBIT - 1) {
-				fr_off = 0;
-				++fr_p;
-			}
-			if (to_off++ == WORDBIT - 1) {
-				to_off = 0;
-				++to_p;
-			}
+		// a short segment spans at most two words in the source and
+		// two words in the destination, so shift it into a single word
+		// and write it back with masks.
+		//
+		// n = 3, fr_off = 6, to_off = 7
+		// from:   BAxxxxxx xxxxxxxC
+		// bits:   00000CBA
+		// to:     Axxxxxxx xxxxxxCB
+		WORDTYPE bits = *fr_p >> fr_off;
+		if (fr_off + n > WORDBIT)
+			bits |= *(fr_p + 1) << (WORDBIT - fr_off);
+		bits &= g_bitMask[n];
+		*to_p = (*to_p & ~(g_bitMask[n] << to_off)) | (bits << to_off);
+		if (to_off + n > WORDBIT) {
+			size_t rest = to_off + n - WORDBIT;
+			*(to_p + 1) = (*(to_p + 1) & ~g_bitMask[rest]) | (bits >> (WORDBIT - to_off));
 		}
 	} else if (fr_off == to_off) {
 		// copy first block, fr_off + 1 bits
@@ -4910,18 +5266,25 @@ void clearGenotype(GenoIterator to, size_t n)
 	WORDTYPE * to_p = const_cast<WORDTYPE *>(BITPTR(to));
 	size_t to_off = BITOFF(to);
 
-	// This can be made more efficient.
-	for (size_t i = 0; i < n; ++i) {
-		// set bit according to from bit
-		*to_p &= ~(1UL << to_off);
-		if (to_off++ == WORDBIT - 1) {
-			while (i + WORDBIT < n) {
-				*++to_p = 0;
-				i += WORDBIT;
-			}
-			++to_p;
-			to_off = 0;
-		}
+	if (n == 0)
+		return;
+
+	if (to_off + n < WORDBIT) {
+		*to_p &= ~(g_bitMask[n] << to_off);
+		return;
+	}
+	// clear the first partial word
+	*to_p &= g_bitMask[to_off];
+	size_t rest = n - (WORDBIT - to_off);
+	// clear whole words
+	size_t blks = rest / WORDBIT;
+	for (size_t i = 0; i < blks; ++i)
+		*++to_p = 0;
+	// and the rest of the bits
+	rest -= blks * WORDBIT;
+	if (rest != 0) {
+		++to_p;
+		*to_p &= ~g_bitMask[rest];
 	}
 }
 
@@ -5067,22 +5430,31 @@ void testCopyGenotype()
 {
 	vectora from(1000);
 	vectora to(1000);
+	vectora expected(1000);
 
-	for (size_t i = 0; i < 100; ++i) {
+	for (size_t i = 0; i < 200; ++i) {
 		for (size_t j = 0; j < 1000; ++j) {
 			// use != 0 to reduce compiler warning
 			from[j] = getRNG().randInt(2) != 0;
-			to[j] = 0;
+			to[j] = getRNG().randInt(2) != 0;
 		}
 		size_t from_idx = getRNG().randInt(300);
 		size_t to_idx = getRNG().randInt(300);
-		if (from_idx > to_idx)
-			continue;
-		size_t length = getRNG().randInt(500);
-		copyGenotype(from.begin() + from_idx,
-			to.begin() + to_idx, length);
-		if (vectora(from.begin() + from_idx, from.begin() + from_idx + length) !=
-		    vectora(to.begin() + to_idx, to.begin() + to_idx + length)) {
+		// test short segments within or across words
+		size_t length = getRNG().randInt(i % 2 ? 500 : WORDBIT);
+		expected = to;
+		if (i % 4 == 3) {
+			// alleles outside of the segment should not be changed
+			for (size_t j = 0; j < length; ++j)
+				expected[to_idx + j] = false;
+			clearGenotype(to.begin() + to_idx, length);
+		} else {
+			for (size_t j = 0; j < length; ++j)
+				expected[to_idx + j] = from[from_idx + j];
+			copyGenotype(from.begin() + from_idx,
+				to.begin() + to_idx, length);
+		}
+		if (expected != to) {
 			cerr	<< "Copying: " << vectora(from.begin() + from_idx, from.begin() + from_idx + length) << '\n'
 			        << "Obtain:  " << vectora(to.begin() + to_idx, to.begin() + to_idx + length) << '\n'
 			        << "Index From: " << from_idx << " to: " << to_idx << " length: " << length << endl;
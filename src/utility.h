@@ -163,6 +163,20 @@ UINT numThreads();
 /// CPPONLY return val and increase val by 1, ensuring thread safety
 ATOMICLONG fetchAndIncrement(ATOMICLONG * val);
 
+/** CPPONLY Release the GIL so that other threads can run. Output to \c cout
+ *  and \c cerr acquires the GIL until \c acquireGIL is called.
+ */
+PyThreadState * releaseGIL();
+
+/// CPPONLY acquire the GIL released by \c releaseGIL
+void acquireGIL(PyThreadState * state);
+
+/** CPPONLY Let output of the calling thread, which runs alongside the main
+ *  thread instead of in an OpenMP region, to \c cout and \c cerr always
+ *  acquire the GIL.
+ */
+void writeOutputWithGIL();
+
 /// CPPONLY parallel sort by using tbb or gnu parallel
 template<class T1, class T2>
 void parallelSort(T1 start, T1 end, T2 cmp)
@@ -1102,12 +1116,31 @@ void PyObj_As_IntArray(PyObject * obj, vectori & val);
 /// CPPONLY
 void PyObj_As_SizeTArray(PyObject * obj, vectoru & val);
 
+/** CPPONLY Get a C-contiguous buffer of numbers from \e obj and set \e type
+ *  to its format character (e.g. 'B' or 'd'). Return false if \e obj is not
+ *  such a buffer. Otherwise \e view should be released by the caller.
+ */
+bool PyObj_GetNumBuffer(PyObject * obj, Py_buffer & view, char & type);
+
+/// CPPONLY
+template <typename T>
+bool PyObj_As_NumBuffer(PyObject * obj, std::vector<T> & val, bool integerOnly, size_t * cols = NULL);
+
 /// CPPONLY
 PyObject * Allele_Vec_As_NumArray(GenoIterator begin, GenoIterator end);
 
 /// CPPONLY
 PyObject * Lineage_Vec_As_NumArray(LineageIterator begin, LineageIterator end);
 
+/// CPPONLY
+PyObject * Info_Vec_As_NumArray(InfoIterator begin, size_t numInds, size_t infoSize);
+
+/// CPPONLY return a copy of \e val as a Python \c array.array object
+PyObject * Double_Vec_As_PyArray(const vectorf & val);
+
+/// CPPONLY return a copy of \e val as a Python \c array.array object
+PyObject * SizeT_Vec_As_PyArray(const vectoru & val);
+
 // ///////////////////////////////////////////////////////
 /** CPPONLY shared variables.
 
@@ -1844,6 +1877,15 @@ public:
 	/// CPPONLY
 	static unsigned long generateRandomSeed();
 
+	/// CPPONLY exchange the generator and state of two RNGs.
+	void swap(RNG & rhs)
+	{
+		std::swap(m_RNG, rhs.m_RNG);
+		std::swap(m_seed, rhs.m_seed);
+		std::swap(m_bitByte, rhs.m_bitByte);
+		std::swap(m_bitIndex, rhs.m_bitIndex);
+	}
+
 
 	/** Generate a random number following a rng_uniform [0, 1) distribution.
 	 *  <group>3-rng</group>
@@ -2067,7 +2109,7 @@ public:
 	 */
 	WeightedSampler(const vectorf & weights = vectorf(), ULONG N = 0)
 		: m_algorithm(0), m_q(0), m_a(0), m_param(0),
-		m_sequence(0), m_index(0)
+		m_sequence(0), m_index(0), m_scale(1), m_weights()
 	{
 
 		set(weights.begin(), weights.end(), N);
@@ -2088,6 +2130,7 @@ public:
 	{
 		size_t sz = last - first;
 
+		m_weights.clear();
 		// this is the case with unknown number of outputs
 		if (N == 0) {
 			m_N = sz;
@@ -2102,6 +2145,7 @@ public:
 				// return 0 all time
 				m_algorithm = 1;
 				m_param = 0;
+				m_scale = *first;
 				return;
 			}
 			// fixed value
@@ -2117,6 +2161,7 @@ public:
 			if (allEqual) {
 				m_algorithm = 2;
 				m_param = m_N;
+				m_scale = *first;
 				return;
 			}
 			// only one value
@@ -2135,6 +2180,7 @@ public:
 			}
 			if (fixed) {
 				m_algorithm = 1;
+				m_scale = *(first + m_param);
 				return;
 			}
 			// the mos difficult case
@@ -2144,6 +2190,7 @@ public:
 
 			DBG_FAILIF(fcmp_le(w, 0), ValueError, "Sum of weight is <= 0.");
 
+			m_scale = w / m_N;
 			w = m_N / w;
 
 			// initialize p with N*p0,...N*p_k-1
@@ -2222,7 +2269,25 @@ public:
 	 */
 	vectoru drawSamples(ULONG n = 1);
 
+	/** Change the weight of the \e index-th number to \e weight. The sampler
+	 *  is converted to a binary indexed (Fenwick) tree when this function is
+	 *  called for the first time so that the sampler does not have to be
+	 *  rebuilt if only a few weights are changed. Both updates and draws take
+	 *  \c O(log(k)) time afterwards. This function cannot be used with
+	 *  samplers that return exact proportions of numbers.
+	 */
+	void update(size_t index, double weight);
+
+	/** CPPONLY
+	 *  Convert the sampler to a binary indexed (Fenwick) tree so that
+	 *  weights can be changed by function \c update without rebuilding the
+	 *  sampler. Weights are recovered from the current sampler so this
+	 *  function does not change the probabilities of numbers to be drawn.
+	 */
+	void useFenwickTree();
+
 private:
+
 	/// which algorithm to use
 	int m_algorithm;
 
@@ -2242,6 +2307,12 @@ private:
 	vectoru m_sequence;
 
 	ATOMICLONG m_index;
+
+	/// ratio between specified weights and weights in internal tables
+	double m_scale;
+
+	/// weights of the binary indexed tree, which is stored in m_q
+	vectorf m_weights;
 };
 
 
@@ -430,6 +430,32 @@ class TestRecombinator(PerformanceTest):
         )
         return gens
 
+class TestFiniteSitesModel(PerformanceTest):
+    def __init__(self, logger, time=30):
+        PerformanceTest.__init__(self, 'FiniteSitesMutator with Recombinator on long sequences, results are number of generations in %d seconds.' % int(time),
+            logger)
+        self.time = time
+
+    def run(self):
+        # overall running case
+        return self.productRun(size=[2000, 10000], loci=[100000, 1000000])
+
+    def _run(self, size, loci):
+        # single test case, only feasible for the mutant module
+        if moduleInfo()['alleleType'] != 'mutant':
+            return 0
+        pop = Population(size=size, loci=loci)
+        gens = pop.evolve(
+            initOps=InitSex(),
+            preOps=[
+                FiniteSitesMutator(rate=5e-6, ranges=[[0, loci]]),
+                RevertFixedSites(),
+                TicToc(output='', stopAfter=self.time),
+            ],
+            matingScheme=RandomMating(ops=Recombinator(rates=1e-6)),
+        )
+        return gens
+
 class TestCombinedParentsChooser(PerformanceTest):
     def __init__(self, logger, time=30):
         PerformanceTest.__init__(self, 'CombinedParentsChooser, results are number of generations in %d seconds.' % int(time),
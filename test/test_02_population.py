@@ -197,6 +197,72 @@ class TestPopulation(unittest.TestCase):
         self.assertEqual(len(arr), pop.genoSize()*pop.subPopSize(1))
         self.assertRaises(IndexError, pop.genotype, 2)
 
+    def testGenotypeBuffer(self):
+        'Testing buffer interface of Population::genotype() and lineage()'
+        pop = Population(loci=[1, 2], size=[1, 2])
+        if moduleInfo()['alleleType'] in ['binary', 'mutant']:
+            self.assertRaises(BufferError, memoryview, pop.genotype())
+            return
+        pop.setGenotype([0, 1, 2])
+        view = memoryview(pop.genotype())
+        self.assertEqual(view.ndim, 1)
+        self.assertEqual(view.shape, (pop.genoSize()*pop.popSize(),))
+        self.assertEqual(view.format, 'L' if moduleInfo()['alleleType'] == 'long' else 'B')
+        self.assertEqual(view.tolist(), list(pop.genotype()))
+        # views share memory with the population
+        view[0] = 2
+        self.assertEqual(pop.individual(0).allele(0), 2)
+        view = memoryview(pop.genotype(1))
+        self.assertEqual(len(view), pop.genoSize()*pop.subPopSize(1))
+        view[-1] = 1
+        self.assertEqual(pop.individual(2).allele(2, 1), 1)
+        # empty subpopulation
+        pop = Population(loci=[1, 2], size=[0, 2])
+        self.assertEqual(len(memoryview(pop.genotype(0))), 0)
+        if moduleInfo()['alleleType'] == 'lineage':
+            initLineage(pop, range(6))
+            view = memoryview(pop.lineage())
+            self.assertEqual(view.format, 'l')
+            self.assertEqual(view.tolist(), list(range(6)) * 2)
+            view[0] = 10
+            self.assertEqual(pop.individual(0).lineage()[0], 10)
+
+    def testViewLifetime(self):
+        'Testing views of genotype, lineage and info fields keep the population alive'
+        import gc
+        pop = Population(loci=[2, 3], size=[10, 20], infoFields=['a', 'b'])
+        pop.setGenotype([0, 1])
+        pop.setIndInfo(range(30), 'b')
+        if moduleInfo()['alleleType'] == 'lineage':
+            initLineage(pop, range(10))
+        geno = pop.genotype()
+        part = pop.genotype(1)[:10]
+        lineage = pop.lineage()
+        info = pop.infoArray(1)
+        # views outlive the population that is deleted from Python
+        del pop
+        gc.collect()
+        # the memory of the deleted population would otherwise be reused
+        pops = [Population(loci=[2, 3], size=[10, 20], infoFields=['a', 'b'])
+            for i in range(10)]
+        for pop in pops:
+            pop.setGenotype([1])
+            pop.setIndInfo([-1], 'b')
+        self.assertEqual(list(geno), [0, 1] * 150)
+        self.assertEqual(list(part), [0, 1] * 5)
+        self.assertEqual(info.tolist(), [[0, x] for x in range(10, 30)])
+        if moduleInfo()['alleleType'] == 'lineage':
+            self.assertEqual(list(lineage), list(range(10)) * 30)
+        else:
+            self.assertEqual(lineage, None)
+        geno[0] = 1
+        self.assertEqual(geno[0], 1)
+        # a view of a copy refers to the copy, not the original population
+        pop = pops[0]
+        geno = pop.clone().genotype()
+        gc.collect()
+        self.assertEqual(list(geno), [1] * 300)
+
 
 
     def testSetGenotype(self):
@@ -246,6 +312,64 @@ class TestPopulation(unittest.TestCase):
             for idx, ind in enumerate(pop.individuals([0, 1])):
                 self.assertEqual(ind.allele(idx%6), 6)
 
+    def testSetGenotypeByLoci(self):
+        'Testing Population::setGenotype(geno, subPop, loci) with buffers'
+        import array
+        pop = Population(loci=[1, 2], size=[1, 2], lociNames=['a', 'b', 'c'])
+        # values from a buffer are copied in bulk
+        pop.setGenotype(array.array('i', [1, 0, 1, 1, 0, 0]))
+        self.assertEqual(pop.individual(0).genotype(), [1, 0, 1, 1, 0, 0])
+        pop.setGenotype(array.array('B', [0, 1]), 1)
+        self.assertEqual(pop.individual(0).genotype(), [1, 0, 1, 1, 0, 0])
+        self.assertEqual(pop.individual(2).genotype(), [0, 1, 0, 1, 0, 1])
+        pop.setGenotype(pop.individual(0).genotype())
+        self.assertEqual(pop.individual(2).genotype(), [1, 0, 1, 1, 0, 0])
+        # buffers of the allele type of the module, reused cyclically
+        fmt = 'L' if moduleInfo()['alleleType'] == 'long' else 'B'
+        pop.setGenotype(array.array(fmt, [1, 1, 0, 1]))
+        self.assertEqual(list(pop.genotype()), [1, 1, 0, 1] * 4 + [1, 1])
+        pop.setGenotype(array.array(fmt, [0, 0, 1, 0, 1]), 1)
+        self.assertEqual(list(pop.genotype(1)), [0, 0, 1, 0, 1] * 2 + [0, 0])
+        self.assertEqual(pop.individual(0).genotype(), [1, 1, 0, 1, 1, 1])
+        # set selected loci, in the order of individual, ploidy and loci
+        pop.setGenotype([0], loci=ALL_AVAIL)
+        pop.setGenotype(array.array('l', [1, 0, 0, 1]), loci=[2, 0])
+        self.assertEqual(pop.individual(0).genotype(), [0, 0, 1, 1, 0, 0])
+        self.assertEqual(pop.individual(1).genotype(), [0, 0, 1, 1, 0, 0])
+        pop.setGenotype([1], 1, loci='b')
+        self.assertEqual(pop.individual(0).genotype(), [0, 0, 1, 1, 0, 0])
+        self.assertEqual(pop.individual(2).genotype(), [0, 1, 1, 1, 1, 0])
+        self.assertRaises(IndexError, pop.setGenotype, [1], loci=3)
+        # buffers of floating point numbers or negative integers are rejected
+        # instead of being truncated or wrapped around
+        self.assertRaises(ValueError, pop.setGenotype, array.array('d', [1.5]))
+        self.assertRaises(ValueError, pop.setGenotype, array.array('i', [1, -1]))
+        # as all invalid lists of integers, they are reported as TypeError
+        # when they are converted to parameters
+        self.assertRaises(TypeError, pop.removeIndividuals, array.array('f', [0.5]))
+        self.assertRaises(TypeError, pop.removeIndividuals, array.array('l', [-1]))
+        self.assertEqual(pop.popSize(), 3)
+        pop.removeIndividuals(array.array('b', [0]))
+        self.assertEqual(pop.popSize(), 2)
+        # virtual subpopulation
+        pop = self.getPop(size = 100, VSP=True)
+        pop.setGenotype([0])
+        pop.setGenotype(array.array('H', [1]), [0, 1], loci=[1])
+        for ind in pop.individuals():
+            self.assertEqual(ind.allele(1), 1 if ind.sex() == FEMALE else 0)
+            self.assertEqual(ind.allele(0), 0)
+        # info fields
+        pop = Population(size=[2, 3], infoFields=['a', 'b'])
+        pop.setIndInfo(array.array('d', [0.5, 1.5]), 'b')
+        self.assertEqual(pop.indInfo('b'), (0.5, 1.5, 0.5, 1.5, 0.5))
+        pop.setIndInfo(array.array('f', range(3)), 'a', 1)
+        self.assertEqual(pop.indInfo('a'), (0, 0, 0, 1, 2))
+        if moduleInfo()['alleleType'] == 'lineage':
+            pop = Population(loci=[1, 2], size=[1, 2])
+            pop.setLineage(array.array('q', [5, 6]), loci=[0, 2])
+            self.assertEqual(pop.individual(0).lineage(), [5, 0, 6, 5, 0, 6])
+            self.assertEqual(pop.lineage(), [5, 0, 6, 5, 0, 6] * 3)
+
     def testAncestor(self):
         'Testing Population::ancestor(idx, gen), ancestor(idx, gen, subPop), push(pop)'
         pop = Population([100, 200], loci=[10, 20], infoFields=['x', 'y'],
@@ -1285,6 +1409,38 @@ class TestPopulation(unittest.TestCase):
         self.assertRaises(ValueError, testVSPSetAndRead, self.getPop())
         testVSPSetAndRead(self.getPop(VSP=True))
 
+    def testInfoArray(self):
+        'Testing Population::infoArray(), infoArray(subPop)'
+        pop = Population(size=[2, 3], infoFields=['a', 'b'])
+        pop.setIndInfo(range(5), 'a')
+        pop.setIndInfo(range(10, 15), 'b')
+        view = pop.infoArray()
+        self.assertEqual(view.format, 'd')
+        self.assertEqual(view.shape, (5, 2))
+        self.assertEqual(view.tolist(), [[x, x + 10] for x in range(5)])
+        # the memoryview refers to the object that exposes the buffer
+        self.assertFalse(view.obj is None)
+        self.assertEqual(memoryview(view.obj).shape, (5, 2))
+        # and keeps the population alive
+        self.assertTrue(view.obj.owner is pop)
+        view1 = Population(size=3, infoFields='a').infoArray()
+        view1[2, 0] = 5
+        self.assertEqual(view1.obj.owner.indInfo('a'), (0, 0, 5))
+        # views share memory with the population
+        view[1, 1] = 20
+        self.assertEqual(pop.individual(1).info('b'), 20)
+        view = pop.infoArray(1)
+        self.assertEqual(view.shape, (3, 2))
+        self.assertEqual(view.tolist(), [[x, x + 10] for x in range(2, 5)])
+        view[0, 0] = -1
+        self.assertEqual(pop.individual(2).info('a'), -1)
+        self.assertRaises(IndexError, pop.infoArray, 2)
+        pop.setVirtualSplitter(SexSplitter())
+        self.assertRaises(ValueError, pop.infoArray, [0, 0])
+        # no information field
+        pop = Population(size=[2, 3])
+        self.assertEqual(pop.infoArray().shape, (5, 0))
+
     def testSetInfoFields(self):
         'Testing Population::setInfoFields(fields, init=0)'
         pop = self.getPop()
@@ -1335,6 +1491,223 @@ class TestPopulation(unittest.TestCase):
         self.assertFalse('module_os' in pop1.vars())
         os.remove('popout')
 
+    def testSaveCompress(self):
+        'Testing Population::save(filename, compress)'
+        import gzip
+        # large enough to be compressed in multiple blocks
+        pop = Population([1000, 1000], loci=500, infoFields='a')
+        initGenotype(pop, freq=[0.3, 0.7])
+        initInfo(pop, lambda:random.randint(0, 40), infoFields='a')
+        sizes = []
+        for level in [0, 1, 6, 9]:
+            pop.save('popout', compress=level)
+            sizes.append(os.path.getsize('popout'))
+            pop1 = loadPopulation('popout')
+            self.assertEqual(pop, pop1)
+            self.assertEqual(pop.indInfo('a'), pop1.indInfo('a'))
+            # the file can be read by other gzip decompressors
+            with gzip.open('popout', 'rb') as gz:
+                self.assertGreater(len(gz.read()), 2000000)
+        self.assertGreater(sizes[0], sizes[1])
+        self.assertGreater(sizes[1], sizes[3])
+        self.assertRaises(ValueError, pop.save, 'popout', compress=10)
+        # by operator SavePopulation
+        pop.evolve(postOps=SavePopulation('popout', compress=1), gen=1)
+        self.assertEqual(pop, loadPopulation('popout'))
+        os.remove('popout')
+        self.assertRaises(ValueError, SavePopulation, 'popout', compress=-1)
+        # existing positional parameters are not changed
+        pop = Population(100, loci=10)
+        pop.evolve(postOps=SavePopulation('popout', 2), gen=2)
+        self.assertFalse(os.path.isfile('popout'))
+
+    def testSaveBackground(self):
+        'Testing operator SavePopulation(background=True)'
+        pop = Population([500, 500], loci=100, infoFields='a')
+        pop.dvars().myvar = 1
+        pop.evolve(
+            initOps=InitGenotype(freq=[0.3, 0.7]),
+            matingScheme=RandomSelection(),
+            postOps=[
+                PyExec('myvar += 1'),
+                SavePopulation(output='!"popout%d" % gen', background=True)
+            ],
+            gen=5)
+        # all populations are saved when evolve returns
+        for gen in range(5):
+            pop1 = loadPopulation('popout%d' % gen)
+            self.assertEqual(pop1.dvars().myvar, gen + 2)
+            self.assertEqual(pop1.dvars().gen, gen)
+            os.remove('popout%d' % gen)
+        self.assertEqual(pop, pop1)
+        # errors are reported to the main thread
+        self.assertRaises(ValueError, pop.evolve,
+            postOps=SavePopulation(output='nonexist/popout', background=True),
+            matingScheme=RandomSelection(), gen=1)
+        # populations are saved when evolution is stopped by an error
+        pop = Population([500, 500], loci=100)
+        self.assertRaises(RuntimeError, pop.evolve,
+            postOps=[
+                SavePopulation(output='!"popout%d" % gen', background=True),
+                PyExec('undefined_name', at=3)
+            ],
+            matingScheme=RandomSelection(), gen=5)
+        for gen in range(4):
+            pop1 = loadPopulation('popout%d' % gen)
+            self.assertEqual(pop1.dvars().gen, gen)
+            os.remove('popout%d' % gen)
+        # populations saved by operators applied directly are written by
+        # flushBackgroundSaves, which reports errors to the caller
+        SavePopulation(output='popout', background=True).apply(pop)
+        SavePopulation(output='nonexist/popout', background=True).apply(pop)
+        self.assertRaises(ValueError, flushBackgroundSaves)
+        self.assertEqual(loadPopulation('popout'), pop)
+        os.remove('popout')
+        flushBackgroundSaves()
+
+    def testSaveBackgroundAtExit(self):
+        'Testing populations saved in the background are written at exit'
+        import subprocess
+        script = '''
+import simuOpt
+simuOpt.setOptions(quiet=True, alleleType=%r, optimized=%r)
+from simuPOP import *
+pop = Population([500, 500], loci=100)
+SavePopulation(output='popout', background=True).apply(pop)
+SavePopulation(output='nonexist/popout', background=True).apply(pop)
+''' % (moduleInfo()['alleleType'], moduleInfo()['optimized'])
+        proc = subprocess.Popen([sys.executable, '-c', script],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, err = proc.communicate()
+        self.assertTrue(os.path.isfile('popout'))
+        self.assertEqual(loadPopulation('popout').popSize(), 1000)
+        os.remove('popout')
+        # the error is reported when the interpreter exits
+        self.assertTrue(b'Failed to save population' in err)
+
+    def testSaveBinary(self):
+        'Testing Population::save(filename, binary=True)'
+        pop = self.getPop(ancGen=5, infoFields=['a', 'b'])
+        for gen in range(pop.ancestralGens(), -1, -1):
+            pop.useAncestralGen(gen)
+            initGenotype(pop, freq=[0.3, 0.7])
+            initSex(pop)
+            initInfo(pop, lambda:random.randint(0, 40), infoFields=['a', 'b'])
+            for ind in pop.individuals():
+                ind.setAffected(random.random() < 0.3)
+        stat(pop, alleleFreq=list(range(pop.totNumLoci())))
+        pop.save("popout", binary=True)
+        pop1 = loadPopulation("popout")
+        self.assertEqual(pop, pop1)
+        self.assertEqual(pop1.ancestralGens(), pop.ancestralGens())
+        self.assertEqual(pop1.subPopNames(), pop.subPopNames())
+        self.assertEqual(pop1.dvars().alleleFreq, pop.dvars().alleleFreq)
+        for gen in range(pop.ancestralGens(), -1, -1):
+            pop.useAncestralGen(gen)
+            pop1.useAncestralGen(gen)
+            self.assertEqual(pop.indInfo('a'), pop1.indInfo('a'))
+            self.assertEqual(pop.indInfo('b'), pop1.indInfo('b'))
+            self.assertEqual(pop.genotype(), pop1.genotype())
+            self.assertEqual([x.sex() for x in pop.individuals()],
+                [x.sex() for x in pop1.individuals()])
+            self.assertEqual([x.affected() for x in pop.individuals()],
+                [x.affected() for x in pop1.individuals()])
+        # a population without individuals
+        pop = Population(0, loci=[2, 3])
+        pop.save('popout', binary=True)
+        pop1 = loadPopulation('popout')
+        self.assertEqual(pop1.popSize(), 0)
+        self.assertEqual(pop1.numLoci(), (2, 3))
+        os.remove('popout')
+
+    def testMemoryMappedLoad(self):
+        'Testing loadPopulation(filename, memoryMap=True)'
+        pop = self.getPop(ancGen=2, infoFields=['a'])
+        for gen in range(pop.ancestralGens(), -1, -1):
+            pop.useAncestralGen(gen)
+            initGenotype(pop, freq=[0.3, 0.7])
+            initInfo(pop, lambda:random.randint(0, 40), infoFields=['a'])
+        pop.save('popout', binary=True)
+        pop1 = loadPopulation('popout', memoryMap=True)
+        self.assertEqual(pop, pop1)
+        self.assertEqual(pop.indInfo('a'), pop1.indInfo('a'))
+        # changes are not written to the file
+        pop1.individual(0).setAllele(1, 0)
+        pop1.individual(0).setAllele(0, 1)
+        pop2 = loadPopulation('popout', True)
+        self.assertEqual(pop, pop2)
+        # the population can be saved to the file it is mapped from
+        pop1.save('popout', binary=True)
+        self.assertFalse(os.path.isfile('popout.tmp'))
+        pop2.useAncestralGen(2)
+        pop.useAncestralGen(2)
+        self.assertEqual(pop.genotype(), pop2.genotype())
+        pop3 = loadPopulation('popout')
+        self.assertEqual(pop1, pop3)
+        # and evolve
+        pop2.useAncestralGen(0)
+        pop2.evolve(matingScheme=RandomSelection(), gen=2)
+        # a copy of a mapped population has its own genotypes
+        pop4 = loadPopulation('popout', memoryMap=True)
+        pop5 = pop4.clone()
+        del pop4
+        self.assertEqual(pop1, pop5)
+        # text format cannot be mapped
+        pop.save('popout')
+        self.assertRaises(ValueError, loadPopulation, 'popout', memoryMap=True)
+        os.remove('popout')
+
+    def testPartialLoad(self):
+        'Testing loadPopulation(filename, loci, subPops, ancGens, infoFields)'
+        pop = self.getPop(size=[20, 30, 40], loci=[3, 4], ancGen=2,
+            infoFields=['a', 'b', 'c'], subPopNames=['A', 'B', 'C'])
+        for gen in range(pop.ancestralGens(), -1, -1):
+            pop.useAncestralGen(gen)
+            initGenotype(pop, freq=[0.3, 0.7])
+            initInfo(pop, lambda:random.randint(0, 40), infoFields=['a', 'b', 'c'])
+        pop.dvars().myvar = 10
+        for binary in [True, False]:
+            pop.save('popout', binary=binary)
+            for loci, subPops, ancGens, infoFields in [
+                    ([1, 5, 3], ALL_AVAIL, ALL_AVAIL, ALL_AVAIL),
+                    (ALL_AVAIL, [2, 0], ALL_AVAIL, ALL_AVAIL),
+                    (ALL_AVAIL, ['B'], [0, 2], ALL_AVAIL),
+                    (ALL_AVAIL, ALL_AVAIL, ALL_AVAIL, ['c', 'a']),
+                    ([0, 6], [1], [1], ['b']),
+                    ]:
+                pop1 = loadPopulation('popout', loci=loci, subPops=subPops,
+                    ancGens=ancGens, infoFields=infoFields)
+                self.assertEqual(pop1.dvars().myvar, 10)
+                lociIdx = list(range(7)) if loci is ALL_AVAIL else sorted(loci)
+                sps = [0, 1, 2] if subPops is ALL_AVAIL else \
+                    sorted([pop.subPopByName(x) if isinstance(x, str) else x for x in subPops])
+                gens = [0, 1, 2] if ancGens is ALL_AVAIL else ancGens
+                fields = pop.infoFields() if infoFields is ALL_AVAIL else infoFields
+                self.assertEqual(pop1.totNumLoci(), len(lociIdx))
+                self.assertEqual(pop1.infoFields(), tuple(x for x in pop.infoFields() if x in fields))
+                self.assertEqual(pop1.ancestralGens(), len(gens) - 1)
+                for idx, gen in enumerate(gens):
+                    pop.useAncestralGen(gen)
+                    pop1.useAncestralGen(idx)
+                    self.assertEqual(pop1.subPopSizes(), tuple(pop.subPopSize(x) for x in sps))
+                    self.assertEqual(pop1.subPopNames(), tuple(pop.subPopName(x) for x in sps))
+                    inds = [ind for sp in sps for ind in pop.individuals(sp)]
+                    self.assertEqual(list(pop1.genotype()), [ind.allele(l, p)
+                        for ind in inds for p in range(2) for l in lociIdx])
+                    for field in fields:
+                        self.assertEqual(pop1.indInfo(field), tuple(ind.info(field) for ind in inds))
+                    self.assertEqual([x.sex() for x in pop1.individuals()],
+                        [x.sex() for x in inds])
+                pop.useAncestralGen(0)
+            # unspecified ancGens only loads the current generation
+            pop1 = loadPopulation('popout', ancGens=UNSPECIFIED)
+            self.assertEqual(pop1.ancestralGens(), 0)
+            self.assertEqual(pop1.genotype(), pop.genotype())
+            self.assertRaises((ValueError, IndexError), loadPopulation, 'popout',
+                subPops=[(0, 1)])
+            self.assertRaises(IndexError, loadPopulation, 'popout', loci=[10])
+        os.remove('popout')
+
     def testCrossPlatformLoad(self):
         'Testing loading populations created from other platform and allele types'
         localFile = 'sample_%d_%s_v3.pop' % ( \
@@ -2070,7 +2443,47 @@ class TestPopulation(unittest.TestCase):
         arr = list(pop.mutants(1))
         self.assertEqual(len(arr), 4)
         #
-        
+
+    def testSparseMutants(self):
+        'Testing genotypes of populations where most individuals have no mutant'
+        def check(pop, numMutants):
+            geno = list(pop.genotype())
+            # mutants are reported with their index in individual genotypes
+            self.assertEqual(list(pop.mutants()),
+                [(i % pop.genoSize(), a) for i, a in enumerate(geno) if a != 0])
+            self.assertEqual(len(geno) - geno.count(0), numMutants)
+            # mutants of an individual do not leak into its neighbours
+            for idx, ind in enumerate(pop.individuals()):
+                self.assertEqual(list(ind.genotype()),
+                    geno[idx * pop.genoSize():(idx + 1) * pop.genoSize()])
+        pop = Population([20, 30], loci=[50, 60])
+        # mutants at the first and last loci of individuals and chromosomes
+        for idx, locus, ploidy in [(0, 0, 0), (3, 49, 1), (3, 50, 0), (4, 0, 0),
+                (19, 109, 1), (20, 0, 0), (49, 109, 1)]:
+            pop.individual(idx).setAllele(idx % 5 + 1, locus, ploidy)
+        check(pop, 7)
+        pop1 = pop.clone()
+        check(pop1, 7)
+        pop1.removeIndividuals([3])
+        check(pop1, 5)
+        pop1.addIndFrom(pop)
+        check(pop1, 12)
+        pop1.removeLoci([0, 49])
+        check(pop1, 5)
+        pop1.individual(52).setGenotype([0])
+        check(pop1, 4)
+        pop1 = pop.extractSubPops(1)
+        check(pop1, 2)
+        pop1.resize(60, propagate=True)
+        check(pop1, 4)
+        # offspring are copied from parents that are mostly empty
+        pop.evolve(initOps=InitSex(),
+            matingScheme=RandomMating(ops=Recombinator(rates=0.1)),
+            gen=3)
+        geno = list(pop.genotype())
+        check(pop, len(geno) - geno.count(0))
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -66,6 +66,117 @@ class TestSimulator(unittest.TestCase):
             gen=10
         )
 
+    def testEvolveInProcesses(self):
+        'Testing Simulator::evolve(processes)'
+        if os.name == 'nt':
+            return
+        def evolveIn(processes):
+            setOptions(seed=1234)
+            simu = Simulator(Population(size=[100, 40], loci=[2, 5],
+                infoFields='a'), rep=5)
+            simu.dvars(2).input = 'value'
+            gens = simu.evolve(
+                initOps=[InitSex(), InitGenotype(freq=[0.3, .7])],
+                matingScheme=RandomMating(),
+                postOps=[Stat(alleleFreq=0),
+                    PyExec('a = rep'),
+                    TerminateIf('gen == 4', reps=3)],
+                finalOps=PyExec('final = True'),
+                gen=10, processes=processes)
+            return simu, gens
+        simu1, gens1 = evolveIn(2)
+        simu2, gens2 = evolveIn(3)
+        self.assertEqual(gens1, (10, 10, 10, 5, 10))
+        self.assertEqual(gens1, gens2)
+        # results do not depend on the number of processes
+        self.assertEqual(simu1, simu2)
+        for rep in range(5):
+            pop = simu1.population(rep)
+            self.assertEqual(pop.dvars().rep, rep)
+            self.assertEqual(pop.dvars().a, rep)
+            self.assertEqual(pop.dvars().gen, gens1[rep])
+            self.assertEqual(pop.dvars().final, True)
+            self.assertEqual(pop.dvars().alleleFreq[0],
+                simu2.dvars(rep).alleleFreq[0])
+        self.assertEqual(simu1.dvars(2).input, 'value')
+        # replicates use different random number streams
+        self.assertNotEqual(simu1.population(0), simu1.population(1))
+        # evolved populations can be evolved again
+        simu1.evolve(matingScheme=RandomMating(), gen=2, processes=2)
+        self.assertEqual(simu1.dvars(3).gen, 7)
+        # errors in worker processes are reported
+        self.assertRaises(RuntimeError, simu1.evolve,
+            postOps=PyExec('undefined_name'), matingScheme=RandomMating(),
+            gen=2, processes=2)
+        # errors after other replicates have been evolved are raised with
+        # their original type
+        self.assertRaises(ValueError, simu1.evolve,
+            postOps=PyOperator(lambda pop: pop.subPopByName('none') is None, reps=3),
+            matingScheme=RandomMating(), gen=2, processes=2)
+
+    def testEvolveInThreads(self):
+        'Testing Simulator::evolve with replicates mated in threads'
+        threads = moduleInfo()['threads']
+        def evolveWith(ops):
+            setOptions(numThreads=2, seed=1234)
+            simu = Simulator(Population(size=[100, 40], loci=[2, 5],
+                infoFields='ind_id'), rep=5)
+            gens = simu.evolve(
+                initOps=[InitSex(), InitGenotype(freq=[0.3, .7]), IdTagger()],
+                preOps=PyExec('a = rep'),
+                matingScheme=RandomMating(ops=ops),
+                postOps=[Stat(alleleFreq=0),
+                    TerminateIf('gen == 4', reps=3)],
+                gen=10)
+            return simu, gens
+        try:
+            simu1, gens1 = evolveWith([MendelianGenoTransmitter(), IdTagger()])
+            simu2, gens2 = evolveWith([MendelianGenoTransmitter(), IdTagger()])
+            # a during-mating PyOperator prevents mating in threads
+            simu3, gens3 = evolveWith([MendelianGenoTransmitter(), IdTagger(),
+                PyOperator(lambda: True)])
+        finally:
+            setOptions(numThreads=threads)
+        self.assertEqual(gens1, (10, 10, 10, 5, 10))
+        self.assertEqual(gens1, gens2)
+        self.assertEqual(gens1, gens3)
+        # results are reproducible for the same seed and number of threads
+        for rep in range(5):
+            self.assertEqual(simu1.population(rep).genotype(),
+                simu2.population(rep).genotype())
+        for simu in (simu1, simu3):
+            ids = []
+            for rep in range(5):
+                pop = simu.population(rep)
+                self.assertEqual(pop.subPopSizes(), (100, 40))
+                self.assertEqual(pop.dvars().a, rep)
+                self.assertEqual(pop.dvars().gen, gens1[rep])
+                ids.extend(pop.indInfo('ind_id'))
+            # individual IDs are unique across replicates
+            self.assertEqual(len(set(ids)), len(ids))
+        # each replicate is mated in its own thread, using the random number
+        # generator of the thread, which is seeded with seed + thread index
+        pop = Population(size=[100, 40], loci=[2, 5])
+        initSex(pop)
+        initGenotype(pop, freq=[0.3, .7])
+        try:
+            setOptions(numThreads=2, seed=1234)
+            if moduleInfo()['threads'] != 2:
+                return
+            simu = Simulator(pop, rep=2, stealPops=False)
+            simu.evolve(matingScheme=RandomMating(), gen=1)
+            expected = []
+            for rep in range(2):
+                setOptions(numThreads=1, seed=1234 + rep)
+                pop1 = pop.clone()
+                pop1.evolve(matingScheme=RandomMating(), gen=1)
+                expected.append(list(pop1.genotype()))
+        finally:
+            setOptions(numThreads=threads)
+        self.assertNotEqual(expected[0], expected[1])
+        for rep in range(2):
+            self.assertEqual(list(simu.population(rep).genotype()), expected[rep])
+
     def testCreateSimulator(self):
         'Testing the construction of Simulator'
         pop = Population(size=[20, 80], loci=1)
@@ -274,7 +274,80 @@ class TestMatingSchemes(unittest.TestCase):
                 lastParent = parent
                 famSize.append(1)
         self.assertEqual(famSize, [1]*20000+[2]*10000)
-         
+
+    def testMatingInThreads(self):
+        'Testing offspring generated in multiple threads'
+        threads = moduleInfo()['threads']
+        setOptions(numThreads=2)
+        try:
+            pop = Population(size=1000, loci=100, ancGen=1,
+                infoFields=['father_idx', 'mother_idx'])
+            pop.evolve(
+                initOps=[InitSex(), InitGenotype(freq=[0.5, 0.5])],
+                matingScheme=RandomMating(ops=[MendelianGenoTransmitter(),
+                    ParentsTagger()]),
+                gen=1)
+        finally:
+            setOptions(numThreads=threads)
+        pop.useAncestralGen(1)
+        haplotypes = [(list(ind.genotype(0)), list(ind.genotype(1)))
+            for ind in pop.individuals()]
+        pop.useAncestralGen(0)
+        for ind in pop.individuals():
+            dad = haplotypes[int(ind.father_idx)]
+            mom = haplotypes[int(ind.mother_idx)]
+            # each offspring inherits one intact copy from each parent
+            geno = [list(ind.genotype(0)), list(ind.genotype(1))]
+            self.assertTrue(geno[0] in dad or geno[1] in dad)
+            self.assertTrue(geno[0] in mom or geno[1] in mom)
+
+    def testHeteroMatingInThreads(self):
+        'Testing heterogeneous mating schemes executed in multiple threads'
+        threads = moduleInfo()['threads']
+        setOptions(numThreads=1, seed=1234)
+        pop = Population(size=[200]*10, loci=[2, 3],
+            infoFields=['father_idx', 'mother_idx'])
+        pop.setVirtualSplitter(SexSplitter())
+        initSex(pop)
+        initGenotype(pop, freq=[0.4, 0.6])
+        def evolveWith(numThreads):
+            setOptions(numThreads=numThreads, seed=1234)
+            pop1 = pop.clone()
+            pop1.evolve(
+                matingScheme=HeteroMating([
+                    RandomMating(ops=[MendelianGenoTransmitter(), ParentsTagger()]),
+                    SelfMating(subPops=[(9, 0)], weight=-0.5)]),
+                gen=5)
+            return pop1
+        try:
+            pop2 = evolveWith(2)
+            pop3 = evolveWith(3)
+        finally:
+            setOptions(numThreads=threads)
+        self.assertEqual(pop2.subPopSizes(), (200,)*10)
+        # offspring do not depend on the number of threads
+        self.assertEqual(pop2.genotype(), pop3.genotype())
+        self.assertEqual(pop2.indInfo('father_idx'), pop3.indInfo('father_idx'))
+        # offspring of each subpopulation have parents in the subpopulation
+        for sp in range(9):
+            for idx in pop2.indInfo('mother_idx', subPop=sp):
+                self.assertTrue(200 * sp <= idx < 200 * (sp + 1))
+        # a single subpopulation is mated as with a homogeneous mating scheme,
+        # which can produce offspring in multiple threads
+        pop = Population(size=2000, loci=[2, 3])
+        initSex(pop)
+        initGenotype(pop, freq=[0.4, 0.6])
+        try:
+            offspring = []
+            for ms in [RandomMating(), HeteroMating([RandomMating()])]:
+                setOptions(numThreads=2, seed=1234)
+                pop1 = pop.clone()
+                pop1.evolve(matingScheme=ms, gen=2)
+                offspring.append(list(pop1.genotype()))
+        finally:
+            setOptions(numThreads=threads)
+        self.assertEqual(offspring[0], offspring[1])
+
     def testWeightingScheme(self):
         'Testing weighting schemes of heterogeneous mating schemes'
         pop = Population(size=[1000], loci=2, infoFields='mark')
@@ -455,6 +528,40 @@ class TestMatingSchemes(unittest.TestCase):
             gen = 20
         )
 
+    def testPedigreeMatingInThreads(self):
+        'Testing pedigree mating in multiple threads'
+        ped = Population(size=500, ancGen=-1,
+            infoFields=['ind_id', 'father_id', 'mother_id'])
+        ped.evolve(
+            initOps=[InitSex(), IdTagger()],
+            matingScheme=RandomMating(ops=[IdTagger(), PedigreeTagger()]),
+            gen=1)
+        ped.asPedigree()
+        parents = dict([(ind.ind_id, (ind.father_id, ind.mother_id))
+            for ind in ped.allIndividuals(ancGens=0)])
+        pop = Population(size=500, loci=100, ancGen=1, infoFields='ind_id')
+        initInfo(pop, [x.ind_id for x in ped.allIndividuals(ancGens=1)],
+            infoFields='ind_id')
+        initSex(pop, sex=[x.sex() for x in ped.allIndividuals(ancGens=1)])
+        threads = moduleInfo()['threads']
+        setOptions(numThreads=2)
+        try:
+            pop.evolve(
+                initOps=InitGenotype(freq=[0.5, 0.5]),
+                matingScheme=PedigreeMating(ped, ops=MendelianGenoTransmitter()),
+                gen=1)
+        finally:
+            setOptions(numThreads=threads)
+        pop.useAncestralGen(1)
+        haplotypes = dict([(ind.ind_id, (list(ind.genotype(0)), list(ind.genotype(1))))
+            for ind in pop.individuals()])
+        pop.useAncestralGen(0)
+        for ind in pop.individuals():
+            dad, mom = parents[ind.ind_id]
+            geno = [list(ind.genotype(0)), list(ind.genotype(1))]
+            self.assertTrue(geno[0] in haplotypes[dad] or geno[1] in haplotypes[dad])
+            self.assertTrue(geno[0] in haplotypes[mom] or geno[1] in haplotypes[mom])
+
     def testSequentialParentsChooser(self):
         'Testing sequential parent chooser'
         pop = Population(size=[100, 200], infoFields=['parent_idx'])
@@ -532,6 +639,58 @@ class TestMatingSchemes(unittest.TestCase):
         self.assertRaises(ValueError, testPyRetValue, retWrongIndexes)
 
   
+    def testPyParentsChooserBlocks(self):
+        'Testing Python parents chooser that yields blocks of parents'
+        import array
+        def retIndexBlock(pop, subPop):
+            while True:
+                yield array.array('l', range(pop.subPopSize(subPop)))
+        def retPairBlock(pop, subPop):
+            sz = pop.subPopSize(subPop)
+            while True:
+                # parents are paired as (i, sz - 1 - i)
+                yield memoryview(array.array('i', sum([[i, sz - 1 - i]
+                    for i in range(sz)], []))).cast('B').cast('i', [sz, 2])
+        def retWrongBlock(pop, subPop):
+            while True:
+                yield array.array('l', [0, pop.subPopSize(subPop)])
+        def retEmptyBlock(pop, subPop):
+            while True:
+                yield array.array('l')
+        def retTripleBlock(pop, subPop):
+            while True:
+                yield memoryview(array.array('i', [0] * 6)).cast('B').cast('i', [2, 3])
+        def retNegativeBlock(pop, subPop):
+            while True:
+                yield array.array('l', [0, -1])
+        def retBytesBlock(pop, subPop):
+            while True:
+                yield b'\x00\x01'
+        def retFloatBlock(pop, subPop):
+            while True:
+                yield array.array('d', [0, 1])
+        pop = Population([20]*2, loci=1, infoFields=['father_idx', 'mother_idx'])
+        pop.evolve(
+            matingScheme=HomoMating(PyParentsChooser(retIndexBlock),
+                OffspringGenerator([CloneGenoTransmitter(), ParentsTagger()])),
+            gen=1)
+        # parents are used in the order of the block
+        self.assertEqual(pop.indInfo('father_idx'), tuple(float(i) for i in range(40)))
+        pop.evolve(
+            matingScheme=HomoMating(PyParentsChooser(retPairBlock),
+                OffspringGenerator([MendelianGenoTransmitter(), ParentsTagger()])),
+            gen=1)
+        for i in range(40):
+            self.assertEqual(pop.individual(i).father_idx, i)
+            self.assertEqual(pop.individual(i).mother_idx, i // 20 * 20 + 19 - i % 20)
+        for func in (retWrongBlock, retEmptyBlock, retTripleBlock,
+                retNegativeBlock, retBytesBlock, retFloatBlock):
+            pop = Population([20]*2, loci=1)
+            self.assertRaises(ValueError, pop.evolve,
+                matingScheme=HomoMating(PyParentsChooser(func),
+                    OffspringGenerator(CloneGenoTransmitter())),
+                gen=1)
+
     def testHaploidRandomMating(self):
         'Testing random mating in haploid populations'
         pop = Population(size=[50, 100], loci=[5]*5, ploidy=1,
@@ -680,6 +839,22 @@ class TestMatingSchemes(unittest.TestCase):
             self.assertGreaterEqual(ind.a, 0)
         self.assertRaises(RuntimeError, c.chooseParents)
 
+    def testRandomParentChooserWithoutReplacementSelection(self):
+        'Test random parent chooser without replacement with natural selection'
+        pop = Population([10, 10], loci=[1], infoFields=['a', 'fitness'])
+        initInfo(pop, range(20), infoFields='a')
+        initInfo(pop, [0] * 5 + [1, 2, 3, 4, 100], infoFields='fitness')
+        c = RandomParentChooser(replacement=False)
+        first = []
+        for rep in range(100):
+            c.initialize(pop=pop, subPop=1)
+            chosen = [c.chooseParents()[0].a for idx in range(5)]
+            self.assertEqual(sorted(chosen), [15, 16, 17, 18, 19])
+            self.assertRaises(RuntimeError, c.chooseParents)
+            first.append(chosen[0])
+        # the fittest individual is most likely to be chosen first
+        self.assertGreater(first.count(19), 80)
+
     def testRandomParentsChooser(self):
         'Test random parent chooser'
         pop = Population([10, 10], loci=[1], infoFields='a')
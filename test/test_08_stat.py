@@ -10,6 +10,7 @@
 
 import math
 import unittest, os, sys
+import array
 from simuOpt import setOptions
 from random import randint
 
@@ -339,6 +340,138 @@ class TestStat(unittest.TestCase):
         stat(pop, alleleFreq=ALL_AVAIL)
 
 
+    def testAlleleFreqAllChromTypes(self):
+        'Testing allele frequency at loci on all types of chromosomes'
+        pop = Population(size=[300, 200], loci=[70, 5, 3, 4],
+            chromTypes=[AUTOSOME, CHROMOSOME_X, CHROMOSOME_Y, MITOCHONDRIAL])
+        pop.setVirtualSplitter(SexSplitter())
+        initSex(pop)
+        initGenotype(pop, freq=[.6, .3, .1])
+        if moduleInfo()['alleleType'] not in ['binary', 'mutant']:
+            pop.individual(5).setAllele(200, 3)
+        def alleleNum(loci, inds):
+            nums = []
+            for loc in loci:
+                ct = pop.chromType(pop.chromLocusPair(loc)[0])
+                cnt = {}
+                for ind in inds:
+                    if ct == CHROMOSOME_X:
+                        ploidy = [0] if ind.sex() == MALE else [0, 1]
+                    elif ct == CHROMOSOME_Y:
+                        ploidy = [1] if ind.sex() == MALE else []
+                    elif ct == MITOCHONDRIAL:
+                        ploidy = [0]
+                    else:
+                        ploidy = [0, 1]
+                    for p in ploidy:
+                        a = ind.allele(loc, p)
+                        cnt[a] = cnt.get(a, 0) + 1
+                nums.append(cnt)
+            return nums
+        for loci in [ALL_AVAIL, [3, 75, 2, 72, 80], [0, 64, 65, 78]]:
+            idx = range(pop.totNumLoci()) if loci is ALL_AVAIL else loci
+            stat(pop, alleleFreq=loci, vars=['alleleNum', 'alleleFreq'])
+            for loc, cnt in zip(idx, alleleNum(idx, pop.individuals())):
+                self.assertEqual(dict(pop.dvars().alleleNum[loc]), cnt)
+                self.assertAlmostEqual(sum(pop.dvars().alleleFreq[loc].values()), 1)
+            stat(pop, alleleFreq=loci, subPops=[0, 1, (0, 0), (1, 1)],
+                vars=['alleleNum_sp'])
+            for sp in [0, 1, (0, 0), (1, 1)]:
+                for loc, cnt in zip(idx, alleleNum(idx, pop.individuals(sp))):
+                    # the mutant module does not output loci without any allele
+                    # (e.g. chromosome Y of females)
+                    if not cnt and moduleInfo()['alleleType'] == 'mutant':
+                        self.assertFalse(loc in pop.dvars(sp).alleleNum)
+                    else:
+                        self.assertEqual(dict(pop.dvars(sp).alleleNum[loc]), cnt)
+
+    def testMitochondrialAlleleCount(self):
+        'Testing counting only the first copy of mitochondrial loci'
+        pop = Population([4, 6], loci=[1, 1], chromTypes=[AUTOSOME, MITOCHONDRIAL])
+        pop.setVirtualSplitter(SexSplitter())
+        initSex(pop, sex=[MALE, FEMALE])
+        # allele 1 on the first copy of three individuals, and on all other
+        # copies, which should be ignored
+        for idx, ind in enumerate(pop.individuals()):
+            ind.setGenotype([0, 1 if idx in (0, 5, 6) else 0, 1, 1])
+        # a haploid population with the first copies on an autosome
+        hap = Population([4, 6], ploidy=1, loci=[1])
+        hap.setVirtualSplitter(SexSplitter())
+        initSex(hap, sex=[MALE, FEMALE])
+        for idx, ind in enumerate(hap.individuals()):
+            ind.setGenotype([1 if idx in (0, 5, 6) else 0])
+        subPops = [0, 1, (0, 0), (1, 1)]
+        stat(pop, alleleFreq=[1], subPops=subPops, vars=['alleleNum', 'alleleNum_sp'])
+        stat(hap, alleleFreq=[0], subPops=subPops, vars=['alleleNum', 'alleleNum_sp'])
+        for sp, num in zip(subPops, [{0: 3, 1: 1}, {0: 4, 1: 2}, {0: 1, 1: 1}, {0: 2, 1: 1}]):
+            self.assertEqual(dict(pop.dvars(sp).alleleNum[1]), num)
+            self.assertEqual(dict(hap.dvars(sp).alleleNum[0]), num)
+        stat(pop, alleleFreq=[1], vars='alleleNum')
+        self.assertEqual(dict(pop.dvars().alleleNum[1]), {0: 7, 1: 3})
+        # structure statistics of subpopulations and virtual subpopulations
+        for subPops in [ALL_AVAIL, [(0, 0), (0, 1), (1, 0), (1, 1)]]:
+            stat(pop, structure=[1], subPops=subPops)
+            stat(hap, structure=[0], subPops=subPops)
+            self.assertAlmostEqual(pop.dvars().F_st, hap.dvars().F_st)
+        stat(pop, structure=[1])
+        self.assertAlmostEqual(pop.dvars().F_st, -0.1122554)
+
+    def testTrackedAlleleFreq(self):
+        'Testing allele frequency from allele counts tracked during evolution'
+        pop = Population(size=[300, 200], loci=[5, 3, 2],
+            chromTypes=[AUTOSOME, CHROMOSOME_X, CHROMOSOME_Y],
+            infoFields='migrate_to')
+        if moduleInfo()['alleleType'] in ['long', 'mutant']:
+            self.assertRaises(ValueError, pop.trackAlleles)
+            return
+        self.assertRaises(ValueError, pop.trackAlleles, [1, 2, 1])
+        loci = [0, 2, 5, 6, 8]
+        pop.trackAlleles(loci)
+        def alleleNums(pop, subPops):
+            stat(pop, alleleFreq=loci, subPops=subPops,
+                vars=['alleleNum', 'alleleNum_sp'])
+            nums = [dict(pop.dvars().alleleNum[loc]) for loc in loci]
+            for sp in subPops:
+                nums.extend([dict(pop.dvars(sp).alleleNum[loc]) for loc in loci])
+            return nums
+        def checkCounts(pop):
+            untracked = pop.clone()
+            untracked.trackAlleles([])
+            self.assertEqual(alleleNums(pop, [0, 1]),
+                alleleNums(untracked, [0, 1]))
+            return True
+        pop.evolve(
+            initOps=[InitSex(), InitGenotype(freq=[.4, .6])],
+            preOps=Migrator(rate=[[0.9, 0.1], [0.2, 0.8]]),
+            matingScheme=RandomMating(),
+            postOps=[KAlleleMutator(k=2, rates=0.01), PyOperator(checkCounts)],
+            gen=5)
+        # changes made through Individual are not tracked
+        before = alleleNums(pop, [0, 1])
+        ind = pop.individual(0)
+        ind.setAllele(1 - ind.allele(0, 0), 0, 0)
+        self.assertEqual(alleleNums(pop, [0, 1]), before)
+        # alleles in virtual subpopulations are counted directly
+        pop.setVirtualSplitter(SexSplitter())
+        stat(pop, alleleFreq=[0], subPops=[(0, 0), (0, 1), 1],
+            vars='alleleNum')
+        self.assertNotEqual(dict(pop.dvars().alleleNum[0]), before[0])
+        # alleles are recounted if loci are tracked again
+        pop.trackAlleles(loci)
+        self.assertNotEqual(alleleNums(pop, [0, 1]), before)
+        checkCounts(pop)
+        # changes made through arrays returned by Population.genotype() are
+        # tracked, including changes after alleles are counted
+        geno = pop.genotype()
+        before = alleleNums(pop, [0, 1])
+        geno[0] = 1 - geno[0]
+        self.assertNotEqual(alleleNums(pop, [0, 1]), before)
+        checkCounts(pop)
+        geno[:1] = [1 - geno[0]]
+        self.assertEqual(alleleNums(pop, [0, 1]), before)
+        pop.genotype(1)[0] = 1 - pop.genotype(1)[0]
+        checkCounts(pop)
+
     def testHeteroFreq(self):
         'Testing counting of heterozygote frequency'
         pop = Population(size=[500,100,1000],
@@ -544,6 +677,20 @@ class TestStat(unittest.TestCase):
             self.assertEqual(pop.dvars().haploFreq[(2, 5)][(1, 1)], 0.2)
             self.assertEqual(pop.dvars().haploFreq[(2, 5)][(2, 2)], 0.3)
             self.assertEqual(pop.dvars().haploFreq[(2, 5)][(3, 3)], 0.5) 
+        # haplotypes that span several words of packed alleles
+        pop = Population(size=[300, 200], ploidy=2, loci=[80])
+        initGenotype(pop, haplotypes=[[0]*80, [1]*80, [0, 1]*40], prop=[.5, .3, .2])
+        initGenotype(pop, freq=[.2, .8], loci=[0, 70])
+        loci = list(range(0, 80, 2)) + [79]
+        stat(pop, haploFreq=loci, vars=['haploNum', 'haploNum_sp'])
+        for sp in [None, 0, 1]:
+            counts = {}
+            for ind in (pop.individuals() if sp is None else pop.individuals(sp)):
+                for p in range(2):
+                    hap = tuple([ind.allele(x, p) for x in loci])
+                    counts[hap] = counts.get(hap, 0) + 1
+            var = pop.vars() if sp is None else pop.vars(sp)
+            self.assertEqual(dict(var['haploNum'][tuple(loci)]), counts)
 
 
     def testHaploHomoFreq(self):
@@ -695,6 +842,57 @@ class TestStat(unittest.TestCase):
             self.assertAlmostEqual(CramerV(pop.dvars(sp), 2, 4), pop.dvars(sp).CramerV[2][4])
 
 
+    def testWindowedLD(self):
+        'Testing LD of all pairs of loci within a window'
+        pop = Population(size=[500, 100, 1000], ploidy=2, loci=[12, 8],
+            chromTypes=[AUTOSOME, CHROMOSOME_X])
+        initSex(pop)
+        initGenotype(pop, freq=[.3, .7], loci=range(12))
+        initGenotype(pop, haplotypes=[[0]*8, [1]*8, [0, 1]*4], prop=[.4, .4, .2], loci=range(12, 20))
+        stat(pop, LD=range(20), LDWindow=3, vars=['LD', 'LD_prime', 'R2', 'R2_sp'])
+        pairs = [(i, j) for i in range(20) for j in range(i + 1, 20)
+            if j - i <= 3 and (i < 12) == (j < 12)]
+        self.assertEqual(list(zip(pop.dvars().LD_row, pop.dvars().LD_col)), pairs)
+        LD, LD_prime, R2 = pop.dvars().LD, pop.dvars().LD_prime, pop.dvars().R2
+        R2_sp = [pop.dvars(sp).R2 for sp in range(3)]
+        # results are saved in arrays
+        self.assertTrue(isinstance(pop.dvars().LD_row, array.array))
+        self.assertEqual(R2.typecode, 'd')
+        self.assertEqual(len(R2), len(pairs))
+        # and are kept when the population is saved
+        pop.save('windowed_ld.pop')
+        pop1 = loadPopulation('windowed_ld.pop')
+        self.assertEqual(pop1.dvars().R2, R2)
+        os.remove('windowed_ld.pop')
+        stat(pop, LD=pairs, vars=['LD', 'LD_prime', 'R2', 'R2_sp'])
+        for idx, (i, j) in enumerate(pairs):
+            self.assertAlmostEqual(abs(LD[idx]), pop.dvars().LD[i][j])
+            self.assertAlmostEqual(abs(LD_prime[idx]), pop.dvars().LD_prime[i][j])
+            self.assertAlmostEqual(R2[idx], pop.dvars().R2[i][j])
+            for sp in range(3):
+                self.assertAlmostEqual(R2_sp[sp][idx], pop.dvars(sp).R2[i][j])
+        # window in locus positions, and a threshold on R2
+        pop = Population(size=1000, loci=[10], lociPos=[x * 100 for x in range(10)])
+        initGenotype(pop, haplotypes=[[0]*10, [1]*10, [0, 1]*5], prop=[.35, .35, .3])
+        stat(pop, LD=range(10), LDWindow=250, LDThreshold=0.5)
+        self.assertTrue(all(x >= 0.5 for x in pop.dvars().R2))
+        self.assertTrue(all(0 < j - i <= 2 for i, j in zip(pop.dvars().LD_row, pop.dvars().LD_col)))
+        self.assertTrue((0, 2) in zip(pop.dvars().LD_row, pop.dvars().LD_col))
+        self.assertFalse((0, 1) in zip(pop.dvars().LD_row, pop.dvars().LD_col))
+        # multi-allelic loci use their most common alleles as primary alleles
+        if moduleInfo()['alleleType'] != 'binary':
+            pop = Population(size=2000, loci=[3])
+            initGenotype(pop, freq=[.1, .2, .7])
+            stat(pop, LD=range(3), LDWindow=1, vars=['LD', 'R2'])
+            LD, R2 = pop.dvars().LD, pop.dvars().R2
+            stat(pop, LD=[[0, 1, 2, 2], [1, 2, 2, 2]], vars=['LD', 'R2'])
+            self.assertAlmostEqual(LD[0], pop.dvars().LD[0][1])
+            self.assertAlmostEqual(LD[1], pop.dvars().LD[1][2])
+            self.assertAlmostEqual(R2[0], pop.dvars().R2[0][1])
+            self.assertAlmostEqual(R2[1], pop.dvars().R2[1][2])
+        self.assertRaises(ValueError, Stat, LD=range(10), LDWindow=-1)
+        self.assertRaises(ValueError, Stat, LD=range(10), LDWindow=2, vars='LD_ChiSq')
+
     def testCombinedStats(self):
         '''Testing dependency of combined statistics'''
         pop = Population(size=[500,100,1000], ploidy=2, loci = [5])
@@ -746,6 +944,43 @@ class TestStat(unittest.TestCase):
         stat(pop1, neutrality=[1, 3, 4], vars=['Pi_sp'], suffix='_mt')
         pop1.removeSubPops(1)
         self.assertEqual(pop1.dvars(0).Pi_mt, self.pairwiseDiff(pop1, loci=[1, 3, 4]))
+        #
+        # other statistics for a fixed alignment of ten sequences, with
+        # reference values calculated with exact fractions from equations
+        # of Tajima (1989), Fu and Li (1993, with an outgroup) and Fay and
+        # Wu (2000), taking allele 0 as the ancestral allele
+        seqs = ['10011111', '01011111', '00101111', '00000111', '00000111',
+                '00000011', '00000011', '00000001', '00000001', '00000000']
+        pop = Population(size=[3, 2], ploidy=2, loci=[8])
+        pop.setGenotype([int(x) for seq in seqs for x in seq])
+        names = ['Pi', 'S', 'Tajima_D', 'FuLi_D', 'FuLi_F', 'FayWu_H', 'SFS']
+        stat(pop, neutrality=ALL_AVAIL, vars=names + [x + '_sp' for x in names])
+        expected = [
+            # all ten sequences
+            (pop.vars(), {'Pi': 119 / 45., 'S': 8, 'Tajima_D': -0.2798682150,
+                'FuLi_D': -0.0943101005, 'FuLi_F': -0.1717794382,
+                'FayWu_H': -52 / 45., 'SFS': {1: 3, 2: 1, 3: 1, 5: 1, 7: 1, 9: 1}}),
+            # the first six sequences, two sites are not segregating
+            (pop.vars(0), {'Pi': 37 / 15., 'S': 6, 'Tajima_D': -0.3508405480,
+                'FuLi_D': -0.2307167827, 'FuLi_F': -0.3053056441,
+                'FayWu_H': -4 / 15., 'SFS': {1: 3, 2: 1, 3: 1, 5: 1}}),
+            # the last four sequences
+            (pop.vars(1), {'Pi': 1., 'S': 2, 'Tajima_D': -0.7098961679,
+                'FuLi_D': 0.1200689535, 'FuLi_F': 0.,
+                'FayWu_H': -2 / 3., 'SFS': {1: 1, 3: 1}}),
+        ]
+        for vars, values in expected:
+            for name, value in values.items():
+                if name in ['S', 'SFS']:
+                    self.assertEqual(vars[name], value)
+                else:
+                    self.assertAlmostEqual(vars[name], value, places=8)
+        # statistics are zero without segregating site
+        initGenotype(pop, genotype=[0])
+        stat(pop, neutrality=ALL_AVAIL, vars=names)
+        for name in names[:-1]:
+            self.assertEqual(pop.vars()[name], 0)
+        self.assertEqual(pop.dvars().SFS, {})
 
     def Waples89(self, S0, St, t, P0, Pt):
         # number of loci
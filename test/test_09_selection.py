@@ -262,6 +262,53 @@ class TestSelector(unittest.TestCase):
                     self.assertEqual(ind.fitness, 0.25)
 
 
+    def testMapSelectorCache(self):
+        'Testing the fitness cache of map selector'
+        pop = Population(size=[500, 300], loci=[2, 1], chromTypes=[AUTOSOME, CHROMOSOME_X],
+            infoFields='fitness')
+        initSex(pop)
+        initGenotype(pop, freq=[.2, .8])
+        fitness = {a + b: 1 - 0.1 * (2 * sum(a) + sum(b))
+            for a in [(0,0), (0,1), (1,0), (1,1)] for b in [(0,0), (0,1), (1,0), (1,1)]}
+        xfitness = {(0,0):1, (0,1):0.9, (1,1):0.8, (0,):0.7, (1,):0.6}
+        for loci, table in [([0, 1], fitness), ([2], xfitness)]:
+            sel = MapSelector(loci=loci, fitness=table, cacheSize=0)
+            sel.apply(pop)
+            self.assertEqual(len(sel.cachedGenotypes()), 0)
+            expected = pop.indInfo('fitness')
+            sel = MapSelector(loci=loci, fitness=table)
+            # cached values are used in the second round
+            for i in range(2):
+                pop.setIndInfo(0, 'fitness')
+                sel.apply(pop)
+                self.assertEqual(pop.indInfo('fitness'), expected)
+            self.assertTrue(0 < max(sel.cachedGenotypes()) <= (32 if loci == [0, 1] else 8))
+            # a small cache
+            sel = MapSelector(loci=loci, fitness=table, cacheSize=2)
+            sel.apply(pop)
+            self.assertEqual(pop.indInfo('fitness'), expected)
+            self.assertTrue(max(sel.cachedGenotypes()) <= 2)
+        # cache is emptied if loci change
+        table = {(0,0):1, (0,1):0.5, (1,0):0.5, (1,1):0.2}
+        def checkFitness(pop):
+            loc = pop.dvars().gen % 2
+            for ind in pop.individuals():
+                self.assertEqual(ind.fitness, table[(ind.allele(loc, 0), ind.allele(loc, 1))])
+            return True
+        sel = MapSelector(loci=lambda pop: [pop.dvars().gen % 2], fitness=table)
+        pop.evolve(matingScheme=CloneMating(),
+            postOps=[sel, PyOperator(checkFitness)], gen=4)
+        # or if genotypic structure changes
+        sel = MapSelector(loci=[2], fitness=xfitness)
+        initGenotype(pop, genotype=[1] * 6)
+        sel.apply(pop)
+        pop1 = Population(size=[500, 300], loci=[1, 2], chromTypes=[CHROMOSOME_X, AUTOSOME],
+            infoFields='fitness')
+        initSex(pop1)
+        initGenotype(pop1, genotype=[1] * 6)
+        sel.apply(pop1)
+        self.assertEqual(pop1.indInfo('fitness'), (0.8,) * 800)
+
     def testMaSelector(self):
         'Testing multi-allele selector'
         pop = Population(size=10, loci=[1], infoFields=['a', 'fitness', 'b'])
@@ -917,6 +964,45 @@ class TestSelector(unittest.TestCase):
         )
 
 
+    def testVectorizedPySelector(self):
+        'Testing PySelector with vectorized function'
+        pop = Population(size=[200, 100], loci=[3, 5], infoFields=['fitness', 'a'])
+        initSex(pop)
+        initGenotype(pop, freq=[.3, .7])
+        pop.setIndInfo([x / 10. for x in range(pop.popSize())], 'a')
+        def sel(geno, a):
+            return 1 + 0.1 * sum(geno) + a
+        def vsel(geno, a):
+            self.assertEqual(geno.shape[1], 4)
+            return [1 + 0.1 * sum(row) + x for row, x in zip(geno.tolist(), a)]
+        PySelector(loci=[2, 6], func=sel).apply(pop)
+        expected = pop.indInfo('fitness')
+        pop.setIndInfo(0, 'fitness')
+        PySelector(loci=[2, 6], func=vsel, vectorized=True).apply(pop)
+        for x, y in zip(pop.indInfo('fitness'), expected):
+            self.assertAlmostEqual(x, y)
+        # virtual subpopulations
+        pop.setVirtualSplitter(SexSplitter())
+        pop.setIndInfo(0, 'fitness')
+        PySelector(loci=[2, 6], func=vsel, vectorized=True,
+            subPops=[(ALL_AVAIL, 0)]).apply(pop)
+        for ind, y in zip(pop.individuals(), expected):
+            self.assertAlmostEqual(ind.fitness, y if ind.sex() == MALE else 0)
+        # wrong number of values
+        self.assertRaises(ValueError, PySelector(loci=[2, 6],
+            func=lambda geno: [1], vectorized=True).apply, pop)
+        # individuals are not passed
+        self.assertRaises(ValueError, PySelector(loci=[2, 6],
+            func=lambda ind: 1, vectorized=True).apply, pop)
+        # during mating, fitness is the probability for an offspring to survive
+        def vsurv(geno):
+            return [1 - 0.1 * sum(row) for row in geno.tolist()]
+        pop.evolve(
+            matingScheme=RandomMating(ops=[MendelianGenoTransmitter(),
+                PySelector(loci=[2, 6], func=vsurv, vectorized=True)]),
+            gen=1)
+        self.assertEqual(pop.subPopSizes(), (200, 100))
+
     def testDuringMatingSelector(self):
         'Testing the use of selector during mating'
         s1 = .1
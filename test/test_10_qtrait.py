@@ -68,6 +68,39 @@ class TestQuanTrait(unittest.TestCase):
             return random.normalvariate(0, 0.5*sum(geno) ), 1
         pyQuanTrait(pop, loci=[2,6], func=qt1, infoFields=['qtrait1', 'qtrait2'])
 
+    def testVectorizedPyQuanTrait(self):
+        'Testing the hybrid quantitative trait operator with vectorized function'
+        pop = Population([500, 300], loci=[3,5], infoFields=['qtrait1', 'qtrait2', 'a'])
+        initSex(pop)
+        initGenotype(pop, freq=[.3, .7])
+        pop.setIndInfo([x / 10. for x in range(pop.popSize())], 'a')
+        def qt(geno, a):
+            self.assertEqual(geno.shape[1], 4)
+            return [(sum(row), sum(row) + x) for row, x in zip(geno.tolist(), a)]
+        pyQuanTrait(pop, loci=[2,6], func=qt, infoFields=['qtrait1', 'qtrait2'],
+            vectorized=True)
+        for ind in pop.individuals():
+            self.assertEqual(ind.qtrait1, ind.allele(2, 0) + ind.allele(2, 1) +
+                ind.allele(6, 0) + ind.allele(6, 1))
+            self.assertAlmostEqual(ind.qtrait2, ind.qtrait1 + ind.a)
+        # a flat array of values is also acceptable
+        def qt1(geno):
+            return [sum(row) for row in geno.tolist()]
+        pyQuanTrait(pop, loci=[2], func=qt1, infoFields='qtrait1', vectorized=True)
+        for ind in pop.individuals():
+            self.assertEqual(ind.qtrait1, ind.allele(2, 0) + ind.allele(2, 1))
+        self.assertRaises(ValueError, pyQuanTrait, pop, loci=[2], func=qt1,
+            infoFields=['qtrait1', 'qtrait2'], vectorized=True)
+        # during mating
+        pop.evolve(
+            matingScheme=RandomMating(ops=[MendelianGenoTransmitter(),
+                PyQuanTrait(loci=[2, 6], func=qt, infoFields=['qtrait1', 'qtrait2'],
+                    vectorized=True)]),
+            gen=1)
+        for ind in pop.individuals():
+            self.assertEqual(ind.qtrait1, ind.allele(2, 0) + ind.allele(2, 1) +
+                ind.allele(6, 0) + ind.allele(6, 1))
+
     def testAncestralGen(self):
         'Testing parameter ancestralGen of qtrait... (FIXME)'
         # test the ancestralGen parameter of qtrait
@@ -259,6 +259,29 @@ class TestMutator(unittest.TestCase):
         self.assertGenotype(simu.population(0), 0,
             loci=[1,2,3])
 
+    def testMatrixMutator(self):
+        'Testing matrix mutator'
+        if moduleInfo()['alleleType'] == 'binary':
+            return
+        # a stepwise model with 50 alleles
+        rate = [[0]*50 for x in range(50)]
+        for i in range(50):
+            if i > 0:
+                rate[i][i-1] = 0.05
+            if i < 49:
+                rate[i][i+1] = 0.1
+        pop = Population(size=10000, loci=2)
+        initGenotype(pop, genotype=[25, 49])
+        matrixMutate(pop, rate=rate)
+        stat(pop, alleleFreq=ALL_AVAIL)
+        num = pop.dvars().alleleNum
+        self.assertEqual(set(num[0].keys()) - set([24, 25, 26]), set())
+        self.assertEqual(set(num[1].keys()) - set([48, 49]), set())
+        # 20000 x 0.05 = 1000 and 20000 x 0.1 = 2000
+        self.assertTrue(abs(num[0][24] - 1000) < 200)
+        self.assertTrue(abs(num[0][26] - 2000) < 250)
+        self.assertTrue(abs(num[1][48] - 1000) < 200)
+
     def testStepwiseMutator(self):
         'Testing generalized step-wise mutation mutator'
         if moduleInfo()['alleleType'] == 'binary':
@@ -409,6 +432,19 @@ class TestMutator(unittest.TestCase):
             cnt += pop.dvars().alleleNum[0][1]
         # self.assertGreater( cnt/5000., 0.017)
         # self.assertLess( cnt/5000., 0.023)
+        # rare mutations on many loci, with the same or different rates
+        for rates in [0.0001, [[0.002, 0.0005, 0][x % 3] for x in range(1000)]]:
+            pop = Population(size=1000, loci=[400, 600])
+            kAlleleMutate(pop, k=2, rates=rates, loci=list(range(1000)))
+            stat(pop, alleleFreq=ALL_AVAIL)
+            num = [pop.dvars().alleleNum[x][1] for x in range(1000)]
+            if type(rates) == list:
+                # 2000 x (334 x 0.002 + 333 x 0.0005) = 1669
+                self.assertEqual(sum(num[2::3]), 0)
+                self.assertTrue(abs(sum(num) - 1669) < 200)
+            else:
+                # 2000 x 1000 x 0.0001 = 200
+                self.assertTrue(abs(sum(num) - 200) < 60)
 
     def testMutationSexChromosomes(self):
         'Testing mutation on chromosome X'
@@ -984,6 +984,47 @@ class TestTransmitters(unittest.TestCase):
   
 
 
+    def testRecombineSegments(self):
+        'Testing that recombined segments are copied at the right loci'
+        pop = self.getPop(size=[2, 500], loci=[37, 101, 70, 5],
+            chromTypes=[AUTOSOME]*3 + [CHROMOSOME_X])
+        pop.individual(0).setSex(MALE)
+        pop.individual(1).setSex(FEMALE)
+        applyDuringMatingOperator(Recombinator(rates=0.2),
+            pop, pop, dad=0, mom=1, off=(2, pop.popSize()))
+        for idx in range(2, pop.popSize()):
+            ind = pop.individual(idx)
+            for p, par in [(0, pop.individual(1)), (1, pop.individual(0))]:
+                geno = ind.genotype(p)
+                for loc in range(208):
+                    self.assertTrue(geno[loc] in (par.allele(loc, 0), par.allele(loc, 1)))
+
+    def testGeneticMapRecombination(self):
+        'Testing recombination on a long genome with a genetic map'
+        if moduleInfo()['alleleType'] == 'binary':
+            a1, a2 = 0, 1
+        else:
+            a1, a2 = 1, 2
+        # 5000 loci with uneven spacing and a total map length of 2
+        pos = [0]
+        for i in range(4999):
+            pos.append(pos[-1] + [1, 5, 2, 10][i % 4])
+        pop = Population(500, loci=5000, lociPos=pos)
+        initSex(pop)
+        initGenotype(pop, genotype=[a1]*5000+[a2]*5000)
+        pop.evolve(
+            matingScheme=RandomMating(ops=Recombinator(intensity=2./pos[-1])),
+            gen=1)
+        switches = 0
+        for ind in pop.individuals():
+            for p in range(2):
+                geno = ind.genotype(p)
+                # all alleles are inherited from one of the parental copies
+                self.assertEqual(set(geno) - set([a1, a2]), set())
+                switches += sum([geno[i] != geno[i+1] for i in range(4999)])
+        # mean number of recombinations per chromosome is about 2
+        self.assertTrue(abs(switches / 1000. - 2) < 0.3)
+
     def testRecIntensityAfterLoci(self):
         'Testing RecIntensity after loci'
         if moduleInfo()['alleleType'] == 'binary':
@@ -197,6 +197,19 @@ class TestPenetrance(unittest.TestCase):
         # self.assertTrue(abs(self.pop.dvars(2).numOfAffected - 600*0.5 - 400) < 50, 
         #     "Expression abs(self.pop.dvars(2).numOfAffected - 600*0.5 - 400) (test value %f) be less than 50. This test may occasionally fail due to the randomness of outcome." % (abs(self.pop.dvars(2).numOfAffected - 600*0.5 - 400)))
 
+    def testVectorizedPyPenetrance(self):
+        'Testing python penetrance operator with vectorized function'
+        def pen(geno):
+            self.assertEqual(geno.shape[1], 2)
+            return [float(row[0] == row[1]) for row in geno.tolist()]
+        pop = Population(size=[500, 100], loci=[1, 2], infoFields='penetrance')
+        initGenotype(pop, freq=[.3, .7])
+        pyPenetrance(pop, loci=0, func=pen, vectorized=True,
+            infoFields='penetrance')
+        for ind in pop.individuals():
+            self.assertEqual(ind.affected(), ind.allele(0, 0) == ind.allele(0, 1))
+            self.assertEqual(ind.penetrance, float(ind.affected()))
+
     def testAncestralPenetrance(self):
         'Testing the ancestralGen parameter... '
         # test the ancestralGen parameter
@@ -305,6 +305,29 @@ class TestUtils(unittest.TestCase):
             # the count must be exact
             self.assertEqual(num.count(i), 10000 * (i+1))
 
+    def testWeightedSamplerUpdate(self):
+        'Testing updating weights of a weighted sampler'
+        sampler = WeightedSampler([1, 2, 3, 4])
+        sampler.update(0, 0)
+        sampler.update(3, 5)
+        num = sampler.drawSamples(100000)
+        self.assertEqual(num.count(0), 0)
+        for i, w in [(1, 0.2), (2, 0.3), (3, 0.5)]:
+            self.assertAlmostEqual(num.count(i) / 100000., w, places=1)
+        # updates of a sampler with equal weights
+        sampler = WeightedSampler([1]*1000)
+        for i in range(1, 1000):
+            sampler.update(i, 0)
+        self.assertEqual(list(sampler.drawSamples(100)), [0]*100)
+        sampler.update(999, 1)
+        num = [sampler.draw() for i in range(10000)]
+        self.assertEqual(set(num), set([0, 999]))
+        self.assertAlmostEqual(num.count(0) / 10000., 0.5, places=1)
+        self.assertRaises(IndexError, sampler.update, 1000, 1)
+        # exact proportions cannot be updated
+        sampler = WeightedSampler([0.1, 0.2, 0.3, 0.4], 100000)
+        self.assertRaises(ValueError, sampler.update, 0, 0.5)
+
     def testWeightedSamplerWithZero(self):
         'Testing weighted sampler with Zero'
         sampler = WeightedSampler([0, 1, 2, 0, 0, 3, 4, 0])